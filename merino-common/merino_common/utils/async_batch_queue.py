@@ -3,10 +3,12 @@
 import asyncio
 import logging
 from collections.abc import Callable
+from enum import StrEnum
 from typing import Generic, TypeVar, Awaitable, Any
 from asyncio import QueueFull
 from opentelemetry.metrics import (
     Counter,
+    Histogram,
     MeterProvider,
     _Gauge,
     get_meter_provider,
@@ -33,17 +35,42 @@ class QueueShutDownException(AsyncBatchException):
     pass
 
 
+class OverflowPolicy(StrEnum):
+    """What ``put`` does when the queue is at capacity."""
+
+    # Reject the new item with ``QueueFullException``.
+    DROP_NEWEST = "drop_newest"
+    # Evict the oldest queued item to make room for the new one.
+    DROP_OLDEST = "drop_oldest"
+    # Have ``put_wait`` wait up to ``overflow_deadline_s`` for room before rejecting.
+    AWAIT = "await"
+
+
 T = TypeVar("T")
 
 
 class AsyncBatchQueue(Generic[T]):
     """A generic class for batching and processing items asynchronously,
-    one batch at a time.
+    up to ``max_concurrent_batches`` batches at a time.
 
     Once it is started, it will invoke ``on_batch`` callback whenever
     the maximum batch size is collected, or ``collection_delay_s`` has
     been reached (even if maximum batch size is not reached).
 
+    With ``target_flush_latency_s`` set, the batch size adapts between
+    ``min_batch_size`` and ``max_batch_size``: it is halved whenever a batch takes
+    longer than the target to process (or fails), and grown by a quarter whenever
+    a full batch is processed within the target while a backlog of at least
+    another full batch is queued. Bursts are then drained in the largest batches
+    the sink can take in time, and a slowing sink gets smaller batches before its
+    requests start timing out.
+
+    When the queue is at capacity, ``overflow_policy`` decides what to drop: the
+    new item (the default), the oldest queued item, or neither for up to
+    ``overflow_deadline_s`` when items are added with ``put_wait``. Memory is
+    bounded by ``max_queue_size`` plus ``max_concurrent_batches`` batches in
+    flight either way.
+
     To gracefully shut down, the ``stop`` method should be included in
     application lifecycle hooks. When invoked with ``force=False``, it will attempt
     to flush all remaining items in the queue (respecting ``max_batch_size``)
@@ -78,18 +105,31 @@ class AsyncBatchQueue(Generic[T]):
         shutdown_deadline_s (float, optional): Seconds to wait for a graceful ``stop`` to flush the
             queue; if this deadline is exceeded, any remaining items are dropped. Defaults to 30.0.
         max_queue_size (int, optional): The max number of items to keep in the queue. Must be
-            positive. Defaults to 10,000. Exceeding this value will throw QueueFullException
-            when attempting to ``put`` into the queue. Must be greater than zero.
+            positive. Defaults to 10,000. What happens to items beyond it is decided by
+            ``overflow_policy``. Must be greater than zero.
+        max_concurrent_batches (int, optional): The max number of batches processed at once.
+            Defaults to 1, which processes batches serially; this makes it safe for sinks that
+            should not receive concurrent requests (e.g. an API at risk of overloading).
+        min_batch_size (int, optional): The smallest batch size that adaptive batching may
+            shrink to. Must not be greater than ``max_batch_size``. Defaults to 1.
+        target_flush_latency_s (float, optional): The ``on_batch`` duration that adaptive
+            batching sizes batches for. Defaults to None, which disables adaptive batching
+            and always uses ``max_batch_size``.
+        overflow_policy (OverflowPolicy, optional): What to do with items added to a full
+            queue. Defaults to ``OverflowPolicy.DROP_NEWEST``.
+        overflow_deadline_s (float, optional): Seconds ``put_wait`` waits for room under
+            ``OverflowPolicy.AWAIT`` before rejecting the item. Defaults to 1.0.
         meter_provider (MeterProvider, optional): an optional opentelemetry MeterProvider;
             if unset, will pull the globally configured meter provider (or a NoOp if one
             is not configured)
 
     Raises:
         QueueFullException: If attempting to ``put`` onto a queue that has already reached
-            ``max_queue_size``
+            ``max_queue_size``, unless the overflow policy is ``DROP_OLDEST``.
         QueueShutDownException: If attempting to ``put`` an item after ``stop`` has been
             invoked (queue is shutting down).
-        ValueError: If ``max_batch_size`` is greater than ``max_queue_size``.
+        ValueError: If ``max_batch_size`` is greater than ``max_queue_size``, or
+            ``min_batch_size`` is greater than ``max_batch_size``.
 
     Metrics:
         Instruments are registered under the instrumentation scope
@@ -112,8 +152,20 @@ class AsyncBatchQueue(Generic[T]):
           on failure, ``error.type`` (the error callback's own exception class name).
         - ``async_batch_queue.rejected.count`` (counter,
           ``{item}``): items rejected by ``put`` and never enqueued. Attribute
-          ``error.type``: ``queue_full`` (at capacity) or ``shutdown`` (after
-          ``stop``)
+          ``error.type``: ``queue_full`` (at capacity), ``deadline_exceeded`` (no
+          room within ``overflow_deadline_s`` under ``OverflowPolicy.AWAIT``) or
+          ``shutdown`` (after ``stop``)
+        - ``async_batch_queue.evicted.count`` (counter, ``{item}``): queued items
+          evicted to make room for new ones under ``OverflowPolicy.DROP_OLDEST``.
+        - ``async_batch_queue.put_wait.duration`` (histogram, ``ms``): time
+          ``put_wait`` spent waiting for room under ``OverflowPolicy.AWAIT``.
+          Attribute ``outcome``: ``success`` or ``deadline_exceeded``.
+        - ``async_batch_queue.batch.size`` (histogram, ``{item}``): items per
+          processed batch.
+        - ``async_batch_queue.flush.duration`` (histogram, ``ms``): duration of each
+          ``on_batch`` call, including failed ones.
+        - ``async_batch_queue.batch.target_size`` (gauge, ``{item}``): the batch size
+          adaptive batching currently collects. Only set when it is enabled.
         - ``async_batch_queue.dropped.count`` (counter,
           ``{item}``): items that could not be flushed before ``shutdown_deadline_s``
            elapsed -- everything still queued plus the in-flight batch and any batch
@@ -144,19 +196,35 @@ class AsyncBatchQueue(Generic[T]):
         collection_delay_s: PositiveFloat = 5.0,
         shutdown_deadline_s: PositiveFloat = 30.0,
         max_queue_size: PositiveInt = 10000,
+        max_concurrent_batches: PositiveInt = 1,
+        min_batch_size: PositiveInt = 1,
+        target_flush_latency_s: PositiveFloat | None = None,
+        overflow_policy: OverflowPolicy = OverflowPolicy.DROP_NEWEST,
+        overflow_deadline_s: PositiveFloat = 1.0,
         meter_provider: MeterProvider | None = None,
     ):
         if max_batch_size > max_queue_size:
             raise ValueError("Valid max_batch_size must not be greater than max_queue_size")
+        if min_batch_size > max_batch_size:
+            raise ValueError("Valid min_batch_size must not be greater than max_batch_size")
         self.max_batch_size = max_batch_size
+        self.min_batch_size = min_batch_size
         self.collection_delay_s = collection_delay_s
         self.shutdown_deadline_s = shutdown_deadline_s
+        self.max_concurrent_batches = max_concurrent_batches
+        self.target_flush_latency_s = target_flush_latency_s
+        self.overflow_policy = OverflowPolicy(overflow_policy)
+        self.overflow_deadline_s = overflow_deadline_s
+        # The number of items collected per batch; only differs from max_batch_size
+        # when adaptive batching is enabled.
+        self.batch_size = max_batch_size
         self.queue_id = queue_id or f"{type(self).__name__}_{str(id(self))}_{int(time.time())}"
         self._queue: asyncio.Queue[T] = asyncio.Queue(maxsize=max_queue_size)
         # Items pulled off the queue that have not yet finished processing.
         # Used for computing dropped items due to elapsed shutdown deadline.
         self._pending_item_count = 0
         self._current_task: asyncio.Task | None = None
+        self._in_flight: set[asyncio.Task] = set()
         self._shutdown = asyncio.Event()
         self._is_running = asyncio.Event()
         self._batch_callback = on_batch
@@ -166,7 +234,12 @@ class AsyncBatchQueue(Generic[T]):
         self._error_callback_counter: Counter | None = None
         self._rejected_counter: Counter | None = None
         self._dropped_counter: Counter | None = None
+        self._evicted_counter: Counter | None = None
         self._size_gauge: _Gauge | None = None
+        self._target_size_gauge: _Gauge | None = None
+        self._put_wait_histogram: Histogram | None = None
+        self._batch_size_histogram: Histogram | None = None
+        self._flush_duration_histogram: Histogram | None = None
         # Fall back to the globally-configured provider when none is passed. It
         # is a no-op proxy until the application sets one, so this is safe and
         # instruments start reporting automatically once a provider is set.
@@ -175,6 +248,10 @@ class AsyncBatchQueue(Generic[T]):
     def put(self, item: T) -> None:
         """Add an item to the queue for batch processing.
 
+        When the queue is full, the oldest queued item is evicted to make room under
+        ``OverflowPolicy.DROP_OLDEST``; otherwise the item is rejected. ``put`` never
+        waits, so use ``put_wait`` for ``OverflowPolicy.AWAIT``.
+
         Args:
             item (T): The item to process.
 
@@ -189,11 +266,52 @@ class AsyncBatchQueue(Generic[T]):
         try:
             self._queue.put_nowait(item)
         except QueueFull:
-            self._record_rejected("queue_full")
-            raise QueueFullException("The queue is full")
+            if self.overflow_policy is not OverflowPolicy.DROP_OLDEST:
+                self._record_rejected("queue_full")
+                raise QueueFullException("The queue is full")
+            self._queue.get_nowait()
+            self._queue.put_nowait(item)
+            if self._evicted_counter is not None:
+                self._evicted_counter.add(1, {"queue_id": self.queue_id})
         self._record_size()
         return
 
+    async def put_wait(self, item: T) -> None:
+        """Add an item to the queue, waiting for room if it is full under
+        ``OverflowPolicy.AWAIT``. Behaves like ``put`` under the other policies.
+
+        Args:
+            item (T): The item to process.
+
+        Raises:
+            QueueShutDownException: If the batcher has been stopped.
+            QueueFullException: If there was no room for the item within
+                ``overflow_deadline_s``.
+        """
+        if self.overflow_policy is not OverflowPolicy.AWAIT or not self._queue.full():
+            self.put(item)
+            return
+        if self._shutdown.is_set():
+            self._record_rejected("shutdown")
+            raise QueueShutDownException("The queue is shut down")
+
+        loop = asyncio.get_running_loop()
+        started_at = loop.time()
+        outcome = "success"
+        try:
+            await asyncio.wait_for(self._queue.put(item), timeout=self.overflow_deadline_s)
+        except TimeoutError:
+            outcome = "deadline_exceeded"
+            self._record_rejected("deadline_exceeded")
+            raise QueueFullException("The queue is full")
+        finally:
+            if self._put_wait_histogram is not None:
+                self._put_wait_histogram.record(
+                    (loop.time() - started_at) * 1000,
+                    {"outcome": outcome, "queue_id": self.queue_id},
+                )
+        self._record_size()
+
     def qsize(self) -> int:
         """Return the number of items currently buffered in the queue."""
         return self._queue.qsize()
@@ -203,30 +321,39 @@ class AsyncBatchQueue(Generic[T]):
         return max(0, self._max_queue_size - self._queue.qsize())
 
     def _collect_batch_sync(self) -> list[T]:
-        """Pull up to ``max_batch_size`` items off the queue without waiting."""
+        """Pull up to ``batch_size`` items off the queue without waiting."""
         batch: list[T] = []
-        while len(batch) < self.max_batch_size:
+        self._collect_available(batch)
+        self._record_size()
+        return batch
+
+    def _collect_available(self, batch: list[T]) -> None:
+        """Fill the batch up to ``batch_size`` with the items already queued."""
+        while len(batch) < self.batch_size:
             try:
                 batch.append(self._queue.get_nowait())
                 self._pending_item_count += 1
             except asyncio.QueueEmpty:
                 break
-        self._record_size()
-        return batch
 
     async def _wait_for_batch(self) -> list[T]:
         """Collect a batch, blocking for items until the delay elapses.
 
         Returns as soon as the batch is full, the schedule delay expires, or
         shutdown is requested. On shutdown it returns immediately rather than
-        waiting out any remaining delay.
+        waiting out any remaining delay. Items already queued are taken without
+        waiting, so a backlog is collected without a task per item.
         """
         batch: list[T] = []
+        self._collect_available(batch)
+        if len(batch) >= self.batch_size:
+            self._record_size()
+            return batch
         loop = asyncio.get_running_loop()
         deadline = loop.time() + self.collection_delay_s
         shutdown = asyncio.create_task(self._shutdown.wait())
         try:
-            while len(batch) < self.max_batch_size:
+            while len(batch) < self.batch_size:
                 remaining = deadline - loop.time()
                 if remaining <= 0:
                     break
@@ -245,6 +372,7 @@ class AsyncBatchQueue(Generic[T]):
                 if getter in done and not getter.cancelled():
                     batch.append(getter.result())
                     self._pending_item_count += 1
+                    self._collect_available(batch)
                 else:
                     break
         finally:
@@ -257,7 +385,23 @@ class AsyncBatchQueue(Generic[T]):
         while not self._queue.empty():
             batch = self._collect_batch_sync()
             if batch:
-                await self._process(batch)
+                await self._dispatch(batch)
+        await self._wait_in_flight()
+
+    async def _dispatch(self, batch: list[T]) -> None:
+        """Start processing a batch once fewer than ``max_concurrent_batches`` are in
+        flight.
+        """
+        while len(self._in_flight) >= self.max_concurrent_batches:
+            await asyncio.wait(self._in_flight, return_when=asyncio.FIRST_COMPLETED)
+        task = asyncio.create_task(self._process(batch))
+        self._in_flight.add(task)
+        task.add_done_callback(self._in_flight.discard)
+
+    async def _wait_in_flight(self) -> None:
+        """Wait for every in-flight batch to finish processing."""
+        if self._in_flight:
+            await asyncio.wait(self._in_flight)
 
     def _init_metrics(self, meter_provider: MeterProvider) -> None:
         """Register OTel instruments for queue size, capacity, and processed count."""
@@ -295,6 +439,33 @@ class AsyncBatchQueue(Generic[T]):
             unit="{item}",
             description="Number of items dropped after shutdown grace period elapsed",
         )
+        self._evicted_counter = meter.create_counter(
+            name=f"{self.component_type}.evicted.count",
+            unit="{item}",
+            description="Number of queued items evicted to make room for new ones.",
+        )
+        self._put_wait_histogram = meter.create_histogram(
+            name=f"{self.component_type}.put_wait.duration",
+            unit="ms",
+            description="Time put_wait() spent waiting for room in a full queue.",
+        )
+        self._batch_size_histogram = meter.create_histogram(
+            name=f"{self.component_type}.batch.size",
+            unit="{item}",
+            description="Number of items per processed batch.",
+        )
+        self._flush_duration_histogram = meter.create_histogram(
+            name=f"{self.component_type}.flush.duration",
+            unit="ms",
+            description="Duration of each batch callback in milliseconds.",
+        )
+        if self.target_flush_latency_s is not None:
+            self._target_size_gauge = meter.create_gauge(
+                name=f"{self.component_type}.batch.target_size",
+                unit="{item}",
+                description="Number of items adaptive batching currently collects per batch.",
+            )
+            self._target_size_gauge.set(self.batch_size, {"queue_id": self.queue_id})
 
     def _record_size(self) -> None:
         """Publish the current queue depth to the size gauge."""
@@ -333,9 +504,12 @@ class AsyncBatchQueue(Generic[T]):
 
     async def _process(self, batch: list[T]) -> None:
         """Run the batch callback, routing failures to the error callback."""
+        loop = asyncio.get_running_loop()
+        started_at = loop.time()
         try:
             await self._batch_callback(batch)
         except Exception as e:
+            self._record_flush(len(batch), loop.time() - started_at, failed=True)
             self.logger.error("Error processing batch", exc_info=True)
             self._record_outcome(self._processed_counter, len(batch), error=e)
             if self._error_callback is not None:
@@ -346,9 +520,29 @@ class AsyncBatchQueue(Generic[T]):
                     self.logger.error("Error callback raised on batch", exc_info=True)
                     self._record_outcome(self._error_callback_counter, len(batch), error=e)
         else:
+            self._record_flush(len(batch), loop.time() - started_at, failed=False)
             self._record_outcome(self._processed_counter, len(batch), error=None)
         self._pending_item_count -= len(batch)
 
+    def _record_flush(self, batch_size: int, duration_s: float, failed: bool) -> None:
+        """Record a processed batch, and adapt the batch size to how long it took."""
+        attributes = {"queue_id": self.queue_id}
+        if self._batch_size_histogram is not None:
+            self._batch_size_histogram.record(batch_size, attributes)
+        if self._flush_duration_histogram is not None:
+            self._flush_duration_histogram.record(duration_s * 1000, attributes)
+        if self.target_flush_latency_s is None:
+            return
+
+        if failed or duration_s > self.target_flush_latency_s:
+            self.batch_size = max(self.min_batch_size, self.batch_size // 2)
+        elif batch_size >= self.batch_size and self._queue.qsize() >= self.batch_size:
+            self.batch_size = min(self.max_batch_size, self.batch_size + self.batch_size // 4 + 1)
+        else:
+            return
+        if self._target_size_gauge is not None:
+            self._target_size_gauge.set(self.batch_size, attributes)
+
     async def start(self) -> None:
         """Start the background batch loop.
 
@@ -364,40 +558,34 @@ class AsyncBatchQueue(Generic[T]):
             await asyncio.sleep(0)
 
     async def run(self) -> None:
-        """Run batch process. Collect batches until max batch size is reached,
+        """Run batch process. Collect batches until the batch size is reached,
         or configured collection wait period expires. When ready, batches are
-        processed serially; this makes it safe for sinks that should not
-        receive concurrent requests (e.g. an API at risk of overloading).
-        While a batch is processed, the next batch is collected concurrently.
-
-        On shutdown the loop stops collecting, finishes the in-flight request,
-        and drains the remaining queue one batch at a time (with no delay in
-        between collections). The overall shutdown duration is bounded by
-        ``stop()`` (via ``shutdown_deadline_s``).
+        processed, at most ``max_concurrent_batches`` at a time; by default that
+        is serially, which makes it safe for sinks that should not receive
+        concurrent requests (e.g. an API at risk of overloading).
+        While batches are processed, the next batch is collected concurrently.
+
+        On shutdown the loop stops collecting, and drains the remaining queue with
+        no delay in between collections, alongside the in-flight requests. The
+        overall shutdown duration is bounded by ``stop()`` (via
+        ``shutdown_deadline_s``).
         """
         self._is_running.set()
-        in_flight: asyncio.Task | None = None
         try:
             while not self._shutdown.is_set():
                 batch = await self._wait_for_batch()
-                # Ensure processing batches is done serially
-                if in_flight is not None:
-                    await in_flight
-                    in_flight = None
                 if batch:
-                    in_flight = asyncio.create_task(self._process(batch))
-            # On shutdown, finish the in-flight request and then drain the rest.
-            if in_flight is not None:
-                await in_flight
-                in_flight = None
+                    await self._dispatch(batch)
             await self._flush_all()
         finally:
             # If ``run()`` is cancelled (e.g. the shutdown deadline is exceeded),
-            # make sure the in-flight request does not outlive the batcher.
-            if in_flight is not None:
-                in_flight.cancel()
+            # make sure the in-flight requests do not outlive the batcher.
+            in_flight = list(self._in_flight)
+            for task in in_flight:
+                task.cancel()
+            for task in in_flight:
                 try:
-                    await in_flight
+                    await task
                 except asyncio.CancelledError, Exception:
                     pass
             self._is_running.clear()
@@ -13,6 +13,7 @@ def create_http_client(
     pool_timeout: float = 1.0,
     proxy: str | None = None,
     follow_redirects: bool = False,
+    http2: bool = False,
 ) -> AsyncClient:
     """Crete a new `httpx.AsyncClient` with common configurations.
 
@@ -24,6 +25,8 @@ def create_http_client(
       - `pool_timeout` {float}: The timeout for acquiring a connection from the pool.
       - `proxy` {str | None}: A proxy URL for this http client. The URL should look like:
         "http(s)://{your-proxy-host}:{port}".
+      - `follow_redirects` {bool}: Whether to follow redirects.
+      - `http2` {bool}: Whether to enable HTTP/2 support. Requires the `h2` package.
     Returns:
       - {AsyncClient}: An async HTTP client.
     """
@@ -33,4 +36,5 @@ def create_http_client(
         timeout=Timeout(request_timeout, connect=connect_timeout, pool=pool_timeout),
         proxy=Proxy(proxy) if proxy else None,
         follow_redirects=follow_redirects,
+        http2=http2,
     )
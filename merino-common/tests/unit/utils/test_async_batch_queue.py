@@ -12,9 +12,16 @@ import pytest
 from opentelemetry.sdk.metrics import MeterProvider
 from opentelemetry.sdk.metrics.export import InMemoryMetricReader
 
-from merino_common.testing.metrics import collect_metrics, find_point, number_points
+from merino_common.testing.metrics import (
+    collect_metrics,
+    find_point,
+    histogram_count,
+    histogram_points,
+    number_points,
+)
 from merino_common.utils.async_batch_queue import (
     AsyncBatchQueue,
+    OverflowPolicy,
     QueueFullException,
     QueueShutDownException,
 )
@@ -763,3 +770,262 @@ async def test_remaining_capacity_recovers_as_batches_are_collected() -> None:
 
     assert processed == [1, 2]
     assert batcher.remaining_capacity() == 2
+
+
+@pytest.mark.asyncio
+async def test_batches_run_concurrently_up_to_the_limit() -> None:
+    """With ``max_concurrent_batches`` set, batches overlap, but never more than the
+    limit at once.
+    """
+    concurrent = 0
+    max_concurrent = 0
+    processed: list[int] = []
+
+    async def on_batch(batch: list[int]) -> None:
+        nonlocal concurrent, max_concurrent
+        concurrent += 1
+        max_concurrent = max(max_concurrent, concurrent)
+        await asyncio.sleep(0.02)
+        concurrent -= 1
+        processed.extend(batch)
+
+    batcher: AsyncBatchQueue[int] = AsyncBatchQueue(
+        on_batch=on_batch,
+        max_batch_size=1,
+        collection_delay_s=LONG_COLLECTION_DELAY_S,
+        max_concurrent_batches=3,
+        meter_provider=None,
+    )
+    await batcher.start()
+    for i in range(12):
+        batcher.put(i)
+
+    async def all_processed() -> None:
+        while len(processed) < 12:
+            await asyncio.sleep(0.005)
+
+    await asyncio.wait_for(all_processed(), timeout=5.0)
+    await batcher.stop()
+
+    assert max_concurrent == 3
+    assert sorted(processed) == list(range(12))
+
+
+@pytest.mark.asyncio
+async def test_stop_drains_concurrently_and_awaits_every_batch() -> None:
+    """A graceful stop flushes the backlog across concurrent batches, and returns only
+    once all of them have finished.
+    """
+    processed: list[int] = []
+
+    async def on_batch(batch: list[int]) -> None:
+        await asyncio.sleep(0.02)
+        processed.extend(batch)
+
+    batcher: AsyncBatchQueue[int] = AsyncBatchQueue(
+        on_batch=on_batch,
+        max_batch_size=2,
+        collection_delay_s=LONG_COLLECTION_DELAY_S,
+        max_concurrent_batches=4,
+        meter_provider=None,
+    )
+    await batcher.start()
+    for i in range(15):
+        batcher.put(i)
+
+    await batcher.stop()
+
+    assert sorted(processed) == list(range(15))
+
+
+@pytest.mark.asyncio
+async def test_drop_oldest_evicts_to_make_room() -> None:
+    """Under ``DROP_OLDEST`` a full queue evicts its oldest item instead of rejecting
+    the new one, and counts the eviction.
+    """
+    reader = InMemoryMetricReader()
+    provider = MeterProvider(metric_readers=[reader])
+    processed: list[int] = []
+
+    async def on_batch(batch: list[int]) -> None:
+        processed.extend(batch)
+
+    batcher: AsyncBatchQueue[int] = AsyncBatchQueue(
+        on_batch=on_batch,
+        max_batch_size=3,
+        collection_delay_s=LONG_COLLECTION_DELAY_S,
+        max_queue_size=3,
+        overflow_policy=OverflowPolicy.DROP_OLDEST,
+        meter_provider=provider,
+    )
+    for i in range(5):
+        batcher.put(i)
+
+    await batcher.start()
+    await batcher.stop()
+
+    assert processed == [2, 3, 4]
+    metrics = collect_metrics(reader)
+    assert metrics["async_batch_queue.evicted.count"] == 2
+    assert metrics.get("async_batch_queue.rejected.count", 0) == 0
+
+
+@pytest.mark.asyncio
+async def test_put_wait_waits_for_room() -> None:
+    """Under ``AWAIT`` ``put_wait`` blocks on a full queue until a batch is collected."""
+    reader = InMemoryMetricReader()
+    provider = MeterProvider(metric_readers=[reader])
+    processed: list[int] = []
+
+    async def on_batch(batch: list[int]) -> None:
+        processed.extend(batch)
+
+    batcher: AsyncBatchQueue[int] = AsyncBatchQueue(
+        on_batch=on_batch,
+        max_batch_size=2,
+        collection_delay_s=LONG_COLLECTION_DELAY_S,
+        max_queue_size=2,
+        overflow_policy=OverflowPolicy.AWAIT,
+        overflow_deadline_s=5.0,
+        meter_provider=provider,
+    )
+    batcher.put(1)
+    batcher.put(2)
+    # A plain put() never waits, whatever the policy.
+    with pytest.raises(QueueFullException):
+        batcher.put(3)
+
+    waiting = asyncio.create_task(batcher.put_wait(3))
+    await asyncio.sleep(0)
+    assert not waiting.done()
+    await batcher.start()
+    await asyncio.wait_for(waiting, timeout=5.0)
+    await batcher.stop()
+
+    assert processed == [1, 2, 3]
+    assert find_point(reader, "async_batch_queue.rejected.count", **{"error.type": "queue_full"})
+    points = histogram_points(reader, "async_batch_queue.put_wait.duration")
+    assert [(point.attributes or {}).get("outcome") for point in points] == ["success"]
+
+
+@pytest.mark.asyncio
+async def test_put_wait_rejects_after_deadline() -> None:
+    """``put_wait`` gives up once ``overflow_deadline_s`` passes without room."""
+    reader = InMemoryMetricReader()
+    provider = MeterProvider(metric_readers=[reader])
+    batcher: AsyncBatchQueue[int] = AsyncBatchQueue(
+        on_batch=on_batch_noop,
+        max_batch_size=1,
+        collection_delay_s=LONG_COLLECTION_DELAY_S,
+        max_queue_size=1,
+        overflow_policy=OverflowPolicy.AWAIT,
+        overflow_deadline_s=0.05,
+        meter_provider=provider,
+    )
+    # Not started, so nothing ever makes room.
+    batcher.put(1)
+
+    with pytest.raises(QueueFullException):
+        await batcher.put_wait(2)
+
+    await batcher.stop(force=True)
+    point = find_point(
+        reader, "async_batch_queue.rejected.count", **{"error.type": "deadline_exceeded"}
+    )
+    assert point is not None
+    assert point.value == 1
+    assert histogram_count(reader, "async_batch_queue.put_wait.duration") == 1
+
+
+def test_min_batch_size_must_not_exceed_max() -> None:
+    """A ``min_batch_size`` above ``max_batch_size`` is rejected."""
+    with pytest.raises(ValueError):
+        AsyncBatchQueue(on_batch=on_batch_noop, max_batch_size=4, min_batch_size=8)
+
+
+@pytest.mark.asyncio
+async def test_adaptive_batch_size_shrinks_on_slow_flushes() -> None:
+    """Batches slower than ``target_flush_latency_s`` halve the batch size, down to
+    ``min_batch_size``.
+    """
+    sizes: list[int] = []
+
+    async def on_batch(batch: list[int]) -> None:
+        sizes.append(len(batch))
+        await asyncio.sleep(0.03)
+
+    batcher: AsyncBatchQueue[int] = AsyncBatchQueue(
+        on_batch=on_batch,
+        max_batch_size=16,
+        min_batch_size=4,
+        target_flush_latency_s=0.01,
+        collection_delay_s=LONG_COLLECTION_DELAY_S,
+        meter_provider=None,
+    )
+    for i in range(64):
+        batcher.put(i)
+    await batcher.start()
+    await batcher.stop()
+
+    # The next batch is collected while one is in flight, so each resize applies one
+    # batch later.
+    assert sizes[:4] == [16, 16, 8, 4]
+    assert set(sizes[4:]) == {4}
+    assert batcher.batch_size == 4
+
+
+@pytest.mark.asyncio
+async def test_adaptive_batch_size_shrinks_on_failures() -> None:
+    """A failed batch halves the batch size."""
+
+    async def on_batch(batch: list[int]) -> None:
+        raise ValueError("boom")
+
+    batcher: AsyncBatchQueue[int] = AsyncBatchQueue(
+        on_batch=on_batch,
+        max_batch_size=16,
+        target_flush_latency_s=5.0,
+        collection_delay_s=LONG_COLLECTION_DELAY_S,
+        meter_provider=None,
+    )
+    for i in range(16):
+        batcher.put(i)
+    await batcher.start()
+    await batcher.stop()
+
+    assert batcher.batch_size == 8
+
+
+@pytest.mark.asyncio
+async def test_adaptive_batch_size_grows_back_under_backlog() -> None:
+    """Fast full batches grow the batch size back towards ``max_batch_size`` while a
+    backlog remains, and it reports its target on the gauge.
+    """
+    reader = InMemoryMetricReader()
+    provider = MeterProvider(metric_readers=[reader])
+    sizes: list[int] = []
+
+    async def on_batch(batch: list[int]) -> None:
+        sizes.append(len(batch))
+
+    batcher: AsyncBatchQueue[int] = AsyncBatchQueue(
+        on_batch=on_batch,
+        max_batch_size=16,
+        min_batch_size=2,
+        target_flush_latency_s=5.0,
+        collection_delay_s=LONG_COLLECTION_DELAY_S,
+        meter_provider=provider,
+    )
+    batcher.batch_size = 2
+    for i in range(200):
+        batcher.put(i)
+    await batcher.start()
+    await batcher.stop()
+
+    peak = sizes.index(16)
+    assert sizes[: peak + 1] == sorted(sizes[: peak + 1])
+    assert sizes[0] == 2
+    assert sum(sizes) == 200
+    assert collect_metrics(reader)["async_batch_queue.batch.target_size"] == 16
+    assert histogram_count(reader, "async_batch_queue.batch.size") == len(sizes)
+    assert histogram_count(reader, "async_batch_queue.flush.duration") == len(sizes)
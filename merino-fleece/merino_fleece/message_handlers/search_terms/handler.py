@@ -1,18 +1,16 @@
 """The message handler for background search term sanitization."""
 
 import logging
-from collections import Counter
 from collections.abc import Awaitable, Callable
 
 from merino_common.models.suggest_logging import SuggestRequestParams
 from merino_common.utils.async_batch_queue import AsyncBatchQueue
-from merino_common.utils.query_processing.pii_detect import PIIType, basic_detect
-from opentelemetry import metrics
+from merino_common.utils.query_processing.pii_detect import PIIType
 
 from merino_fleece.configs import settings
 from merino_fleece.pii import detect_person_batch, get_detector, get_executor
 from merino_fleece.utils.log_data_creator import create_search_term_log
-from merino_fleece.sanitize import exempts
+from merino_fleece.sanitize.classifier import QueryClassifier
 
 # identifier used to tag the queue's metrics.
 QUEUE_ID = "search_term_sanitization"
@@ -25,13 +23,6 @@ logger = logging.getLogger(__name__)
 # web.suggest.sanitized is used for search terms that sanitization clears as NON_PII.
 sanitized_term_logger = logging.getLogger("web.suggest.sanitized")
 
-_meter = metrics.get_meter("fleece")
-_sanitize_counter = _meter.create_counter(
-    name="search_terms.sanitize",
-    unit="{item}",
-    description="Number of search terms sanitized, labeled by the detected PII type.",
-)
-
 
 class MessageHandler:
     """Buffers submitted search terms and sanitizes them in batches.
@@ -49,6 +40,7 @@ class MessageHandler:
         on_batch: (Callable[[list[SuggestRequestParams]], Awaitable[object]] | None) = None,
     ) -> None:
         self._on_batch = on_batch
+        self._classifier = QueryClassifier(settings.sanitize.verdict_cache_size)
         self._queue: AsyncBatchQueue[SuggestRequestParams] | None = None
 
     async def start(self) -> None:
@@ -103,9 +95,10 @@ class MessageHandler:
     async def sanitize_batch(self, batch: list[SuggestRequestParams]) -> None:
         """Classify the PII type of every search term in the batch and record it in metrics.
 
-        Queries covered by a registered sanitization exempt short-circuit to
-        ``NON_PII`` before any detection runs. Of the rest, cheap pattern matching runs
-        over every query first; only the queries it clears reach SpaCy NER, which is
+        Classification is staged so SpaCy NER only sees the queries nothing cheaper can
+        settle: queries covered by a registered sanitization exempt short-circuit to
+        ``NON_PII``, queries NER has classified before reuse the cached verdict, and
+        pattern matching flags emails and numerics. The remaining distinct queries are
         batched via ``detect_person_batch``. The NER pass is chunked so the shared thread
         pool is released between chunks and concurrent `/pii` requests are not stuck
         behind one long batch.
@@ -120,45 +113,18 @@ class MessageHandler:
         ``PIIType.NON_PII`` is emitted to ``web.suggest.sanitized``. Terms of any other
         PII type are never logged, nor are terms without a query.
         """
-        types: list[PIIType] = []
-        # Queries still needing NER, and their positions in `types`.
-        candidates: list[str] = []
-        candidate_indices: list[int] = []
-
-        for term in batch:
-            query = term.query or ""
-
-            # Exemption wins over detection by definition, and is the cheaper check.
-            if query and exempts.is_exempt(query):
-                types.append(PIIType.NON_PII)
-                continue
-
-            pii_type = basic_detect(query)
-            if pii_type is PIIType.NON_PII and query:
-                candidate_indices.append(len(types))
-                candidates.append(query)
-            types.append(pii_type)
-
-        if candidates:
+        triage = self._classifier.triage([term.query or "" for term in batch])
+
+        verdicts: list[bool] = []
+        if triage.candidates:
             detector = get_detector()
             executor = get_executor()
             chunk_size = settings.sanitize.ner_chunk_size
-            for start in range(0, len(candidates), chunk_size):
-                indices = candidate_indices[start : start + chunk_size]
-                verdicts = await detect_person_batch(
-                    candidates[start : start + chunk_size], detector, executor
+            for start in range(0, len(triage.candidates), chunk_size):
+                verdicts += await detect_person_batch(
+                    triage.candidates[start : start + chunk_size], detector, executor
                 )
-                # `detect_person_batch` preserves input order, so verdicts align
-                # positionally with `indices`. strict=True makes any future
-                # violation of that contract fail loudly rather than mislabel terms.
-                for index, is_person in zip(indices, verdicts, strict=True):
-                    if is_person:
-                        types[index] = PIIType.PERSON
-
-        # Aggregate before recording so a 512-term batch costs one counter add per
-        # distinct PII type rather than one per term.
-        for type_name, count in Counter(pii_type.name.lower() for pii_type in types).items():
-            _sanitize_counter.add(count, {"type": type_name})
+        types = self._classifier.resolve(triage, verdicts)
 
         # Log _only_ the sanitized search terms (i.e. those of PIIType.NON_PII)
         if LOG_SEARCH_TERMS:
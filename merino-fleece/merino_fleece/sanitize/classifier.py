@@ -0,0 +1,180 @@
+"""Staged classification of search terms by PII type.
+
+NER is by far the most expensive step of sanitization, so each query goes through
+cheaper stages first and only reaches the model if none of them settles it:
+
+1. ``exempt``: queries covered by a registered sanitization exempt are ``NON_PII``.
+2. ``cache``: queries that NER has already classified reuse its verdict.
+3. ``pattern``: ``basic_detect`` flags emails and numerics; empty queries are ``NON_PII``.
+4. ``ner``: the remaining queries are deduplicated and handed to the detector as a batch.
+
+Classification is split into :meth:`QueryClassifier.triage`, which runs the cheap stages,
+and :meth:`QueryClassifier.resolve`, which takes the NER verdicts. That lets callers run
+NER however suits them: the worker synchronously on its thread pool, the HTTP handler in
+chunks off the event loop.
+"""
+
+import threading
+from collections import Counter, OrderedDict
+from dataclasses import dataclass, field
+from enum import StrEnum
+
+from merino_common.utils.query_processing.pii_detect import PIIType, basic_detect
+from opentelemetry import metrics
+
+from merino_fleece.pii.detector import PiiDetector
+from merino_fleece.sanitize import exempts
+
+# Max number of NER verdicts to keep. A verdict costs roughly the size of its query.
+DEFAULT_VERDICT_CACHE_SIZE = 50_000
+
+_meter = metrics.get_meter("fleece")
+_sanitize_counter = _meter.create_counter(
+    name="search_terms.sanitize",
+    unit="{item}",
+    description="Number of search terms sanitized, labeled by the detected PII type.",
+)
+_stage_counter = _meter.create_counter(
+    name="search_terms.sanitize.stage",
+    unit="{item}",
+    description="Number of search terms classified, labeled by the stage that settled them.",
+)
+
+
+class Stage(StrEnum):
+    """The classification stages, in the order they run."""
+
+    EXEMPT = "exempt"
+    CACHE = "cache"
+    PATTERN = "pattern"
+    NER = "ner"
+
+
+class VerdictCache:
+    """Bounded, thread-safe LRU map from queries to the PII type NER found in them.
+
+    Only NER verdicts are stored: every other stage is cheaper than a cache entry is
+    worth. A `max_size` of 0 disables the cache.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        self._verdicts: OrderedDict[str, PIIType] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._verdicts)
+
+    def get(self, query: str) -> PIIType | None:
+        """Return the cached verdict for the query, marking it as recently used."""
+        with self._lock:
+            verdict = self._verdicts.get(query)
+            if verdict is not None:
+                self._verdicts.move_to_end(query)
+            return verdict
+
+    def update(self, verdicts: dict[str, PIIType]) -> None:
+        """Store verdicts, evicting the least recently used ones beyond `max_size`."""
+        if self.max_size <= 0:
+            return
+        with self._lock:
+            for query, verdict in verdicts.items():
+                self._verdicts[query] = verdict
+                self._verdicts.move_to_end(query)
+            while len(self._verdicts) > self.max_size:
+                self._verdicts.popitem(last=False)
+
+
+@dataclass
+class Triage:
+    """The outcome of the cheap stages for a batch of queries.
+
+    Attributes:
+        queries: The classified queries.
+        types: The PII type of each query, None where it is left to NER.
+        candidates: The distinct queries left to NER, in first-seen order.
+        stages: The number of queries settled by each stage so far.
+    """
+
+    queries: list[str]
+    types: list[PIIType | None]
+    candidates: list[str]
+    stages: Counter[Stage] = field(default_factory=Counter)
+
+
+class QueryClassifier:
+    """Classify queries by PII type, running NER only on queries no cheaper stage settles.
+
+    Args:
+        cache_size: Max number of NER verdicts to keep for reuse. 0 disables the cache.
+    """
+
+    def __init__(self, cache_size: int = DEFAULT_VERDICT_CACHE_SIZE) -> None:
+        self.cache = VerdictCache(cache_size)
+
+    def triage(self, queries: list[str]) -> Triage:
+        """Run the exempt, cache and pattern stages over the queries."""
+        triage = Triage(queries=queries, types=[], candidates=[])
+        candidates: dict[str, None] = {}
+
+        for query in queries:
+            # Exemption wins over detection by definition, and is the cheapest check.
+            if query and exempts.is_exempt(query):
+                triage.types.append(PIIType.NON_PII)
+                triage.stages[Stage.EXEMPT] += 1
+                continue
+
+            if query and (verdict := self.cache.get(query)) is not None:
+                triage.types.append(verdict)
+                triage.stages[Stage.CACHE] += 1
+                continue
+
+            pii_type = basic_detect(query)
+            if pii_type is PIIType.NON_PII and query:
+                triage.types.append(None)
+                candidates[query] = None
+                continue
+            triage.types.append(pii_type)
+            triage.stages[Stage.PATTERN] += 1
+
+        triage.candidates = list(candidates)
+        return triage
+
+    def resolve(self, triage: Triage, verdicts: list[bool]) -> list[PIIType]:
+        """Apply NER verdicts to the candidates of a triage and return the type of every
+        query, in input order. Cache the verdicts and record the classification metrics.
+
+        `verdicts` must hold one verdict per candidate, in the candidates' order.
+        """
+        ner_types = {
+            query: PIIType.PERSON if is_person else PIIType.NON_PII
+            # strict=True makes a detector that drops or reorders verdicts fail loudly
+            # rather than mislabel queries.
+            for query, is_person in zip(triage.candidates, verdicts, strict=True)
+        }
+        self.cache.update(ner_types)
+
+        types: list[PIIType] = []
+        for query, pii_type in zip(triage.queries, triage.types, strict=True):
+            if pii_type is None:
+                pii_type = ner_types[query]
+                triage.stages[Stage.NER] += 1
+            types.append(pii_type)
+
+        # Aggregate before recording so a 512-term batch costs one counter add per
+        # distinct stage and PII type rather than one per term.
+        for stage, count in triage.stages.items():
+            _stage_counter.add(count, {"stage": stage.value})
+        for type_name, count in Counter(pii_type.name.lower() for pii_type in types).items():
+            _sanitize_counter.add(count, {"type": type_name})
+        return types
+
+    def classify(self, queries: list[str], detector: PiiDetector) -> list[PIIType]:
+        """Return the PII type of each query, in input order.
+
+        Runs NER synchronously, in a single ``PiiDetector.is_person_batch`` call; run it
+        off any event loop.
+        """
+        triage = self.triage(queries)
+        verdicts = detector.is_person_batch(triage.candidates) if triage.candidates else []
+        return self.resolve(triage, verdicts)
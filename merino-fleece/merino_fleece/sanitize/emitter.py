@@ -8,3 +8,11 @@ def emit_sanitized_query(submission: SanitizedSuggestRequest) -> None:
     placeholder to be implemented in a follow-up ticket.
     """
     pass
+
+
+def emit_sanitized_queries(submissions: list[SanitizedSuggestRequest]) -> None:
+    """Emit a batch of sanitized search terms in one call, so a sink that supports bulk
+    writes can be used for the whole batch once emission is implemented.
+    """
+    for submission in submissions:
+        emit_sanitized_query(submission)
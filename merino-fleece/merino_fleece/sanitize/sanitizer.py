@@ -1,10 +1,27 @@
 """Sanitization utilities for search term submissions."""
 
-from merino_fleece.sanitize.models import SanitizedSuggestRequest
-
 from merino_common.models.suggest_logging import SuggestRequestParams
+from merino_common.utils.query_processing.pii_detect import PIIType
+
+from merino_fleece.pii.detector import PiiDetector
+from merino_fleece.sanitize.classifier import QueryClassifier
+from merino_fleece.sanitize.models import SanitizedSuggestRequest
 
 
 def sanitize_query(query: SuggestRequestParams) -> SanitizedSuggestRequest:
     """Sanitize query text; placeholder to be implemented in a follow-up ticket."""
     return SanitizedSuggestRequest(**query.model_dump(exclude={"query"}), query=query.query)
+
+
+def sanitize_queries(
+    terms: list[SuggestRequestParams], classifier: QueryClassifier, detector: PiiDetector
+) -> list[SanitizedSuggestRequest]:
+    """Classify a batch of search terms and return those found to hold no PII, sanitized
+    and in input order. Terms of any other PII type are dropped.
+    """
+    types = classifier.classify([term.query or "" for term in terms], detector)
+    return [
+        sanitize_query(term)
+        for term, pii_type in zip(terms, types, strict=True)
+        if pii_type is PIIType.NON_PII
+    ]
@@ -0,0 +1,263 @@
+"""Cross-message micro-batching of search terms for the Pub/Sub worker.
+
+Pub/Sub delivers each submission to its own callback, and a submission usually holds
+only a handful of search terms. Running NER per submission would pay the model's
+per-call overhead for every message, so the batcher pools the terms of many in-flight
+messages and sanitizes them together: one classification pass over the pooled terms
+on the shared NER thread pool, running NER on only the terms that no cheaper stage
+settles, then one bulk emission. A message is acked once every one of its terms has
+been sanitized and emitted, or nacked for redelivery if any of its batches failed.
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import Executor, Future, wait
+from dataclasses import dataclass
+
+from google.cloud.pubsub_v1.subscriber.message import Message
+from merino_common.models.suggest_logging import SearchTermsSubmission, SuggestRequestParams
+from opentelemetry import metrics
+from pydantic import ValidationError
+
+from merino_fleece.pii import get_detector, get_executor
+from merino_fleece.pii.detector import PiiDetector
+from merino_fleece.sanitize.classifier import QueryClassifier
+from merino_fleece.sanitize.emitter import emit_sanitized_queries
+from merino_fleece.sanitize.sanitizer import sanitize_queries
+
+logger = logging.getLogger(__name__)
+
+# Max number of search terms sanitized in a single batch.
+DEFAULT_MAX_TERMS = 256
+
+# Max milliseconds a search term waits for its batch to fill before a partial batch
+# is sanitized.
+DEFAULT_MAX_DELAY_MS = 50
+
+# Max number of batches queued on or running in the NER thread pool at once.
+DEFAULT_MAX_IN_FLIGHT_BATCHES = 2
+
+_meter = metrics.get_meter("fleece")
+_batch_size = _meter.create_histogram(
+    name="sanitize.worker.batch.size",
+    unit="{item}",
+    description="Number of search terms sanitized per batch by the Pub/Sub worker.",
+)
+_batch_duration = _meter.create_histogram(
+    name="sanitize.worker.batch.duration",
+    unit="ms",
+    description="Duration of sanitizing and emitting a batch of search terms in milliseconds.",
+)
+_message_counter = _meter.create_counter(
+    name="sanitize.worker.messages",
+    unit="{message}",
+    description="Number of Pub/Sub messages settled by the worker, labeled by outcome.",
+)
+
+
+@dataclass
+class _PendingMessage:
+    """A message whose search terms are still being sanitized."""
+
+    message: Message
+    remaining: int
+    failed: bool = False
+
+
+class TermBatcher:
+    """Pool search terms across Pub/Sub messages and sanitize them in batches.
+
+    `submit` is the streaming pull callback. It only decodes the message and buffers
+    its terms, so the subscriber's callback threads are never held up by NER. A
+    flusher thread cuts a batch once `max_terms` terms are buffered or the oldest
+    buffered term has waited `max_delay_ms`, and hands it to the NER thread pool.
+    At most `max_in_flight_batches` batches are handed over at once; past that the
+    flusher waits, and terms keep pooling into larger batches. The subscriber's flow
+    control bounds the number of buffered messages.
+
+    Args:
+        max_terms: Max number of search terms sanitized in a single batch.
+        max_delay_ms: Max milliseconds to wait for a batch to fill.
+        max_in_flight_batches: Max number of batches handed to the thread pool at once.
+        detector: The PII detector. Defaults to the process-wide detector.
+        executor: The thread pool to sanitize batches on. Defaults to the process-wide
+            NER thread pool.
+        classifier: Classifies search terms by PII type. Defaults to a classifier with
+            a verdict cache of the default size.
+    """
+
+    def __init__(
+        self,
+        max_terms: int = DEFAULT_MAX_TERMS,
+        max_delay_ms: int = DEFAULT_MAX_DELAY_MS,
+        max_in_flight_batches: int = DEFAULT_MAX_IN_FLIGHT_BATCHES,
+        detector: PiiDetector | None = None,
+        executor: Executor | None = None,
+        classifier: QueryClassifier | None = None,
+    ) -> None:
+        self.max_terms = max_terms
+        self.max_delay_s = max_delay_ms / 1000
+        self._detector = detector
+        self._executor = executor
+        self.classifier = classifier or QueryClassifier()
+        self._condition = threading.Condition()
+        self._buffer: list[tuple[_PendingMessage, SuggestRequestParams]] = []
+        # Monotonic time at which the oldest buffered term was submitted.
+        self._buffered_at = 0.0
+        self._in_flight: set[Future[None]] = set()
+        self._slots = threading.BoundedSemaphore(max_in_flight_batches)
+        # Guards the remaining term counts of pending messages across batches.
+        self._settle_lock = threading.Lock()
+        self._flusher: threading.Thread | None = None
+        self._stopping = False
+
+    def start(self) -> None:
+        """Start the flusher thread. No-op if it is already running."""
+        with self._condition:
+            if self._flusher is not None:
+                return
+            self._stopping = False
+            self._flusher = threading.Thread(
+                target=self._flush_loop, name="fleece-batcher", daemon=True
+            )
+            self._flusher.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        """Sanitize every buffered term, then stop the flusher thread.
+
+        Blocks until the in-flight batches are done and their messages settled, or until
+        `timeout` seconds have passed. Messages submitted from now on are nacked.
+        """
+        with self._condition:
+            flusher = self._flusher
+            self._stopping = True
+            self._condition.notify_all()
+        if flusher is None:
+            return
+        deadline = None if timeout is None else time.monotonic() + timeout
+        flusher.join(timeout)
+        with self._condition:
+            in_flight = list(self._in_flight)
+            if not flusher.is_alive():
+                self._flusher = None
+        wait(in_flight, None if deadline is None else max(deadline - time.monotonic(), 0))
+
+    def submit(self, message: Message) -> None:
+        """Decode a message and buffer its search terms for sanitization.
+
+        Invalid messages are dropped and acked, since redelivering them cannot succeed.
+        Messages without search terms are acked right away.
+        """
+        try:
+            submission = SearchTermsSubmission.model_validate_json(message.data)
+        except ValidationError:
+            logger.exception("Dropping invalid message")
+            self._settle(message, "dropped")
+            return
+
+        if not submission.search_terms:
+            self._settle(message, "ack")
+            return
+
+        pending = _PendingMessage(message, remaining=len(submission.search_terms))
+        with self._condition:
+            if self._stopping:
+                self._settle(message, "nack")
+                return
+            # Wake the flusher to start timing a new batch, or to cut a full one.
+            if not self._buffer:
+                self._buffered_at = time.monotonic()
+                self._condition.notify()
+            self._buffer.extend((pending, term) for term in submission.search_terms)
+            if len(self._buffer) >= self.max_terms:
+                self._condition.notify()
+
+    def _flush_loop(self) -> None:
+        """Cut batches from the buffer and dispatch them until stopped and drained."""
+        while (batch := self._next_batch()) is not None:
+            self._dispatch(batch)
+
+    def _next_batch(self) -> list[tuple[_PendingMessage, SuggestRequestParams]] | None:
+        """Wait for a full batch, or for the oldest buffered term to time out.
+
+        Returns None once the batcher is stopping and the buffer is empty.
+        """
+        with self._condition:
+            while not self._buffer:
+                if self._stopping:
+                    return None
+                self._condition.wait()
+            while len(self._buffer) < self.max_terms and not self._stopping:
+                remaining = self._buffered_at + self.max_delay_s - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._condition.wait(remaining)
+            # Any leftover terms keep the submission time of the batch, which makes
+            # them overdue, so they are cut into the next batch without waiting.
+            batch = self._buffer[: self.max_terms]
+            del self._buffer[: self.max_terms]
+            return batch
+
+    def _dispatch(self, batch: list[tuple[_PendingMessage, SuggestRequestParams]]) -> None:
+        """Hand a batch to the thread pool once a slot is free."""
+        self._slots.acquire()
+        try:
+            future = (self._executor or get_executor()).submit(self._process, batch)
+        except Exception:
+            self._slots.release()
+            logger.exception("Failed to dispatch batch of search terms")
+            self._complete(batch, failed=True)
+            return
+        with self._condition:
+            self._in_flight.add(future)
+        future.add_done_callback(self._release)
+
+    def _release(self, future: Future[None]) -> None:
+        """Free the slot of a finished batch."""
+        with self._condition:
+            self._in_flight.discard(future)
+        self._slots.release()
+
+    def _process(self, batch: list[tuple[_PendingMessage, SuggestRequestParams]]) -> None:
+        """Sanitize and emit a batch of search terms, then settle the messages it completes.
+
+        Runs on the thread pool. A failure nacks every message with terms in the batch.
+        """
+        started_at = time.perf_counter()
+        failed = False
+        try:
+            sanitized = sanitize_queries(
+                [term for _, term in batch], self.classifier, self._detector or get_detector()
+            )
+            emit_sanitized_queries(sanitized)
+        except Exception:
+            logger.exception("Failed to sanitize batch of search terms")
+            failed = True
+        finally:
+            _batch_size.record(len(batch))
+            _batch_duration.record((time.perf_counter() - started_at) * 1000)
+        self._complete(batch, failed)
+
+    def _complete(
+        self, batch: list[tuple[_PendingMessage, SuggestRequestParams]], failed: bool
+    ) -> None:
+        """Count the batch's terms as done, and settle the messages left with none."""
+        done: list[_PendingMessage] = []
+        with self._settle_lock:
+            for pending, _ in batch:
+                pending.failed |= failed
+                pending.remaining -= 1
+                if pending.remaining == 0:
+                    done.append(pending)
+        for pending in done:
+            self._settle(pending.message, "nack" if pending.failed else "ack")
+
+    @staticmethod
+    def _settle(message: Message, outcome: str) -> None:
+        """Ack or nack a message and count the outcome. Dropped messages are acked."""
+        if outcome == "nack":
+            message.nack()
+        else:
+            message.ack()
+        _message_counter.add(1, {"outcome": outcome})
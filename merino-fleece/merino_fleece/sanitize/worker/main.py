@@ -3,6 +3,9 @@
 import signal
 import logging
 
+from merino_fleece.pii import init_detector, init_executor, shutdown_executor
+from merino_fleece.sanitize.classifier import QueryClassifier
+from merino_fleece.sanitize.worker.batcher import TermBatcher
 from merino_fleece.sanitize.worker.worker import FleeceQueueWorker
 from merino_fleece.configs import settings
 
@@ -12,16 +15,32 @@ restart_backoff = settings.pubsub.restart_backoff
 # Normalize to None if path is empty (disabled)
 heartbeat_path = settings.pubsub.heartbeat_path or None
 heartbeat_interval = settings.pubsub.heartbeat_interval
+batch_max_terms = settings.pubsub.batch_max_terms
+batch_max_delay_ms = settings.pubsub.batch_max_delay_ms
+batch_max_in_flight = settings.pubsub.batch_max_in_flight
+drain_timeout = settings.pubsub.drain_timeout
+verdict_cache_size = settings.sanitize.verdict_cache_size
 
 logger = logging.getLogger(__name__)
 
 if __name__ == "__main__":
+    # Search terms are sanitized on the same detector and NER thread pool as the API.
+    init_detector()
+    init_executor()
+
     worker = FleeceQueueWorker(
         subscription_name=subscription,
         restart_stream=restart_stream,
         restart_backoff=restart_backoff,
         heartbeat_path=heartbeat_path,
         heartbeat_interval=heartbeat_interval,
+        batcher=TermBatcher(
+            max_terms=batch_max_terms,
+            max_delay_ms=batch_max_delay_ms,
+            max_in_flight_batches=batch_max_in_flight,
+            classifier=QueryClassifier(verdict_cache_size),
+        ),
+        drain_timeout=drain_timeout,
     )
 
     def handle_exit(signum, frame):
@@ -35,4 +54,7 @@ if __name__ == "__main__":
     signal.signal(signal.SIGTERM, handle_exit)
     signal.signal(signal.SIGINT, handle_exit)
 
-    worker.start()
+    try:
+        worker.start()
+    finally:
+        shutdown_executor()
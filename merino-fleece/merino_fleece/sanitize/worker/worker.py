@@ -6,13 +6,9 @@ import threading
 import time
 
 import google.cloud.pubsub_v1 as pubsub_v1
-from google.cloud.pubsub_v1.subscriber.message import Message
 from google.cloud.pubsub_v1.types import SubscriberOptions
-from merino_common.models.suggest_logging import SearchTermsSubmission
-from pydantic import ValidationError
 
-from merino_fleece.sanitize.emitter import emit_sanitized_query
-from merino_fleece.sanitize.sanitizer import sanitize_query
+from merino_fleece.sanitize.worker.batcher import TermBatcher
 
 logger = logging.getLogger(__name__)
 
@@ -22,27 +18,17 @@ DEFAULT_RECONNECT_DELAY_SECONDS = 5
 # Seconds between heartbeat file refreshes.
 DEFAULT_HEARTBEAT_INTERVAL_SECONDS = 10
 
-
-def callback(message: Message) -> None:
-    """Handle an incoming Pub/Sub message: sanitize then emit its search terms."""
-    try:
-        submission = SearchTermsSubmission.model_validate_json(message.data)
-        for query in submission.search_terms:
-            sanitized = sanitize_query(query)
-            emit_sanitized_query(sanitized)
-    except ValidationError:
-        logger.exception("Dropping invalid message")
-    # TODO: Any additional exception handling as needed if encounter
-    # error during sanitization or emission, once methods are defined
-    # Should be caught and `nacked` for redelivery if not fatal
-    message.ack()
+# Seconds to wait for buffered search terms to be sanitized when stopping.
+DEFAULT_DRAIN_TIMEOUT_SECONDS = 20
 
 
 class FleeceQueueWorker:
     """Streaming-pull worker that consumes and processes search term submissions.
 
     Wraps a Pub/Sub `SubscriberClient` and blocks on a streaming pull until the
-    subscription is cancelled via `stop` or an error interrupts the stream.
+    subscription is cancelled via `stop` or an error interrupts the stream. Messages
+    are handed to a `TermBatcher`, which sanitizes the search terms of many messages
+    together and acks each message once its terms are done.
 
     Args:
         subscription_name: Fully-qualified Pub/Sub subscription path
@@ -55,6 +41,10 @@ class FleeceQueueWorker:
             external liveness probe (e.g. for k8s). Parent directories are created on
             demand. When None, the heartbeat is disabled.
         heartbeat_interval: Seconds between heartbeat refreshes.
+        batcher: Batches the search terms of received messages for sanitization.
+            Defaults to a `TermBatcher` on the process-wide PII detector and thread pool.
+        drain_timeout: Seconds `stop` waits for buffered search terms to be sanitized
+            and their messages acked before cancelling the streaming pull.
     """
 
     def __init__(
@@ -64,12 +54,16 @@ class FleeceQueueWorker:
         restart_backoff: int = DEFAULT_RECONNECT_DELAY_SECONDS,
         heartbeat_path: str | None = None,
         heartbeat_interval: int = DEFAULT_HEARTBEAT_INTERVAL_SECONDS,
+        batcher: TermBatcher | None = None,
+        drain_timeout: float = DEFAULT_DRAIN_TIMEOUT_SECONDS,
     ) -> None:
         self.subscription_name = subscription_name
         self.restart_stream = restart_stream
         self.restart_backoff = restart_backoff
         self.heartbeat_path = heartbeat_path
         self.heartbeat_interval = heartbeat_interval
+        self.batcher = batcher or TermBatcher()
+        self.drain_timeout = drain_timeout
         self._stopping = False
         self._heartbeat_stop = threading.Event()
         self._connect()
@@ -90,20 +84,29 @@ class FleeceQueueWorker:
             "Listening for messages",
             extra={"subscription_name": self.subscription_name},
         )
-        while True:
-            errored = self._process_messages()
-            # Restart on error, if not stopped manually and restart behavior is enabled
-            if not errored or not self.restart_stream or self._stopping:
-                return
-            time.sleep(self.restart_backoff)
-            self.restart()
+        self.batcher.start()
+        try:
+            while True:
+                errored = self._process_messages()
+                # Restart on error, if not stopped manually and restart behavior is enabled
+                if not errored or not self.restart_stream or self._stopping:
+                    return
+                time.sleep(self.restart_backoff)
+                self.restart()
+        finally:
+            self.batcher.stop(self.drain_timeout)
 
     def stop(self) -> None:
         """Cancel the streaming pull, draining in-flight callbacks before shutdown.
-        If heartbeat is enabled, wake the heartbeat thread so it exits promptly.
+
+        Buffered search terms are sanitized first, bounded by `drain_timeout`, so their
+        messages are acked while the stream is still open; messages received meanwhile
+        are nacked for redelivery. If heartbeat is enabled, wake the heartbeat thread so
+        it exits promptly.
         """
         self._stopping = True
         self._heartbeat_stop.set()
+        self.batcher.stop(self.drain_timeout)
         self._future.cancel()
 
     def _heartbeat_loop(self) -> None:
@@ -166,7 +169,7 @@ class FleeceQueueWorker:
         )
         self._future = self.subscriber.subscribe(
             self.subscription_name,
-            callback=callback,
+            callback=self.batcher.submit,
             await_callbacks_on_shutdown=True,
         )
 
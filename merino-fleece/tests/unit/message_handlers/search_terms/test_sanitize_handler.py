@@ -14,6 +14,7 @@ from merino_common.testing.metrics import number_points
 from merino_common.utils.async_batch_queue import QueueFullException
 from merino_fleece.message_handlers.search_terms import handler as handler_module
 from merino_fleece.message_handlers.search_terms.handler import MessageHandler
+from merino_fleece.sanitize import classifier as classifier_module
 from merino_fleece.sanitize import exempts
 
 ParamsFactory = Callable[[str | None], SuggestRequestParams]
@@ -284,7 +285,7 @@ async def test_exempt_terms_skip_detection(
     `non_pii` would not prove anything.
     """
     register_exempt("firefox accounts")
-    basic_detect = mocker.spy(handler_module, "basic_detect")
+    basic_detect = mocker.spy(classifier_module, "basic_detect")
     before = counter_by_type(metric_reader)
 
     await MessageHandler().sanitize_batch([params("firefox accounts")])
@@ -376,6 +377,30 @@ async def test_ner_is_chunked(
     assert delta(before, after, "non_pii") == 4
 
 
+@pytest.mark.asyncio
+async def test_repeated_queries_reach_ner_once(
+    detector: RecordingDetector,
+    params: ParamsFactory,
+    metric_reader: InMemoryMetricReader,
+) -> None:
+    """A query repeated within and across batches is handed to NER only once.
+
+    Every occurrence is still counted under its type: deduplication saves detection
+    work, not terms.
+    """
+    detector.verdicts["barack obama"] = True
+    handler = MessageHandler()
+    before = counter_by_type(metric_reader)
+
+    await handler.sanitize_batch([params("barack obama"), params("barack obama")])
+    await handler.sanitize_batch([params("barack obama"), params("best pizza")])
+
+    after = counter_by_type(metric_reader)
+    assert delta(before, after, "person") == 3
+    assert delta(before, after, "non_pii") == 1
+    assert detector.batch_calls == [["barack obama"], ["best pizza"]]
+
+
 @pytest.mark.asyncio
 async def test_empty_batch_skips_detection(detector: RecordingDetector) -> None:
     """An empty batch does no work and records nothing."""
@@ -0,0 +1,164 @@
+"""Unit tests for merino_fleece.sanitize.classifier."""
+
+from collections.abc import Iterator
+
+import pytest
+from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+
+from merino_common.testing.metrics import number_points
+from merino_common.utils.query_processing.pii_detect import PIIType
+
+from merino_fleece.sanitize import exempts
+from merino_fleece.sanitize.classifier import QueryClassifier, Stage, VerdictCache
+
+STAGE_METRIC = "search_terms.sanitize.stage"
+
+
+class RecordingDetector:
+    """Detector flagging queries that contain "john", recording each batch it is given."""
+
+    def __init__(self) -> None:
+        self.batches: list[list[str]] = []
+
+    def is_person_batch(self, texts: list[str]) -> list[bool]:
+        """Return whether each text mentions "john"."""
+        self.batches.append(list(texts))
+        return ["john" in text for text in texts]
+
+
+class StubExempt:
+    """Exempt stub covering a fixed set of search terms."""
+
+    def __init__(self, *terms: str) -> None:
+        self.terms = set(terms)
+
+    async def initialize(self) -> None:
+        """Nothing to bootstrap."""
+
+    async def shutdown(self) -> None:
+        """Nothing to tear down."""
+
+    def is_exempt(self, search_term: str) -> bool:
+        """Return whether the term is one of this stub's."""
+        return search_term in self.terms
+
+
+@pytest.fixture
+def register_exempt() -> Iterator[None]:
+    """Register an exempt covering "firefox" and "iphone 15" for the test."""
+    exempts.register(StubExempt("firefox", "iphone 15"))
+    yield
+    exempts._exempts.clear()
+
+
+def counter_by_stage(reader: InMemoryMetricReader) -> dict[str, float]:
+    """Return the stage counter's current value per `stage` attribute."""
+    totals: dict[str, float] = {}
+    for point in number_points(reader, STAGE_METRIC):
+        stage = str((point.attributes or {}).get("stage"))
+        totals[stage] = totals.get(stage, 0.0) + point.value
+    return totals
+
+
+def test_stages_in_order(register_exempt: None) -> None:
+    """Each query is settled by the first stage that can, and only the rest reach NER."""
+    classifier = QueryClassifier()
+    detector = RecordingDetector()
+
+    types = classifier.classify(
+        ["firefox", "iphone 15", "me@example.com", "call 555", "", "john smith", "weather"],
+        detector,  # type: ignore[arg-type]
+    )
+
+    assert types == [
+        PIIType.NON_PII,  # exempt
+        PIIType.NON_PII,  # exempt, even though it holds a digit
+        PIIType.EMAIL,
+        PIIType.NUMERIC,
+        PIIType.NON_PII,  # empty
+        PIIType.PERSON,
+        PIIType.NON_PII,
+    ]
+    assert detector.batches == [["john smith", "weather"]]
+
+
+def test_duplicate_queries_reach_ner_once() -> None:
+    """Repeated queries in a batch are detected once, and every occurrence gets the verdict."""
+    classifier = QueryClassifier()
+    detector = RecordingDetector()
+
+    types = classifier.classify(["john", "weather", "john"], detector)  # type: ignore[arg-type]
+
+    assert types == [PIIType.PERSON, PIIType.NON_PII, PIIType.PERSON]
+    assert detector.batches == [["john", "weather"]]
+
+
+def test_cached_verdicts_skip_ner() -> None:
+    """Queries NER has classified before are settled from the cache."""
+    classifier = QueryClassifier()
+    detector = RecordingDetector()
+    classifier.classify(["john", "weather"], detector)  # type: ignore[arg-type]
+
+    types = classifier.classify(["weather", "john", "news"], detector)  # type: ignore[arg-type]
+
+    assert types == [PIIType.NON_PII, PIIType.PERSON, PIIType.NON_PII]
+    assert detector.batches == [["john", "weather"], ["news"]]
+
+
+def test_cache_disabled() -> None:
+    """A cache size of 0 sends every query to NER."""
+    classifier = QueryClassifier(cache_size=0)
+    detector = RecordingDetector()
+
+    classifier.classify(["weather"], detector)  # type: ignore[arg-type]
+    classifier.classify(["weather"], detector)  # type: ignore[arg-type]
+
+    assert detector.batches == [["weather"], ["weather"]]
+    assert len(classifier.cache) == 0
+
+
+def test_cache_evicts_least_recently_used() -> None:
+    """The cache stays within its size, evicting the verdicts used least recently."""
+    cache = VerdictCache(max_size=2)
+    cache.update({"a": PIIType.NON_PII, "b": PIIType.PERSON})
+    cache.get("a")
+
+    cache.update({"c": PIIType.NON_PII})
+
+    assert len(cache) == 2
+    assert cache.get("b") is None
+    assert cache.get("a") is PIIType.NON_PII
+    assert cache.get("c") is PIIType.NON_PII
+
+
+def test_resolve_rejects_missing_verdicts() -> None:
+    """A detector that drops verdicts fails loudly rather than mislabeling queries."""
+    classifier = QueryClassifier()
+    triage = classifier.triage(["john", "weather"])
+
+    with pytest.raises(ValueError):
+        classifier.resolve(triage, [True])
+
+
+def test_stage_counts_are_recorded(
+    register_exempt: None, metric_reader: InMemoryMetricReader
+) -> None:
+    """Every query is counted under the stage that settled it."""
+    classifier = QueryClassifier()
+    detector = RecordingDetector()
+    classifier.classify(["weather"], detector)  # type: ignore[arg-type]
+    before = counter_by_stage(metric_reader)
+
+    classifier.classify(
+        ["firefox", "weather", "call 555", "john", "john"],
+        detector,  # type: ignore[arg-type]
+    )
+
+    after = counter_by_stage(metric_reader)
+    deltas = {stage: after.get(stage, 0.0) - before.get(stage, 0.0) for stage in Stage}
+    assert deltas == {
+        Stage.EXEMPT: 1,
+        Stage.CACHE: 1,
+        Stage.PATTERN: 1,
+        Stage.NER: 2,
+    }
@@ -0,0 +1,239 @@
+"""Unit tests for merino_fleece.sanitize.worker.batcher."""
+
+import threading
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import pytest
+from pytest_mock import MockerFixture
+
+from merino_common.models.suggest_logging import SearchTermsSubmission, SuggestRequestParams
+
+from merino_fleece.sanitize.worker.batcher import TermBatcher
+
+
+class FakeMessage:
+    """In-memory stand-in for a Pub/Sub message, recording how it was settled."""
+
+    def __init__(self, data: bytes) -> None:
+        self.data = data
+        self.outcomes: list[str] = []
+        self.settled = threading.Event()
+
+    def ack(self) -> None:
+        """Record an ack."""
+        self.outcomes.append("ack")
+        self.settled.set()
+
+    def nack(self) -> None:
+        """Record a nack."""
+        self.outcomes.append("nack")
+        self.settled.set()
+
+
+class FakeDetector:
+    """Detector flagging queries that contain "john", recording each batch it is given."""
+
+    def __init__(self, error: Exception | None = None) -> None:
+        self.batches: list[list[str]] = []
+        self.error = error
+
+    def is_person_batch(self, texts: list[str]) -> list[bool]:
+        """Return whether each text mentions "john"."""
+        self.batches.append(list(texts))
+        if self.error is not None:
+            raise self.error
+        return ["john" in text for text in texts]
+
+
+def _log_entry(query: str) -> SuggestRequestParams:
+    """Build a valid SuggestRequestParams for the query."""
+    fields: dict[str, Any] = {
+        "query": query,
+        "code": 200,
+        "rid": "1b11844c52b34c33a6ad54b7bc2eb7c7",
+        "client_variants": "",
+        "requested_providers": "",
+        "browser": "Firefox(103.0)",
+        "os_family": "macos",
+        "form_factor": "desktop",
+    }
+    return SuggestRequestParams(**fields)
+
+
+def _message(*queries: str) -> FakeMessage:
+    """Build a message submitting the given queries."""
+    submission = SearchTermsSubmission(search_terms=[_log_entry(query) for query in queries])
+    return FakeMessage(submission.model_dump_json().encode("utf-8"))
+
+
+@pytest.fixture
+def executor() -> Iterator[ThreadPoolExecutor]:
+    """Provide a single-threaded pool standing in for the shared NER thread pool."""
+    pool = ThreadPoolExecutor(max_workers=1)
+    yield pool
+    pool.shutdown(wait=True)
+
+
+@pytest.fixture
+def emit(mocker: MockerFixture) -> Any:
+    """Patch bulk emission and return the mock."""
+    return mocker.patch("merino_fleece.sanitize.worker.batcher.emit_sanitized_queries")
+
+
+def _emitted_queries(emit: Any) -> list[list[str]]:
+    """Return the queries of each bulk emission."""
+    return [[term.query for term in call.args[0]] for call in emit.call_args_list]
+
+
+def test_pools_terms_across_messages(executor: ThreadPoolExecutor, emit: Any) -> None:
+    """Terms of several messages are detected in one pass, emitted in bulk, and acked."""
+    detector = FakeDetector()
+    batcher = TermBatcher(max_terms=10, max_delay_ms=10_000, detector=detector, executor=executor)
+    messages = [_message("firefox"), _message("weather", "news"), _message("maps")]
+
+    for message in messages:
+        batcher.submit(message)
+    batcher.start()
+    batcher.stop()
+
+    assert detector.batches == [["firefox", "weather", "news", "maps"]]
+    assert _emitted_queries(emit) == [["firefox", "weather", "news", "maps"]]
+    assert [message.outcomes for message in messages] == [["ack"]] * 3
+
+
+def test_cuts_full_batches(executor: ThreadPoolExecutor, emit: Any) -> None:
+    """A batch is cut once `max_terms` terms are buffered, without waiting for the delay."""
+    detector = FakeDetector()
+    batcher = TermBatcher(max_terms=2, max_delay_ms=10_000, detector=detector, executor=executor)
+    batcher.start()
+    messages = [_message("a"), _message("b")]
+
+    for message in messages:
+        batcher.submit(message)
+
+    assert all(message.settled.wait(5) for message in messages)
+    assert detector.batches == [["a", "b"]]
+    batcher.stop()
+
+
+def test_flushes_partial_batch_after_delay(executor: ThreadPoolExecutor, emit: Any) -> None:
+    """A partial batch is sanitized once its oldest term has waited `max_delay_ms`."""
+    detector = FakeDetector()
+    batcher = TermBatcher(max_terms=100, max_delay_ms=10, detector=detector, executor=executor)
+    batcher.start()
+    message = _message("weather")
+
+    batcher.submit(message)
+
+    assert message.settled.wait(5)
+    assert message.outcomes == ["ack"]
+    batcher.stop()
+
+
+def test_message_split_across_batches_acked_once(executor: ThreadPoolExecutor, emit: Any) -> None:
+    """A message whose terms span several batches is acked once, after the last one."""
+    detector = FakeDetector()
+    batcher = TermBatcher(max_terms=2, max_delay_ms=10_000, detector=detector, executor=executor)
+    message = _message("a", "b", "c")
+
+    batcher.submit(message)
+    batcher.start()
+    batcher.stop()
+
+    assert detector.batches == [["a", "b"], ["c"]]
+    assert message.outcomes == ["ack"]
+
+
+def test_pii_terms_are_not_emitted(executor: ThreadPoolExecutor, emit: Any) -> None:
+    """Only terms found to hold no PII are emitted; pattern matches skip NER."""
+    detector = FakeDetector()
+    batcher = TermBatcher(detector=detector, executor=executor)
+    message = _message("john smith", "call 555 1234", "me@example.com", "weather")
+
+    batcher.submit(message)
+    batcher.start()
+    batcher.stop()
+
+    assert detector.batches == [["john smith", "weather"]]
+    assert _emitted_queries(emit) == [["weather"]]
+    assert message.outcomes == ["ack"]
+
+
+def test_failed_batch_nacks_its_messages(
+    executor: ThreadPoolExecutor, emit: Any, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Every message with terms in a failed batch is nacked for redelivery."""
+    detector = FakeDetector(error=RuntimeError("model crashed"))
+    batcher = TermBatcher(detector=detector, executor=executor)
+    messages = [_message("firefox"), _message("weather")]
+
+    with caplog.at_level("ERROR", logger="merino_fleece.sanitize.worker.batcher"):
+        for message in messages:
+            batcher.submit(message)
+        batcher.start()
+        batcher.stop()
+
+    emit.assert_not_called()
+    assert [message.outcomes for message in messages] == [["nack"]] * 2
+    assert "Failed to sanitize batch of search terms" in caplog.text
+
+
+def test_empty_message_acked(emit: Any) -> None:
+    """A submission with no search terms is acked without being buffered."""
+    batcher = TermBatcher(detector=FakeDetector())
+    message = _message()
+
+    batcher.submit(message)
+
+    assert message.outcomes == ["ack"]
+    emit.assert_not_called()
+
+
+def test_invalid_message_dropped(emit: Any, caplog: pytest.LogCaptureFixture) -> None:
+    """A message that fails validation is logged, dropped, and still acked."""
+    batcher = TermBatcher(detector=FakeDetector())
+    message = FakeMessage(b'{"not": "a valid submission"}')
+
+    with caplog.at_level("ERROR", logger="merino_fleece.sanitize.worker.batcher"):
+        batcher.submit(message)
+
+    assert message.outcomes == ["ack"]
+    assert "Dropping invalid message" in caplog.text
+    emit.assert_not_called()
+
+
+def test_nacks_messages_after_stop(executor: ThreadPoolExecutor, emit: Any) -> None:
+    """Messages received while stopping are nacked so another worker picks them up."""
+    detector = FakeDetector()
+    batcher = TermBatcher(detector=detector, executor=executor)
+    batcher.start()
+    batcher.stop()
+    message = _message("weather")
+
+    batcher.submit(message)
+
+    assert message.outcomes == ["nack"]
+    assert detector.batches == []
+
+
+def test_concurrent_submissions(executor: ThreadPoolExecutor, emit: Any) -> None:
+    """Messages submitted from many subscriber threads are each settled exactly once."""
+    batcher = TermBatcher(max_terms=16, max_delay_ms=5, detector=FakeDetector(), executor=executor)
+    messages = [_message(f"query {i}", "john", "weather") for i in range(200)]
+    batcher.start()
+
+    threads = [
+        threading.Thread(target=lambda chunk: [batcher.submit(m) for m in chunk], args=(chunk,))
+        for chunk in (messages[i::4] for i in range(4))
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    batcher.stop()
+
+    assert all(message.outcomes == ["ack"] for message in messages)
+    # "query {i}" holds a digit, and "john" is a person, so only "weather" is emitted.
+    assert sum(len(queries) for queries in _emitted_queries(emit)) == len(messages)
@@ -1,79 +1,13 @@
 """Unit tests for merino_fleece.sanitize.worker.worker."""
 
 from pathlib import Path
-from typing import Any
 from unittest.mock import MagicMock
 
 import pytest
 from pytest_mock import MockerFixture
 
-from merino_common.models.suggest_logging import SuggestRequestParams, SearchTermsSubmission
-
-from merino_fleece.sanitize.models import SanitizedSuggestRequest
-from merino_fleece.sanitize.worker.worker import FleeceQueueWorker, callback
-
-
-def _log_entry(**overrides: Any) -> SuggestRequestParams:
-    """Build a valid SuggestRequestParams, applying any field overrides."""
-    fields: dict[str, Any] = {
-        "query": "how to use fleece in firefox",
-        "code": 200,
-        "rid": "1b11844c52b34c33a6ad54b7bc2eb7c7",
-        "client_variants": "",
-        "requested_providers": "",
-        "browser": "Firefox(103.0)",
-        "os_family": "macos",
-        "form_factor": "desktop",
-    }
-    fields.update(overrides)
-    return SuggestRequestParams(**fields)
-
-
-def test_callback_sanitizes_emits_and_acks(mocker: MockerFixture) -> None:
-    """The callback sanitizes each term, emits it, and acks the message."""
-    emit = mocker.patch("merino_fleece.sanitize.worker.worker.emit_sanitized_query")
-    submission = SearchTermsSubmission(search_terms=[_log_entry(), _log_entry()])
-    message = MagicMock()
-    message.data = submission.model_dump_json().encode("utf-8")
-
-    callback(message)
-
-    assert emit.call_count == 2
-    # Each emitted term is the sanitized request with its query preserved.
-    assert all(isinstance(call.args[0], SanitizedSuggestRequest) for call in emit.call_args_list)
-    assert all(
-        call.args[0].query == "how to use fleece in firefox" for call in emit.call_args_list
-    )
-    message.ack.assert_called_once_with()
-
-
-def test_callback_empty_batch_still_acks(mocker: MockerFixture) -> None:
-    """A submission with no search terms emits nothing but still acks."""
-    emit = mocker.patch("merino_fleece.sanitize.worker.worker.emit_sanitized_query")
-    submission = SearchTermsSubmission(search_terms=[])
-    message = MagicMock()
-    message.data = submission.model_dump_json().encode("utf-8")
-
-    callback(message)
-
-    emit.assert_not_called()
-    message.ack.assert_called_once_with()
-
-
-def test_callback_drops_invalid_message(
-    mocker: MockerFixture, caplog: pytest.LogCaptureFixture
-) -> None:
-    """A message that fails validation is logged, dropped, and still acked."""
-    emit = mocker.patch("merino_fleece.sanitize.worker.worker.emit_sanitized_query")
-    message = MagicMock()
-    message.data = b'{"not": "a valid submission"}'
-
-    with caplog.at_level("ERROR", logger="merino_fleece.sanitize.worker.worker"):
-        callback(message)
-
-    emit.assert_not_called()
-    assert "Dropping invalid message" in caplog.text
-    message.ack.assert_called_once_with()
+from merino_fleece.sanitize.worker.batcher import TermBatcher
+from merino_fleece.sanitize.worker.worker import FleeceQueueWorker
 
 
 @pytest.fixture
@@ -102,12 +36,40 @@ def test_start_subscribes_and_blocks(subscriber_mock: MagicMock) -> None:
 
     subscriber_mock.subscribe.assert_called_once_with(
         "my-subscription",
-        callback=callback,
+        callback=worker.batcher.submit,
         await_callbacks_on_shutdown=True,
     )
     future.result.assert_called_once_with(timeout=None)
 
 
+def test_start_runs_batcher_until_stream_ends(
+    subscriber_mock: MagicMock, mocker: MockerFixture
+) -> None:
+    """start() starts the batcher before pulling and drains it once the stream ends."""
+    batcher = mocker.create_autospec(TermBatcher, instance=True)
+    worker = FleeceQueueWorker("my-subscription", batcher=batcher, drain_timeout=3)
+
+    worker.start()
+
+    batcher.start.assert_called_once_with()
+    batcher.stop.assert_called_once_with(3)
+
+
+def test_stop_drains_batcher_before_cancelling(
+    subscriber_mock: MagicMock, mocker: MockerFixture
+) -> None:
+    """stop() settles buffered messages while the stream is open, then cancels the pull."""
+    calls = mocker.MagicMock()
+    batcher = mocker.create_autospec(TermBatcher, instance=True)
+    calls.attach_mock(batcher.stop, "drain")
+    calls.attach_mock(subscriber_mock.subscribe.return_value.cancel, "cancel")
+    worker = FleeceQueueWorker("my-subscription", batcher=batcher, drain_timeout=3)
+
+    worker.stop()
+
+    assert calls.mock_calls == [mocker.call.drain(3), mocker.call.cancel()]
+
+
 def test_stop_cancels_future_and_sets_flag(subscriber_mock: MagicMock) -> None:
     """stop() marks the worker as stopping and cancels the active streaming pull future."""
     future = subscriber_mock.subscribe.return_value
@@ -277,7 +239,10 @@ def test_start_spawns_heartbeat_thread_when_configured(
 ) -> None:
     """start() launches the heartbeat daemon thread only when a path is configured."""
     thread_cls = mocker.patch("merino_fleece.sanitize.worker.worker.threading.Thread")
-    worker = FleeceQueueWorker("my-subscription", heartbeat_path=str(tmp_path / "heartbeat"))
+    batcher = mocker.create_autospec(TermBatcher, instance=True)
+    worker = FleeceQueueWorker(
+        "my-subscription", heartbeat_path=str(tmp_path / "heartbeat"), batcher=batcher
+    )
 
     worker.start()
 
@@ -292,7 +257,8 @@ def test_start_no_heartbeat_thread_when_unconfigured(
 ) -> None:
     """start() does not spawn a heartbeat thread when no path is configured."""
     thread_cls = mocker.patch("merino_fleece.sanitize.worker.worker.threading.Thread")
-    worker = FleeceQueueWorker("my-subscription")
+    batcher = mocker.create_autospec(TermBatcher, instance=True)
+    worker = FleeceQueueWorker("my-subscription", batcher=batcher)
 
     worker.start()
 
@@ -18,6 +18,7 @@ _validators = [
         "runtime.disabled_providers",
         is_type_of=list,
     ),
+    Validator("runtime.shutdown_timeout_sec", is_type_of=float, gt=0),
     Validator(
         "runtime.skip_gcp_client_auth",
         is_type_of=bool,
@@ -33,6 +34,19 @@ _validators = [
     Validator("metrics.dev_logger", is_type_of=bool),
     Validator("metrics.host", is_type_of=str),
     Validator("metrics.port", gte=0, is_type_of=int),
+    Validator("profiler.enabled", is_type_of=bool),
+    Validator(
+        "profiler.auth_token",
+        is_type_of=str,
+        len_min=1,
+        when=Validator("profiler.enabled", eq=True),
+    ),
+    Validator("profiler.max_duration_sec", is_type_of=float, gt=0, lte=300),
+    Validator("profiler.interval_ms", is_type_of=float, gte=1, lte=1000),
+    Validator("metrics.loop_monitor.enabled", is_type_of=bool),
+    Validator("metrics.loop_monitor.interval_sec", is_type_of=float, gt=0),
+    Validator("metrics.loop_monitor.slow_callback_detection", is_type_of=bool),
+    Validator("metrics.loop_monitor.slow_callback_threshold_sec", is_type_of=float, gt=0),
     Validator("query_pattern_matching.enabled", is_type_of=bool),
     Validator("query_pattern_matching.sample_rate", gte=0, lte=1),
     Validator("query_pattern_matching.patterns", is_type_of=list),
@@ -48,6 +62,12 @@ _validators = [
     Validator("message_handler.collection_delay_sec", is_type_of=float, gt=0),
     Validator("message_handler.shutdown_deadline_sec", is_type_of=float, gt=0),
     Validator("message_handler.max_queue_size", is_type_of=int, gt=0),
+    Validator("message_handler.max_concurrent_batches", is_type_of=int, gt=0),
+    # 0 or None turns adaptive batching off.
+    Validator("message_handler.target_flush_latency_sec", is_type_of=(int, float), gte=0)
+    | Validator("message_handler.target_flush_latency_sec", is_type_of=type(None)),
+    Validator("message_handler.min_batch_size", is_type_of=int, gt=0),
+    Validator("message_handler.overflow_policy", is_in=["drop_newest", "drop_oldest"]),
     Validator("image_gcs.gcs_project", is_type_of=str),
     Validator("image_gcs.gcs_bucket", is_type_of=str),
     Validator("image_gcs.gcs_enabled", is_type_of=bool),
@@ -154,6 +174,8 @@ _validators = [
     # Set the upper bound of query timeout to 5 seconds as we don't want Merino
     # to wait for responses from Accuweather indefinitely.
     Validator("providers.accuweather.query_timeout_sec", is_type_of=float, gte=0, lte=5.0),
+    Validator("providers.accuweather.max_concurrency", is_type_of=int, gt=0),
+    Validator("providers.accuweather.hedge_requests", is_type_of=bool),
     Validator("providers.accuweather.type", is_type_of=str, must_exist=True),
     Validator("providers.accuweather.cache", is_in=["redis", "none"]),
     Validator(
@@ -171,6 +193,7 @@ _validators = [
     Validator("providers.adm.resync_interval_sec", gt=0),
     Validator("providers.adm.score", gte=0, lte=1),
     Validator("providers.adm.type", is_type_of=str, must_exist=True),
+    Validator("providers.adm.warm_start", is_type_of=bool),
     Validator("providers.amo.backend", is_in=["dynamic", "static"]),
     Validator("providers.amo.score", gte=0, lte=1),
     Validator("providers.amo.type", is_type_of=str, must_exist=True),
@@ -182,6 +205,8 @@ _validators = [
     Validator("providers.sports.sports", is_type_of=list),
     # base score for sport.
     Validator("providers.sports.score", is_type_of=float),
+    Validator("providers.sports.max_concurrency", is_type_of=int, gt=0),
+    Validator("providers.sports.hedge_requests", is_type_of=bool),
     Validator("providers.sports.enabled_by_default", is_type_of=bool),
     Validator("providers.sports.sportsdata.api_key", is_type_of=str),
     Validator("providers.sports.sportsdata.cache_dir", is_type_of=str),
@@ -218,6 +243,9 @@ _validators = [
         is_in=["remote", "local"],
         must_exist=True,
     ),
+    Validator("providers.top_picks.warm_start", is_type_of=bool),
+    Validator("providers.polygon.warm_start", is_type_of=bool),
+    Validator("providers.flightaware.warm_start", is_type_of=bool),
     Validator("providers.wikipedia.backend", is_in=["elasticsearch", "test"]),
     Validator("providers.wikipedia.enabled_by_default", is_type_of=bool),
     Validator("providers.wikipedia.es_url", is_type_of=str),
@@ -233,6 +261,8 @@ _validators = [
         required=True,
     ),
     Validator("providers.wikipedia.es_user", is_type_of=str),
+    Validator("providers.wikipedia.max_concurrency", is_type_of=int, gt=0),
+    Validator("providers.wikipedia.hedge_requests", is_type_of=bool),
     Validator("providers.wikipedia.score", gte=0, lte=1),
     Validator("providers.wikipedia.type", is_type_of=str, must_exist=True),
     # Since Firefox will time out the request to Merino if it takes longer than 200ms,
@@ -248,6 +278,22 @@ _validators = [
     # Max set that is passed into FastAPI Query constuctor param 'max_length'.
     Validator("web.api.v1.query_character_max", is_type_of=int, gt=5, lte=500),
     Validator("web.api.v1.client_variant_character_max", is_type_of=int, gt=0, lte=100),
+    Validator("web.api.v1.response_cache.enabled", is_type_of=bool),
+    Validator("web.api.v1.response_cache.max_entries", is_type_of=int, gt=0),
+    Validator("web.api.v1.response_cache.ttl_sec", is_type_of=int, gt=0),
+    Validator("web.api.v1.response_cache.bypass_providers", is_type_of=list),
+    Validator("governance.admission.enabled", is_type_of=bool),
+    Validator("governance.admission.min_concurrency", is_type_of=int, gt=0),
+    Validator("governance.admission.decrease_ratio", is_type_of=float, gt=0, lt=1),
+    Validator("governance.admission.latency_target_ratio", is_type_of=float, gt=0),
+    Validator("governance.admission.latency_ewma_weight", is_type_of=float, gt=0, lte=1),
+    Validator("hedging.percentile", is_type_of=float, gt=0, lt=100),
+    Validator("hedging.max_hedge_ratio", is_type_of=float, gte=0, lte=1),
+    Validator("hedging.min_delay_sec", is_type_of=float, gte=0),
+    Validator("hedging.window_size", is_type_of=int, gt=0),
+    Validator("hedging.min_samples", is_type_of=int, gt=0),
+    Validator("snapshots.directory", is_type_of=str),
+    Validator("snapshots.max_age_sec", is_type_of=float, gt=0),
     # Allow a longer timeout for testing
     Validator(
         "runtime.query_timeout_sec",
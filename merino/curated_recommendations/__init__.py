@@ -7,6 +7,7 @@ import logging
 import random
 
 from merino.configs import settings
+from merino.curated_recommendations.candidate_snapshots import CandidateSnapshotStore
 from merino.curated_recommendations.corpus_backends.protocol import SurfaceId
 from merino.curated_recommendations.corpus_backends.scheduled_surface_backend import (
     ScheduledSurfaceBackend,
@@ -25,10 +26,6 @@ from merino.curated_recommendations.ml_backends.spindle_backend import (
 )
 from merino.curated_recommendations.ml_backends.static_local_model import SuperInferredModel
 from merino.curated_recommendations.ml_backends.gcs_ml_recs import GcsMLRecs
-from merino.curated_recommendations.ml_backends.gcs_interest_cohort_model import (
-    EmptyCohortModel,
-    GcsInterestCohortModel,
-)
 from merino.curated_recommendations.ml_backends.lints_interest_model import (
     EmptyLinTSInterestBackend,
     LinTSInterestBackend,
@@ -169,6 +166,12 @@ def init_ml_cohort_model_backend() -> CohortModelBackend:
     """Initialize the ML Cohort Model GCS Backend which falls back to an empty
     if GCS cannot be initialized.
     """
+    # Imported here as the cohort model depends on torch, which is slow to import.
+    from merino.curated_recommendations.ml_backends.gcs_interest_cohort_model import (
+        EmptyCohortModel,
+        GcsInterestCohortModel,
+    )
+
     try:
         synced_gcs_blob = SyncedGcsBlob(
             storage_client=initialize_storage_client(
@@ -277,16 +280,24 @@ def init_provider() -> None:
         spindle_backend=spindle_backend,
     )
 
+    prior_backend = init_prior_backend()
+    candidate_snapshots = (
+        CandidateSnapshotStore(sections_backend, engagement_backend, prior_backend)
+        if settings.curated_recommendations.candidate_snapshots.enabled
+        else None
+    )
+
     _provider = CuratedRecommendationsProvider(
         scheduled_surface_backend=scheduled_surface_backend,
         engagement_backend=engagement_backend,
-        prior_backend=init_prior_backend(),
+        prior_backend=prior_backend,
         sections_backend=sections_backend,
         local_model_backend=local_model_backend,
         ml_recommendations_backend=ml_recommendations_backend,
         cohort_model_backend=cohort_model_backend,
         lints_interest_backend=lints_interest_backend,
         spindle_backend=spindle_backend,
+        candidate_snapshots=candidate_snapshots,
     )
     _legacy_provider = LegacyCuratedRecommendationsProvider()
 
@@ -0,0 +1,221 @@
+"""Versioned, precomputed snapshots of the request-independent ranking inputs of candidates.
+
+Corpus sections only change when the sections backend refreshes its cache, and engagement and
+priors only change when their GCS blobs are refreshed. A snapshot joins engagement and priors to
+all candidates of a surface once per version of that data, for a given region and engagement
+region, and stores them in columnar form. Requests then only sample, rank and lay out items.
+"""
+
+import asyncio
+import logging
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from typing import NamedTuple
+
+import numpy as np
+
+from merino.curated_recommendations.corpus_backends.protocol import (
+    CorpusSection,
+    SectionsProtocol,
+    SurfaceId,
+)
+from merino.curated_recommendations.engagement_backends.protocol import EngagementBackend
+from merino.curated_recommendations.prior_backends.protocol import Prior, PriorBackend
+
+logger = logging.getLogger(__name__)
+
+
+class SnapshotKey(NamedTuple):
+    """Identifies the requests that a snapshot can be used for."""
+
+    surface_id: SurfaceId
+    region: str | None
+    engagement_region: str | None
+
+
+class SnapshotVersion(NamedTuple):
+    """Identifies the backend data that a snapshot was built from."""
+
+    corpus_sections_id: int
+    engagement_update_count: int
+    prior_update_count: int
+
+
+def _read_only(array: np.ndarray) -> np.ndarray:
+    array.setflags(write=False)
+    return array
+
+
+@dataclass(frozen=True)
+class RegionEngagement:
+    """Engagement of all candidates of a snapshot in one region, as parallel arrays by row."""
+
+    clicks: np.ndarray
+    impressions: np.ndarray
+    reports: np.ndarray
+    has_engagement: np.ndarray
+
+    @classmethod
+    def build(
+        cls,
+        corpus_item_ids: list[str],
+        region: str | None,
+        engagement_backend: EngagementBackend,
+    ) -> "RegionEngagement":
+        """Look up the engagement of every candidate in the region (None for all regions)."""
+        columns = engagement_backend.get_many(corpus_item_ids, region)
+        return cls(
+            clicks=_read_only(columns.clicks.astype(np.float64)),
+            impressions=_read_only(columns.impressions.astype(np.float64)),
+            reports=_read_only(columns.reports.astype(np.float64)),
+            has_engagement=_read_only(columns.found.astype(bool)),
+        )
+
+    def opens_no_opens(self, rows: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Return opens and no-opens for the given rows, 0 for candidates without engagement."""
+        clicks = self.clicks[rows]
+        return clicks, self.impressions[rows] - clicks
+
+
+@dataclass(frozen=True)
+class CandidateSnapshot:
+    """Engagement and priors of all candidates of a surface, for a region and engagement region.
+
+    Snapshots are immutable. They are replaced as a whole when a newer version has been built.
+    """
+
+    key: SnapshotKey
+    version: SnapshotVersion
+    # Kept alive so that version.corpus_sections_id cannot be reused by other sections.
+    corpus_sections: list[CorpusSection]
+    item_rows: dict[str, int]
+    # Keyed on region, None being engagement across all regions.
+    engagement: dict[str | None, RegionEngagement]
+    # Keyed on region, None being the global prior.
+    priors: dict[str | None, Prior | None]
+
+    def rows(self, corpus_item_ids: Iterable[str]) -> np.ndarray:
+        """Return the row of each corpus item, or -1 for items that are not in the snapshot."""
+        item_rows = self.item_rows
+        return np.fromiter(
+            (item_rows.get(corpus_item_id, -1) for corpus_item_id in corpus_item_ids),
+            dtype=np.intp,
+        )
+
+    def covers(self, *regions: str | None) -> bool:
+        """Return whether engagement and priors were looked up for all the given regions."""
+        return all(region in self.engagement and region in self.priors for region in regions)
+
+
+def _iter_corpus_sections(corpus_sections: list[CorpusSection]) -> Iterator[CorpusSection]:
+    """Iterate over the corpus sections and the alternate slates of section experiments."""
+    for section in corpus_sections:
+        yield section
+        if section.alternateSection is not None:
+            yield section.alternateSection
+
+
+def build_candidate_snapshot(
+    key: SnapshotKey,
+    version: SnapshotVersion,
+    corpus_sections: list[CorpusSection],
+    engagement_backend: EngagementBackend,
+    prior_backend: PriorBackend,
+) -> CandidateSnapshot:
+    """Join the engagement and priors of the global, request and engagement regions to all
+    items of the corpus sections.
+    """
+    corpus_item_ids = list(
+        dict.fromkeys(
+            item.corpusItemId
+            for section in _iter_corpus_sections(corpus_sections)
+            for item in section.sectionItems
+        )
+    )
+    regions = list(dict.fromkeys([None, key.region, key.engagement_region]))
+    return CandidateSnapshot(
+        key=key,
+        version=version,
+        corpus_sections=corpus_sections,
+        item_rows={corpus_item_id: row for row, corpus_item_id in enumerate(corpus_item_ids)},
+        engagement={
+            region: RegionEngagement.build(corpus_item_ids, region, engagement_backend)
+            for region in regions
+        },
+        priors={region: prior_backend.get(region) for region in regions},
+    )
+
+
+class CandidateSnapshotStore:
+    """Build and cache a candidate snapshot per (surface, region, engagement region).
+
+    A snapshot is rebuilt in a worker thread when the corpus sections, engagement or priors
+    change. Until the rebuild completes, requests keep using the previous snapshot. Only the
+    first request for a key waits for its snapshot to be built.
+    """
+
+    def __init__(
+        self,
+        sections_backend: SectionsProtocol,
+        engagement_backend: EngagementBackend,
+        prior_backend: PriorBackend,
+    ) -> None:
+        self.sections_backend = sections_backend
+        self.engagement_backend = engagement_backend
+        self.prior_backend = prior_backend
+        self._snapshots: dict[SnapshotKey, CandidateSnapshot] = {}
+        self._pending: dict[SnapshotKey, asyncio.Task[CandidateSnapshot | None]] = {}
+
+    async def get(
+        self,
+        surface_id: SurfaceId,
+        region: str | None = None,
+        engagement_region: str | None = None,
+    ) -> CandidateSnapshot | None:
+        """Return the latest snapshot for the surface and regions, or None if it could not be
+        built. Rankers fall back to looking up engagement and priors when there is no snapshot.
+        """
+        key = SnapshotKey(surface_id, region, engagement_region)
+        corpus_sections = await self.sections_backend.fetch(surface_id)
+        version = SnapshotVersion(
+            corpus_sections_id=id(corpus_sections),
+            engagement_update_count=self.engagement_backend.update_count,
+            prior_update_count=self.prior_backend.update_count,
+        )
+
+        snapshot = self._snapshots.get(key)
+        if snapshot is not None and snapshot.version == version:
+            return snapshot
+
+        task = self._pending.get(key)
+        if task is None:
+            task = asyncio.create_task(self._build(key, version, corpus_sections))
+            self._pending[key] = task
+            task.add_done_callback(lambda _: self._pending.pop(key, None))
+
+        if snapshot is not None:
+            return snapshot
+        return await asyncio.shield(task)
+
+    async def _build(
+        self,
+        key: SnapshotKey,
+        version: SnapshotVersion,
+        corpus_sections: list[CorpusSection],
+    ) -> CandidateSnapshot | None:
+        """Build a snapshot in a worker thread and swap it in."""
+        try:
+            snapshot = await asyncio.to_thread(
+                build_candidate_snapshot,
+                key,
+                version,
+                corpus_sections,
+                self.engagement_backend,
+                self.prior_backend,
+            )
+        except Exception as e:
+            logger.error(f"Failed to build candidate snapshot for {key}: {e}")
+            return self._snapshots.get(key)
+
+        self._snapshots[key] = snapshot
+        return snapshot
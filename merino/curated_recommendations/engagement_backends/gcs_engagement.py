@@ -1,25 +1,140 @@
 """Wrapper for engagement data from Google Cloud Storage."""
 
-import json
 import logging
-from collections import Counter
+import sys
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from typing import NotRequired, TypedDict
 
+import numpy as np
 from aiodogstatsd import Client as StatsdClient
+from pydantic import TypeAdapter
 
 from merino.curated_recommendations.engagement_backends.protocol import (
     Engagement,
     EngagementBackend,
+    EngagementColumns,
 )
 from merino.utils.synced_gcs_blob import SyncedGcsBlob
 
 logger = logging.getLogger(__name__)
 
-EngagementKeyType = tuple[str | None, str | None]  # Keyed on (corpus_item_id, region)
-EngagementCacheType = dict[EngagementKeyType, Engagement]
+
+class EngagementRecord(TypedDict):
+    """A record of the engagement blob. Validated without building an Engagement model."""
+
+    scheduled_corpus_item_id: NotRequired[str | None]
+    corpus_item_id: NotRequired[str | None]
+    region: NotRequired[str | None]
+    click_count: int
+    impression_count: int
+    report_count: NotRequired[int | None]
+
+
+_engagement_records = TypeAdapter(list[EngagementRecord])
+
+
+@dataclass(frozen=True)
+class EngagementTable:
+    """Engagement of all corpus items in one region, as parallel arrays indexed by row."""
+
+    region: str | None
+    # Keyed on interned corpus_item_id. Records without a corpus_item_id are aggregated in None.
+    rows: dict[str | None, int]
+    scheduled_corpus_item_ids: list[str | None]
+    clicks: np.ndarray
+    impressions: np.ndarray
+    reports: np.ndarray
+    # False where no record of the item had a report_count.
+    has_reports: np.ndarray
+    # Engagement models built by `get`, which is called repeatedly for the same candidates.
+    _models: dict[str | None, Engagement] = field(default_factory=dict, compare=False)
+
+    @classmethod
+    def build(cls, region: str | None, records: list[EngagementRecord]) -> "EngagementTable":
+        """Build the table from the records of the region, summing records of the same item."""
+        rows: dict[str | None, int] = {}
+        scheduled_corpus_item_ids: list[str | None] = []
+        clicks: list[int] = []
+        impressions: list[int] = []
+        reports: list[int] = []
+        has_reports: list[bool] = []
+        for record in records:
+            corpus_item_id = record.get("corpus_item_id")
+            if corpus_item_id is not None:
+                corpus_item_id = sys.intern(corpus_item_id)
+            report_count = record.get("report_count")
+            row = rows.get(corpus_item_id)
+            if row is None:
+                rows[corpus_item_id] = len(clicks)
+                scheduled_corpus_item_ids.append(record.get("scheduled_corpus_item_id"))
+                clicks.append(record["click_count"])
+                impressions.append(record["impression_count"])
+                reports.append(report_count or 0)
+                has_reports.append(report_count is not None)
+            else:
+                # Same as adding Engagement models, which treats a missing report_count as 0.
+                scheduled_corpus_item_ids[row] = scheduled_corpus_item_ids[row] or record.get(
+                    "scheduled_corpus_item_id"
+                )
+                clicks[row] += record["click_count"]
+                impressions[row] += record["impression_count"]
+                reports[row] += report_count or 0
+                has_reports[row] = True
+        return cls(
+            region=region,
+            rows=rows,
+            scheduled_corpus_item_ids=scheduled_corpus_item_ids,
+            clicks=np.array(clicks, dtype=np.int64),
+            impressions=np.array(impressions, dtype=np.int64),
+            reports=np.array(reports, dtype=np.int64),
+            has_reports=np.array(has_reports, dtype=bool),
+        )
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def get(self, corpus_item_id: str | None) -> Engagement | None:
+        """Return the engagement of a corpus item, or None if it has no engagement."""
+        if (engagement := self._models.get(corpus_item_id)) is not None:
+            return engagement
+        row = self.rows.get(corpus_item_id)
+        if row is None:
+            return None
+        engagement = self._models[corpus_item_id] = Engagement.model_construct(
+            scheduled_corpus_item_id=self.scheduled_corpus_item_ids[row],
+            corpus_item_id=corpus_item_id,
+            region=self.region,
+            click_count=int(self.clicks[row]),
+            impression_count=int(self.impressions[row]),
+            report_count=int(self.reports[row]) if self.has_reports[row] else None,
+        )
+        return engagement
+
+    def get_many(self, corpus_item_ids: Sequence[str]) -> EngagementColumns:
+        """Return the engagement of a batch of corpus items."""
+        rows = self.rows
+        indices = np.fromiter(
+            (rows.get(corpus_item_id, -1) for corpus_item_id in corpus_item_ids),
+            dtype=np.intp,
+            count=len(corpus_item_ids),
+        )
+        found = indices >= 0
+        found_indices = indices[found]
+        columns = []
+        for column in (self.clicks, self.impressions, self.reports):
+            values = np.zeros(len(indices), dtype=np.float64)
+            values[found] = column[found_indices]
+            columns.append(values)
+        return EngagementColumns(*columns, found=found)
 
 
 class GcsEngagement(EngagementBackend):
-    """Backend that caches and periodically retrieves engagement data from Google Cloud Storage."""
+    """Backend that caches and periodically retrieves engagement data from Google Cloud Storage.
+
+    Engagement is stored in one columnar EngagementTable per region, rather than as one
+    Engagement model per item and region. Use `get_many` to look up a batch of items at once.
+    """
 
     def __init__(
         self,
@@ -32,7 +147,7 @@ class GcsEngagement(EngagementBackend):
         Args:
             synced_gcs_blob: Instance of SyncedGcsBlob that manages GCS synchronization.
         """
-        self._cache: EngagementCacheType = {}
+        self._tables: dict[str | None, EngagementTable] = {}
         self.synced_blob = synced_gcs_blob
         self.synced_blob.set_fetch_callback(self._fetch_callback)
         self.metrics_client = metrics_client
@@ -48,7 +163,25 @@ class GcsEngagement(EngagementBackend):
         Returns:
             Engagement: Engagement data for the specified id if it exists in cache, otherwise None.
         """
-        return self._cache.get((corpus_item_id, region))
+        table = self._tables.get(region)
+        return table.get(corpus_item_id) if table is not None else None
+
+    def get_many(
+        self, corpus_item_ids: Sequence[str], region: str | None = None
+    ) -> EngagementColumns:
+        """Get cached engagement from the last 24h for a batch of corpus item ids
+
+        Args:
+            corpus_item_ids: The ids of the corpus items for which to return engagement data.
+            region: Return engagement for a given region (e.g. 'US'), or across all regions (None).
+
+        Returns:
+            EngagementColumns: Engagement of the items, in the same order as corpus_item_ids.
+        """
+        table = self._tables.get(region)
+        if table is None:
+            return super().get_many(corpus_item_ids, region)
+        return table.get_many(corpus_item_ids)
 
     @property
     def update_count(self) -> int:
@@ -61,49 +194,40 @@ class GcsEngagement(EngagementBackend):
         Args:
             data: The engagement blob string data, with an array of Engagement objects.
         """
-        parsed_data = [Engagement(**item) for item in json.loads(data)]
-        next_cache: EngagementCacheType = {}
-        for engagement in parsed_data:
-            cache_key = (engagement.corpus_item_id, engagement.region)
-            prev_engagement = next_cache.get(cache_key, None)
-            next_cache[cache_key] = (
-                engagement if prev_engagement is None else prev_engagement + engagement
-            )
-        if len(next_cache) > 0:
-            self._cache = next_cache
+        records_by_region: dict[str | None, list[EngagementRecord]] = {}
+        for record in _engagement_records.validate_json(data):
+            records_by_region.setdefault(record.get("region"), []).append(record)
+        next_tables = {
+            region: EngagementTable.build(region, records)
+            for region, records in records_by_region.items()
+        }
+        if len(next_tables) > 0:
+            self._tables = next_tables
         self._track_metrics()
 
     def _track_metrics(self) -> None:
         """Emit statistics about engagement"""
+        tables = self._tables
         # Emit the total number of engagement records.
-        self.metrics_client.gauge(f"{self.metrics_namespace}.count", value=len(self._cache))
-
-        # Emit the number corpus items by region for which we have engagement data.
-        region_counts = Counter(region for _, region in self._cache)
-        for region, count in region_counts.items():
-            region_name = region.lower() if region is not None else "global"
-            self.metrics_client.gauge(f"{self.metrics_namespace}.{region_name}.count", value=count)
+        self.metrics_client.gauge(
+            f"{self.metrics_namespace}.count", value=sum(len(table) for table in tables.values())
+        )
 
-        # Sum clicks and impressions by region.
-        clicks: Counter[str] = Counter()
-        impressions: Counter[str] = Counter()
-        report_counts: Counter[str] = Counter()
-        for (item_id, region), eng in self._cache.items():
+        for region, table in tables.items():
             region_name = region.lower() if region is not None else "global"
-            clicks[region_name] += eng.click_count
-            impressions[region_name] += eng.impression_count
-            report_counts[region_name] += eng.report_count or 0  # report_count can be None
-
-        # Emit clicks by region.
-        for region, count in clicks.items():
-            self.metrics_client.gauge(f"{self.metrics_namespace}.{region}.clicks", value=count)
-        # Emit impressions by region.
-        for region, count in impressions.items():
+            # Emit the number corpus items by region for which we have engagement data.
+            self.metrics_client.gauge(
+                f"{self.metrics_namespace}.{region_name}.count", value=len(table)
+            )
+            # Emit clicks, impressions and report_counts by region.
+            self.metrics_client.gauge(
+                f"{self.metrics_namespace}.{region_name}.clicks", value=int(table.clicks.sum())
+            )
             self.metrics_client.gauge(
-                f"{self.metrics_namespace}.{region}.impressions", value=count
+                f"{self.metrics_namespace}.{region_name}.impressions",
+                value=int(table.impressions.sum()),
             )
-        # Emit report_counts by region.
-        for region, count in report_counts.items():
             self.metrics_client.gauge(
-                f"{self.metrics_namespace}.{region}.report_counts", value=count
+                f"{self.metrics_namespace}.{region_name}.report_counts",
+                value=int(table.reports.sum()),
             )
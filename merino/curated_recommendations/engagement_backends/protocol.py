@@ -1,7 +1,10 @@
 """Protocol and Pydantic models for the Engagement provider backend."""
 
 import logging
-from typing import Protocol
+from collections.abc import Sequence
+from typing import NamedTuple, Protocol
+
+import numpy as np
 from pydantic import BaseModel
 
 logger = logging.getLogger(__name__)
@@ -48,6 +51,18 @@ class Engagement(BaseModel):
         )
 
 
+class EngagementColumns(NamedTuple):
+    """Engagement of a batch of corpus items in one region, as parallel arrays.
+
+    Counts are 0 for items without engagement, for which `found` is False.
+    """
+
+    clicks: np.ndarray
+    impressions: np.ndarray
+    reports: np.ndarray
+    found: np.ndarray
+
+
 class EngagementBackend(Protocol):
     """Protocol for Engagement backend that the provider depends on."""
 
@@ -55,6 +70,28 @@ class EngagementBackend(Protocol):
         """Fetch engagement data for the given scheduled corpus item id and optionally region"""
         ...
 
+    def get_many(
+        self, corpus_item_ids: Sequence[str], region: str | None = None
+    ) -> EngagementColumns:
+        """Fetch engagement data for a batch of corpus item ids and optionally region.
+
+        Backends that store engagement in columnar form should override this default, which
+        calls `get` for each item.
+        """
+        n_items = len(corpus_item_ids)
+        clicks = np.zeros(n_items, dtype=np.float64)
+        impressions = np.zeros(n_items, dtype=np.float64)
+        reports = np.zeros(n_items, dtype=np.float64)
+        found = np.zeros(n_items, dtype=bool)
+        for row, corpus_item_id in enumerate(corpus_item_ids):
+            engagement = self.get(corpus_item_id, region)
+            if engagement is not None:
+                clicks[row] = engagement.click_count
+                impressions[row] = engagement.impression_count
+                reports[row] = engagement.report_count or 0
+                found[row] = True
+        return EngagementColumns(clicks, impressions, reports, found)
+
     @property
     def update_count(self) -> int:
         """Returns the number of times the engagement has been updated."""
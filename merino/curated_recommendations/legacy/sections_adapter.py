@@ -2,6 +2,7 @@
 
 import logging
 
+from merino.curated_recommendations.candidate_snapshots import CandidateSnapshot
 from merino.curated_recommendations.corpus_backends.protocol import (
     SectionsProtocol,
     SurfaceId,
@@ -60,6 +61,7 @@ async def get_legacy_recommendations_from_sections(
     count: int,
     region: str | None = None,
     rescaler: EngagementRescaler | None = None,
+    candidate_snapshot: CandidateSnapshot | None = None,
 ) -> list[CuratedRecommendation]:
     """Fetch section items and return as a flat list for non-sections clients.
 
@@ -72,6 +74,7 @@ async def get_legacy_recommendations_from_sections(
         region: Optional region for engagement filtering (e.g., 'US', 'CA')
         rescaler: Optional rescaler for Thompson sampling (applies pessimistic priors
             and scales engagement metrics for gaming/hobbies content)
+        candidate_snapshot: Optional precomputed engagement and priors of the candidates
 
     Returns:
         Ranked list of CuratedRecommendation objects
@@ -102,6 +105,7 @@ async def get_legacy_recommendations_from_sections(
         recommendations,
         engagement_backend=engagement_backend,
         region=region,
+        candidate_snapshot=candidate_snapshot,
     )
 
     # 6. Apply Thompson sampling with rescaler
@@ -110,6 +114,7 @@ async def get_legacy_recommendations_from_sections(
     ranker = ThompsonSamplingRanker(
         engagement_backend=engagement_backend,
         prior_backend=prior_backend,
+        candidate_snapshot=candidate_snapshot,
     )
     recommendations = ranker.rank_items(
         recommendations,
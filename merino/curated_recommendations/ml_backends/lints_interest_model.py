@@ -9,14 +9,14 @@ Per-surface design mirrors ``gcs_ml_recs.GcsMLRecs``: one ``SyncedGcsBlob``
 per ``SurfaceId``, atomically-installed state behind ``is_valid(surface_id)``.
 """
 
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from functools import partial
 import json
 import logging
-import tempfile
+import struct
 
 import numpy as np
-from safetensors import safe_open
 from scipy.linalg.blas import stpsv
 
 from merino.curated_recommendations.corpus_backends.protocol import SurfaceId, Topic
@@ -37,6 +37,54 @@ L_FORMAT_LAPACK_LOWER_PACKED = "lapack_lower_packed"
 VALIDITY_PERIOD_MINUTES = 60
 
 
+# safetensors dtype codes we know how to view as numpy arrays.
+SAFETENSORS_DTYPES: dict[str, np.dtype] = {
+    "F16": np.dtype("<f2"),
+    "F32": np.dtype("<f4"),
+    "F64": np.dtype("<f8"),
+    "I32": np.dtype("<i4"),
+    "I64": np.dtype("<i8"),
+}
+
+
+def read_safetensors(data: bytes) -> tuple[dict[str, str], dict[str, np.ndarray]]:
+    """Parse a safetensors file held in memory into ``(metadata, tensors)``.
+
+    The format is an 8-byte little-endian header length, a JSON header mapping
+    tensor names to dtype, shape and byte offsets, and the raw tensor data.
+    Tensors are returned as read-only numpy views into ``data`` — nothing is
+    copied unless a tensor's offset is misaligned for its dtype.
+    """
+    buffer = memoryview(data)
+    if len(buffer) < 8:
+        raise ValueError("safetensors data is truncated")
+    (header_len,) = struct.unpack_from("<Q", buffer)
+    data_start = 8 + header_len
+    if data_start > len(buffer):
+        raise ValueError("safetensors header length exceeds data size")
+    header = json.loads(bytes(buffer[8:data_start]))
+    metadata = header.pop("__metadata__", None) or {}
+
+    tensors: dict[str, np.ndarray] = {}
+    for name, info in header.items():
+        dtype = SAFETENSORS_DTYPES.get(info["dtype"])
+        if dtype is None:
+            raise ValueError(f"tensor {name!r} has unsupported dtype {info['dtype']!r}")
+        begin, end = info["data_offsets"]
+        if not 0 <= begin <= end <= len(buffer) - data_start:
+            raise ValueError(f"tensor {name!r} data offsets are out of bounds")
+        shape = tuple(info["shape"])
+        if (end - begin) != dtype.itemsize * int(np.prod(shape, dtype=np.int64)):
+            raise ValueError(f"tensor {name!r} size does not match its shape {shape}")
+        tensor = np.frombuffer(
+            buffer, dtype=dtype, count=(end - begin) // dtype.itemsize, offset=data_start + begin
+        ).reshape(shape)
+        if not tensor.flags.aligned:
+            tensor = tensor.copy()
+        tensors[name] = tensor
+    return metadata, tensors
+
+
 def remap_interests_for_real_world_strengths(val: float | None):
     """Remap ~1.1 and below to 0.87 reflecting analysis.
     See content-ml-services/jobs/metaflow/prospecting/inferred_tuning for details
@@ -46,6 +94,38 @@ def remap_interests_for_real_world_strengths(val: float | None):
     return val
 
 
+@dataclass(frozen=True)
+class LinTSSurfaceState:
+    """Everything parsed from one surface's bundle. Instances are installed with
+    a single dict assignment, so a request never sees a mix of two bundles.
+    """
+
+    L_packed: np.ndarray
+    theta_hat: np.ndarray
+    item_to_idx: dict[str, int]
+    item_topic_to_idx: dict[tuple[str, int], int]
+    topic_main_to_idx: dict[int, int]
+    topic_names: list[str]
+    dim: int
+    bias_idx: int
+    v: float
+    cache_time: datetime
+    model_id: str
+    epoch_id: str
+    # Optional tz_pred feature state. -1 sentinel = "tz_pred not present in
+    # this bundle, skip the adjustment entirely".
+    tz_pred_idx: int
+    tz_baseline_idx: int
+    tz_preds: np.ndarray
+    tz_pred_item_to_idx: dict[str, int]
+    # Dense per-item lookup tables for vectorized scoring; see
+    # ``LinTSInterestBackend._build_item_tables``.
+    item_rows: dict[str, int]
+    item_main_cols: np.ndarray
+    item_topic_cols: np.ndarray
+    tz_pred_rows: np.ndarray
+
+
 class LinTSInterestBackend:
     """Per-surface backend that loads the LinTS-interest safetensors bundle and
     samples θ̃ per request via packed-triangular solve.
@@ -54,25 +134,8 @@ class LinTSInterestBackend:
     def __init__(self, synced_gcs_blobs: dict[SurfaceId, SyncedGcsBlob]) -> None:
         self.synced_blobs: dict[SurfaceId, SyncedGcsBlob] = synced_gcs_blobs
 
-        # Per-surface state, all populated atomically inside ``_fetch_callback``.
-        self._L_packed: dict[SurfaceId, np.ndarray] = {}
-        self._theta_hat: dict[SurfaceId, np.ndarray] = {}
-        self._item_to_idx: dict[SurfaceId, dict[str, int]] = {}
-        self._item_topic_to_idx: dict[SurfaceId, dict[tuple[str, int], int]] = {}
-        self._topic_main_to_idx: dict[SurfaceId, dict[int, int]] = {}
-        self._topic_names: dict[SurfaceId, list[str]] = {}
-        self._dim: dict[SurfaceId, int] = {}
-        self._bias_idx: dict[SurfaceId, int] = {}
-        self._v: dict[SurfaceId, float] = {}
-        self._cache_time: dict[SurfaceId, datetime] = {}
-        self._model_id: dict[SurfaceId, str] = {}
-        self._epoch_id: dict[SurfaceId, str] = {}
-        # Optional tz_pred feature state. -1 sentinel = "tz_pred not present
-        # in this bundle, skip the adjustment entirely".
-        self._tz_pred_idx: dict[SurfaceId, int] = {}
-        self._tz_baseline_idx: dict[SurfaceId, int] = {}
-        self._tz_preds: dict[SurfaceId, np.ndarray] = {}
-        self._tz_pred_item_to_idx: dict[SurfaceId, dict[str, int]] = {}
+        # Per-surface state, swapped in atomically by ``_fetch_callback``.
+        self._states: dict[SurfaceId, LinTSSurfaceState] = {}
 
         for surface_id, blob in self.synced_blobs.items():
             blob.set_fetch_binary_callback(partial(self._fetch_callback, surface_id=surface_id))
@@ -86,73 +149,52 @@ class LinTSInterestBackend:
         bad publish doesn't break a previously-working surface.
         """
         try:
-            parsed = self._parse_bundle(data)
+            state = self._parse_bundle(data)
         except Exception as e:
             logger.error(f"LinTSInterestBackend: failed to parse bundle for {surface_id}: {e}")
             return
 
-        # Atomic install: every field is set together so ``is_valid`` never sees
-        # a partially-loaded state.
-        self._L_packed[surface_id] = parsed["L_packed"]
-        self._theta_hat[surface_id] = parsed["theta_hat"]
-        self._item_to_idx[surface_id] = parsed["item_to_idx"]
-        self._item_topic_to_idx[surface_id] = parsed["item_topic_to_idx"]
-        self._topic_main_to_idx[surface_id] = parsed["topic_main_to_idx"]
-        self._topic_names[surface_id] = parsed["topic_names"]
-        self._dim[surface_id] = parsed["dim"]
-        self._bias_idx[surface_id] = parsed["bias_idx"]
-        self._v[surface_id] = parsed["v"]
-        self._cache_time[surface_id] = parsed["cache_time"]
-        self._model_id[surface_id] = parsed["model_id"]
-        self._epoch_id[surface_id] = parsed["epoch_id"]
-        self._tz_pred_idx[surface_id] = parsed["tz_pred_idx"]
-        self._tz_baseline_idx[surface_id] = parsed["tz_baseline_idx"]
-        self._tz_preds[surface_id] = parsed["tz_preds"]
-        self._tz_pred_item_to_idx[surface_id] = parsed["tz_pred_item_to_idx"]
+        # Atomic install: the whole state is swapped in with one assignment so
+        # requests scoring concurrently with a refresh never see a partially
+        # loaded bundle.
+        self._states[surface_id] = state
 
         logger.info(
-            f"LinTSInterestBackend: loaded {surface_id} dim={parsed['dim']} "
-            f"items={len(parsed['item_to_idx'])} epoch={parsed['epoch_id']}"
+            f"LinTSInterestBackend: loaded {surface_id} dim={state.dim} "
+            f"items={len(state.item_to_idx)} epoch={state.epoch_id}"
         )
 
     @staticmethod
-    def _parse_bundle(data: bytes) -> dict:
-        """Validate + parse a v4 bundle into a dict of fields.
+    def _parse_bundle(data: bytes) -> LinTSSurfaceState:
+        """Validate + parse a v4 bundle into a surface state.
 
         Raises if schema_version, L_format, or tensor shapes don't match
         expectations. Caller catches and treats it as "invalid bundle, keep
         existing state".
+
+        The bundle is parsed straight from the downloaded bytes, and float32
+        tensors are zero-copy views into them. ``SyncedGcsBlob`` runs this in a
+        worker thread, off the event loop.
         """
-        # safetensors' Python API takes a file path, so we land the bytes in a
-        # tempfile. The file is auto-deleted when the with-block exits.
-        with tempfile.NamedTemporaryFile(suffix=".safetensors") as tmp:
-            tmp.write(data)
-            tmp.flush()
-            with safe_open(tmp.name, framework="numpy") as st:
-                meta = st.metadata() or {}
-                schema_version = meta.get("schema_version")
-                if schema_version != SCHEMA_VERSION:
-                    raise ValueError(
-                        f"schema_version mismatch: got {schema_version!r}, "
-                        f"expected {SCHEMA_VERSION!r}"
-                    )
-                l_format = meta.get("L_format")
-                if l_format != L_FORMAT_LAPACK_LOWER_PACKED:
-                    raise ValueError(
-                        f"L_format mismatch: got {l_format!r}, "
-                        f"expected {L_FORMAT_LAPACK_LOWER_PACKED!r}"
-                    )
-
-                dim = int(meta["dim"])
-                bias_idx = int(meta["bias_idx"])
-                v = float(meta["v"])
-
-                L_packed = st.get_tensor("L_lower").copy()
-                theta_hat = st.get_tensor("theta_hat").copy()
-                tensor_keys = set(st.keys())
-                tz_preds_tensor = (
-                    st.get_tensor("tz_preds").copy() if "tz_preds" in tensor_keys else None
-                )
+        meta, tensors = read_safetensors(data)
+        schema_version = meta.get("schema_version")
+        if schema_version != SCHEMA_VERSION:
+            raise ValueError(
+                f"schema_version mismatch: got {schema_version!r}, expected {SCHEMA_VERSION!r}"
+            )
+        l_format = meta.get("L_format")
+        if l_format != L_FORMAT_LAPACK_LOWER_PACKED:
+            raise ValueError(
+                f"L_format mismatch: got {l_format!r}, expected {L_FORMAT_LAPACK_LOWER_PACKED!r}"
+            )
+
+        dim = int(meta["dim"])
+        bias_idx = int(meta["bias_idx"])
+        v = float(meta["v"])
+
+        L_packed = tensors["L_lower"]
+        theta_hat = tensors["theta_hat"]
+        tz_preds_tensor = tensors.get("tz_preds")
 
         # ml-services serializes L as float16 to halve disk/wire size; we
         # upconvert to float32 here because scipy.linalg.blas.stpsv (used at
@@ -163,6 +205,12 @@ class LinTSInterestBackend:
         # bit-identical between float32 and float16-round-tripped scores.
         if L_packed.dtype == np.float16:
             L_packed = L_packed.astype(np.float32)
+            # L dominates the bundle size. Once it is converted, copy the
+            # remaining tensors too so the views don't keep the downloaded
+            # bytes (and the float16 L in them) alive.
+            theta_hat = theta_hat.copy()
+            if tz_preds_tensor is not None:
+                tz_preds_tensor = tz_preds_tensor.copy()
         # Tensor sanity: catches truncation and silent dtype drift.
         if L_packed.dtype != np.float32 or theta_hat.dtype != np.float32:
             raise ValueError(
@@ -232,34 +280,92 @@ class LinTSInterestBackend:
         else:
             tz_preds_tensor = np.zeros((0, 0), dtype=np.float32)
 
+        item_tables = LinTSInterestBackend._build_item_tables(
+            dim=dim,
+            n_topics=len(topic_names),
+            item_to_idx=item_to_idx,
+            item_topic_to_idx=item_topic_to_idx,
+            tz_pred_item_to_idx=tz_pred_item_to_idx,
+        )
+
+        return LinTSSurfaceState(
+            L_packed=L_packed,
+            theta_hat=theta_hat,
+            item_to_idx=item_to_idx,
+            item_topic_to_idx=item_topic_to_idx,
+            topic_main_to_idx=topic_main_to_idx,
+            topic_names=topic_names,
+            dim=dim,
+            bias_idx=bias_idx,
+            v=v,
+            cache_time=cache_time,
+            model_id=meta.get("model_id", "unknown"),
+            epoch_id=epoch_id,
+            tz_pred_idx=tz_pred_idx,
+            tz_baseline_idx=tz_baseline_idx,
+            tz_preds=tz_preds_tensor,
+            tz_pred_item_to_idx=tz_pred_item_to_idx,
+            **item_tables,
+        )
+
+    @staticmethod
+    def _build_item_tables(
+        dim: int,
+        n_topics: int,
+        item_to_idx: dict[str, int],
+        item_topic_to_idx: dict[tuple[str, int], int],
+        tz_pred_item_to_idx: dict[str, int],
+    ) -> dict:
+        """Precompute dense lookup tables so ``score_request`` can gather every
+        candidate's features with a few numpy calls instead of per-item dict
+        lookups.
+
+        Every item id known to the bundle gets a row in ``item_rows``, and row
+        ``len(item_rows)`` is shared by unknown items. Missing θ̃ features point
+        at column ``dim``, which ``score_request`` pads with a zero, and missing
+        tz_pred rows are -1.
+        """
+        feature_cols = [*item_to_idx.values(), *item_topic_to_idx.values()]
+        if feature_cols and not (0 <= min(feature_cols) and max(feature_cols) < dim):
+            raise ValueError(f"item feature indexes fall outside [0, dim={dim})")
+
+        item_rows: dict[str, int] = {}
+        for iid in item_to_idx:
+            item_rows.setdefault(iid, len(item_rows))
+        for iid, _ in item_topic_to_idx:
+            item_rows.setdefault(iid, len(item_rows))
+        for iid in tz_pred_item_to_idx:
+            item_rows.setdefault(iid, len(item_rows))
+        n_rows = len(item_rows) + 1
+
+        item_main_cols = np.full(n_rows, dim, dtype=np.intp)
+        for iid, col in item_to_idx.items():
+            item_main_cols[item_rows[iid]] = col
+
+        item_topic_cols = np.full((n_rows, n_topics), dim, dtype=np.intp)
+        for (iid, t), col in item_topic_to_idx.items():
+            if 0 <= t < n_topics:
+                item_topic_cols[item_rows[iid], t] = col
+
+        tz_pred_rows = np.full(n_rows, -1, dtype=np.intp)
+        for iid, row in tz_pred_item_to_idx.items():
+            tz_pred_rows[item_rows[iid]] = row
+
         return {
-            "L_packed": L_packed,
-            "theta_hat": theta_hat,
-            "item_to_idx": item_to_idx,
-            "item_topic_to_idx": item_topic_to_idx,
-            "topic_main_to_idx": topic_main_to_idx,
-            "topic_names": topic_names,
-            "dim": dim,
-            "bias_idx": bias_idx,
-            "v": v,
-            "cache_time": cache_time,
-            "model_id": meta.get("model_id", "unknown"),
-            "epoch_id": epoch_id,
-            "tz_pred_idx": tz_pred_idx,
-            "tz_baseline_idx": tz_baseline_idx,
-            "tz_preds": tz_preds_tensor,
-            "tz_pred_item_to_idx": tz_pred_item_to_idx,
+            "item_rows": item_rows,
+            "item_main_cols": item_main_cols,
+            "item_topic_cols": item_topic_cols,
+            "tz_pred_rows": tz_pred_rows,
         }
 
     # ----------------------------------------------------------------- query
 
     def is_valid(self, surface_id: SurfaceId) -> bool:
         """Return whether this surface has a fresh, well-formed bundle loaded."""
-        cache_time = self._cache_time.get(surface_id)
-        dim = self._dim.get(surface_id)
-        if cache_time is None or not dim:
+        state = self._states.get(surface_id)
+        if state is None or not state.dim:
             return False
-        return datetime.now(timezone.utc) - cache_time <= timedelta(
+        return datetime.now(timezone.utc) - state.cache_time <= timedelta(
             minutes=VALIDITY_PERIOD_MINUTES
         )
 
@@ -287,20 +393,23 @@ class LinTSInterestBackend:
         strengths_adjusted = {
             key: remap_interests_for_real_world_strengths(val) for key, val in strengths.items()
         }
-        d = self._dim[surface_id]
-        bias_idx = self._bias_idx[surface_id]
-        v = self._v[surface_id]
-        L_packed = self._L_packed[surface_id]
-        theta_hat = self._theta_hat[surface_id]
-        item_to_idx = self._item_to_idx[surface_id]
-        item_topic_to_idx = self._item_topic_to_idx[surface_id]
-        topic_main_to_idx = self._topic_main_to_idx[surface_id]
-        topic_names = self._topic_names[surface_id]
+        # Read the state once; a refresh may swap in a new one mid-request.
+        state = self._states[surface_id]
+        d = state.dim
+        bias_idx = state.bias_idx
+        v = state.v
+        L_packed = state.L_packed
+        theta_hat = state.theta_hat
+        topic_main_to_idx = state.topic_main_to_idx
+        topic_names = state.topic_names
         n_topics = len(topic_names)
-        tz_pred_idx = self._tz_pred_idx.get(surface_id, -1)
-        tz_baseline_idx = self._tz_baseline_idx.get(surface_id, -1)
-        tz_preds = self._tz_preds.get(surface_id, np.zeros((0, 0), dtype=np.float32))
-        tz_pred_item_to_idx = self._tz_pred_item_to_idx.get(surface_id, {})
+        tz_pred_idx = state.tz_pred_idx
+        tz_baseline_idx = state.tz_baseline_idx
+        tz_preds = state.tz_preds
+        item_rows = state.item_rows
+        item_main_cols = state.item_main_cols
+        item_topic_cols = state.item_topic_cols
+        tz_pred_rows = state.tz_pred_rows
 
         # 1) Sample θ̃ = θ̂ + v · L^{-T} ε via the packed triangular solve.
         eps = rng.standard_normal(d).astype(np.float32)
@@ -335,24 +444,26 @@ class LinTSInterestBackend:
                     tz_pred_coef = float(theta_tilde[tz_pred_idx])
 
         # 3) Per-candidate: item_main if known, plus active (item × topic) pairs,
-        # plus the tz_pred contribution when the bundle exposes it.
+        # plus the tz_pred contribution when the bundle exposes it. Candidates
+        # are mapped to table rows once; unknown items land on the last row,
+        # whose features all point at the zero padding of θ̃.
+        unknown_row = len(item_rows)
+        rows = np.fromiter(
+            (item_rows.get(str(iid), unknown_row) for iid in candidate_item_ids),
+            dtype=np.intp,
+            count=len(candidate_item_ids),
+        )
+        theta_padded = np.append(theta_tilde, np.float32(0.0))
         scores = np.full(len(candidate_item_ids), const_score, dtype=np.float32)
-        for r, raw_iid in enumerate(candidate_item_ids):
-            iid = str(raw_iid)
-            ii = item_to_idx.get(iid)
-            if ii is not None:
-                scores[r] += theta_tilde[ii]
-            for t in range(n_topics):
-                sv_t = strength_vec[t]
-                if sv_t == 0.0:
-                    continue
-                pi = item_topic_to_idx.get((iid, t))
-                if pi is not None:
-                    scores[r] += sv_t * theta_tilde[pi]
-            if tz_pred_active:
-                pred_row = tz_pred_item_to_idx.get(iid)
-                if pred_row is not None:
-                    scores[r] += tz_pred_coef * float(tz_preds[pred_row, user_tz_idx])
+        scores += theta_padded[item_main_cols[rows]]
+        active_topics = np.flatnonzero(strength_vec)
+        if active_topics.size:
+            pair_cols = item_topic_cols[np.ix_(rows, active_topics)]
+            scores += theta_padded[pair_cols] @ strength_vec[active_topics]
+        if tz_pred_active:
+            pred_rows = tz_pred_rows[rows]
+            known = pred_rows >= 0
+            scores[known] += np.float32(tz_pred_coef) * tz_preds[pred_rows[known], user_tz_idx]
         return scores
 
     def has_item(self, surface_id: SurfaceId, corpus_item_id: str) -> bool:
@@ -361,14 +472,15 @@ class LinTSInterestBackend:
         Useful for callers that want to fall back to vanilla TS for the
         unknown-item portion of the candidate set.
         """
-        items = self._item_to_idx.get(surface_id)
-        if items is None:
+        state = self._states.get(surface_id)
+        if state is None:
             return False
-        return str(corpus_item_id) in items
+        return str(corpus_item_id) in state.item_to_idx
 
     def get_model_id(self, surface_id: SurfaceId) -> str | None:
         """Return the inferred-interests model id this surface was trained on."""
-        return self._model_id.get(surface_id)
+        state = self._states.get(surface_id)
+        return state.model_id if state is not None else None
 
     @property
     def update_count(self) -> int:
@@ -5,6 +5,7 @@ from typing import cast
 
 
 from merino.curated_recommendations import LocalModelBackend, MLRecsBackend
+from merino.curated_recommendations.candidate_snapshots import CandidateSnapshotStore
 from merino.curated_recommendations.ml_backends.lints_interest_model import (
     EmptyLinTSInterestBackend,
     LinTSInterestBackend,
@@ -73,6 +74,7 @@ class CuratedRecommendationsProvider:
         cohort_model_backend: CohortModelBackend,
         lints_interest_backend: LinTSInterestBackend | EmptyLinTSInterestBackend,
         spindle_backend: SpindleBackendProtocol | None = None,
+        candidate_snapshots: CandidateSnapshotStore | None = None,
     ) -> None:
         """Initialize the provider with all backend dependencies."""
         self.scheduled_surface_backend = scheduled_surface_backend
@@ -84,6 +86,7 @@ class CuratedRecommendationsProvider:
         self.cohort_model_backend = cohort_model_backend
         self.lints_interest_backend = lints_interest_backend
         self.spindle_backend = spindle_backend
+        self.candidate_snapshots = candidate_snapshots
 
     @staticmethod
     def is_sections_experiment(
@@ -169,6 +172,11 @@ class CuratedRecommendationsProvider:
                 self.cohort_model_backend,
                 cohort_model_training_run_id=cohort_model_training_run_id,
             )
+            candidate_snapshot = (
+                await self.candidate_snapshots.get(surface_id, region, engagement_region)
+                if self.candidate_snapshots
+                else None
+            )
             sections_feeds = await get_sections(
                 request,
                 surface_id,
@@ -181,10 +189,16 @@ class CuratedRecommendationsProvider:
                 region=region,
                 engagement_region=engagement_region,
                 spindle_backend=self.spindle_backend,
+                candidate_snapshot=candidate_snapshot,
             )
         elif surface_id in ROLLED_OUT_SECTION_SURFACES:
             # Rolled-out section surfaces: fetch from sections backend instead of scheduler
             rescaler = CrawledContentRescaler()
+            candidate_snapshot = (
+                await self.candidate_snapshots.get(surface_id, region)
+                if self.candidate_snapshots
+                else None
+            )
             general_feed = await get_legacy_recommendations_from_sections(
                 sections_backend=self.sections_backend,
                 engagement_backend=self.engagement_backend,
@@ -193,6 +207,7 @@ class CuratedRecommendationsProvider:
                 count=request.count,
                 region=region,
                 rescaler=rescaler,
+                candidate_snapshot=candidate_snapshot,
             )
         else:
             # Other markets: fetch from scheduled surface backend
@@ -2,6 +2,7 @@
 
 import numpy as np
 
+from merino.curated_recommendations.candidate_snapshots import CandidateSnapshot
 from merino.curated_recommendations.corpus_backends.protocol import SurfaceId
 from merino.curated_recommendations.ml_backends.protocol import (
     ContextualArticleRankings,
@@ -60,8 +61,9 @@ class ContextualRanker(Ranker):
         region_weight: float = REGION_ENGAGEMENT_WEIGHT,
         ml_backend: MLRecsBackend | None = None,
         disable_time_zone_context: bool = False,
+        candidate_snapshot: CandidateSnapshot | None = None,
     ) -> None:
-        super().__init__(engagement_backend, prior_backend, region_weight)
+        super().__init__(engagement_backend, prior_backend, region_weight, candidate_snapshot)
         assert ml_backend is not None
         self.surface_id: SurfaceId = surface_id
         self.ml_backend: MLRecsBackend = ml_backend
@@ -113,15 +115,16 @@ class ContextualRanker(Ranker):
         contextual_scores: ContextualArticleRankings | None
         contextual_scores = self.ml_backend.get(self.surface_id, region, cohort, time_zone)
         rng = np.random.default_rng()
-        for rec in recs:
-            opens, no_opens, a_prior, b_prior, non_rescaled_b_prior = self.compute_interactions(
-                rec,
-                rescaler,
-                region,
-                engagement_region=engagement_region,
-                regional_prior=regional_prior,
-                blend_region_with_global=False,
-            )
+        all_interactions = self.compute_interactions_many(
+            recs,
+            rescaler,
+            region,
+            engagement_region=engagement_region,
+            regional_prior=regional_prior,
+            blend_region_with_global=False,
+        )
+        for rec, interactions in zip(recs, all_interactions):
+            opens, no_opens, a_prior, b_prior, non_rescaled_b_prior = interactions
             is_fresh = False
             # add random value between 0 and 1 to break ties randomly
             score = None
@@ -11,6 +11,7 @@ import logging
 import numpy as np
 from scipy.stats import beta
 
+from merino.curated_recommendations.candidate_snapshots import CandidateSnapshot
 from merino.curated_recommendations.corpus_backends.protocol import SurfaceId
 from merino.curated_recommendations.engagement_backends.protocol import EngagementBackend
 from merino.curated_recommendations.ml_backends.lints_interest_model import (
@@ -60,8 +61,9 @@ class InterestRanker(Ranker):
         surface_id: SurfaceId,
         lints_backend: LinTSInterestBackend | EmptyLinTSInterestBackend,
         region_weight: float = REGION_ENGAGEMENT_WEIGHT,
+        candidate_snapshot: CandidateSnapshot | None = None,
     ) -> None:
-        super().__init__(engagement_backend, prior_backend, region_weight)
+        super().__init__(engagement_backend, prior_backend, region_weight, candidate_snapshot)
         self.surface_id: SurfaceId = surface_id
         self.lints_backend = lints_backend
 
@@ -107,13 +109,14 @@ class InterestRanker(Ranker):
             logger.error(f"InterestRanker: score_request failed; falling back: {e}")
             model_scores = None
 
-        for r, rec in enumerate(recs):
-            opens, no_opens, a_prior, b_prior, non_rescaled_b_prior = self.compute_interactions(
-                rec,
-                rescaler,
-                region,
-                blend_region_with_global=False,
-            )
+        all_interactions = self.compute_interactions_many(
+            recs,
+            rescaler,
+            region,
+            blend_region_with_global=False,
+        )
+        for r, (rec, interactions) in enumerate(zip(recs, all_interactions)):
+            opens, no_opens, a_prior, b_prior, non_rescaled_b_prior = interactions
 
             # Two conditions must hold to use the LinTS score:
             #   (1) model_scores is not None — score_request didn't crash
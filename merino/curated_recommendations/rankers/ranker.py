@@ -4,6 +4,9 @@ import logging
 
 from random import sample as random_sample
 
+import numpy as np
+
+from merino.curated_recommendations.candidate_snapshots import CandidateSnapshot
 from merino.curated_recommendations.engagement_backends.protocol import EngagementBackend
 from merino.curated_recommendations.prior_backends.constant_prior import ConstantPrior
 from merino.curated_recommendations.prior_backends.protocol import (
@@ -20,6 +23,8 @@ from merino.curated_recommendations.rankers.utils import REGION_ENGAGEMENT_WEIGH
 
 logger = logging.getLogger(__name__)
 
+Interactions = tuple[float, float, float, float, float]
+
 
 class Ranker:
     """Base class for ranking curated recommendations"""
@@ -29,10 +34,12 @@ class Ranker:
         engagement_backend: EngagementBackend,
         prior_backend: PriorBackend,
         region_weight: float = REGION_ENGAGEMENT_WEIGHT,
+        candidate_snapshot: CandidateSnapshot | None = None,
     ) -> None:
         self.engagement_backend = engagement_backend
         self.prior_backend = prior_backend
         self.region_weight = region_weight
+        self.candidate_snapshot = candidate_snapshot
 
     def get_opens_no_opens(
         self, rec: CuratedRecommendation, region_query: str | None = None
@@ -63,6 +70,15 @@ class Ranker:
         if engagement_region is None or engagement_region == region:
             return engagement_region
 
+        snapshot = self.candidate_snapshot
+        if snapshot is not None and snapshot.covers(engagement_region):
+            rows = snapshot.rows(rec.corpusItemId for rec in recs)
+            known = rows >= 0
+            if snapshot.engagement[engagement_region].has_engagement[rows[known]].any():
+                return engagement_region
+            # Only candidates that were added since the snapshot was built remain to be checked.
+            recs = [rec for rec, is_known in zip(recs, known) if not is_known]
+
         for rec in recs:
             if self.engagement_backend.get(rec.corpusItemId, engagement_region) is not None:
                 return engagement_region
@@ -94,7 +110,7 @@ class Ranker:
         engagement_region: str | None = None,
         regional_prior: Prior | None = None,
         blend_region_with_global=True,
-    ) -> tuple[float, float, float, float, float]:
+    ) -> Interactions:
         """Compute opens, no_opens, a_prior, b_prior, non_rescaled_b_prior for a recommendation."""
         opens, no_opens, _ = self.get_opens_no_opens(rec)
         region_query = engagement_region if engagement_region is not None else region
@@ -124,6 +140,95 @@ class Ranker:
 
         return opens, no_opens, a_prior, b_prior, non_rescaled_b_prior
 
+    def compute_interactions_many(
+        self,
+        recs: list[CuratedRecommendation],
+        rescaler: EngagementRescaler | None = None,
+        region: str | None = None,
+        engagement_region: str | None = None,
+        regional_prior: Prior | None = None,
+        blend_region_with_global=True,
+    ) -> list[Interactions]:
+        """Compute the interactions of each recommendation, like `compute_interactions`.
+
+        Engagement and priors of recommendations in the candidate snapshot are blended in a single
+        vectorized pass. Other recommendations are looked up one at a time.
+        """
+        region_query = engagement_region if engagement_region is not None else region
+        snapshot = self.candidate_snapshot
+        rows = (
+            snapshot.rows(rec.corpusItemId for rec in recs)
+            if snapshot is not None and snapshot.covers(None, region, region_query)
+            else None
+        )
+        if snapshot is None or rows is None or not (rows >= 0).any():
+            return [
+                self.compute_interactions(
+                    rec,
+                    rescaler,
+                    region,
+                    engagement_region,
+                    regional_prior,
+                    blend_region_with_global,
+                )
+                for rec in recs
+            ]
+
+        opens, no_opens = snapshot.engagement[None].opens_no_opens(rows)
+        region_opens, region_no_opens = snapshot.engagement[region_query].opens_no_opens(rows)
+
+        prior: Prior = snapshot.priors[None] or ConstantPrior().get()
+        a_prior = np.full(len(recs), float(prior.alpha))
+        b_prior = np.full(len(recs), float(prior.beta))
+        region_prior = regional_prior if regional_prior is not None else snapshot.priors[region]
+
+        if region_prior:
+            # Weighted average of regional and global engagement
+            region_weight = self.region_weight if blend_region_with_global else 1.0
+            blend = region_no_opens != 0
+            opens = np.where(
+                blend, region_opens * region_weight + opens * (1 - region_weight), opens
+            )
+            no_opens = np.where(
+                blend, region_no_opens * region_weight + no_opens * (1 - region_weight), no_opens
+            )
+            a_prior = np.where(
+                blend,
+                (region_weight * region_prior.alpha) + ((1 - region_weight) * a_prior),
+                a_prior,
+            )
+            b_prior = np.where(
+                blend,
+                (region_weight * region_prior.beta) + ((1 - region_weight) * b_prior),
+                b_prior,
+            )
+
+        interactions: list[Interactions] = []
+        for rec, row, rec_opens, rec_no_opens, rec_a_prior, rec_b_prior in zip(
+            recs, rows, opens.tolist(), no_opens.tolist(), a_prior.tolist(), b_prior.tolist()
+        ):
+            if row < 0:
+                interactions.append(
+                    self.compute_interactions(
+                        rec,
+                        rescaler,
+                        region,
+                        engagement_region,
+                        regional_prior,
+                        blend_region_with_global,
+                    )
+                )
+                continue
+            if rescaler is not None:
+                rec_opens, rec_no_opens = rescaler.rescale(rec, rec_opens, rec_no_opens)
+            non_rescaled_b_prior = rec_b_prior
+            if rescaler is not None:
+                rec_a_prior, rec_b_prior = rescaler.rescale_prior(rec, rec_a_prior, rec_b_prior)
+            interactions.append(
+                (rec_opens, rec_no_opens, rec_a_prior, rec_b_prior, non_rescaled_b_prior)
+            )
+        return interactions
+
     def suppress_fresh_items(
         self, scored_recs: list[CuratedRecommendation], fresh_items_max: int
     ) -> None:
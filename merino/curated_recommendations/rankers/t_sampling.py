@@ -16,7 +16,7 @@ from merino.curated_recommendations.protocol import (
 )
 from scipy.stats import beta
 
-from merino.curated_recommendations.rankers.ranker import Ranker
+from merino.curated_recommendations.rankers.ranker import Interactions, Ranker
 from merino.curated_recommendations.rankers.utils import (
     INFERRED_SCORE_WEIGHT,
     filter_fresh_items_with_probability,
@@ -80,15 +80,9 @@ class ThompsonSamplingRanker(Ranker):
                 * PERSONALIZATION_TOPIC_WEIGHTING.get(rec.topic, 1.0)
             )
 
-        def compute_ranking_scores(rec: CuratedRecommendation):
+        def compute_ranking_scores(rec: CuratedRecommendation, interactions: Interactions):
             """Sample beta distributed from weighted regional/global engagement for a recommendation."""
-            opens, no_opens, a_prior, b_prior, non_rescaled_b_prior = self.compute_interactions(
-                rec,
-                rescaler,
-                region,
-                engagement_region=engagement_region,
-                regional_prior=regional_prior,
-            )
+            opens, no_opens, a_prior, b_prior, non_rescaled_b_prior = interactions
             # Add priors and ensure opens and no_opens are > 0, which is required by beta.rvs.
             alpha_val = opens + max(a_prior, 1e-18)
             beta_val = no_opens + max(b_prior, 1e-18)
@@ -105,8 +99,15 @@ class ThompsonSamplingRanker(Ranker):
                     rec.ranking_data.is_fresh = True
                     rec.ranking_data.remaining_impressions = int(target_no_opens - no_opens)
 
-        for rec in recs:
-            compute_ranking_scores(rec)
+        all_interactions = self.compute_interactions_many(
+            recs,
+            rescaler,
+            region,
+            engagement_region=engagement_region,
+            regional_prior=regional_prior,
+        )
+        for rec, interactions in zip(recs, all_interactions):
+            compute_ranking_scores(rec, interactions)
         self.suppress_fresh_items(recs, fresh_items_max)
         # Sort the recommendations from best to worst sampled score & renumber
         sorted_recs = sorted(
@@ -164,16 +165,15 @@ class ThompsonSamplingRanker(Ranker):
             # This should be transitioned to use the results of compute_interactions function below
             prior = ConstantPrior().get()
 
-            for rec in recs:
-                opens, no_opens, a_prior, b_prior, non_rescaled_b_prior = (
-                    self.compute_interactions(
-                        rec,
-                        rescaler,
-                        region,
-                        engagement_region=engagement_region,
-                        regional_prior=regional_prior,
-                    )
-                )
+            all_interactions = self.compute_interactions_many(
+                recs,
+                rescaler,
+                region,
+                engagement_region=engagement_region,
+                regional_prior=regional_prior,
+            )
+            for rec, interactions in zip(recs, all_interactions):
+                opens, no_opens, a_prior, b_prior, non_rescaled_b_prior = interactions
                 total_clicks += opens
                 total_imps += no_opens
 
@@ -9,6 +9,7 @@ import math
 from copy import copy
 from datetime import datetime, timedelta, timezone
 
+from merino.curated_recommendations.candidate_snapshots import CandidateSnapshot
 from merino.curated_recommendations.corpus_backends.protocol import Topic
 from merino.curated_recommendations.engagement_backends.protocol import EngagementBackend
 from merino.curated_recommendations.protocol import (
@@ -75,6 +76,7 @@ def takedown_reported_recommendations(
     region: str | None = None,
     report_ratio_threshold: float = DEFAULT_REPORT_RECS_RATIO_THRESHOLD,
     safeguard_cap_takedown_fraction: float = DEFAULT_SAFEGUARD_CAP_TAKEDOWN_FRACTION,
+    candidate_snapshot: CandidateSnapshot | None = None,
 ) -> list[CuratedRecommendation]:
     """Takedown highly-reported content & return filtered list of recommendations.
 
@@ -87,6 +89,8 @@ def takedown_reported_recommendations(
     :param region: Optionally, the client's region, e.g. 'US'.
     :param report_ratio_threshold: Threshold indicating which recommendation should be excluded.
     :param safeguard_cap_takedown_fraction: Max fraction of recommendations that can be auto-removed.
+    :param candidate_snapshot: Optionally, precomputed engagement of the candidates. Engagement
+        is looked up in the engagement_backend for recommendations that are not in the snapshot.
 
     :return: Filtered list of recommendations.
     """
@@ -106,7 +110,42 @@ def takedown_reported_recommendations(
                 )
         return False
 
-    over = [rec for rec in recs if _should_remove(rec)]
+    rows = (
+        candidate_snapshot.rows(rec.corpusItemId for rec in recs)
+        if candidate_snapshot is not None and region in candidate_snapshot.engagement
+        else None
+    )
+    if candidate_snapshot is not None and rows is not None and (rows >= 0).any():
+        engagement = candidate_snapshot.engagement[region]
+        known = rows >= 0
+        # Only gather the rows of items in the snapshot, rows of other items are -1.
+        impressions = np.zeros(len(recs))
+        reports = np.zeros(len(recs))
+        impressions[known] = engagement.impressions[rows[known]]
+        reports[known] = engagement.reports[rows[known]]
+        report_ratios = np.divide(
+            reports, impressions, out=np.zeros_like(reports), where=impressions > 0
+        )
+        over_mask = (report_ratios > report_ratio_threshold) & (
+            reports >= DEFAULT_REPORT_COUNT_THRESHOLD
+        )
+        over = []
+        for rec, is_known, is_over, ratio, _reports, _impressions in zip(
+            recs,
+            known.tolist(),
+            over_mask.tolist(),
+            report_ratios.tolist(),
+            reports.tolist(),
+            impressions.tolist(),
+        ):
+            if not is_known:
+                if _should_remove(rec):
+                    over.append(rec)
+            elif is_over:
+                rec_eng_metrics[rec.corpusItemId] = (ratio, int(_reports), int(_impressions))
+                over.append(rec)
+    else:
+        over = [rec for rec in recs if _should_remove(rec)]
     if not over:
         return recs
 
@@ -1,11 +1,12 @@
 """Module for building and ranking curated recommendation sections."""
 
 import logging
-from copy import deepcopy
-
 import random
+import weakref
+from typing import NamedTuple
 
 from merino.curated_recommendations import EngagementBackend
+from merino.curated_recommendations.candidate_snapshots import CandidateSnapshot
 from merino.curated_recommendations.corpus_backends.protocol import (
     SectionsProtocol,
     SurfaceId,
@@ -100,6 +101,24 @@ SECTION_ITEM_RANKING_TOP_N = 4
 DEFAULT_TOPIC_INTERESTS: dict[str, float] = {"arts": 1.1, "government": 1.1}
 
 
+class _PrebuiltRecommendations(NamedTuple):
+    """Recommendations mapped once from a corpus section, shared by all requests."""
+
+    section_ref: weakref.ref
+    section_items: list[CorpusItem]
+    recommendations: tuple[CuratedRecommendation, ...]
+
+
+# Prebuilt recommendations keyed by (id(corpus_section), is_legacy_section). Corpus sections
+# are cached by the sections backend until the next refresh, and entries are evicted when the
+# corpus section they were built from is garbage collected.
+_prebuilt_recommendations: dict[tuple[int, bool], _PrebuiltRecommendations] = {}
+
+# Ad-free variants of layouts keyed by id(layout). The original layout is kept alive with its
+# variant, so that its id cannot be reused.
+_layouts_without_ads: dict[int, tuple[Layout, Layout]] = {}
+
+
 def map_section_item_to_recommendation(
     item: CorpusItem,
     rank: int,
@@ -151,6 +170,66 @@ def map_corpus_section_to_section(
     Returns:
         A Section model containing mapped recommendations and default layout.
     """
+    # Recommendations are built once per corpus refresh and shallow-copied per request, so that
+    # per-request fields (e.g. receivedRank, serverScore) can be set without re-validating them.
+    recommendations = [
+        rec.model_copy() for rec in get_prebuilt_recommendations(corpus_section, is_legacy_section)
+    ]
+    return Section(
+        receivedFeedRank=rank,
+        recommendations=recommendations,
+        title=corpus_section.title,
+        subtitle=corpus_section.description,
+        heroTitle=corpus_section.heroTitle,
+        heroSubtitle=corpus_section.heroSubtitle,
+        iab=corpus_section.iab,
+        layout=layout,
+        followable=corpus_section.followable,
+        allowAds=corpus_section.allowAds,
+    )
+
+
+def get_prebuilt_recommendations(
+    corpus_section: CorpusSection,
+    is_legacy_section: bool = False,
+) -> tuple[CuratedRecommendation, ...]:
+    """Return the recommendations of a corpus section, mapping them on first use.
+
+    The returned recommendations are shared between requests and must not be mutated; use
+    `model_copy()` to get a per-request recommendation.
+
+    Args:
+        corpus_section: The corpus section to map.
+        is_legacy_section: If section is one of the standard historical sections
+
+    Returns:
+        The deduplicated recommendations of the section, in order of their receivedRank.
+    """
+    key = (id(corpus_section), is_legacy_section)
+    prebuilt = _prebuilt_recommendations.get(key)
+    if (
+        prebuilt is not None
+        and prebuilt.section_ref() is corpus_section
+        and prebuilt.section_items is corpus_section.sectionItems
+    ):
+        return prebuilt.recommendations
+
+    recommendations = _build_section_recommendations(corpus_section, is_legacy_section)
+    _prebuilt_recommendations[key] = _PrebuiltRecommendations(
+        section_ref=weakref.ref(
+            corpus_section, lambda _: _prebuilt_recommendations.pop(key, None)
+        ),
+        section_items=corpus_section.sectionItems,
+        recommendations=recommendations,
+    )
+    return recommendations
+
+
+def _build_section_recommendations(
+    corpus_section: CorpusSection,
+    is_legacy_section: bool,
+) -> tuple[CuratedRecommendation, ...]:
+    """Map the deduplicated items of a corpus section to recommendations."""
     item_flags = set()
     is_manual_section = corpus_section.createSource == CreateSource.MANUAL
     is_headlines = corpus_section.externalId == HEADLINES_SECTION_KEY
@@ -169,7 +248,7 @@ def map_corpus_section_to_section(
             continue
         seen_ids.add(item.corpusItemId)
         section_items.append(item)
-    recommendations = [
+    return tuple(
         map_section_item_to_recommendation(
             item,
             rank,
@@ -178,18 +257,6 @@ def map_corpus_section_to_section(
             is_manual_section=is_manual_section,
         )
         for rank, item in enumerate(section_items)
-    ]
-    return Section(
-        receivedFeedRank=rank,
-        recommendations=recommendations,
-        title=corpus_section.title,
-        subtitle=corpus_section.description,
-        heroTitle=corpus_section.heroTitle,
-        heroSubtitle=corpus_section.heroSubtitle,
-        iab=corpus_section.iab,
-        layout=deepcopy(layout),
-        followable=corpus_section.followable,
-        allowAds=corpus_section.allowAds,
     )
 
 
@@ -336,14 +403,34 @@ def adjust_ads_in_sections(sections: dict[str, Section]) -> None:
         sections: Mapping of section IDs to Section objects.
 
     Returns:
-        None. Mutates tile.hasAd flags in-place.
+        None. Replaces the layout of sections without ads in-place.
     """
     allowed_ranks = {0, 1, 2, 4, 6, 8, 10, 12, 14, 16, 18}
     for sec in sections.values():
         if not sec.allowAds or sec.receivedFeedRank not in allowed_ranks:
-            for rl in sec.layout.responsiveLayouts:
-                for tile in rl.tiles:
-                    tile.hasAd = False
+            sec.layout = get_layout_without_ads(sec.layout)
+
+
+def get_layout_without_ads(layout: Layout) -> Layout:
+    """Return a variant of the layout with ads disabled on all tiles.
+
+    Layouts are shared between sections and requests, so the variant is a copy that is built
+    once per layout, and the given layout is not modified.
+    """
+    if not any(tile.hasAd for rl in layout.responsiveLayouts for tile in rl.tiles):
+        return layout
+
+    cached = _layouts_without_ads.get(id(layout))
+    if cached is not None:
+        return cached[1]
+
+    responsive_layouts = [
+        rl.model_copy(update={"tiles": [t.model_copy(update={"hasAd": False}) for t in rl.tiles]})
+        for rl in layout.responsiveLayouts
+    ]
+    layout_without_ads = layout.model_copy(update={"responsiveLayouts": responsive_layouts})
+    _layouts_without_ads[id(layout)] = (layout, layout_without_ads)
+    return layout_without_ads
 
 
 def is_contextual_ads_experiment(request: CuratedRecommendationsRequest) -> bool:
@@ -553,7 +640,7 @@ def cycle_layouts_for_ranked_sections(sections: dict[str, Section], layout_cycle
         if sid not in (DAILY_BRIEFING_SECTION_KEY, "top_stories_section")
     ]
     for idx, section in enumerate(ranked_sections):
-        section.layout = deepcopy(layout_cycle[idx % len(layout_cycle)])
+        section.layout = layout_cycle[idx % len(layout_cycle)]
 
 
 def put_daily_briefing_first_then_top_stories(
@@ -834,6 +921,7 @@ async def get_sections(
     region: str | None = None,
     engagement_region: str | None = None,
     spindle_backend: SpindleBackendProtocol | None = None,
+    candidate_snapshot: CandidateSnapshot | None = None,
 ) -> dict[str, Section]:
     """Build, rank, and layout recommendation sections for a "sections" experiment.
 
@@ -844,6 +932,7 @@ async def get_sections(
         engagement_backend: Backend to fetch click/impression data.
         prior_backend: Backend providing priors for Thompson sampling.
         region: Two-letter region code, or None.
+        candidate_snapshot: Precomputed engagement and priors of the candidates, or None.
 
     Returns:
         A dict mapping section IDs to fully-configured Section models.
@@ -885,6 +974,7 @@ async def get_sections(
         all_corpus_recommendations,
         engagement_backend=engagement_backend,
         region=region,
+        candidate_snapshot=candidate_snapshot,
     )
 
     # 6. Update corpus_sections to make sure reported takedown recs are not present
@@ -927,6 +1017,7 @@ async def get_sections(
             prior_backend=prior_backend,
             surface_id=surface_id,
             lints_backend=lints_interest_backend,
+            candidate_snapshot=candidate_snapshot,
         )
     elif use_contexual_ranker:
         is_inferred_time_zone_experiment_enabled = is_inferred_time_zone_experiment(request)
@@ -944,10 +1035,13 @@ async def get_sections(
             prior_backend=prior_backend,
             surface_id=surface_id,
             ml_backend=ml_backend,
+            candidate_snapshot=candidate_snapshot,
         )
     else:
         ranker = ThompsonSamplingRanker(
-            engagement_backend=engagement_backend, prior_backend=prior_backend
+            engagement_backend=engagement_backend,
+            prior_backend=prior_backend,
+            candidate_snapshot=candidate_snapshot,
         )
 
     # 7. Rank all corpus recommendations globally by engagement
@@ -1001,7 +1095,7 @@ async def get_sections(
             receivedFeedRank=0,
             recommendations=top_stories,
             title=get_translation(surface_id, "top-stories", "Popular Today"),
-            layout=deepcopy(popular_today_layout),
+            layout=popular_today_layout,
         )
     }
 
@@ -1013,13 +1107,14 @@ async def get_sections(
         daily_briefing_section = map_corpus_section_to_section(
             corpus_section=raw_daily_briefing,
             rank=0,
-            layout=deepcopy(layout_4_medium),
+            layout=layout_4_medium,
             is_legacy_section=False,
         )
         daily_briefing_section.recommendations = takedown_reported_recommendations(
             daily_briefing_section.recommendations,
             engagement_backend=engagement_backend,
             region=region,
+            candidate_snapshot=candidate_snapshot,
         )
         if request.sections:
             daily_briefing_section.recommendations = exclude_recommendations_from_blocked_sections(
@@ -1028,7 +1123,7 @@ async def get_sections(
         sections[DAILY_BRIEFING_SECTION_KEY] = daily_briefing_section
         if should_show_popular_today_with_daily_briefing(request):
             # briefing-with-popular: show both Daily Briefing and Popular Today (shrink)
-            sections["top_stories_section"].layout = deepcopy(layout_4_medium)
+            sections["top_stories_section"].layout = layout_4_medium
         else:
             # briefing-without-popular: remove Popular Today entirely
             sections.pop("top_stories_section", None)
@@ -0,0 +1,186 @@
+"""Per-provider admission control for suggest queries.
+
+Every suggest request queries each of its providers, so a backend that slows down
+(e.g. Elasticsearch, AccuWeather, AeroAPI, Polygon) ends up with a growing pile of
+queries in flight that will mostly time out anyway. An admission controller caps the
+number of in-flight queries of a provider and sheds the queries over that cap right
+away, rather than queueing them: a shed provider simply contributes no suggestions to
+the request, the same as a timed out one.
+
+The cap adapts to the backend with AIMD (additive increase, multiplicative decrease):
+  - A query that fails or times out is a congestion signal, and so is a successful
+    query while the moving average (EWMA) of the provider's successful latencies is
+    above its latency target. A congestion signal cuts the limit by `decrease_ratio`,
+    down to `min_concurrency`. Queries that were already in flight when the limit was
+    cut do not cut it again, so a burst of failures only cuts it once.
+  - Every other query raises the limit by `1 / limit`, i.e. by about one per
+    limit's worth of successful queries, up to `max_concurrency`.
+
+Averaging the latencies means a sustained slowdown cuts the limit while an isolated
+slow query does not: since slower queries time out, a single one can raise the average
+by at most `latency_ewma_weight` times the query timeout.
+
+Admission control works alongside the circuit breakers in `circuitbreakers.py`: the
+breaker still guards the backend call inside the provider, and a `CircuitBreakerError`
+from an open breaker is neither a success nor a congestion signal for the limit.
+"""
+
+import time
+from asyncio import Task
+from collections.abc import Mapping
+from typing import Any
+
+from circuitbreaker import CircuitBreakerError
+
+
+class AdmissionController:
+    """Limit the number of in-flight queries of a provider with an AIMD limit.
+
+    This behaves like a non-blocking semaphore whose size is the current limit:
+    `try_acquire()` takes a slot if one is free, and the slot is given back when the
+    query finishes. `asyncio.Semaphore` cannot be resized, hence the plain counter,
+    which is safe since it is only touched from the event loop.
+
+    Args:
+        name: The name of the provider.
+        max_concurrency: The max (and initial) number of in-flight queries.
+        min_concurrency: The number of in-flight queries always admitted.
+        latency_target_sec: Queries count as a congestion signal while the moving
+            average of the successful latencies is above this.
+        decrease_ratio: The ratio the limit is multiplied by on a congestion signal.
+        latency_ewma_weight: The weight of the latest latency in the moving average.
+    """
+
+    name: str
+    max_concurrency: int
+    min_concurrency: int
+    latency_target_sec: float
+    decrease_ratio: float
+    latency_ewma_weight: float
+    limit: float
+    in_flight: int
+    latency_ewma: float
+
+    def __init__(
+        self,
+        name: str,
+        max_concurrency: int,
+        min_concurrency: int,
+        latency_target_sec: float,
+        decrease_ratio: float = 0.5,
+        latency_ewma_weight: float = 0.2,
+    ) -> None:
+        if not 1 <= min_concurrency <= max_concurrency:
+            raise ValueError(
+                f"Expected 1 <= min_concurrency <= max_concurrency for {name}, "
+                f"got {min_concurrency} and {max_concurrency}"
+            )
+        self.name = name
+        self.max_concurrency = max_concurrency
+        self.min_concurrency = min_concurrency
+        self.latency_target_sec = latency_target_sec
+        self.decrease_ratio = decrease_ratio
+        self.latency_ewma_weight = latency_ewma_weight
+        self.limit = float(max_concurrency)
+        self.in_flight = 0
+        self.latency_ewma = 0.0
+        # Monotonic time of the last decrease. Queries started before it don't decrease.
+        self._decreased_at = float("-inf")
+
+    def try_acquire(self) -> bool:
+        """Take an in-flight slot, or return False if the provider is at its limit."""
+        if self.in_flight >= int(self.limit):
+            return False
+        self.in_flight += 1
+        return True
+
+    def release(self, started_at: float, congested: bool | None) -> None:
+        """Give back the slot of a finished query and adapt the limit to its outcome.
+
+        Args:
+            started_at: The monotonic time the query was admitted at.
+            congested: Whether the query failed or timed out. None leaves the limit and
+                the latency average as they are.
+        """
+        self.in_flight -= 1
+        now = time.monotonic()
+        if congested is None:
+            return
+        if not congested:
+            self.latency_ewma += self.latency_ewma_weight * (now - started_at - self.latency_ewma)
+            congested = self.latency_ewma > self.latency_target_sec
+        if congested:
+            if started_at >= self._decreased_at:
+                self.limit = max(float(self.min_concurrency), self.limit * self.decrease_ratio)
+                self._decreased_at = now
+        else:
+            self.limit = min(float(self.max_concurrency), self.limit + 1 / self.limit)
+
+    def track(self, task: Task[Any]) -> None:
+        """Release the slot taken for a query task once it is done.
+
+        A task that raised or was cancelled (e.g. timed out) signals congestion, except
+        for a `CircuitBreakerError`, which says nothing about the backend's capacity.
+        """
+        started_at = time.monotonic()
+
+        def _on_done(task: Task[Any]) -> None:
+            congested: bool | None
+            if task.cancelled():
+                congested = True
+            elif isinstance(task.exception(), CircuitBreakerError):
+                congested = None
+            else:
+                congested = task.exception() is not None
+            self.release(started_at, congested)
+
+        task.add_done_callback(_on_done)
+
+
+class AdmissionControllers:
+    """The admission controllers of the providers with a concurrency limit.
+
+    Controllers are created on first use, since the latency target is derived from the
+    provider's query timeout.
+
+    Args:
+        max_concurrency: The max number of in-flight queries of each limited provider,
+            by provider name. Providers not in it are never shed.
+        min_concurrency: The number of in-flight queries always admitted per provider.
+        decrease_ratio: The ratio a limit is multiplied by on a congestion signal.
+        latency_target_ratio: The fraction of a provider's query timeout above which the
+            moving average of its latencies counts as a congestion signal.
+        latency_ewma_weight: The weight of the latest latency in the moving average.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: Mapping[str, int],
+        min_concurrency: int,
+        decrease_ratio: float,
+        latency_target_ratio: float,
+        latency_ewma_weight: float = 0.2,
+    ) -> None:
+        self.max_concurrency = dict(max_concurrency)
+        self.min_concurrency = min_concurrency
+        self.decrease_ratio = decrease_ratio
+        self.latency_target_ratio = latency_target_ratio
+        self.latency_ewma_weight = latency_ewma_weight
+        self._controllers: dict[str, AdmissionController] = {}
+
+    def get(self, name: str, query_timeout_sec: float) -> AdmissionController | None:
+        """Return the admission controller of a provider, or None if it has no limit."""
+        if (controller := self._controllers.get(name)) is not None:
+            return controller
+        if (max_concurrency := self.max_concurrency.get(name)) is None:
+            return None
+        controller = AdmissionController(
+            name=name,
+            max_concurrency=max_concurrency,
+            min_concurrency=min(self.min_concurrency, max_concurrency),
+            latency_target_sec=query_timeout_sec * self.latency_target_ratio,
+            decrease_ratio=self.decrease_ratio,
+            latency_ewma_weight=self.latency_ewma_weight,
+        )
+        self._controllers[name] = controller
+        return controller
@@ -5,7 +5,11 @@ from typing import Any
 
 import kinto_http
 
-from merino.jobs.utils.chunked_rs_uploader import Chunk, ChunkedRemoteSettingsUploader
+from merino.jobs.utils.chunked_rs_uploader import (
+    DEFAULT_MAX_CONCURRENT_UPLOADS,
+    Chunk,
+    ChunkedRemoteSettingsUploader,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +37,7 @@ class ChunkedRemoteSettingsSuggestionUploader(ChunkedRemoteSettingsUploader):
         suggestion_score_fallback: float | None = None,
         total_item_count: int | None = None,
         chunk_cls=Chunk,
+        max_concurrent_uploads: int = DEFAULT_MAX_CONCURRENT_UPLOADS,
     ):
         """Initialize the uploader."""
         super(ChunkedRemoteSettingsSuggestionUploader, self).__init__(
@@ -45,6 +50,7 @@ class ChunkedRemoteSettingsSuggestionUploader(ChunkedRemoteSettingsUploader):
             dry_run,
             total_item_count,
             chunk_cls=chunk_cls,
+            max_concurrent_uploads=max_concurrent_uploads,
         )
         self.suggestion_score_fallback = suggestion_score_fallback
         self.total_item_count = total_item_count
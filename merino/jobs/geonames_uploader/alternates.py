@@ -5,6 +5,7 @@ import logging
 from typing import Any, Iterable, Mapping, Tuple
 import itertools
 
+from merino.jobs.utils.chunked_rs_uploader import RecordUpload, upload_records
 from merino.jobs.utils.rs_client import RecordData, RemoteSettingsClient, filter_expression_dict
 from merino.jobs.geonames_uploader.downloader import download_alternates, GeonameAlternate
 
@@ -75,8 +76,7 @@ def upload_alternates(
     # alternates records as unused and delete them. Then we're done.
     if not geonames_records:
         logger.info(f"No geonames records for country '{country}'")
-        for record_id in existing_alternates_records_by_id.keys():
-            rs_client.delete_record(record_id)
+        rs_client.delete_records(sorted(existing_alternates_records_by_id.keys()))
         upload.deleted_count = len(existing_alternates_records_by_id)
         return upload
 
@@ -114,6 +114,7 @@ def upload_alternates(
     # For each geonames record and language, create (potentially) an alternates
     # record.
     final_record_ids = set()
+    record_uploads: list[RecordUpload] = []
     for geonames_record in geonames_records:
         geonames_record_id = geonames_record.data["id"]
         geonames_by_id = {g["id"]: g for g in geonames_record.geonames}
@@ -182,27 +183,34 @@ def upload_alternates(
                 and record != {k: existing_alts_record.get(k) for k, v in record.items()}
             )
 
-            uploaded = rs_client.upload(
-                record=record,
-                attachment={
-                    "language": lang,
-                    "alternates_by_geoname_id": rs_geoname_and_alts_lists,
-                },
-                existing_record=existing_alts_record,
-                force_reupload=force_record,
+            record_uploads.append(
+                RecordUpload(
+                    record=record,
+                    attachment={
+                        "language": lang,
+                        "alternates_by_geoname_id": rs_geoname_and_alts_lists,
+                    },
+                    existing_record=existing_alts_record,
+                    force_reupload=force_record,
+                )
             )
 
-            if uploaded:
-                upload.uploaded_count += 1
-            else:
-                upload.not_uploaded_count += 1
+    # Upload the records concurrently.
+    for uploaded in upload_records(rs_client, record_uploads):
+        if uploaded:
+            upload.uploaded_count += 1
+        else:
+            upload.not_uploaded_count += 1
 
     # Delete existing records for the country and languages that weren't
-    # uploaded above.
-    for record_id in existing_alternates_records_by_id.keys():
-        if record_id not in final_record_ids:
-            rs_client.delete_record(record_id)
-            upload.deleted_count += 1
+    # uploaded above, in one batch.
+    delete_ids = sorted(
+        record_id
+        for record_id in existing_alternates_records_by_id
+        if record_id not in final_record_ids
+    )
+    rs_client.delete_records(delete_ids)
+    upload.deleted_count += len(delete_ids)
 
     return upload
 
@@ -7,19 +7,29 @@ regions, and countries [1]. See technical documentation at [2].
 
 """
 
+import io
 import logging
 from typing import Any, Callable
 from dataclasses import dataclass
+from tempfile import SpooledTemporaryFile
+from zipfile import ZipFile
 
-import csv
 import requests
 
-from merino.jobs.geonames_uploader.tempzipfile import TempZipFile
-
 from merino.jobs.utils import pretty_file_size
 
 logger = logging.getLogger(__name__)
 
+# Downloaded zip files are buffered in memory up to this size and spill over to
+# a temporary file beyond it. Country zip files are usually much smaller.
+SPOOL_MAX_SIZE = 64 * 1024 * 1024
+
+# The size of the chunks the download is read in.
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+# The approximate size of the batches of lines read from the zipped TSV file.
+LINE_BATCH_SIZE = 1024 * 1024
+
 
 # Column indexes in the `geoname` table described in the GeoNames documentation.
 GEONAME_COL_ID = 0
@@ -106,32 +116,30 @@ class GeonamesDownload:
         self.geonames = geonames or []
 
     def _process_line(self, line: list[str]) -> None:
-        geoname_id = int(line[GEONAME_COL_ID])
-        latitude = line[GEONAME_COL_LATITUDE]
-        longitude = line[GEONAME_COL_LONGITUDE]
+        # Check the cheap filters first since most lines are filtered out.
         feature_class = line[GEONAME_COL_FEATURE_CLASS]
-        feature_code = line[GEONAME_COL_FEATURE_CODE]
+        if feature_class != FEATURE_CLASS_CITY and feature_class != FEATURE_CLASS_ADMIN_DIVISION:
+            return
         population = int(line[GEONAME_COL_POPULATION])
-        is_city = feature_class == FEATURE_CLASS_CITY
-        is_admin_division = feature_class == FEATURE_CLASS_ADMIN_DIVISION
-        if (is_city or is_admin_division) and self.population_threshold <= population:
-            self.geonames.append(
-                Geoname(
-                    id=geoname_id,
-                    name=line[GEONAME_COL_NAME],
-                    ascii_name=line[GEONAME_COL_ASCII_NAME],
-                    latitude=latitude or None,
-                    longitude=longitude or None,
-                    feature_class=feature_class,
-                    feature_code=feature_code,
-                    country_code=line[GEONAME_COL_COUNTRY_CODE],
-                    admin1_code=line[GEONAME_COL_ADMIN1_CODE] or None,
-                    admin2_code=line[GEONAME_COL_ADMIN2_CODE] or None,
-                    admin3_code=line[GEONAME_COL_ADMIN3_CODE] or None,
-                    admin4_code=line[GEONAME_COL_ADMIN4_CODE] or None,
-                    population=population or None,
-                )
+        if population < self.population_threshold:
+            return
+        self.geonames.append(
+            Geoname(
+                id=int(line[GEONAME_COL_ID]),
+                name=line[GEONAME_COL_NAME],
+                ascii_name=line[GEONAME_COL_ASCII_NAME],
+                latitude=line[GEONAME_COL_LATITUDE] or None,
+                longitude=line[GEONAME_COL_LONGITUDE] or None,
+                feature_class=feature_class,
+                feature_code=line[GEONAME_COL_FEATURE_CODE],
+                country_code=line[GEONAME_COL_COUNTRY_CODE],
+                admin1_code=line[GEONAME_COL_ADMIN1_CODE] or None,
+                admin2_code=line[GEONAME_COL_ADMIN2_CODE] or None,
+                admin3_code=line[GEONAME_COL_ADMIN3_CODE] or None,
+                admin4_code=line[GEONAME_COL_ADMIN4_CODE] or None,
+                population=population or None,
             )
+        )
 
     def __repr__(self) -> str:
         return str(vars(self))
@@ -160,7 +168,7 @@ def download_geonames(
 
     """
     dl = GeonamesDownload(population_threshold=population_threshold)
-    _download(url_format, country, dl, dl._process_line)
+    _download(url_format, country, dl, dl._process_line, MAX_GEONAME_COL)
     return dl
 
 
@@ -190,13 +198,19 @@ class AlternatesDownload:
         self.alternates_by_geoname_id_by_language = alternates_by_geoname_id_by_language or {}
 
     def _process_line(self, line: list[str]) -> None:
-        geoname_id = int(line[ALTERNATES_COL_GEONAME_ID])
+        # Check the language first since it doesn't require parsing.
         lang = line[ALTERNATES_COL_ISO_LANGUAGE]
-        name = line[ALTERNATES_COL_NAME]
-        is_preferred = line[ALTERNATES_COL_IS_PREFERRED]
-        is_short = line[ALTERNATES_COL_IS_SHORT]
-        if (self.geoname_ids is None or geoname_id in self.geoname_ids) and lang in self.languages:
-            self._add_alternate(geoname_id, lang, name, is_preferred, is_short)
+        if lang not in self.languages:
+            return
+        geoname_id = int(line[ALTERNATES_COL_GEONAME_ID])
+        if self.geoname_ids is None or geoname_id in self.geoname_ids:
+            self._add_alternate(
+                geoname_id,
+                lang,
+                line[ALTERNATES_COL_NAME],
+                line[ALTERNATES_COL_IS_PREFERRED],
+                line[ALTERNATES_COL_IS_SHORT],
+            )
 
     def _add_alternate(
         self,
@@ -240,7 +254,7 @@ def download_alternates(
 
     """
     dl = AlternatesDownload(languages=languages, geoname_ids=geoname_ids)
-    _download(url_format, country, dl, dl._process_line)
+    _download(url_format, country, dl, dl._process_line, MAX_ALTERNATES_COL)
     return dl
 
 
@@ -249,20 +263,38 @@ def _download(
     country: str,
     state: Any,
     process_line: Callable[[list[str]], None],
+    max_col: int,
 ) -> None:
+    """Download the country's zip file and pass each line of the TSV file in it
+    to `process_line`, split into at least `max_col + 1` columns.
+
+    The zip file is buffered in a spooled temporary file rather than written to
+    disk and extracted, and the TSV file is decompressed and read from the zip
+    file in batches of lines. GeoNames files are not quoted, so lines are split
+    on tabs directly instead of going through `csv`.
+
+    """
     url = url_format.format(country=country)
     logger.info(f"Sending request: {url}")
-    resp = requests.get(url, stream=True)  # nosec
-    resp.raise_for_status()
-    content_len = resp.headers.get("content-length")
-    content_len_str = pretty_file_size(int(content_len)) if content_len else "??? bytes"
-    logger.info(f"Downloading {url} ({content_len_str})")
-    with TempZipFile(resp.raw) as zip_file:
-        txt_filename = f"{country}.txt"
-        logger.info(f"Extracting {txt_filename} from {url}")
-        txt_path = zip_file.extract(txt_filename)
-        logger.info(f"Opening {txt_filename} from {url}")
-        with open(txt_path, newline="", encoding="utf-8-sig") as txt_file:
-            reader = csv.reader(txt_file, dialect="excel-tab")
-            for line in reader:
-                process_line(line)
+    with requests.get(url, stream=True) as resp:  # nosec
+        resp.raise_for_status()
+        content_len = resp.headers.get("content-length")
+        content_len_str = pretty_file_size(int(content_len)) if content_len else "??? bytes"
+        logger.info(f"Downloading {url} ({content_len_str})")
+        with SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE) as buffer:
+            for chunk in resp.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                buffer.write(chunk)
+            buffer.seek(0)
+
+            txt_filename = f"{country}.txt"
+            logger.info(f"Reading {txt_filename} from {url}")
+            with (
+                ZipFile(buffer) as zip_file,
+                zip_file.open(txt_filename) as member,
+                io.TextIOWrapper(member, encoding="utf-8-sig", newline="") as txt_file,
+            ):
+                maxsplit = max_col + 1
+                while lines := txt_file.readlines(LINE_BATCH_SIZE):
+                    for line in lines:
+                        if line := line.rstrip("\r\n"):
+                            process_line(line.split("\t", maxsplit))
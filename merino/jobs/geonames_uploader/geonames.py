@@ -8,6 +8,7 @@ import math
 from typing import Any, Mapping
 from dataclasses import asdict, dataclass, field
 
+from merino.jobs.utils.chunked_rs_uploader import RecordUpload, upload_records
 from merino.jobs.utils.rs_client import RecordData, RemoteSettingsClient, filter_expression_dict
 from merino.jobs.geonames_uploader.downloader import Geoname, download_geonames
 
@@ -84,6 +85,7 @@ def upload_geonames(
     # Create a record for each partition.
     upload = GeonamesUpload()
     final_record_ids = set()
+    record_uploads: list[RecordUpload] = []
     partitions_ascending = list(reversed(partitions_descending))
     for i, partition in enumerate(partitions_ascending):
         lower_threshold = partition.threshold
@@ -128,25 +130,34 @@ def upload_geonames(
 
         geonames = [_rs_geoname(g) for g in partition.geonames]
 
-        uploaded = rs_client.upload(
-            record=record,
-            attachment=geonames,
-            existing_record=existing_record,
-            force_reupload=force_record,
+        record_uploads.append(
+            RecordUpload(
+                record=record,
+                attachment=geonames,
+                existing_record=existing_record,
+                force_reupload=force_record,
+            )
         )
 
         final_record_ids.add(record_id)
         upload.final_records.append(GeonamesRecord(data=record, geonames=geonames))
+
+    # Upload the records concurrently.
+    for uploaded in upload_records(rs_client, record_uploads):
         if uploaded:
             upload.uploaded_count += 1
         else:
             upload.not_uploaded_count += 1
 
-    # Delete existing records for the country that weren't uploaded above.
-    for record_id, record in existing_geonames_records_by_id.items():
-        if record_id not in final_record_ids:
-            rs_client.delete_record(record_id)
-            upload.deleted_count += 1
+    # Delete existing records for the country that weren't uploaded above, in
+    # one batch.
+    delete_ids = sorted(
+        record_id
+        for record_id in existing_geonames_records_by_id
+        if record_id not in final_record_ids
+    )
+    rs_client.delete_records(delete_ids)
+    upload.deleted_count += len(delete_ids)
 
     return upload
 
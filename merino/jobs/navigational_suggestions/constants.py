@@ -11,6 +11,21 @@ META_SELECTOR: str = "meta[name=apple-touch-icon], meta[name=msapplication-TileI
 
 MANIFEST_SELECTOR: str = 'link[rel="manifest"]'
 
+# `rel` values of link tags matched by LINK_SELECTOR (compared case-insensitively)
+LINK_RELS: frozenset[str] = frozenset(
+    {
+        "apple-touch-icon",
+        "apple-touch-icon-precomposed",
+        "icon shortcut",
+        "shortcut icon",
+        "icon",
+        "fluid-icon",
+    }
+)
+
+# `name` values of meta tags matched by META_SELECTOR
+META_NAMES: frozenset[str] = frozenset({"apple-touch-icon", "msapplication-TileImage"})
+
 ALLOW_REDIRECTS: bool = True
 
 PARSER: str = "html.parser"
@@ -54,7 +69,13 @@ MANIFEST_JSON_BASE64_MARKER: str = "/application/manifest+json;base64,"
 # Processing configuration
 DEFAULT_MAX_FAVICON_ICONS: int = 5
 DEFAULT_CHUNK_SIZE: int = 25
+# Maximum number of concurrent requests in flight against the same registered domain
+DEFAULT_PER_HOST_LIMIT: int = 2
+# Overall deadline (in seconds) for processing a single domain
+DEFAULT_DOMAIN_TIMEOUT: float = 60.0
 FAVICON_BATCH_SIZE: int = 5
+# Maximum number of favicon uploads to GCS in flight at once
+DEFAULT_MAX_CONCURRENT_UPLOADS: int = 8
 
 # Source priority for favicon selection (lower is better)
 FAVICON_SOURCE_PRIORITY: dict[str, int] = {
@@ -81,3 +102,6 @@ REQUEST_HEADERS: dict[str, str] = {
 }
 
 TIMEOUT: int = 15
+
+# Maximum number of bytes of a page body read by the web scraper
+MAX_PAGE_BYTES: int = 512 * 1024
@@ -5,7 +5,7 @@ from typing import Any, Optional
 from bs4 import BeautifulSoup
 
 from merino.jobs.navigational_suggestions.constants import DEFAULT_MAX_FAVICON_ICONS
-from merino.jobs.navigational_suggestions.models import FaviconData
+from merino.jobs.navigational_suggestions.models import FaviconData, ScrapedPage
 from merino.jobs.navigational_suggestions.scrapers.favicon_scraper import FaviconScraper
 from merino.jobs.navigational_suggestions.utils import join_url, process_favicon_url
 
@@ -20,7 +20,7 @@ class FaviconExtractor:
 
     async def extract_favicons(
         self,
-        page: Optional[BeautifulSoup],
+        page: Optional[ScrapedPage | BeautifulSoup],
         scraped_url: str,
         max_icons: int = DEFAULT_MAX_FAVICON_ICONS,
     ) -> list[dict[str, Any]]:
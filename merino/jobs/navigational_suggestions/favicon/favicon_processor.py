@@ -1,12 +1,14 @@
 """Favicon processor for downloading, validating, and uploading favicons"""
 
+import asyncio
 import logging
-from typing import Any, TYPE_CHECKING
+from typing import Any, Optional, TYPE_CHECKING
 
 from merino.jobs.navigational_suggestions.constants import FAVICON_BATCH_SIZE
 from merino.jobs.navigational_suggestions.favicon.favicon_selector import FaviconSelector
 from merino.jobs.navigational_suggestions.utils import fix_url, is_valid_url
-from merino.jobs.navigational_suggestions.io import AsyncFaviconDownloader
+from merino.utils.gcs.models import Image
+from merino.jobs.navigational_suggestions.io import AsyncFaviconDownloader, AsyncFaviconUploader
 
 if TYPE_CHECKING:
     from merino.jobs.navigational_suggestions.io.domain_metadata_uploader import (
@@ -17,17 +19,24 @@ logger = logging.getLogger(__name__)
 
 
 class FaviconProcessor:
-    """Download, validate, and upload favicons. Prioritizes SVGs over bitmaps."""
+    """Download, validate, and upload favicons. Prioritizes SVGs over bitmaps.
+
+    Image dimension probing and uploads run in worker threads so they don't block the
+    event loop. Pass a shared `favicon_uploader` to skip re-uploading favicons that were
+    already uploaded for another domain.
+    """
 
     def __init__(
         self,
         favicon_downloader: AsyncFaviconDownloader,
         base_url: str = "",
         cache_control: str | None = None,
+        favicon_uploader: Optional[AsyncFaviconUploader] = None,
     ) -> None:
         self.favicon_downloader = favicon_downloader
         self.base_url = base_url
         self.cache_control = cache_control
+        self.favicon_uploader = favicon_uploader or AsyncFaviconUploader()
 
     async def process_and_upload_best_favicon(
         self,
@@ -85,6 +94,18 @@ class FaviconProcessor:
             logger.error(f"Unexpected error in process_and_upload_best_favicon: {e}")
             return "", f"processing_exception: {str(e)}"
 
+    async def _upload(
+        self, image: Image, dst_favicon_name: str, uploader: "DomainMetadataUploader"
+    ) -> str:
+        """Upload a favicon through the shared uploader and return its public URL."""
+        return await self.favicon_uploader.upload(
+            image,
+            dst_favicon_name,
+            uploader,
+            forced_upload=True,
+            cache_control=self.cache_control,
+        )
+
     def _categorize_svg_urls(self, urls: list[str]) -> tuple[list[str], list[int]]:
         """Extract SVG URLs and their indices."""
         svg_urls = []
@@ -135,14 +156,11 @@ class FaviconProcessor:
                         continue
 
                     # Upload and return immediately - SVGs are top priority
-                    dst_favicon_name = uploader.destination_favicon_name(image)
+                    dst_favicon_name = await self.favicon_uploader.destination_favicon_name(
+                        image, uploader
+                    )
                     try:
-                        result = uploader.upload_image(
-                            image,
-                            dst_favicon_name,
-                            forced_upload=True,
-                            cache_control=self.cache_control,
-                        )
+                        result = await self._upload(image, dst_favicon_name, uploader)
                         return str(result)
                     except Exception as e:
                         logger.warning(f"Failed to upload SVG favicon: {e}")
@@ -206,18 +224,19 @@ class FaviconProcessor:
 
                             # Get image dimensions
                             try:
-                                width, height = image.get_dimensions()
+                                width, height = await asyncio.to_thread(image.get_dimensions)
                                 width_val = min(width, height)
                             except Exception as e:
                                 # Check if this is an SVG served without .svg extension
                                 if image and "image/svg+xml" in image.content_type:
                                     try:
-                                        dst_favicon_name = uploader.destination_favicon_name(image)
-                                        result = uploader.upload_image(
-                                            image,
-                                            dst_favicon_name,
-                                            forced_upload=True,
-                                            cache_control=self.cache_control,
+                                        dst_favicon_name = (
+                                            await self.favicon_uploader.destination_favicon_name(
+                                                image, uploader
+                                            )
+                                        )
+                                        result = await self._upload(
+                                            image, dst_favicon_name, uploader
                                         )
                                         return str(result), min_width, failed_image_validations
                                     except Exception as svg_err:
@@ -238,12 +257,13 @@ class FaviconProcessor:
                                 best_favicon_source,
                             ):
                                 try:
-                                    dst_favicon_name = uploader.destination_favicon_name(image)
-                                    favicon_url = uploader.upload_image(
-                                        image,
-                                        dst_favicon_name,
-                                        forced_upload=True,
-                                        cache_control=self.cache_control,
+                                    dst_favicon_name = (
+                                        await self.favicon_uploader.destination_favicon_name(
+                                            image, uploader
+                                        )
+                                    )
+                                    favicon_url = await self._upload(
+                                        image, dst_favicon_name, uploader
                                     )
                                     best_favicon_url = favicon_url
                                     best_favicon_width = width_val
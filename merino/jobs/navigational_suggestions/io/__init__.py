@@ -3,6 +3,9 @@
 from merino.jobs.navigational_suggestions.io.async_favicon_downloader import (
     AsyncFaviconDownloader,
 )
+from merino.jobs.navigational_suggestions.io.async_favicon_uploader import (
+    AsyncFaviconUploader,
+)
 from merino.jobs.navigational_suggestions.io.domain_data_downloader import (
     DomainDataDownloader,
 )
@@ -13,6 +16,7 @@ from merino.jobs.navigational_suggestions.io.domain_metadata_uploader import (
 
 __all__ = [
     "AsyncFaviconDownloader",
+    "AsyncFaviconUploader",
     "DomainDataDownloader",
     "DomainMetadataUploader",
     "DomainDiff",
@@ -0,0 +1,103 @@
+"""Async favicon uploader for uploading favicons to GCS off the event loop"""
+
+import asyncio
+import logging
+from typing import Optional, TYPE_CHECKING
+
+from merino.jobs.navigational_suggestions.constants import DEFAULT_MAX_CONCURRENT_UPLOADS
+from merino.utils.gcs.models import Image
+
+if TYPE_CHECKING:
+    from merino.jobs.navigational_suggestions.io.domain_metadata_uploader import (
+        DomainMetadataUploader,
+    )
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncFaviconUploader:
+    """Upload favicons to GCS from worker threads with bounded concurrency.
+
+    Favicon names are derived from a hash of their content, so identical favicons shared
+    by several domains are uploaded only once per job run; concurrent uploads of the same
+    favicon wait for the one already in flight.
+    """
+
+    def __init__(self, max_concurrent_uploads: int = DEFAULT_MAX_CONCURRENT_UPLOADS) -> None:
+        self.max_concurrent_uploads = max_concurrent_uploads
+        self.uploaded: dict[str, str] = {}
+        self.upload_count = 0
+        self.dedupe_count = 0
+        self._pending: dict[str, asyncio.Future[str]] = {}
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @staticmethod
+    async def destination_favicon_name(image: Image, uploader: "DomainMetadataUploader") -> str:
+        """Hash the image content into its destination name in a worker thread."""
+        return await asyncio.to_thread(uploader.destination_favicon_name, image)
+
+    async def upload(
+        self,
+        image: Image,
+        dst_favicon_name: str,
+        uploader: "DomainMetadataUploader",
+        forced_upload: bool = True,
+        cache_control: str | None = None,
+    ) -> str:
+        """Upload the image and return its public URL, reusing the URL of an identical
+        image uploaded earlier. Upload errors are raised to the caller.
+        """
+        if (public_url := self.uploaded.get(dst_favicon_name)) is not None:
+            self.dedupe_count += 1
+            return public_url
+
+        if (pending := self._pending.get(dst_favicon_name)) is not None:
+            self.dedupe_count += 1
+            return await asyncio.shield(pending)
+
+        future: asyncio.Future[str] = asyncio.get_running_loop().create_future()
+        self._pending[dst_favicon_name] = future
+        try:
+            async with self._get_semaphore():
+                public_url = await asyncio.to_thread(
+                    uploader.upload_image,
+                    image,
+                    dst_favicon_name,
+                    forced_upload=forced_upload,
+                    cache_control=cache_control,
+                )
+        except asyncio.CancelledError:
+            # Only the uploading task was cancelled; report a failed upload to any waiters
+            self._fail(future, RuntimeError(f"Upload of {dst_favicon_name} was cancelled"))
+            raise
+        except Exception as e:
+            self._fail(future, e)
+            raise
+        else:
+            self.upload_count += 1
+            self.uploaded[dst_favicon_name] = public_url
+            future.set_result(public_url)
+            return public_url
+        finally:
+            del self._pending[dst_favicon_name]
+
+    @staticmethod
+    def _fail(future: asyncio.Future[str], error: Exception) -> None:
+        """Fail the pending upload future and mark its exception as retrieved, in case
+        nobody else is waiting on it.
+        """
+        future.set_exception(error)
+        future.exception()
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """Return the upload semaphore for the running event loop.
+
+        The job may run several event loops in sequence, and a semaphore must not be
+        shared across them.
+        """
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_concurrent_uploads)
+            self._loop = loop
+        return self._semaphore
@@ -37,3 +37,13 @@ class DomainError(BaseModel):
 
     domain: str
     error_reason: str
+
+
+class ScrapedPage(BaseModel):
+    """The subset of an HTML page needed to extract domain metadata."""
+
+    title: Optional[str] = None
+    links: list[dict[str, Any]] = []
+    metas: list[dict[str, Any]] = []
+    manifests: list[dict[str, Any]] = []
+    has_bot_blocking_element: bool = False
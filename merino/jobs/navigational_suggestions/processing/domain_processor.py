@@ -3,18 +3,28 @@
 import asyncio
 import contextvars
 import logging
+from collections import defaultdict, deque
 from typing import Any, Optional, TYPE_CHECKING
 
 import tldextract
+from httpx import AsyncClient
 
 from merino.configs import settings
+from merino.jobs.navigational_suggestions.constants import (
+    DEFAULT_CHUNK_SIZE,
+    DEFAULT_DOMAIN_TIMEOUT,
+    DEFAULT_PER_HOST_LIMIT,
+)
 from merino.jobs.navigational_suggestions.enrichments.custom_favicons import get_custom_favicon_url
 from merino.jobs.navigational_suggestions.favicon.favicon_extractor import FaviconExtractor
 from merino.jobs.navigational_suggestions.favicon.favicon_processor import FaviconProcessor
 from merino.jobs.navigational_suggestions.scrapers.favicon_scraper import FaviconScraper
-from merino.jobs.navigational_suggestions.scrapers.web_scraper import WebScraper
+from merino.jobs.navigational_suggestions.scrapers.web_scraper import (
+    WebScraper,
+    create_scraper_client,
+)
 from merino.jobs.navigational_suggestions.utils import get_base_url
-from merino.jobs.navigational_suggestions.io import AsyncFaviconDownloader
+from merino.jobs.navigational_suggestions.io import AsyncFaviconDownloader, AsyncFaviconUploader
 from merino.jobs.navigational_suggestions.validators import (
     get_second_level_domain,
     get_title_or_fallback,
@@ -39,18 +49,28 @@ CACHE_CONTROL = settings.jobs.navigational_suggestions.cache_control
 
 class DomainProcessor:
     """Process domains to extract metadata and favicons. Checks custom favicons first,
-    falls back to web scraping. Processes in chunks for memory management.
+    falls back to web scraping. Keeps up to `chunk_size` domains in flight at any time
+    so that a single slow domain does not hold up the rest of the batch.
     """
 
     def __init__(
         self,
         blocked_domains: set[str],
         favicon_downloader: Optional[AsyncFaviconDownloader] = None,
-        chunk_size: int = 25,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        favicon_uploader: Optional[AsyncFaviconUploader] = None,
+        per_host_limit: int = DEFAULT_PER_HOST_LIMIT,
+        domain_timeout: float = DEFAULT_DOMAIN_TIMEOUT,
     ) -> None:
         self.blocked_domains = blocked_domains
         self.favicon_downloader = favicon_downloader or AsyncFaviconDownloader()
         self.chunk_size = chunk_size
+        # Shared across domains so identical favicons are only uploaded once per run
+        self.favicon_uploader = favicon_uploader or AsyncFaviconUploader()
+        self.per_host_limit = per_host_limit
+        self.domain_timeout = domain_timeout
+        # Connection pool shared by the web scrapers of a `_process_domains` run
+        self.scraper_client: Optional[AsyncClient] = None
 
     def process_domain_metadata(
         self,
@@ -59,7 +79,10 @@ class DomainProcessor:
         uploader: "DomainMetadataUploader",
         enable_monitoring: bool = False,
     ) -> list[dict[str, Optional[str]]]:
-        """Extract domain metadata, process concurrently in chunks, upload favicons to GCS."""
+        """Extract domain metadata concurrently and upload favicons to GCS.
+
+        Results are returned in the same order as `domains_data`.
+        """
         logger.info(f"Starting to process {len(domains_data)} domains")
         results = asyncio.run(
             self._process_domains(domains_data, favicon_min_width, uploader, enable_monitoring)
@@ -77,9 +100,22 @@ class DomainProcessor:
         uploader: "DomainMetadataUploader",
         enable_monitoring: bool = False,
     ) -> list[dict[str, Optional[str]]]:
-        """Process domains in chunks to limit resource consumption."""
-        filtered_results: list[dict[str, Optional[str]]] = []
-        total_chunks = (len(domains_data) + self.chunk_size - 1) // self.chunk_size
+        """Process domains with a sliding window of `chunk_size` workers.
+
+        Each worker pulls the next domain as soon as it finishes the previous one,
+        so there is no head-of-line blocking between batches. Domains of the same
+        registered domain (e.g. `example.com` and `www.example.com`) are additionally
+        limited to `per_host_limit` in flight, and each domain is bounded by
+        `domain_timeout` seconds.
+        """
+        total = len(domains_data)
+        results: list[Optional[dict[str, Optional[str]]]] = [None] * total
+        pending: deque[int] = deque(range(total))
+        # Domains in flight, and domains put aside until one of those finishes, per host.
+        host_in_flight: defaultdict[str, int] = defaultdict(int)
+        host_deferred: defaultdict[str, deque[int]] = defaultdict(deque)
+        completed = 0
+        total_chunks = (total + self.chunk_size - 1) // self.chunk_size
 
         # Initialize monitor only if monitoring is enabled
         monitor = None
@@ -90,45 +126,89 @@ class DomainProcessor:
         else:
             logger.info("Starting domain processing (monitoring disabled)")
 
-        for i in range(0, len(domains_data), self.chunk_size):
-            end_idx = min(i + self.chunk_size, len(domains_data))
-            chunk = domains_data[i:end_idx]
-            chunk_num = i // self.chunk_size + 1
-
-            logger.info(
-                f"Processing chunk {chunk_num}/{total_chunks} ({i + 1}-{end_idx} of {len(domains_data)})"
-            )
-
-            tasks = [
-                self._process_single_domain(domain_data, favicon_min_width, uploader)
-                for domain_data in chunk
-            ]
-
-            # Process current chunk with gather
-            chunk_results = await asyncio.gather(*tasks, return_exceptions=True)
-
-            # Process results
-            for result in chunk_results:
-                if isinstance(result, Exception):
-                    logger.error(f"Error processing domain: {result}")
-                else:
-                    if not isinstance(result, dict):
-                        logger.error(f"Unexpected result type: {result}")
-                        continue
-                    filtered_results.append(result)
+        async def worker() -> None:
+            nonlocal completed
+            while pending:
+                index = pending.popleft()
+                domain_data = domains_data[index]
+                host_key = (
+                    tldextract.extract(domain_data["domain"]).registered_domain
+                    or domain_data["domain"]
+                )
+                if host_in_flight[host_key] >= self.per_host_limit:
+                    # Put the domain aside rather than wait for its host with a worker slot,
+                    # the worker of a domain of that host requeues it when it finishes.
+                    host_deferred[host_key].append(index)
+                    continue
+
+                host_in_flight[host_key] += 1
+                try:
+                    result = await self._process_with_deadline(
+                        domain_data, favicon_min_width, uploader
+                    )
+                finally:
+                    host_in_flight[host_key] -= 1
+                    if host_deferred[host_key]:
+                        pending.appendleft(host_deferred[host_key].popleft())
+
+                results[index] = result
+
+                completed += 1
+                if completed % self.chunk_size == 0 or completed == total:
+                    logger.info(f"Processed {completed}/{total} domains")
+                    if monitor:
+                        monitor.log_metrics(
+                            chunk_num=(completed + self.chunk_size - 1) // self.chunk_size,
+                            total_chunks=total_chunks,
+                        )
 
-            # Reset the FaviconDownloader instead of recreating
+        self.scraper_client = create_scraper_client(max_connections=self.chunk_size * 2)
+        workers = [asyncio.create_task(worker()) for _ in range(min(self.chunk_size, total))]
+        try:
+            await asyncio.gather(*workers)
+        finally:
+            for task in workers:
+                task.cancel()
+            await self.scraper_client.aclose()
+            self.scraper_client = None
             await self.favicon_downloader.reset()
 
-            # Log system metrics after processing this chunk if monitoring is enabled
-            if monitor:
-                monitor.log_metrics(chunk_num=chunk_num, total_chunks=total_chunks)
-
-        logger.info("Domain processing complete")
+        logger.info(
+            f"Domain processing complete: uploaded {self.favicon_uploader.upload_count} "
+            f"favicons, skipped {self.favicon_uploader.dedupe_count} duplicate uploads"
+        )
         if monitor:
             monitor.log_metrics()
 
-        return filtered_results
+        return [result for result in results if result is not None]
+
+    async def _process_with_deadline(
+        self,
+        domain_data: dict[str, Any],
+        favicon_min_width: int,
+        uploader: "DomainMetadataUploader",
+    ) -> dict[str, Optional[str]]:
+        """Process a single domain within `domain_timeout`, converting failures to an
+        empty result so the output stays aligned with the input domains.
+        """
+        domain = domain_data.get("domain")
+        try:
+            async with asyncio.timeout(self.domain_timeout):
+                return await self._process_single_domain(domain_data, favicon_min_width, uploader)
+        except TimeoutError:
+            logger.warning(f"Timed out processing domain {domain} after {self.domain_timeout}s")
+            error_reason = f"domain_timeout: exceeded {self.domain_timeout}s"
+        except Exception as e:
+            logger.error(f"Error processing domain {domain}: {e}")
+            error_reason = f"processing_exception_{e.__class__.__name__}: {e}"
+
+        return {
+            "url": None,
+            "title": None,
+            "icon": None,
+            "domain": None,
+            "error_reason": error_reason,
+        }
 
     async def _process_single_domain(
         self,
@@ -208,10 +288,13 @@ class DomainProcessor:
                 # Download and upload the custom favicon
                 favicon_image = await self.favicon_downloader.download_favicon(custom_favicon_url)
                 if favicon_image:
-                    dst_favicon_name = uploader.destination_favicon_name(favicon_image)
-                    favicon = uploader.upload_image(
+                    dst_favicon_name = await self.favicon_uploader.destination_favicon_name(
+                        favicon_image, uploader
+                    )
+                    favicon = await self.favicon_uploader.upload(
                         favicon_image,
                         dst_favicon_name,
+                        uploader,
                         forced_upload=uploader.force_upload,
                         cache_control=CACHE_CONTROL,
                     )
@@ -244,19 +327,19 @@ class DomainProcessor:
     ) -> dict[str, Optional[str]]:
         """Scrape domain website for metadata and favicon."""
         error_reason = None
-        with WebScraper() as web_scraper:
+        async with WebScraper(self.scraper_client) as web_scraper:
             # Set the context variable for this task's context
             token = current_web_scraper.set(web_scraper)
 
             try:
                 # Try to open the domain
                 url: str = f"https://{domain}"
-                full_url: Optional[str] = web_scraper.open(url)
+                full_url: Optional[str] = await web_scraper.open(url)
 
                 if full_url is None:
                     # Retry with www. prefix as some domains require it
                     url = f"https://www.{domain}"
-                    full_url = web_scraper.open(url)
+                    full_url = await web_scraper.open(url)
 
                 # Check if we successfully opened a page on the correct domain
                 if full_url and self._is_matching_domain(domain, full_url):
@@ -345,7 +428,9 @@ class DomainProcessor:
             # Create components for favicon extraction
             favicon_scraper = FaviconScraper(self.favicon_downloader)
             favicon_extractor = FaviconExtractor(favicon_scraper)
-            favicon_processor = FaviconProcessor(self.favicon_downloader, scraped_url)
+            favicon_processor = FaviconProcessor(
+                self.favicon_downloader, scraped_url, favicon_uploader=self.favicon_uploader
+            )
 
             # Extract favicons from the page
             page = web_scraper.get_page()
@@ -8,7 +8,7 @@ from merino.jobs.navigational_suggestions.constants import (
     META_SELECTOR,
     MANIFEST_SELECTOR,
 )
-from merino.jobs.navigational_suggestions.models import FaviconData
+from merino.jobs.navigational_suggestions.models import FaviconData, ScrapedPage
 from merino.jobs.navigational_suggestions.utils import join_url
 from merino.jobs.navigational_suggestions.io import AsyncFaviconDownloader
 
@@ -22,7 +22,14 @@ class FaviconScraper:
         self.async_downloader = async_downloader or AsyncFaviconDownloader()
 
     def scrape_favicon_data(self, page) -> FaviconData:
-        """Extract favicon references from link tags, meta tags, and manifest links."""
+        """Extract favicon references from link tags, meta tags, and manifest links.
+
+        `page` is either a `ScrapedPage` produced by the web scraper, whose tags have
+        already been extracted while parsing, or a BeautifulSoup document.
+        """
+        if isinstance(page, ScrapedPage):
+            return FaviconData(links=page.links, metas=page.metas, manifests=page.manifests)
+
         try:
             links = [link.attrs for link in page.select(LINK_SELECTOR)]
             metas = [meta.attrs for meta in page.select(META_SELECTOR)]
@@ -0,0 +1,92 @@
+"""Incremental HTML parser that only extracts the tags the scraper needs"""
+
+from html.parser import HTMLParser
+from typing import Any, Optional
+
+from merino.jobs.navigational_suggestions.constants import LINK_RELS, META_NAMES
+from merino.jobs.navigational_suggestions.models import ScrapedPage
+
+# Attributes that BeautifulSoup exposes as lists, kept that way for downstream consumers
+MULTI_VALUED_ATTRIBUTES: frozenset[str] = frozenset({"rel", "class", "rev"})
+
+# HTML elements commonly used by bot protection services (Cloudflare, etc.)
+# Structure: list of (attribute_name, attribute_value) tuples for div elements
+# Future: expand this list as new bot-blocking patterns are discovered
+BOT_BLOCKING_ELEMENTS = [
+    ("id", "challenge-form"),  # Cloudflare challenge
+    ("class", "cf-browser-verification"),  # Cloudflare verification
+]
+
+
+class PageParser(HTMLParser):
+    """Collect the title, icon links, icon metas, manifests and bot-blocking markers
+    of a page. Data can be fed in chunks as it is streamed from the network; every
+    other element is skipped without building a document tree.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.page = ScrapedPage()
+        self._in_head = False
+        self._in_title = False
+        self._title_parts: list[str] = []
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, Optional[str]]]) -> None:
+        """Record the attributes of the tags relevant to domain metadata."""
+        match tag:
+            case "head":
+                self._in_head = True
+            case "body":
+                self._in_head = False
+            case "title" if self._in_head and self.page.title is None:
+                self._in_title = True
+            case "link":
+                attributes = _to_attributes(attrs)
+                rel = " ".join(attributes.get("rel", [])).lower()
+                if rel in LINK_RELS:
+                    self.page.links.append(attributes)
+                elif rel == "manifest" and self._in_head:
+                    self.page.manifests.append(attributes)
+            case "meta":
+                attributes = _to_attributes(attrs)
+                if attributes.get("name") in META_NAMES:
+                    self.page.metas.append(attributes)
+            case "div" if not self.page.has_bot_blocking_element:
+                attributes = _to_attributes(attrs)
+                for name, value in BOT_BLOCKING_ELEMENTS:
+                    attribute = attributes.get(name)
+                    if attribute == value or (isinstance(attribute, list) and value in attribute):
+                        self.page.has_bot_blocking_element = True
+
+    def handle_startendtag(self, tag: str, attrs: list[tuple[str, Optional[str]]]) -> None:
+        """Handle self-closing tags such as `<link ... />`."""
+        self.handle_starttag(tag, attrs)
+
+    def handle_endtag(self, tag: str) -> None:
+        """Track the end of the head and title elements."""
+        match tag:
+            case "head":
+                self._in_head = False
+            case "title" if self._in_title:
+                self._in_title = False
+                self.page.title = "".join(self._title_parts)
+
+    def handle_data(self, data: str) -> None:
+        """Accumulate the text of the title element."""
+        if self._in_title:
+            self._title_parts.append(data)
+
+    def result(self) -> ScrapedPage:
+        """Return the parsed page, including an unterminated title if any."""
+        if self._in_title and self.page.title is None:
+            self.page.title = "".join(self._title_parts)
+        return self.page
+
+
+def _to_attributes(attrs: list[tuple[str, Optional[str]]]) -> dict[str, Any]:
+    """Convert parser attributes to a dict shaped like BeautifulSoup's `Tag.attrs`."""
+    attributes: dict[str, Any] = {}
+    for name, value in attrs:
+        value = value or ""
+        attributes[name] = value.split() if name in MULTI_VALUED_ATTRIBUTES else value
+    return attributes
@@ -1,150 +1,168 @@
 """Web scraper for extracting data from websites"""
 
+import codecs
 import logging
-from typing import Optional, cast
+from typing import Optional
 
-import requests
-from bs4 import BeautifulSoup
-from mechanicalsoup import StatefulBrowser
+import httpx
+from httpx import AsyncClient
 
 from merino.jobs.navigational_suggestions.constants import (
     ALLOW_REDIRECTS,
-    PARSER,
+    MAX_PAGE_BYTES,
+    REQUEST_HEADERS,
+    TIMEOUT,
 )
-from merino.jobs.navigational_suggestions.constants import REQUEST_HEADERS, TIMEOUT
+from merino.jobs.navigational_suggestions.models import ScrapedPage
+from merino.jobs.navigational_suggestions.scrapers.page_parser import PageParser
+from merino_common.utils.http_client import create_http_client
 
 logger = logging.getLogger(__name__)
 
-# HTML elements commonly used by bot protection services (Cloudflare, etc.)
-# Structure: list of (attribute_name, attribute_value) tuples for div elements
-# Future: expand this list as new bot-blocking patterns are discovered
-BOT_BLOCKING_ELEMENTS = [
-    ("id", "challenge-form"),  # Cloudflare challenge
-    ("class_", "cf-browser-verification"),  # Cloudflare verification
+# Phrases used in page titles by bot-blocking services
+# (e.g., Cloudflare, Akamai, captcha pages, access denied pages)
+BOT_INDICATORS = [
+    "access denied",
+    "captcha",
+    "cloudflare",
+    "security check",
+    "robot or human",
+    "just a moment",
+    "checking your browser",
+    "ddos protection",
+    "are you a robot",
+    "bot protection",
+    "please verify",
+    "attention required",
 ]
 
 
+def create_scraper_client(max_connections: int = 100) -> AsyncClient:
+    """Create a client with connection pooling for the web scraper, negotiating HTTP/2
+    with the sites that support it. A single client should be shared by all scrapers of a
+    job run.
+    """
+    return create_http_client(
+        max_connections=max_connections,
+        connect_timeout=float(TIMEOUT),
+        request_timeout=float(TIMEOUT),
+        pool_timeout=float(TIMEOUT),
+        follow_redirects=ALLOW_REDIRECTS,
+        http2=True,
+    )
+
+
 class WebScraper:
-    """Website scraper using MechanicalSoup. Use as context manager."""
-
-    def __init__(self) -> None:
-        session: requests.Session = requests.Session()
-        self.browser = StatefulBrowser(
-            session=session,
-            soup_config={"features": PARSER},
-            raise_on_404=False,
-            user_agent=REQUEST_HEADERS["User-Agent"],
-        )
-
-    def __enter__(self):
+    """Async website scraper built on a shared `httpx.AsyncClient`. Use as an async
+    context manager.
+
+    Page bodies are streamed and fed to an incremental parser that only keeps the
+    title, icon links, icon metas and manifests, and at most `max_page_bytes` bytes
+    of a body are read.
+    """
+
+    def __init__(
+        self,
+        client: Optional[AsyncClient] = None,
+        max_page_bytes: int = MAX_PAGE_BYTES,
+    ) -> None:
+        self._owns_client = client is None
+        self.client = client or create_scraper_client(max_connections=10)
+        self.max_page_bytes = max_page_bytes
+        self.page: Optional[ScrapedPage] = None
+        self.url: Optional[str] = None
+        self.status_code: Optional[int] = None
+
+    async def __aenter__(self):
         return self
 
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        self.close()
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
         return False
 
-    def open(self, url: str) -> Optional[str]:
+    async def open(self, url: str) -> Optional[str]:
         """Open URL and return final URL after redirects, or None if failed."""
+        self.page = None
+        self.url = None
+        self.status_code = None
         try:
-            response = self.browser.open(url, timeout=TIMEOUT, allow_redirects=ALLOW_REDIRECTS)
-            if response and response.status_code >= 400:
-                logger.debug(f"HTTP {response.status_code} error for URL {url}")
-            return str(self.browser.url)
-        except requests.exceptions.Timeout:
+            async with self.client.stream("GET", url, headers=REQUEST_HEADERS) as response:
+                self.status_code = response.status_code
+                self.url = str(response.url)
+                if response.status_code >= 400:
+                    logger.debug(f"HTTP {response.status_code} error for URL {url}")
+                self.page = await self._parse_body(response)
+            return self.url
+        except httpx.TimeoutException:
             logger.debug(f"Timeout opening URL {url}")
             return None
-        except requests.exceptions.ConnectionError as e:
-            logger.debug(f"Connection error opening URL {url}: {e}")
-            return None
-        except requests.exceptions.TooManyRedirects:
+        except httpx.TooManyRedirects:
             logger.debug(f"Too many redirects for URL {url}")
             return None
-        except requests.exceptions.SSLError as e:
-            logger.debug(f"SSL error opening URL {url}: {e}")
+        except httpx.ConnectError as e:
+            logger.debug(f"Connection error opening URL {url}: {e}")
             return None
         except Exception as e:
             logger.debug(f"Failed to open URL {url}: {e}")
             return None
 
+    async def _parse_body(self, response: httpx.Response) -> ScrapedPage:
+        """Stream the response body into the page parser, stopping at `max_page_bytes`."""
+        parser = PageParser()
+        encoding = response.charset_encoding or "utf-8"
+        try:
+            decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+        except LookupError:
+            decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+
+        remaining = self.max_page_bytes
+        async for chunk in response.aiter_bytes():
+            chunk = chunk[:remaining]
+            parser.feed(decoder.decode(chunk))
+            remaining -= len(chunk)
+            if remaining <= 0:
+                logger.debug(f"Truncated page body of {response.url} at {self.max_page_bytes}B")
+                break
+        else:
+            parser.feed(decoder.decode(b"", final=True))
+
+        parser.close()
+        return parser.result()
+
     def scrape_title(self) -> Optional[str]:
         """Extract title from page header."""
-        try:
-            title_element = self.browser.page.find("head").find("title")
-            if title_element:
-                return str(title_element.get_text())
-            return None
-        except Exception as e:
-            logger.debug(f"Exception while scraping title: {e}")
-            return None
+        return self.page.title if self.page else None
 
-    def get_page(self) -> Optional[BeautifulSoup]:
-        """Get the current page's BeautifulSoup object."""
-        return cast(Optional[BeautifulSoup], self.browser.page)
+    def get_page(self) -> Optional[ScrapedPage]:
+        """Get the current page's parsed metadata."""
+        return self.page
 
     def get_current_url(self) -> Optional[str]:
         """Get current URL after any redirects."""
-        try:
-            return str(self.browser.url) if self.browser.url else None
-        except Exception:
-            return None
+        return self.url
 
     def get_status_code(self) -> Optional[int]:
         """Get HTTP status code of the last response."""
-        try:
-            if hasattr(self.browser, "response") and self.browser.response:
-                return int(self.browser.response.status_code)
-            return None
-        except Exception:
-            return None
+        return self.status_code
 
     def is_bot_blocked(self) -> bool:
         """Check if page appears to be a bot-blocking or challenge page."""
-        try:
-            page = self.get_page()
-            if not page:
-                return False
-
-            title = self.scrape_title()
-            if title:
-                title_lower = title.lower()
-                # Check page title for common phrases used by bot-blocking services
-                # (e.g., Cloudflare, Akamai, captcha pages, access denied pages)
-                bot_indicators = [
-                    "access denied",
-                    "captcha",
-                    "cloudflare",
-                    "security check",
-                    "robot or human",
-                    "just a moment",
-                    "checking your browser",
-                    "ddos protection",
-                    "are you a robot",
-                    "bot protection",
-                    "please verify",
-                    "attention required",
-                ]
-                if any(indicator in title_lower for indicator in bot_indicators):
-                    return True
-
-            # Check for specific HTML elements commonly used by bot protection services
-            # These elements are typically present on challenge/verification pages
-            for attr, value in BOT_BLOCKING_ELEMENTS:
-                if page.find("div", attrs={attr: value}):
-                    return True
-
-            return False
-        except Exception:
+        page = self.get_page()
+        if not page:
             return False
 
-    def close(self) -> None:
-        """Close browser session and clean up resources."""
-        try:
-            if hasattr(self.browser, "session") and self.browser.session:
-                self.browser.session.close()
+        if page.title:
+            title_lower = page.title.lower()
+            if any(indicator in title_lower for indicator in BOT_INDICATORS):
+                return True
 
-            if hasattr(self.browser, "_browser"):
-                self.browser._browser = None
+        # Elements commonly used by bot protection services on challenge pages
+        return page.has_bot_blocking_element
 
-            self.browser.close()
+    async def close(self) -> None:
+        """Close the HTTP client if it is owned by this scraper."""
+        try:
+            if self._owns_client:
+                await self.client.aclose()
         except Exception as ex:
             logger.warning(f"Error occurred when closing scraper session: {ex}")
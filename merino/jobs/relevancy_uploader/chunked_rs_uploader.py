@@ -3,7 +3,11 @@
 import logging
 from typing import Any
 
-from merino.jobs.utils.chunked_rs_uploader import Chunk, ChunkedRemoteSettingsUploader
+from merino.jobs.utils.chunked_rs_uploader import (
+    DEFAULT_MAX_CONCURRENT_UPLOADS,
+    Chunk,
+    ChunkedRemoteSettingsUploader,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -50,6 +54,7 @@ class ChunkedRemoteSettingsRelevancyUploader(ChunkedRemoteSettingsUploader):
         version: int,
         dry_run: bool = False,
         total_item_count: int | None = None,
+        max_concurrent_uploads: int = DEFAULT_MAX_CONCURRENT_UPLOADS,
     ):
         """Initialize the uploader."""
         super().__init__(
@@ -62,6 +67,7 @@ class ChunkedRemoteSettingsRelevancyUploader(ChunkedRemoteSettingsUploader):
             dry_run,
             total_item_count,
             chunk_cls=RelevancyChunk,
+            max_concurrent_uploads=max_concurrent_uploads,
         )
         self.category_name = category_name
         self.category_code = category_code
@@ -72,12 +78,11 @@ class ChunkedRemoteSettingsRelevancyUploader(ChunkedRemoteSettingsUploader):
         `category_code`.
         """
         logger.info(f"Deleting records with type: {self.record_type}")
-        count = 0
+        ids = []
         for record in self.client.get_records():
             record_details = record.get("record_custom_details", {})
             cat_to_domains_details = record_details.get("category_to_domains", {})
             if cat_to_domains_details.get("version") == self.version:
-                logger.info(f"Deleting record: {record['id']}")
-                self.client.delete_record(record["id"])
-                count += 1
-        logger.info(f"Deleted {count} records")
+                ids.append(record["id"])
+        self.client.delete_records(ids)
+        logger.info(f"Deleted {len(ids)} records")
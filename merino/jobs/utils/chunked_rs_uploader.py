@@ -1,12 +1,110 @@
 """Chunked remote settings uploader"""
 
 import logging
-from typing import Any, Tuple
-
-from merino.jobs.utils.rs_client import RemoteSettingsClient
+from concurrent.futures import ALL_COMPLETED, FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, Iterable, Tuple
+
+import kinto_http
+import requests
+from tenacity import (
+    Retrying,
+    before_sleep_log,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_exponential,
+)
+
+from merino.jobs.utils.rs_client import RecordData, RemoteSettingsClient
 
 logger = logging.getLogger(__name__)
 
+# The default number of chunks uploaded at the same time.
+DEFAULT_MAX_CONCURRENT_UPLOADS = 4
+
+# The default number of attempts made at uploading a chunk before giving up.
+DEFAULT_MAX_UPLOAD_ATTEMPTS = 3
+
+# The default base wait in seconds between attempts at uploading a chunk. The
+# wait doubles after each failed attempt.
+DEFAULT_UPLOAD_RETRY_WAIT_SEC = 1.0
+
+
+def _is_retryable(error: BaseException) -> bool:
+    """Return whether a failed upload request is worth retrying: connection
+    errors, timeouts, rate limiting and server errors are.
+    """
+    if isinstance(error, (requests.ConnectionError, requests.Timeout)):
+        return True
+    if isinstance(error, kinto_http.KintoException):
+        response = error.response
+        return response is None or response.status_code == 429 or response.status_code >= 500
+    return False
+
+
+@dataclass
+class RecordUpload:
+    """A record and its attachment to upload, see `RemoteSettingsClient.upload()`."""
+
+    record: RecordData
+    attachment: Any
+    existing_record: RecordData | None = None
+    force_reupload: bool = False
+
+
+def upload_record(
+    client: RemoteSettingsClient,
+    upload: RecordUpload,
+    max_upload_attempts: int = DEFAULT_MAX_UPLOAD_ATTEMPTS,
+    upload_retry_wait_sec: float = DEFAULT_UPLOAD_RETRY_WAIT_SEC,
+) -> bool:
+    """Upload a record and its attachment, retrying on transient errors. Return
+    `True` if the record was created/updated or `False` if it was unchanged.
+    """
+    retrying = Retrying(
+        stop=stop_after_attempt(max_upload_attempts),
+        wait=wait_exponential(multiplier=upload_retry_wait_sec),
+        retry=retry_if_exception(_is_retryable),
+        before_sleep=before_sleep_log(logger, logging.WARNING),
+        reraise=True,
+    )
+    return retrying(
+        client.upload,
+        record=upload.record,
+        attachment=upload.attachment,
+        existing_record=upload.existing_record,
+        force_reupload=upload.force_reupload,
+    )
+
+
+def upload_records(
+    client: RemoteSettingsClient,
+    uploads: Iterable[RecordUpload],
+    max_concurrent_uploads: int = DEFAULT_MAX_CONCURRENT_UPLOADS,
+    max_upload_attempts: int = DEFAULT_MAX_UPLOAD_ATTEMPTS,
+    upload_retry_wait_sec: float = DEFAULT_UPLOAD_RETRY_WAIT_SEC,
+) -> list[bool]:
+    """Upload records and their attachments from a thread pool, with up to
+    `max_concurrent_uploads` uploads in flight, retrying each on transient
+    errors. Return whether each record was created/updated, in the order of
+    `uploads`. If an upload fails, the ones that have not started are dropped
+    and its error is raised.
+    """
+    with ThreadPoolExecutor(
+        max_workers=max_concurrent_uploads, thread_name_prefix="rs-upload"
+    ) as executor:
+        futures = [
+            executor.submit(
+                upload_record, client, upload, max_upload_attempts, upload_retry_wait_sec
+            )
+            for upload in uploads
+        ]
+        try:
+            return [future.result() for future in futures]
+        except BaseException:
+            executor.shutdown(cancel_futures=True)
+            raise
+
 
 class Chunk:
     """A chunk of items to be uploaded in a single attachment. Can be subclassed
@@ -118,19 +216,34 @@ class ChunkedRemoteSettingsUploader:
     The record's attachment will be the list of items in the chunk as JSON (MIME
     type "application/json").
 
+    Up to `max_concurrent_uploads` chunks are uploaded at the same time from a
+    thread pool, so the order in which records are created is not defined. A
+    chunk whose upload fails with a connection or server error is retried up to
+    `max_upload_attempts` times with exponential backoff, and errors that
+    remain are raised from `add_item()` or `finish()`. If the `with` block
+    raises, chunks that have not started uploading are dropped.
+
     It's common to delete existing suggestions before uploading new ones, so as
     a convenience the uploader can also delete all records of its `record_type`:
 
         uploader.delete_records()
 
+    Rather than deleting every record up front, the uploader diffs the existing
+    records against the uploaded ones: records that are uploaded again are
+    updated in place, or left alone if their data and attachment did not change,
+    and the remaining ones are deleted in bulk when the uploader finishes.
+
     """
 
     chunk_cls: type[Chunk]
     chunk_size: int
     client: RemoteSettingsClient
     current_chunk: Chunk
+    max_concurrent_uploads: int
+    max_upload_attempts: int
     record_type: str
     total_item_count: int | None
+    upload_retry_wait_sec: float
 
     def __init__(
         self,
@@ -143,6 +256,9 @@ class ChunkedRemoteSettingsUploader:
         dry_run: bool = False,
         total_item_count: int | None = None,
         chunk_cls: type[Chunk] = Chunk,
+        max_concurrent_uploads: int = DEFAULT_MAX_CONCURRENT_UPLOADS,
+        max_upload_attempts: int = DEFAULT_MAX_UPLOAD_ATTEMPTS,
+        upload_retry_wait_sec: float = DEFAULT_UPLOAD_RETRY_WAIT_SEC,
     ):
         """Initialize the uploader."""
         self.chunk_cls = chunk_cls
@@ -150,6 +266,9 @@ class ChunkedRemoteSettingsUploader:
         self.current_chunk = chunk_cls(self, 0)
         self.record_type = record_type
         self.total_item_count = total_item_count
+        self.max_concurrent_uploads = max_concurrent_uploads
+        self.max_upload_attempts = max_upload_attempts
+        self.upload_retry_wait_sec = upload_retry_wait_sec
         self.client = RemoteSettingsClient(
             auth=auth,
             bucket=bucket,
@@ -157,6 +276,13 @@ class ChunkedRemoteSettingsUploader:
             server=server,
             dry_run=dry_run,
         )
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrent_uploads, thread_name_prefix="rs-upload"
+        )
+        self._pending_uploads: set[Future[bool]] = set()
+        self._existing_records: dict[str, RecordData] = {}
+        self._uploaded_record_ids: set[str] = set()
+        self._delete_existing_records = False
 
     def add_item(self, item: dict[str, Any]) -> None:
         """Add an item to the current_chunk. If the chunk becomes full as a
@@ -169,20 +295,28 @@ class ChunkedRemoteSettingsUploader:
 
     def finish(self) -> None:
         """Finish the currrent chunk. If the chunk is not empty, it will be
-        uploaded before this method returns. This method should be called when
-        the caller is done with the uploader. If the uploader was created in a
+        uploaded before this method returns, along with all other pending
+        chunks, and records marked for deletion by `delete_records()` that were
+        not uploaded again are deleted. This method should be called when the
+        caller is done with the uploader. If the uploader was created in a
         `with` statement (as a context manager), this is called automatically.
         """
         self._finish_current_chunk()
+        self._wait_for_uploads()
+        self._delete_obsolete_records()
 
     def delete_records(self) -> None:
         """Delete records whose "type" is equal to the uploader's
-        `record_type`.
+        `record_type`. Records are deleted in bulk by `finish()`, except the
+        ones the uploader uploads again, which are updated instead.
         """
         logger.info(f"Deleting records with type: {self.record_type}")
-        for record in self.client.get_records():
-            if record.get("type") == self.record_type:
-                self.client.delete_record(record["id"])
+        self._existing_records = {
+            record["id"]: record
+            for record in self.client.get_records()
+            if record.get("type") == self.record_type
+        }
+        self._delete_existing_records = True
 
     def _finish_current_chunk(self) -> None:
         """If the current chunk is not empty, upload it and create a new empty
@@ -195,14 +329,58 @@ class ChunkedRemoteSettingsUploader:
             )
 
     def _upload_chunk(self, chunk: Chunk) -> None:
-        """Create a record and attachment for a chunk."""
-        self.client.upload(
-            record=chunk.to_record(),
-            attachment=chunk.to_attachment(),
+        """Create a record and attachment for a chunk. The upload runs in the
+        background; if `max_concurrent_uploads` uploads are already in flight,
+        wait for one of them to complete first.
+        """
+        record = chunk.to_record()
+        attachment = chunk.to_attachment()
+        self._uploaded_record_ids.add(record["id"])
+
+        existing_record = self._existing_records.get(record["id"])
+        if existing_record and any(existing_record.get(k) != v for k, v in record.items()):
+            # The record's data changed, so it must be updated even if its
+            # attachment didn't.
+            existing_record = None
+
+        if len(self._pending_uploads) >= self.max_concurrent_uploads:
+            self._wait_for_uploads(return_when=FIRST_COMPLETED)
+        self._pending_uploads.add(
+            self._executor.submit(
+                upload_record,
+                self.client,
+                RecordUpload(record, attachment, existing_record),
+                self.max_upload_attempts,
+                self.upload_retry_wait_sec,
+            )
         )
 
+    def _wait_for_uploads(self, return_when: str = ALL_COMPLETED) -> None:
+        """Wait for pending uploads to complete and raise the first upload
+        error, if any.
+        """
+        done, not_done = wait(self._pending_uploads, return_when=return_when)
+        self._pending_uploads = not_done
+        for future in done:
+            future.result()
+
+    def _delete_obsolete_records(self) -> None:
+        """Delete the existing records marked by `delete_records()` that were
+        not uploaded again.
+        """
+        if self._delete_existing_records:
+            self.client.delete_records(
+                sorted(self._existing_records.keys() - self._uploaded_record_ids)
+            )
+            self._existing_records = {}
+            self._delete_existing_records = False
+
     def __enter__(self):
         return self
 
     def __exit__(self, exc_type, exc_value, traceback):
-        self.finish()
+        try:
+            if exc_type is None:
+                self.finish()
+        finally:
+            self._executor.shutdown(cancel_futures=exc_type is not None)
@@ -106,8 +106,8 @@ async def async_test_domain(domain: str, min_width: int) -> DomainTestResult:
 
             base_url = metadata["url"]
 
-            with WebScraper() as web_scraper:
-                scraped_url = web_scraper.open(base_url)
+            async with WebScraper() as web_scraper:
+                scraped_url = await web_scraper.open(base_url)
                 if scraped_url:
                     page = web_scraper.get_page()
                     if page:
@@ -111,6 +111,21 @@ class RemoteSettingsClient:
         if not self.dry_run:
             self.kinto.delete_record(id=id)
 
+    def delete_records(self, ids: Iterable[str]) -> None:
+        """Delete records by their IDs using batch requests. Kinto splits the
+        batch into as many requests as the server's `batch_max_requests` setting
+        requires.
+
+        """
+        ids = list(ids)
+        if not ids:
+            return
+        logger.info(f"Deleting {len(ids)} records: {', '.join(ids)}")
+        if not self.dry_run:
+            with self.kinto.batch() as batch:
+                for id in ids:
+                    batch.delete_record(id=id)
+
     def download_attachment(self, record: RecordData) -> Any:
         """Download and return a record's attachment."""
         with TemporaryDirectory() as tmp_dir_name:
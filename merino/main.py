@@ -23,6 +23,7 @@ from merino.runtime import (
 from merino.configs import settings
 from merino_common.app_configs.config_logging import configure_logging
 from merino_common.app_configs.config_sentry import configure_sentry
+from merino.utils.loop_monitor import LoopMonitor
 from merino.utils.metrics import configure_metrics, get_metrics_client
 from merino.middleware import (
     featureflags,
@@ -102,6 +103,7 @@ def create_lifespan(mode: RuntimeMode | str):
             )
             await configure_metrics()
             cleanup_callbacks.append(_close_metrics_client)
+            _start_loop_monitor(cleanup_callbacks)
 
             if mode_enables(runtime_mode, RuntimeFeature.REGULAR_API):
                 await _start_regular_services(cleanup_callbacks)
@@ -136,6 +138,25 @@ async def _start_regular_services(cleanup_callbacks: list[CleanupCallback]) -> N
     await games.init_providers()
 
 
+def _start_loop_monitor(cleanup_callbacks: list[CleanupCallback]) -> None:
+    """Start the event loop monitor, if enabled, and register cleanup."""
+    loop_monitor_settings = settings.metrics.loop_monitor
+    if not loop_monitor_settings.enabled:
+        return
+
+    monitor = LoopMonitor(
+        get_metrics_client(),
+        interval_sec=loop_monitor_settings.interval_sec,
+        slow_callback_threshold_sec=(
+            loop_monitor_settings.slow_callback_threshold_sec
+            if loop_monitor_settings.slow_callback_detection
+            else None
+        ),
+    )
+    monitor.start()
+    cleanup_callbacks.append(monitor.shutdown)
+
+
 def _start_governance(cleanup_callbacks: list[CleanupCallback]) -> None:
     """Start regular service governance and register cleanup."""
     from merino import governance
@@ -201,6 +222,11 @@ def _include_routers(app: FastAPI, mode: RuntimeMode) -> None:
     """Include routers enabled for a runtime mode."""
     app.include_router(dockerflow.router)
 
+    if settings.profiler.enabled:
+        from merino.web import profiler
+
+        app.include_router(profiler.router)
+
     if mode_enables(mode, RuntimeFeature.REGULAR_API):
         from merino.web import api_v1
 
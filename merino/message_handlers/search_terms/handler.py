@@ -10,7 +10,7 @@ from merino.message_handlers.search_terms.pubsub import (
 )
 from merino_common.utils.http_client import create_http_client
 from merino_common.models.suggest_logging import SuggestRequestParams
-from merino_common.utils.async_batch_queue import AsyncBatchQueue
+from merino_common.utils.async_batch_queue import AsyncBatchQueue, OverflowPolicy
 
 # identifier used to tag the queue's metrics.
 QUEUE_ID = "search_term_submission"
@@ -65,6 +65,10 @@ class MessageHandler:
             collection_delay_s=settings.message_handler.collection_delay_sec,
             shutdown_deadline_s=settings.message_handler.shutdown_deadline_sec,
             max_queue_size=settings.message_handler.max_queue_size,
+            max_concurrent_batches=settings.message_handler.max_concurrent_batches,
+            min_batch_size=settings.message_handler.min_batch_size,
+            target_flush_latency_s=settings.message_handler.target_flush_latency_sec or None,
+            overflow_policy=OverflowPolicy(settings.message_handler.overflow_policy),
         )
         await queue.start()
         self._queue = queue
@@ -1,8 +1,7 @@
 """Thompson sampling optimizer."""
 
 import numpy as np
-
-from scipy.stats import beta
+import numpy.typing as npt
 
 from merino.optimizers.models import ThompsonCandidate, ThompsonConfig
 
@@ -14,6 +13,7 @@ class ThompsonSampler:
 
     def __init__(self, config: ThompsonConfig) -> None:
         self.config = config
+        self._rng = np.random.default_rng(config.random_seed)
 
     def below_threshold(self, candidate: ThompsonCandidate) -> bool:
         """Check if the given candidate's engagement ratio is below that of the dummy candidate.
@@ -24,10 +24,21 @@ class ThompsonSampler:
             A boolean. True if the candidate's engagement ratio is below the dummy's CTR,
             otherwise false. When the dummy is unset, this always returns false.
         """
+        return self.ratio_below_threshold(candidate.metrics.ratio)
+
+    def ratio_below_threshold(self, ratio: float) -> bool:
+        """Check if the given engagement ratio is below that of the dummy candidate.
+
+        Params:
+            - `ratio`: an engagement ratio, i.e. engaged / attempted.
+        Returns:
+            A boolean. True if the ratio is below the dummy's CTR, otherwise false.
+            When the dummy is unset, this always returns false.
+        """
         dummy_ratio: float = (
             self.config.dummy_candidate.ratio if self.config.dummy_candidate else 0
         )
-        return candidate.metrics.ratio < dummy_ratio
+        return ratio < dummy_ratio
 
     def sample(self, candidates: list[ThompsonCandidate]) -> ThompsonCandidate | None:
         """Apply Thompson sampling to a set of candidates.
@@ -43,25 +54,38 @@ class ThompsonSampler:
         if not candidates:
             return None
 
-        samples = [
-            beta.rvs(
-                c.metrics.engaged, c.metrics.not_engaged, random_state=self.config.random_seed
-            )
-            for c in candidates
-        ]
+        n = self.select(
+            np.array([c.metrics.engaged for c in candidates], dtype=np.float64),
+            np.array([c.metrics.not_engaged for c in candidates], dtype=np.float64),
+        )
+        return None if n is None else candidates[n]
+
+    def select(self, alpha: npt.NDArray[np.float64], beta: npt.NDArray[np.float64]) -> int | None:
+        """Apply Thompson sampling to candidates given as parallel arrays of Beta parameters.
+
+        All candidates are drawn in a single vectorized call, so this is the entry point
+        for hot paths that keep their engagement priors in arrays.
+
+        Params:
+            - `alpha`: the engaged count of each candidate, no less than 1.
+            - `beta`: the not engaged count of each candidate, no less than 1.
+        Returns:
+            The index of the selected candidate or None if no candidate wins.
+        """
+        if len(alpha) == 0:
+            return None
 
-        n = np.argmax(samples)
-        sample = samples[n]
+        samples = self._rng.beta(alpha, beta)
+        n = int(np.argmax(samples))
 
         if (
             self.config.dummy_candidate
-            and beta.rvs(
+            and self._rng.beta(
                 self.config.dummy_candidate.engaged,
                 self.config.dummy_candidate.not_engaged,
-                random_state=self.config.random_seed,
             )
-            > sample
+            > samples[n]
         ):
             return None
 
-        return candidates[n]
+        return n
@@ -23,15 +23,39 @@ _provider_initialize_duration = _meter.create_histogram(
     unit="ms",
     description="Duration of suggest provider initialization",
 )
+_provider_shutdown_duration = _meter.create_histogram(
+    "merino_providers_shutdown_duration",
+    unit="ms",
+    description="Duration of suggest provider shutdown",
+)
+
+
+def _start_type(warm: bool) -> str:
+    """Return the `start` attribute of the initialization duration."""
+    return "warm" if warm else "cold"
 
 
 async def _initialize_provider(provider_name: str, provider: BaseProvider) -> None:
-    """Initialize a provider and record its initialization duration."""
+    """Initialize a provider and record its initialization duration, by whether it was
+    initialized from a snapshot (warm) or from its upstreams (cold).
+    """
     start = timer()
     try:
         await provider.initialize()
     finally:
         _provider_initialize_duration.record(
+            (timer() - start) * 1000,
+            {"provider": provider_name, "start": _start_type(provider.warm_started)},
+        )
+
+
+async def _shutdown_provider(provider_name: str, provider: BaseProvider) -> None:
+    """Shut down a provider and record its shutdown duration."""
+    start = timer()
+    try:
+        await provider.shutdown()
+    finally:
+        _provider_shutdown_duration.record(
             (timer() - start) * 1000,
             {"provider": provider_name},
         )
@@ -75,7 +99,10 @@ async def init_providers() -> None:
     finally:
         _provider_initialize_duration.record(
             (timer() - initialization_start) * 1000,
-            {"provider": "__ALL__"},
+            {
+                "provider": "__ALL__",
+                "start": _start_type(any(p.warm_started for p in providers.values())),
+            },
         )
 
     # init query normalization pipeline
@@ -83,18 +110,51 @@ async def init_providers() -> None:
 
 
 async def shutdown_providers() -> None:
-    """Shut down all providers
+    """Shut down all providers concurrently
+
+    Providers still shutting down after `runtime.shutdown_timeout_sec` are cancelled so
+    that a slow provider can't hold up the exit of the application. A failing provider
+    is logged and doesn't stop the others from shutting down.
 
     This should only be called once at the shutdown of application.
     """
+    from merino.configs import settings
+
     start = timer()
+    try:
+        wrapped_tasks = [
+            asyncio.create_task(
+                _shutdown_provider(provider_name, provider),
+                name=provider_name,
+            )
+            for provider_name, provider in providers.items()
+        ]
+        done, pending = await task_runner.gather(
+            wrapped_tasks, timeout=settings.runtime.shutdown_timeout_sec
+        )
 
-    for provider in providers.values():
-        await provider.shutdown()
-    logger.info(
-        "Provider shutdown completed",
-        extra={"providers": [*providers.keys()], "elapsed": timer() - start},
-    )
+        if pending:
+            logger.warning(
+                "Provider shutdown timed out",
+                extra={"providers": sorted(task.get_name() for task in pending)},
+            )
+        for task in done:
+            if (exception := task.exception()) is not None:
+                logger.error(
+                    f"Provider shutdown failed: {exception}",
+                    extra={"provider": task.get_name()},
+                    exc_info=exception,
+                )
+
+        logger.info(
+            "Provider shutdown completed",
+            extra={"providers": [*providers.keys()], "elapsed": timer() - start},
+        )
+    finally:
+        _provider_shutdown_duration.record(
+            (timer() - start) * 1000,
+            {"provider": "__ALL__"},
+        )
 
 
 def get_providers() -> tuple[dict[str, BaseProvider], list[BaseProvider]]:
@@ -1 +1,5 @@
 """AdM provider"""
+
+# Experiment treatment variant that opts a request into the ED1 fuzzy fallback. It is
+# defined here so that the API can check for it without loading the provider.
+AMP_FUZZY_VARIANT: str = "amp-fuzzy-matching-treatment"
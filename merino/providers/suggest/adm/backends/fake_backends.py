@@ -10,3 +10,7 @@ class FakeAdmBackend:  # pragma: no cover
     async def fetch(self) -> SuggestionContent:
         """Get fake Content from partner."""
         return SuggestionContent(index_manager=AmpIndexManager(), icons={})  # type: ignore[no-untyped-call]
+
+    def restore_snapshot(self) -> SuggestionContent | None:
+        """Restore nothing, the fake backend has no snapshot."""
+        return None
@@ -6,6 +6,7 @@ from collections import defaultdict
 import json
 import logging
 import time
+from typing import Final
 from urllib.parse import urljoin
 
 import aiodogstatsd
@@ -21,9 +22,13 @@ from merino.providers.suggest.adm.backends.protocol import (
 )
 from merino_common.utils.http_client import create_http_client
 from merino.utils.icon_processor import IconProcessor
+from merino.utils.snapshot import Snapshot
 
 logger = logging.getLogger(__name__)
 
+# The version of the snapshot payload, to be bumped whenever its format changes.
+SNAPSHOT_VERSION: Final[int] = 1
+
 
 class MarsError(BackendError):
     """Error during interaction with the MARS API."""
@@ -43,6 +48,10 @@ class MarsBackend:
     etags: dict[str, str]
     # Timestamp of the last successful 200-with-data response.
     last_new_data_at: float
+    # The local snapshot of the suggestion data, if warm starts are enabled.
+    snapshot: Snapshot | None
+    # The raw suggestions of each index, kept to be snapshotted.
+    raw_suggestions: dict[str, str]
 
     def __init__(
         self,
@@ -52,6 +61,7 @@ class MarsBackend:
         connect_timeout: float,
         request_timeout: float,
         suggestion_url_path: str = "data",
+        snapshot: Snapshot | None = None,
     ) -> None:
         """Initialize the MARS backend.
 
@@ -62,6 +72,8 @@ class MarsBackend:
             connect_timeout: Timeout in seconds for establishing a connection.
             request_timeout: Timeout in seconds for a request.
             suggestion_url_path: The URL path for fetching suggestions.
+            snapshot: The local snapshot to save the suggestion data to after each
+                change, and to restore it from on startup.
 
         Raises:
             ValueError: If base_url is empty.
@@ -83,6 +95,8 @@ class MarsBackend:
         )
         self.etags = {}
         self.last_new_data_at = 0.0
+        self.snapshot = snapshot
+        self.raw_suggestions = {}
 
     def _emit_index_metrics(self, idx_id: str, index_label: str) -> None:
         """Emit gauge metrics for the amp index after a successful build."""
@@ -121,6 +135,15 @@ class MarsBackend:
                 segments.append((country, segment, form_factor, idx_id))
                 segment_labels[segment] = form_factor
 
+        # Forget the suggestions of the segments no longer configured, so that they aren't
+        # snapshotted and restored on the next startup.
+        idx_ids = {idx_id for *_, idx_id in segments}
+        self.raw_suggestions = {
+            idx_id: raw_suggestions
+            for idx_id, raw_suggestions in self.raw_suggestions.items()
+            if idx_id in idx_ids
+        }
+
         # Fetch suggestion data for all segments concurrently.
         mars_suggestions: defaultdict[str, dict[SegmentType, str]] = await self.get_suggestions(
             segments
@@ -135,6 +158,8 @@ class MarsBackend:
                 idx_id = f"{country}/{segment}"
                 try:
                     self.suggestion_content.index_manager.build(idx_id, raw_suggestions)
+                    if self.snapshot is not None:
+                        self.raw_suggestions[idx_id] = raw_suggestions
                     icons_in_use = icons_in_use.union(
                         self.suggestion_content.index_manager.list_icons(idx_id)
                     )
@@ -170,9 +195,67 @@ class MarsBackend:
                 icons[icon_id] = original_url
 
         self.suggestion_content.icons.update(icons)
+        await self.save_snapshot()
+
+        return self.suggestion_content
+
+    def restore_snapshot(self) -> SuggestionContent | None:
+        """Build the indexes and icons from the local snapshot, if any, along with the
+        ETags of the suggestions so that the next fetch only downloads what changed since.
+
+        Returns:
+            The restored suggestion content, or None if no index was restored.
+        """
+        if self.snapshot is None or (payload := self.snapshot.load(SNAPSHOT_VERSION)) is None:
+            return None
 
+        try:
+            data = json.loads(payload)
+            segments: dict[str, str] = data["suggestions"]
+            etags: dict[str, str] = data["etags"]
+            icons: dict[str, str] = data["icons"]
+            last_new_data_at = float(data["last_new_data_at"])
+        except (ValueError, TypeError, KeyError) as error:
+            logger.warning(f"Unable to restore the MARS snapshot: {error}")
+            return None
+
+        for idx_id, raw_suggestions in segments.items():
+            try:
+                self.suggestion_content.index_manager.build(idx_id, raw_suggestions)
+            except Exception as e:
+                logger.warning(
+                    f"Unable to build index {idx_id} from the snapshot",
+                    extra={"error message": f"{e}"},
+                )
+                continue
+            self.raw_suggestions[idx_id] = raw_suggestions
+            if idx_id in etags:
+                self.etags[idx_id] = etags[idx_id]
+
+        if not self.raw_suggestions:
+            return None
+        self.suggestion_content.icons.update(icons)
+        self.last_new_data_at = last_new_data_at
         return self.suggestion_content
 
+    async def save_snapshot(self) -> None:
+        """Save the suggestion data to the local snapshot, if warm starts are enabled."""
+        if self.snapshot is None or not self.raw_suggestions:
+            return
+        payload = {
+            "suggestions": dict(self.raw_suggestions),
+            "etags": {
+                idx_id: self.etags[idx_id]
+                for idx_id in self.raw_suggestions.keys() & self.etags.keys()
+            },
+            "icons": dict(self.suggestion_content.icons),
+            "last_new_data_at": self.last_new_data_at,
+        }
+        # Serializing megabytes of suggestions would block the event loop, so it's done in a
+        # thread, on copies of the dicts that later fetches may update meanwhile.
+        data = await asyncio.to_thread(lambda: json.dumps(payload).encode())
+        await self.snapshot.save(data, SNAPSHOT_VERSION)
+
     async def get_suggestions(
         self, segments: list[tuple[str, SegmentType, str, str]]
     ) -> defaultdict[str, dict[SegmentType, str]]:
@@ -67,3 +67,7 @@ class AdmBackend(Protocol):
     async def fetch(self) -> SuggestionContent:  # pragma: no cover
         """Get suggestion content from partner."""
         ...
+
+    def restore_snapshot(self) -> SuggestionContent | None:  # pragma: no cover
+        """Restore suggestion content from a local snapshot, if any."""
+        ...
@@ -0,0 +1,98 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""Engagement priors for Thompson sampling AMP suggestions.
+
+Keyword engagement data is keyed by ``"{advertiser}/{keyword}"``. Rather than format
+that key and validate an ``EngagementMetrics`` for every candidate of every request,
+the priors are resolved once per engagement refresh into a two-level map from keyword
+to advertiser to Beta parameters. A request then costs one lookup for its query, and
+its candidates' priors come out as the parallel arrays ``ThompsonSampler.select``
+draws from.
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import Final
+
+import numpy as np
+import numpy.typing as npt
+from pydantic import ValidationError
+
+from merino.optimizers.models import EngagementMetrics
+from merino.providers.suggest.adm.backends.protocol import EngagementData
+
+logger = logging.getLogger(__name__)
+
+# (engaged, not engaged, attempted) of an advertiser/keyword pair with no engagement data.
+DEFAULT_PRIOR: Final[tuple[int, int, int]] = (1, 1, 1)
+
+
+@dataclass(frozen=True)
+class CandidatePriors:
+    """Engagement priors of a list of candidates, as parallel arrays.
+
+    Attributes:
+        alpha: The engaged count of each candidate.
+        beta: The not engaged count of each candidate.
+        attempted: The attempted count of each candidate.
+    """
+
+    alpha: npt.NDArray[np.float64]
+    beta: npt.NDArray[np.float64]
+    attempted: npt.NDArray[np.float64]
+
+    def ratio(self, index: int) -> float:
+        """Return the engagement ratio of the candidate at the given index."""
+        return float(self.alpha[index] / self.attempted[index])
+
+
+class EngagementPriors:
+    """Beta priors for advertiser/keyword pairs, resolved from keyword engagement data.
+
+    Live metrics take precedence over historical ones. Counters are adjusted the same
+    way as ``EngagementMetrics``; entries it rejects (more clicks than impressions)
+    are skipped and fall back to the default prior.
+    """
+
+    def __init__(self, data: EngagementData) -> None:
+        self._by_keyword: dict[str, dict[str, tuple[int, int, int]]] = {}
+        skipped = 0
+        for key, entry in data.amp.items():
+            kw_metrics = entry.live or entry.historical
+            if kw_metrics is None:
+                continue
+            advertiser, _, keyword = key.partition("/")
+            try:
+                metrics = EngagementMetrics(
+                    engaged=kw_metrics.clicks, attempted=kw_metrics.impressions
+                )
+            except ValidationError:
+                skipped += 1
+                continue
+            self._by_keyword.setdefault(keyword, {})[advertiser] = (
+                metrics.engaged,
+                metrics.not_engaged,
+                metrics.attempted,
+            )
+        if skipped:
+            logger.warning(
+                "Skipped invalid keyword engagement entries", extra={"skipped": skipped}
+            )
+
+    def __len__(self) -> int:
+        return sum(len(advertisers) for advertisers in self._by_keyword.values())
+
+    def lookup(self, keyword: str, advertisers: list[str]) -> CandidatePriors:
+        """Return the priors of each advertiser's suggestion for the keyword, in order.
+
+        Advertisers are expected to be lowercased, as in the engagement data.
+        """
+        by_advertiser = self._by_keyword.get(keyword)
+        if by_advertiser is None:
+            rows = [DEFAULT_PRIOR] * len(advertisers)
+        else:
+            rows = [by_advertiser.get(advertiser, DEFAULT_PRIOR) for advertiser in advertisers]
+        table = np.array(rows, dtype=np.float64).reshape(-1, 3)
+        return CandidatePriors(alpha=table[:, 0], beta=table[:, 1], attempted=table[:, 2])
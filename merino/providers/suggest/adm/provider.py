@@ -12,8 +12,8 @@ from moz_merino_ext.amp import AmpIndexManager, PyAmpResult
 from pydantic import HttpUrl
 
 from merino.configs import settings
-from merino.optimizers.models import EngagementMetrics, ThompsonCandidate
 from merino.optimizers.thompson import ThompsonSampler
+from merino.providers.suggest.adm import AMP_FUZZY_VARIANT as AMP_FUZZY_VARIANT
 from merino.providers.suggest.adm.backends.protocol import (
     EngagementData,
     FormFactor,
@@ -25,15 +25,20 @@ from merino_common.utils import cron
 from merino.utils.query_processing.normalization import get_pipeline
 from merino.providers.suggest.adm.backends.protocol import AdmBackend, SuggestionContent
 from merino.providers.suggest.adm.fuzzy import rejection_reason
+from merino.providers.suggest.adm.priors import EngagementPriors
 from merino.providers.suggest.base import (
     BaseProvider,
     BaseSuggestion,
     SuggestionRequest,
 )
 from merino.providers.suggest.custom_details import AmpDetails, CustomDetails
+from merino.utils.snapshot import Snapshot
 
 logger = logging.getLogger(__name__)
 
+# The version of the engagement data snapshot payload.
+ENGAGEMENT_SNAPSHOT_VERSION: Final = 1
+
 
 @unique
 class IABCategory(str, Enum):
@@ -59,8 +64,6 @@ FORM_FACTORS_FALLBACK_MAPPING = {
 FALLBACK_FORM_FACTOR: str = "other"
 FALLBACK_COUNTRY_CODE: str = "US"
 TS_DRY_RUN: bool = settings.providers.adm.thompson.dry_run
-# Experiment treatment variant that opts a request into the ED1 fuzzy fallback.
-AMP_FUZZY_VARIANT: str = "amp-fuzzy-matching-treatment"
 # toggle fuzzy matching for AMP suggestions
 AMP_FUZZY_ENABLED: bool = settings.providers.adm.fuzzy.enabled
 # providers that receive normalized queries (AMP gated per-environment)
@@ -105,11 +108,13 @@ class Provider(BaseProvider):
     min_attempted_count: int
     thompson: ThompsonSampler | None = None
     engagement_resync_interval_sec: float
-    engagement_data: EngagementData
+    engagement_priors: EngagementPriors
     filemanager: EngagementFilemanager
     last_engagement_fetch_at: float
     engagement_cron_task: asyncio.Task
     staleness_cron_task: asyncio.Task
+    warm_start: bool
+    engagement_snapshot: Snapshot | None
 
     def __init__(
         self,
@@ -125,6 +130,8 @@ class Provider(BaseProvider):
         enabled_by_default: bool = True,
         min_attempted_count: int = 0,
         thompson: ThompsonSampler | None = None,
+        warm_start: bool = False,
+        engagement_snapshot: Snapshot | None = None,
         **kwargs: Any,
     ) -> None:
         """Store the given Remote Settings backend on the provider."""
@@ -145,20 +152,33 @@ class Provider(BaseProvider):
             gcs_bucket_path=engagement_gcs_bucket,
             blob_name=engagement_blob_name,
         )
+        self.warm_start = warm_start
+        self.engagement_snapshot = engagement_snapshot
         super().__init__(**kwargs)
 
     async def initialize(self) -> None:
-        """Initialize cron job."""
-        try:
-            await self._fetch()
-        except Exception as e:
-            logger.warning(
-                "Failed to fetch data from Remote Settings, will retry it soon",
-                extra={"error message": f"{e}"},
-            )
-            # Set the last fetch timestamp to 0 so that the cron job will retry
-            # the fetch upon the next tick.
+        """Initialize cron job.
+
+        On a warm start, the suggestions and engagement data are restored from their local
+        snapshots and the cron jobs refresh them in the background, since their last fetch
+        timestamps are left at 0.
+        """
+        if self.warm_start and (content := self.backend.restore_snapshot()) is not None:
+            self.suggestion_content = content
+            self._refresh_normalization_terms()
+            self.warm_started = True
             self.last_fetch_at = 0
+        else:
+            try:
+                await self._fetch()
+            except Exception as e:
+                logger.warning(
+                    "Failed to fetch data from Remote Settings, will retry it soon",
+                    extra={"error message": f"{e}"},
+                )
+                # Set the last fetch timestamp to 0 so that the cron job will retry
+                # the fetch upon the next tick.
+                self.last_fetch_at = 0
 
         # Run a cron job that resyncs data from Remote Settings in the background.
         cron_job = cron.Job(
@@ -172,7 +192,10 @@ class Provider(BaseProvider):
         # reference to it.
         self.cron_task = asyncio.create_task(cron_job())
 
-        await self._fetch_engagement_data()
+        if self._restore_engagement_data():
+            self.warm_started = True
+        else:
+            await self._fetch_engagement_data()
         engagement_cron_job = cron.Job(
             name="resync_engagement_data",
             interval=self.cron_interval_sec,
@@ -189,6 +212,17 @@ class Provider(BaseProvider):
         )
         self.staleness_cron_task = asyncio.create_task(staleness_cron_job())
 
+    @property
+    def engagement_data(self) -> EngagementData:
+        """Keyword engagement data used for Thompson sampling."""
+        return self._engagement_data
+
+    @engagement_data.setter
+    def engagement_data(self, data: EngagementData) -> None:
+        """Store engagement data and resolve its priors for sampling."""
+        self._engagement_data = data
+        self.engagement_priors = EngagementPriors(data)
+
     def _should_emit_staleness(self) -> bool:
         """Check if the backend tracks data staleness."""
         return getattr(self.backend, "last_new_data_at", 0) > 0
@@ -241,12 +275,35 @@ class Provider(BaseProvider):
                 return
             self.engagement_data = EngagementData.model_validate(data.model_dump())
             self.last_engagement_fetch_at = time.time()
+            if self.engagement_snapshot is not None:
+                await self.engagement_snapshot.save(
+                    self.engagement_data.model_dump_json().encode(), ENGAGEMENT_SNAPSHOT_VERSION
+                )
         except Exception as e:
             logger.warning(
                 "Failed to fetch engagement data from GCS",
                 extra={"error": str(e)},
             )
 
+    def _restore_engagement_data(self) -> bool:
+        """Restore the engagement data from its local snapshot, returning whether it was
+        restored.
+        """
+        if self.engagement_snapshot is None:
+            return False
+        payload = self.engagement_snapshot.load(ENGAGEMENT_SNAPSHOT_VERSION)
+        if payload is None:
+            return False
+        try:
+            self.engagement_data = EngagementData.model_validate_json(payload)
+        except ValueError as e:
+            logger.warning(
+                "Unable to restore the engagement data snapshot",
+                extra={"error": str(e)},
+            )
+            return False
+        return True
+
     def hidden(self) -> bool:  # noqa: D102
         return False
 
@@ -254,21 +311,6 @@ class Provider(BaseProvider):
         """Convert a query string to lowercase and remove leading spaces."""
         return query.lstrip().lower()
 
-    def _fetch_engagement_metrics(self, suggestion: PyAmpResult, query: str) -> EngagementMetrics:
-        """Fetch engagement metrics for an AMP suggestion."""
-        advertiser = suggestion.advertiser.lower()
-        engaged, attempted = 1, 1
-
-        keyword_key = f"{advertiser}/{query}"
-        if entry := self.engagement_data.amp.get(keyword_key):
-            kw_metrics = entry.live or entry.historical
-            if kw_metrics:
-                return EngagementMetrics(
-                    engaged=kw_metrics.clicks, attempted=kw_metrics.impressions
-                )
-
-        return EngagementMetrics(engaged=engaged, attempted=attempted)
-
     def _is_thompson_eligible(self) -> bool:
         """Return True if Thompson sampling should be applied to this request."""
         if not self.thompson:
@@ -280,10 +322,10 @@ class Provider(BaseProvider):
     def _select(self, suggestions: list[PyAmpResult], query: str) -> PyAmpResult | None:
         def _sampling() -> PyAmpResult | None:
             """Thompson sampling helper function."""
-            candidates = [
-                ThompsonCandidate(id=i, metrics=self._fetch_engagement_metrics(suggestion, query))
-                for i, suggestion in enumerate(suggestions)
-            ]
+            thompson = cast(ThompsonSampler, self.thompson)
+            priors = self.engagement_priors.lookup(
+                query, [suggestion.advertiser.lower() for suggestion in suggestions]
+            )
 
             tags = {}
             if suggestions:
@@ -291,24 +333,21 @@ class Provider(BaseProvider):
                 # should always be a singleton list. Update it if that's false in the future.
                 tags["subject"] = suggestions[0].advertiser.lower()
                 tags["below_threshold"] = (
-                    "true"
-                    if cast(ThompsonSampler, self.thompson).below_threshold(candidates[0])
-                    else "false"
+                    "true" if thompson.ratio_below_threshold(priors.ratio(0)) else "false"
                 )
 
             # If it's the only candidate with an attempted count less than the threshold, skip sampling.
-            if len(candidates) == 1 and candidates[0].metrics.attempted < self.min_attempted_count:
+            if len(suggestions) == 1 and priors.attempted[0] < self.min_attempted_count:
                 self.metrics_client.increment(
                     "providers.adm.thompson.select", tags={"outcome": "skipped", **tags}
                 )
                 return suggestions[0]
 
-            winner = cast(ThompsonSampler, self.thompson).sample(candidates)
-            if winner:
+            winner_idx = thompson.select(priors.alpha, priors.beta)
+            if winner_idx is not None:
                 self.metrics_client.increment(
                     "providers.adm.thompson.select", tags={"outcome": "selected", **tags}
                 )
-                winner_idx: int = winner.id
                 return suggestions[winner_idx]
             else:
                 self.metrics_client.increment(
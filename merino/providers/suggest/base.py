@@ -131,6 +131,9 @@ class BaseProvider(ABC):
     _name: str
     _enabled_by_default: bool
     _query_timeout_sec: float = settings.runtime.query_timeout_sec
+    # Whether the provider was initialized from a local snapshot of its data rather than
+    # from its upstreams, see `merino.utils.snapshot`.
+    warm_started: bool = False
 
     @abstractmethod
     async def initialize(self) -> None:  # pragma: no cover
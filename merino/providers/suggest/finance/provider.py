@@ -3,6 +3,7 @@
 import asyncio
 import logging
 import time
+from typing import Final
 
 import aiodogstatsd
 from fastapi import HTTPException
@@ -29,9 +30,13 @@ from merino.providers.suggest.finance.backends.polygon.utils import (
 )
 from merino_common.utils import cron
 from merino.configs import settings
+from merino.utils.snapshot import Snapshot
 
 logger = logging.getLogger(__name__)
 
+# The version of the manifest snapshot payload.
+SNAPSHOT_VERSION: Final = 1
+
 
 class Provider(BaseProvider):
     """Suggestion provider for finance."""
@@ -46,6 +51,7 @@ class Provider(BaseProvider):
     cron_interval_sec: int
     last_fetch_at: float
     last_fetch_failure_at: float | None = None
+    snapshot: Snapshot | None
 
     def __init__(
         self,
@@ -57,6 +63,7 @@ class Provider(BaseProvider):
         resync_interval_sec: int,
         cron_interval_sec: int,
         enabled_by_default: bool = False,
+        snapshot: Snapshot | None = None,
     ) -> None:
         self.backend = backend
         self.metrics_client = metrics_client
@@ -70,13 +77,22 @@ class Provider(BaseProvider):
         self.resync_interval_sec = resync_interval_sec
         self.cron_interval_sec = cron_interval_sec
         self.last_fetch_at = 0.0
+        self.snapshot = snapshot
 
         super().__init__()
 
     async def initialize(self) -> None:
-        """Initialize the provider."""
+        """Initialize the provider.
+
+        On a warm start, the manifest is restored from its local snapshot and the cron job
+        refreshes it in the background, since the last fetch timestamp is left at 0.
+        """
         if settings.image_gcs.gcs_enabled:
-            await self._fetch_manifest()
+            if self._restore_snapshot():
+                self.warm_started = True
+                self.data_fetched_event.set()
+            else:
+                await self._fetch_manifest()
 
             cron_job_fetch = cron.Job(
                 name="fetch_polygon_manifest",
@@ -99,6 +115,8 @@ class Provider(BaseProvider):
                     self.manifest_data = data
                     self.last_fetch_at = time.time()
                     self.last_fetch_failure_at = None
+                    if self.snapshot is not None:
+                        await self.snapshot.save(data.model_dump_json().encode(), SNAPSHOT_VERSION)
 
                 case GetManifestResultCode.FAIL:
                     logger.error("Failed to fetch manifest data from finance backend.")
@@ -118,6 +136,17 @@ class Provider(BaseProvider):
         finally:
             self.data_fetched_event.set()
 
+    def _restore_snapshot(self) -> bool:
+        """Restore the manifest from its local snapshot, returning whether it was restored."""
+        if self.snapshot is None or (payload := self.snapshot.load(SNAPSHOT_VERSION)) is None:
+            return False
+        try:
+            self.manifest_data = FinanceManifest.model_validate_json(payload)
+        except ValueError as err:
+            logger.warning(f"Unable to restore the finance manifest snapshot: {err}")
+            return False
+        return True
+
     def _should_fetch(self) -> bool:
         """Determine if we should fetch new data based on time and last failure."""
         now = time.time()
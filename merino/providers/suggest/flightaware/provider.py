@@ -1,8 +1,10 @@
 """FlightAware Integration"""
 
 import asyncio
+import json
 import logging
 import time
+from typing import Final
 import aiodogstatsd
 from fastapi import HTTPException
 from pydantic import HttpUrl
@@ -23,9 +25,13 @@ from merino.providers.suggest.flightaware.backends.utils import (
 )
 from merino_common.utils import cron
 from merino.configs import settings
+from merino.utils.snapshot import Snapshot
 
 logger = logging.getLogger(__name__)
 
+# The version of the flight numbers snapshot payload.
+SNAPSHOT_VERSION: Final = 1
+
 
 class Provider(BaseProvider):
     """Suggestion provider for flight aware"""
@@ -36,6 +42,7 @@ class Provider(BaseProvider):
     flight_numbers: set[str]
     resync_interval_sec: int
     cron_interval_sec: int
+    snapshot: Snapshot | None
 
     def __init__(
         self,
@@ -47,6 +54,7 @@ class Provider(BaseProvider):
         resync_interval_sec: int,
         cron_interval_sec: int,
         enabled_by_default: bool = False,
+        snapshot: Snapshot | None = None,
     ):
         self.backend = backend
         self.metrics_client = metrics_client
@@ -60,12 +68,21 @@ class Provider(BaseProvider):
         self.resync_interval_sec = resync_interval_sec
         self.cron_interval_sec = cron_interval_sec
         self.data_fetched_event = asyncio.Event()
+        self.snapshot = snapshot
         super().__init__()
 
     async def initialize(self) -> None:
-        """Initialize flight aware provider."""
+        """Initialize flight aware provider.
+
+        On a warm start, the flight numbers are restored from their local snapshot and the
+        cron job refreshes them in the background, since the last fetch timestamp is left at 0.
+        """
         if settings.image_gcs.gcs_enabled:
-            await self._fetch_data()
+            if self._restore_snapshot():
+                self.warm_started = True
+                self.data_fetched_event.set()
+            else:
+                await self._fetch_data()
 
             cron_job = cron.Job(
                 name="resync_flightaware",
@@ -88,6 +105,10 @@ class Provider(BaseProvider):
 
                     self.last_fetch_at = time.time()
                     logger.info("Successfully fetched and set flight numbers from backend.")
+                    if self.snapshot is not None:
+                        await self.snapshot.save(
+                            json.dumps(sorted(self.flight_numbers)).encode(), SNAPSHOT_VERSION
+                        )
 
                 case GetFlightNumbersResultCode.FAIL:
                     logger.error("Failed to fetch data from flightaware backend.")
@@ -98,6 +119,19 @@ class Provider(BaseProvider):
         finally:
             self.data_fetched_event.set()
 
+    def _restore_snapshot(self) -> bool:
+        """Restore the flight numbers from their local snapshot, returning whether they were
+        restored.
+        """
+        if self.snapshot is None or (payload := self.snapshot.load(SNAPSHOT_VERSION)) is None:
+            return False
+        try:
+            self.flight_numbers = set(json.loads(payload))
+        except (ValueError, TypeError) as err:
+            logger.warning(f"Unable to restore the flight numbers snapshot: {err}")
+            return False
+        return True
+
     def _should_fetch(self) -> bool:
         """Determine if we should fetch new data based on time elapsed."""
         return (time.time() - self.last_fetch_at) >= self.resync_interval_sec
@@ -8,55 +8,15 @@ from merino.cache.none import NoCacheAdapter
 from merino.cache.redis import RedisAdapter, create_redis_clients
 from merino.configs import settings
 from merino.exceptions import InvalidProviderError
-from merino.providers.suggest.finance.backends.polygon.backend import PolygonBackend
-from merino.utils.gcs.gcs_uploader import GcsUploader
-from merino.utils.metrics import get_metrics_client
-from merino.optimizers.models import ThompsonConfig, EngagementMetrics
-from merino.optimizers.thompson import ThompsonSampler
-from merino.providers.suggest.adm.backends.fake_backends import FakeAdmBackend
-from merino.providers.suggest.adm.backends.mars import MarsBackend
-from merino.providers.suggest.adm.backends.protocol import AdmBackend
-from merino.providers.suggest.adm.provider import Provider as AdmProvider
-from merino.providers.suggest.amo.addons_data import ADDON_KEYWORDS as ADDON_KEYWORDS
-from merino.providers.suggest.amo.backends.dynamic import DynamicAmoBackend
-from merino.providers.suggest.amo.backends.static import StaticAmoBackend
-from merino.providers.suggest.amo.provider import Provider as AmoProvider
 from merino.providers.suggest.base import BaseProvider
-from merino.providers.suggest.geolocation.provider import (
-    Provider as GeolocationProvider,
-)
-from merino.providers.suggest.top_picks.backends.top_picks import TopPicksBackend
-from merino.providers.suggest.top_picks.provider import Provider as TopPicksProvider
-from merino.providers.suggest.weather.backends.accuweather import AccuweatherBackend
-from merino.providers.suggest.weather.backends.fake_backends import FakeWeatherBackend
-from merino.providers.suggest.weather.provider import Provider as WeatherProvider
-from merino.providers.suggest.wikipedia.backends.elastic import ElasticBackend
-from merino.providers.suggest.wikipedia.backends.fake_backends import (
-    FakeWikipediaBackend,
-)
-from merino.providers.suggest.wikipedia.provider import Provider as WikipediaProvider
-from merino.providers.suggest.finance.provider import Provider as PolygonProvider
-from merino.providers.suggest.yelp.provider import Provider as YelpProvider
-from merino.providers.suggest.flightaware.provider import (
-    Provider as FlightAwareProvider,
-)
-from merino.providers.suggest.flightaware.backends.flightaware import FlightAwareBackend
-from merino.providers.suggest.sports import (
-    DEFAULT_INTENT_WORDS as SPORT_DEFAULT_INTENT_WORDS,
-    BASE_SUGGEST_SCORE as SPORT_BASE_SUGGEST_SCORE,
-)
-from merino.providers.suggest.sports.provider import SportsDataProvider
-from merino.providers.suggest.sports.backends.sportsdata.backend import (
-    SportsDataBackend,
-)
-from merino.providers.suggest.sports.backends.sportsdata.common.elastic import (
-    SportsDataStore,
-    ElasticCredentials,
-)
-from merino.providers.suggest.yelp.backends.yelp import YelpBackend
-from merino.utils.blocklists import TOP_PICKS_BLOCKLIST, WIKIPEDIA_TITLE_BLOCKLIST
+from merino.utils.hedging import Hedger
+from merino.utils.metrics import get_metrics_client
 from merino_common.utils.http_client import create_http_client
-from merino.utils.icon_processor import IconProcessor
+from merino.utils.snapshot import Snapshot
+
+# Provider modules, and the data and libraries they depend on (e.g. numpy, Elasticsearch
+# or the airline and ticker mappings), are imported in `_create_provider` so that only
+# the providers enabled in the settings are loaded.
 
 
 @unique
@@ -75,6 +35,33 @@ class ProviderType(str, Enum):
     SPORTS = "sports"
 
 
+def _create_hedger(name: str, setting: Settings) -> Hedger | None:
+    """Create a hedger for the upstream requests of a provider that opts into hedging."""
+    if not setting.get("hedge_requests", False):
+        return None
+    return Hedger(
+        name,
+        get_metrics_client(),
+        percentile=settings.hedging.percentile,
+        max_hedge_ratio=settings.hedging.max_hedge_ratio,
+        min_delay_sec=settings.hedging.min_delay_sec,
+        window_size=settings.hedging.window_size,
+        min_samples=settings.hedging.min_samples,
+    )
+
+
+def _create_snapshot(name: str, setting: Settings) -> Snapshot | None:
+    """Create a local snapshot of the data of a provider that opts into warm starts."""
+    if not setting.get("warm_start", False):
+        return None
+    return Snapshot(
+        name,
+        settings.snapshots.directory,
+        max_age_sec=settings.snapshots.max_age_sec,
+        metrics_client=get_metrics_client(),
+    )
+
+
 def _create_provider(provider_id: str, setting: Settings) -> BaseProvider:
     """Create a provider for a given type and settings.
 
@@ -83,6 +70,11 @@ def _create_provider(provider_id: str, setting: Settings) -> BaseProvider:
     """
     match setting.type:
         case ProviderType.ACCUWEATHER:
+            from merino.providers.suggest.weather.backends.accuweather import AccuweatherBackend
+            from merino.providers.suggest.weather.backends.accuweather.utils import RequestType
+            from merino.providers.suggest.weather.backends.fake_backends import FakeWeatherBackend
+            from merino.providers.suggest.weather.provider import Provider as WeatherProvider
+
             cache = (
                 RedisAdapter(
                     *create_redis_clients(
@@ -128,6 +120,12 @@ def _create_provider(provider_id: str, setting: Settings) -> BaseProvider:
                             settings.accuweather.url_location_key_placeholder
                         ),
                         url_hourly_forecasts_path=settings.accuweather.url_hourly_forecasts_path,
+                        hedgers={
+                            request_type: _create_hedger(
+                                f"accuweather.upstream.{request_type}", setting
+                            )
+                            for request_type in RequestType
+                        },
                     )
                     if setting.backend == "accuweather"
                     else FakeWeatherBackend()
@@ -140,6 +138,11 @@ def _create_provider(provider_id: str, setting: Settings) -> BaseProvider:
                 cron_interval_sec=setting.cron_interval_sec,
             )
         case ProviderType.AMO:
+            from merino.providers.suggest.amo.addons_data import ADDON_KEYWORDS
+            from merino.providers.suggest.amo.backends.dynamic import DynamicAmoBackend
+            from merino.providers.suggest.amo.backends.static import StaticAmoBackend
+            from merino.providers.suggest.amo.provider import Provider as AmoProvider
+
             return AmoProvider(
                 backend=(
                     DynamicAmoBackend(api_url=settings.amo.dynamic.api_url)
@@ -153,6 +156,14 @@ def _create_provider(provider_id: str, setting: Settings) -> BaseProvider:
                 enabled_by_default=setting.enabled_by_default,
             )
         case ProviderType.ADM:
+            from merino.optimizers.models import EngagementMetrics, ThompsonConfig
+            from merino.optimizers.thompson import ThompsonSampler
+            from merino.providers.suggest.adm.backends.fake_backends import FakeAdmBackend
+            from merino.providers.suggest.adm.backends.mars import MarsBackend
+            from merino.providers.suggest.adm.backends.protocol import AdmBackend
+            from merino.providers.suggest.adm.provider import Provider as AdmProvider
+            from merino.utils.icon_processor import IconProcessor
+
             icon_processor = IconProcessor(
                 gcs_project=settings.image_gcs.gcs_project,
                 gcs_bucket=settings.image_gcs.gcs_bucket,
@@ -170,6 +181,7 @@ def _create_provider(provider_id: str, setting: Settings) -> BaseProvider:
                     connect_timeout=settings.mars.connect_timeout_sec,
                     request_timeout=settings.mars.request_timeout_sec,
                     suggestion_url_path=settings.mars.suggestion_url_path,
+                    snapshot=_create_snapshot(f"{provider_id}_mars", setting),
                 )
             else:
                 backend = FakeAdmBackend()
@@ -201,13 +213,26 @@ def _create_provider(provider_id: str, setting: Settings) -> BaseProvider:
                 engagement_gcs_bucket=settings.engagement.gcs_storage_bucket,
                 engagement_resync_interval_sec=setting.engagement_resync_interval_sec,
                 engagement_blob_name=settings.engagement.blob_name,
+                warm_start=setting.get("warm_start", False),
+                engagement_snapshot=_create_snapshot(f"{provider_id}_engagement", setting),
             )
         case ProviderType.GEOLOCATION:
+            from merino.providers.suggest.geolocation.provider import (
+                Provider as GeolocationProvider,
+            )
+
             return GeolocationProvider(
                 name=provider_id,
                 enabled_by_default=setting.enabled_by_default,
             )
         case ProviderType.TOP_PICKS:
+            from merino.providers.suggest.top_picks.backends.top_picks import (
+                DomainDataSource,
+                TopPicksBackend,
+            )
+            from merino.providers.suggest.top_picks.provider import Provider as TopPicksProvider
+            from merino.utils.blocklists import TOP_PICKS_BLOCKLIST
+
             return TopPicksProvider(
                 backend=TopPicksBackend(
                     top_picks_file_path=setting.top_picks_file_path,
@@ -218,8 +243,20 @@ def _create_provider(provider_id: str, setting: Settings) -> BaseProvider:
                 score=setting.score,
                 name=provider_id,
                 enabled_by_default=setting.enabled_by_default,
+                snapshot=(
+                    _create_snapshot(provider_id, setting)
+                    if setting.domain_data_source == DomainDataSource.REMOTE
+                    else None
+                ),
             )
         case ProviderType.WIKIPEDIA:
+            from merino.providers.suggest.wikipedia.backends.elastic import ElasticBackend
+            from merino.providers.suggest.wikipedia.backends.fake_backends import (
+                FakeWikipediaBackend,
+            )
+            from merino.providers.suggest.wikipedia.provider import Provider as WikipediaProvider
+            from merino.utils.blocklists import WIKIPEDIA_TITLE_BLOCKLIST
+
             return WikipediaProvider(
                 backend=(
                     (
@@ -227,6 +264,7 @@ def _create_provider(provider_id: str, setting: Settings) -> BaseProvider:
                             api_key=setting.es_api_key,
                             url=setting.es_url,
                             metrics_client=get_metrics_client(),
+                            hedger=_create_hedger("wikipedia.es", setting),
                         )
                     )
                     if setting.backend == "elasticsearch"
@@ -242,6 +280,10 @@ def _create_provider(provider_id: str, setting: Settings) -> BaseProvider:
                 cron_interval_sec=setting.cron_interval_sec,
             )
         case ProviderType.POLYGON:
+            from merino.providers.suggest.finance.backends.polygon.backend import PolygonBackend
+            from merino.providers.suggest.finance.provider import Provider as PolygonProvider
+            from merino.utils.gcs.gcs_uploader import GcsUploader
+
             cache = (
                 RedisAdapter(
                     *create_redis_clients(
@@ -284,8 +326,12 @@ def _create_provider(provider_id: str, setting: Settings) -> BaseProvider:
                 enabled_by_default=setting.enabled_by_default,
                 resync_interval_sec=setting.resync_interval_sec,
                 cron_interval_sec=setting.cron_interval_sec,
+                snapshot=_create_snapshot(provider_id, setting),
             )
         case ProviderType.YELP:
+            from merino.providers.suggest.yelp.backends.yelp import YelpBackend
+            from merino.providers.suggest.yelp.provider import Provider as YelpProvider
+
             cache = (
                 RedisAdapter(
                     *create_redis_clients(
@@ -319,6 +365,13 @@ def _create_provider(provider_id: str, setting: Settings) -> BaseProvider:
                 enabled_by_default=setting.enabled_by_default,
             )
         case ProviderType.FLIGHTAWARE:
+            from merino.providers.suggest.flightaware.backends.flightaware import (
+                FlightAwareBackend,
+            )
+            from merino.providers.suggest.flightaware.provider import (
+                Provider as FlightAwareProvider,
+            )
+
             cache = (
                 RedisAdapter(
                     *create_redis_clients(
@@ -347,8 +400,22 @@ def _create_provider(provider_id: str, setting: Settings) -> BaseProvider:
                 enabled_by_default=setting.enabled_by_default,
                 resync_interval_sec=setting.resync_interval_sec,
                 cron_interval_sec=setting.cron_interval_sec,
+                snapshot=_create_snapshot(provider_id, setting),
             )
         case ProviderType.SPORTS:
+            from merino.providers.suggest.sports import (
+                BASE_SUGGEST_SCORE as SPORT_BASE_SUGGEST_SCORE,
+                DEFAULT_INTENT_WORDS as SPORT_DEFAULT_INTENT_WORDS,
+            )
+            from merino.providers.suggest.sports.backends.sportsdata.backend import (
+                SportsDataBackend,
+            )
+            from merino.providers.suggest.sports.backends.sportsdata.common.elastic import (
+                ElasticCredentials,
+                SportsDataStore,
+            )
+            from merino.providers.suggest.sports.provider import SportsDataProvider
+
             intent_words = [
                 word.lower().strip()
                 for word in setting.get("intent_words", SPORT_DEFAULT_INTENT_WORDS)
@@ -367,6 +434,7 @@ def _create_provider(provider_id: str, setting: Settings) -> BaseProvider:
                 languages=[lang for lang in setting.get("languages", ["en"])],
                 index_map={"event": event_map},
                 metrics_client=get_metrics_client(),
+                hedger=_create_hedger("sports.es", setting),
             )
             return SportsDataProvider(
                 backend=SportsDataBackend(
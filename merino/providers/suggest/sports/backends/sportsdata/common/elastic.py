@@ -8,6 +8,7 @@ import logging
 from abc import abstractmethod, ABC
 from aiodogstatsd import Client as StatsDClient
 from datetime import datetime, timezone
+from functools import partial
 from time import monotonic
 from typing import Any, Final
 
@@ -34,6 +35,7 @@ from merino.providers.suggest.sports.backends.sportsdata.common.data import (
 from merino.providers.suggest.sports.backends.sportsdata.common.error import (
     SportsDataError,
 )
+from merino.utils.hedging import Hedger
 from merino.utils.metrics import ES_SEARCH_METRIC_NAME
 
 
@@ -381,9 +383,12 @@ class SportsDataStore(ElasticDataStore):
         index_map: dict[str, str],
         meta_map: str = META_INDEX,
         metrics_client: StatsDClient,
+        hedger: Hedger | None = None,
         **kwargs,
     ) -> None:
-        """Initialize a connection to ElasticSearch"""
+        """Initialize a connection to ElasticSearch. Event searches are hedged if a
+        `hedger` is given.
+        """
         super().__init__(credentials=credentials)
         self.languages = languages
         self.platform = platform
@@ -392,6 +397,7 @@ class SportsDataStore(ElasticDataStore):
         self.meta_map = meta_map
         self.index_settings = {lang: EN_INDEX_SETTINGS for lang in languages}
         self._metrics_client = metrics_client
+        self._hedger = hedger
         logging.getLogger(__name__).info(
             f"{LOGGING_TAG} Initialized Elastic search at {credentials.dsn}"
         )
@@ -716,15 +722,15 @@ class SportsDataStore(ElasticDataStore):
             # Do not retry due to strict latency requirements, and to avoid overloading
             # cluster (searched via suggest on every keystroke when query contains
             # matching intent word)
-            res = await self.client.options(
-                request_timeout=REQUEST_TIMEOUT_SEC, max_retries=0
-            ).search(
+            search = partial(
+                self.client.options(request_timeout=REQUEST_TIMEOUT_SEC, max_retries=0).search,
                 index=index_id,
                 query=query,
                 sort=[{"date": "desc"}, {"updated": "desc"}],
                 # The list of fields to return from Elasticsearch
                 source_includes=["event", "touched"],
             )
+            res = await (self._hedger.run(search) if self._hedger else search())
         except ApiError as e:
             self._metrics_client.increment(
                 f"{ES_SEARCH_METRIC_NAME}.error", tags={"index": index_id, "status": e.meta.status}
@@ -8,7 +8,7 @@ import asyncio
 import logging
 import time
 from collections import defaultdict
-from typing import Any
+from typing import Any, Final
 
 from merino_common.utils import cron
 from merino.configs import settings
@@ -24,9 +24,13 @@ from merino.providers.suggest.top_picks.backends.protocol import (
     TopPicksData,
 )
 from merino.providers.suggest.top_picks.backends.top_picks import DomainDataSource
+from merino.utils.snapshot import Snapshot
 
 logger = logging.getLogger(__name__)
 
+# The version of the top picks data snapshot payload.
+SNAPSHOT_VERSION: Final = 1
+
 
 class Suggestion(BaseSuggestion):
     """Model for Top Pick Suggestion."""
@@ -43,6 +47,7 @@ class Provider(BaseProvider):
     resync_interval_sec: int
     cron_interval_sec: int
     last_fetch_at: float
+    snapshot: Snapshot | None
 
     def __init__(
         self,
@@ -52,9 +57,11 @@ class Provider(BaseProvider):
         enabled_by_default: bool = False,
         resync_interval_sec=settings.providers.top_picks.resync_interval_sec,
         cron_interval_sec=settings.providers.top_picks.cron_interval_sec,
+        snapshot: Snapshot | None = None,
         **kwargs: Any,
     ) -> None:
         self.backend = backend
+        self.snapshot = snapshot
         self.score = score
         self._name = name
         self._enabled_by_default = enabled_by_default
@@ -74,25 +81,33 @@ class Provider(BaseProvider):
         super().__init__(**kwargs)
 
     async def initialize(self) -> None:
-        """Initialize the provider."""
-        try:
-            # Fetch Top Picks suggestions from domain list.
-            result_code, result = await self.backend.fetch()
+        """Initialize the provider.
 
-            match GetFileResultCode(result_code):
-                case GetFileResultCode.SUCCESS:
-                    self.top_picks_data: TopPicksData = result  # type: ignore
-                    self.last_fetch_at = time.time()
-                case GetFileResultCode.SKIP:
-                    return None
-                case GetFileResultCode.FAIL:
-                    logger.error("Failed to fetch data from Top Picks Backend.")
-                    return None
-        except BackendError as backend_error:
-            logger.error(
-                "Failed to fetch data from Top Picks Backend.",
-                extra={"error message": f"{backend_error}"},
-            )
+        On a warm start, the top picks data is restored from its local snapshot and the
+        cron job refreshes it in the background, since the last fetch timestamp is left at 0.
+        """
+        if self._restore_snapshot():
+            self.warm_started = True
+        else:
+            try:
+                # Fetch Top Picks suggestions from domain list.
+                result_code, result = await self.backend.fetch()
+
+                match GetFileResultCode(result_code):
+                    case GetFileResultCode.SUCCESS:
+                        self.top_picks_data: TopPicksData = result  # type: ignore
+                        self.last_fetch_at = time.time()
+                        await self._save_snapshot()
+                    case GetFileResultCode.SKIP:
+                        return None
+                    case GetFileResultCode.FAIL:
+                        logger.error("Failed to fetch data from Top Picks Backend.")
+                        return None
+            except BackendError as backend_error:
+                logger.error(
+                    "Failed to fetch data from Top Picks Backend.",
+                    extra={"error message": f"{backend_error}"},
+                )
 
         # Run a cron job that will periodically check whether to update domain file.
         # Only runs when domain source set to `remote`.
@@ -119,6 +134,7 @@ class Provider(BaseProvider):
                 case GetFileResultCode.SUCCESS:
                     self.top_picks_data: TopPicksData = result  # type: ignore
                     self.last_fetch_at = time.time()
+                    await self._save_snapshot()
                 case GetFileResultCode.SKIP:
                     return None
                 case GetFileResultCode.FAIL:
@@ -130,6 +146,29 @@ class Provider(BaseProvider):
                 extra={"error message": f"{backend_error}"},
             )
 
+    def _restore_snapshot(self) -> bool:
+        """Restore the top picks data from its local snapshot, returning whether it was
+        restored.
+        """
+        if self.snapshot is None or (payload := self.snapshot.load(SNAPSHOT_VERSION)) is None:
+            return False
+        try:
+            self.top_picks_data = TopPicksData.model_validate_json(payload)
+        except ValueError as error:
+            logger.warning(
+                "Unable to restore the Top Picks snapshot",
+                extra={"error message": f"{error}"},
+            )
+            return False
+        return True
+
+    async def _save_snapshot(self) -> None:
+        """Save the top picks data to its local snapshot, if warm starts are enabled."""
+        if self.snapshot is not None:
+            await self.snapshot.save(
+                self.top_picks_data.model_dump_json().encode(), SNAPSHOT_VERSION
+            )
+
     def hidden(self) -> bool:  # noqa: D102
         return False
 
@@ -7,7 +7,7 @@ import hashlib
 import orjson
 import logging
 from enum import Enum
-from typing import Any, Callable, NamedTuple, cast
+from typing import Any, Callable, Mapping, NamedTuple, cast
 
 import aiodogstatsd
 from dateutil import parser
@@ -51,6 +51,7 @@ from merino.providers.suggest.weather.backends.accuweather.errors import (
     AccuweatherErrorMessages,
     MissingLocationKeyError,
 )
+from merino.utils.hedging import Hedger
 
 logger = logging.getLogger(__name__)
 
@@ -254,8 +255,11 @@ class AccuweatherBackend:
         url_location_completion_path: str,
         url_location_key_placeholder: str,
         metrics_sample_rate: float,
+        hedgers: Mapping[RequestType, Hedger | None] | None = None,
     ) -> None:
-        """Initialize the AccuWeather backend.
+        """Initialize the AccuWeather backend. Upstream requests are hedged by the hedger
+        of their request type in `hedgers`, if any. The endpoints' latencies differ, so each
+        request type needs its own hedger.
 
         Raises:
             ValueError: If API key or URL parameters are None or empty.
@@ -303,6 +307,7 @@ class AccuweatherBackend:
         self.url_location_completion_path = url_location_completion_path
         self.url_location_key_placeholder = url_location_key_placeholder
         self.metrics_sample_rate = metrics_sample_rate
+        self.hedgers = hedgers or {}
 
     def cache_key_for_accuweather_request(
         self, url: str, query_params: dict[str, str] = {}
@@ -378,7 +383,10 @@ class AccuweatherBackend:
         with self.metrics_client.timeit(
             f"accuweather.request.{request_type}.get", sample_rate=self.metrics_sample_rate
         ):
-            response: Response = await self.http_client.get(url_path, params=params)
+            # Only the request itself is hedged, the response is processed and cached once.
+            get = functools.partial(self.http_client.get, url_path, params=params)
+            hedger = self.hedgers.get(request_type)
+            response: Response = await (hedger.run(get) if hedger else get())
             response.raise_for_status()
 
         if (response_dict := process_api_response(response.json())) is None:
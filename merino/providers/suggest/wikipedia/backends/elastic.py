@@ -2,6 +2,7 @@
 
 import logging
 import string
+from functools import partial
 from typing import Any, Final
 from urllib.parse import quote
 from aiodogstatsd import Client as StatsDClient
@@ -10,6 +11,7 @@ from elasticsearch import ApiError
 from merino.configs import settings
 from merino.exceptions import BackendError
 from merino.search.async_elastic import AsyncElasticSearchAdapter
+from merino.utils.hedging import Hedger
 from merino.utils.metrics import ES_SEARCH_METRIC_NAME
 
 
@@ -55,17 +57,25 @@ class ElasticBackend:
 
     elasticsearch: AsyncElasticSearchAdapter
 
-    def __init__(self, *, api_key: str, url: str, metrics_client: StatsDClient) -> None:
+    def __init__(
+        self,
+        *,
+        api_key: str,
+        url: str,
+        metrics_client: StatsDClient,
+        hedger: Hedger | None = None,
+    ) -> None:
         """Initialize the ElasticBackend.
         Raises a ValueError if URL is incorrectly formatted.
 
         The client is configured to not retry failures. This is due in part to
         Merino's low latency requirements, and also to avoid undue load
         (e.g. retrying on 429), since searching via suggest is performed
-        on each keystroke.
+        on each keystroke. Slow searches can instead be hedged by passing a `hedger`.
         """
         self.elasticsearch = AsyncElasticSearchAdapter(url=url, api_key=api_key, max_retries=0)
         self._metrics_client = metrics_client
+        self._hedger = hedger
         logging.info("Initialized Elasticsearch with URL")
 
     async def shutdown(self) -> None:
@@ -88,12 +98,14 @@ class ElasticBackend:
 
         self._metrics_client.increment(f"{ES_SEARCH_METRIC_NAME}.count", tags={"index": index_id})
         try:
-            res = await self.elasticsearch.search(
+            search = partial(
+                self.elasticsearch.search,
                 index=index_id,
                 suggest=suggest,
                 timeout=REQUEST_TIMEOUT_SEC,
                 source_includes=["title"],
             )
+            res = await (self._hedger.run(search) if self._hedger else search())
         except ApiError as e:
             self._metrics_client.increment(
                 f"{ES_SEARCH_METRIC_NAME}.error", tags={"index": index_id, "status": e.meta.status}
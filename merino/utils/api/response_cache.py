@@ -0,0 +1,160 @@
+"""An in-process cache of whole `/api/v1/suggest` responses.
+
+A small number of short prefixes ("w", "we", "f", ...) make up a large share of suggest
+traffic, and for most providers the response depends only on the query and the
+request's segment: providers, country, region, form factor, languages and client
+variants. The cache keys responses on that tuple and stores the serialized suggestions
+along with the `Cache-Control` TTL, so a hit skips the provider fan-out and the
+serialization of the suggestions altogether. A hit's `max-age` is what is left of the
+entry's lifetime, so clients never keep a response longer than the cache would.
+
+Providers whose suggestions are personalized or time-sensitive (e.g. weather, flights,
+finance) are never cached: a request that searches any of them bypasses the cache.
+"""
+
+import json
+import math
+import time
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import dataclass, replace
+from typing import Any
+
+from merino.providers.suggest.base import BaseProvider, BaseSuggestion
+
+# A normalized (query, providers, country, regions, form factor, languages,
+# client variants, source, request type) tuple.
+ResponseCacheKey = tuple[Any, ...]
+
+
+def dump_json(content: Any) -> bytes:
+    """Serialize JSON content exactly like `JSONResponse` does."""
+    return json.dumps(
+        content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")
+    ).encode("utf-8")
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """A cached suggest response.
+
+    Attributes:
+        suggestions: The suggestions, for the per-request suggestion metrics.
+        suggestions_json: The serialized suggestions, as they appear in the body.
+        cache_control: The `Cache-Control` header value of the response. On entries
+            returned by `SuggestResponseCache.get()`, `max-age` is the entry's remaining
+            lifetime.
+        cache_control_ttl: The `Cache-Control` TTL of the original response.
+        compute_ms: How long building the response took, i.e. what a hit saves.
+        expires_at: The monotonic time after which the entry is stale.
+    """
+
+    suggestions: list[BaseSuggestion]
+    suggestions_json: bytes
+    cache_control: str
+    cache_control_ttl: int
+    compute_ms: float
+    expires_at: float
+
+    def render(self, request_id: str | None, client_variants: list[str]) -> bytes:
+        """Return the response body for a request, with its own request ID and variants.
+
+        The layout matches `SuggestResponse` serialized with `exclude_none=True`.
+        """
+        parts = [b'{"suggestions":', self.suggestions_json]
+        if request_id is not None:
+            parts += [b',"request_id":', dump_json(request_id)]
+        parts += [b',"client_variants":', dump_json(client_variants), b',"server_variants":[]}']
+        return b"".join(parts)
+
+
+class SuggestResponseCache:
+    """A bounded LRU cache of suggest responses with a per-entry TTL.
+
+    Args:
+        max_entries: The max number of responses to keep.
+        ttl_sec: The max number of seconds to serve a response for. Entries never
+            outlive the `max-age` of their own `Cache-Control` header either.
+        bypass_providers: Names of the providers whose requests are never cached.
+    """
+
+    def __init__(self, max_entries: int, ttl_sec: int, bypass_providers: Iterable[str]) -> None:
+        self.max_entries = max_entries
+        self.ttl_sec = ttl_sec
+        self.bypass_providers = frozenset(bypass_providers)
+        self._entries: OrderedDict[ResponseCacheKey, CachedResponse] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def key(
+        self,
+        query: str,
+        providers: list[BaseProvider],
+        country: str | None,
+        regions: list[str] | None,
+        form_factor: str | None,
+        languages: list[str],
+        client_variants: list[str],
+        source: str,
+        request_type: str | None,
+    ) -> ResponseCacheKey | None:
+        """Return the cache key of a request, or None if the request bypasses the cache."""
+        names = [provider.name for provider in providers]
+        if not names or not self.bypass_providers.isdisjoint(names):
+            return None
+        return (
+            query,
+            tuple(sorted(names)),
+            country,
+            tuple(regions or ()),
+            form_factor,
+            tuple(languages),
+            tuple(client_variants),
+            source,
+            request_type,
+        )
+
+    def get(self, key: ResponseCacheKey) -> CachedResponse | None:
+        """Return the fresh response cached for the key, marking it as recently used.
+
+        The returned `Cache-Control` header's `max-age` is the smaller of the original
+        TTL and the entry's remaining lifetime, rounded up to the second.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        remaining_sec = entry.expires_at - time.monotonic()
+        if remaining_sec <= 0:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        max_age = min(entry.cache_control_ttl, math.ceil(remaining_sec))
+        return replace(entry, cache_control=f"private, max-age={max_age}")
+
+    def put(
+        self,
+        key: ResponseCacheKey,
+        suggestions: list[BaseSuggestion],
+        suggestions_json: bytes,
+        cache_control_ttl: int,
+        compute_ms: float,
+    ) -> None:
+        """Cache a response, evicting the least recently used ones beyond `max_entries`.
+
+        Responses with a `Cache-Control` TTL of 0 are not cached.
+        """
+        ttl = min(self.ttl_sec, cache_control_ttl)
+        if ttl <= 0 or self.max_entries <= 0:
+            return
+        self._entries[key] = CachedResponse(
+            suggestions=suggestions,
+            suggestions_json=suggestions_json,
+            cache_control=f"private, max-age={cache_control_ttl}",
+            cache_control_ttl=cache_control_ttl,
+            compute_ms=compute_ms,
+            expires_at=time.monotonic() + ttl,
+        )
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
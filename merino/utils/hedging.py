@@ -0,0 +1,130 @@
+"""Hedged requests for read-only upstream backends.
+
+Backends like Elasticsearch or AccuWeather serve a suggest query with a single upstream
+request, so one slow replica or connection holds up the whole suggest response until
+the provider times out. A hedged request fires a second, identical request when the
+first one is slower than most (i.e. slower than a percentile of the recent latencies),
+takes whichever finishes first, and cancels the other.
+
+Hedging duplicates upstream load, so it is capped: each request earns
+`max_hedge_ratio` of a hedge, and a hedge is only fired when a whole one has been
+earned. Only hedge requests that are safe to send twice, i.e. reads.
+"""
+
+import asyncio
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from typing import Final, TypeVar
+
+import aiodogstatsd
+
+T = TypeVar("T")
+
+# The max number of hedges that can be saved up and fired in a burst.
+MAX_HEDGE_BURST: Final[float] = 10.0
+
+# The number of latency samples between two recomputations of the hedge delay.
+RECOMPUTE_INTERVAL: Final[int] = 64
+
+
+class Hedger:
+    """Hedge requests to an upstream backend once they are slower than a percentile.
+
+    Args:
+        name: The metric prefix, e.g. `wikipedia.es`. Hedges are counted on
+            `{name}.hedge.fired`, and those that finished first on `{name}.hedge.won`.
+        metrics_client: The StatsD client.
+        percentile: The percentile of the recent latencies to hedge after.
+        max_hedge_ratio: The max fraction of the requests that are hedged.
+        min_delay_sec: The least number of seconds to wait before hedging.
+        window_size: The number of recent latencies the percentile is computed over.
+        min_samples: The number of latencies to collect before hedging at all.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        metrics_client: aiodogstatsd.Client,
+        *,
+        percentile: float = 95.0,
+        max_hedge_ratio: float = 0.05,
+        min_delay_sec: float = 0.0,
+        window_size: int = 1000,
+        min_samples: int = 100,
+    ) -> None:
+        if not 0 < percentile < 100:
+            raise ValueError(f"Expected a percentile between 0 and 100, got {percentile}")
+        if min_samples > window_size:
+            raise ValueError("`min_samples` must not be greater than `window_size`")
+        self.name = name
+        self.metrics_client = metrics_client
+        self.percentile = percentile
+        self.max_hedge_ratio = max_hedge_ratio
+        self.min_delay_sec = min_delay_sec
+        self.min_samples = min_samples
+        self._latencies: deque[float] = deque(maxlen=window_size)
+        self._since_recompute = 0
+        self._delay_sec: float | None = None
+        self._budget = 0.0
+
+    @property
+    def delay_sec(self) -> float | None:
+        """The number of seconds to wait before hedging, or None before `min_samples`."""
+        return self._delay_sec
+
+    async def run(self, request: Callable[[], Awaitable[T]]) -> T:
+        """Run a request, hedging it with a second one if it is slow.
+
+        `request` is called once per attempt and must be safe to call twice. The result
+        of the first attempt to succeed is returned. If every attempt fails, the error of
+        the first attempt is raised.
+        """
+        self._budget = min(self._budget + self.max_hedge_ratio, MAX_HEDGE_BURST)
+        started_at = time.perf_counter()
+        delay_sec = self._delay_sec
+        if delay_sec is None or self._budget < 1:
+            result = await request()
+            self._observe(time.perf_counter() - started_at)
+            return result
+
+        primary = asyncio.ensure_future(request())
+        attempts = {primary}
+        try:
+            done, pending = await asyncio.wait(attempts, timeout=delay_sec)
+            if not done:
+                self._budget -= 1
+                attempts.add(asyncio.ensure_future(request()))
+                self.metrics_client.increment(f"{self.name}.hedge.fired")
+                pending = set(attempts)
+            while True:
+                # Check every finished attempt, so that no exception goes unretrieved.
+                succeeded = [attempt for attempt in done if attempt.exception() is None]
+                winner = primary if primary in succeeded else next(iter(succeeded), None)
+                if winner is not None or not pending:
+                    break
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for attempt in attempts:
+                attempt.cancel()
+
+        if winner is None:
+            return primary.result()
+        # If the hedge won, the primary's latency is at least the time it has run for.
+        self._observe(time.perf_counter() - started_at)
+        if winner is not primary:
+            self.metrics_client.increment(f"{self.name}.hedge.won")
+        return winner.result()
+
+    def _observe(self, latency_sec: float) -> None:
+        """Record the latency of a successful request and refresh the hedge delay."""
+        self._latencies.append(latency_sec)
+        self._since_recompute += 1
+        if len(self._latencies) < self.min_samples:
+            return
+        if self._delay_sec is not None and self._since_recompute < RECOMPUTE_INTERVAL:
+            return
+        self._since_recompute = 0
+        latencies = sorted(self._latencies)
+        index = min(int(len(latencies) * self.percentile / 100), len(latencies) - 1)
+        self._delay_sec = max(latencies[index], self.min_delay_sec)
@@ -0,0 +1,163 @@
+"""Event loop health monitoring.
+
+Merino serves every request from a single event loop, so any synchronous work on it
+(e.g. a CPU heavy index rebuild, or a blocking upload in a callback) stalls every
+in-flight request. The loop monitor makes those stalls visible:
+
+  - Lag: a background task sleeps for `interval_sec` at a time, and records how much
+    later than scheduled it woke up on `event_loop.lag_ms`. An idle, healthy loop has
+    a lag close to 0.
+  - Stalls (optional): a watchdog thread notices when the monitor's wakeup is overdue by
+    more than `slow_callback_threshold_sec`, i.e. something has held the loop for that
+    long, and samples the loop thread's stack. The code holding the loop is counted on
+    `event_loop.stall`, tagged with its `source`: the cron job or the coroutine running
+    (or otherwise the innermost Merino function), and its stack is logged.
+
+The watchdog samples the stack with `sys._current_frames()`, which works with any loop
+implementation, uvloop included. It needs the GIL to do so, so a stall in C code holding
+the GIL is attributed to the Python code that called it, once it returns.
+"""
+
+import asyncio
+import inspect
+import logging
+import sys
+import threading
+import time
+import traceback
+from dataclasses import dataclass
+from types import FrameType
+
+import aiodogstatsd
+
+from merino_common.utils import cron
+
+logger = logging.getLogger(__name__)
+
+# The max number of stack frames logged for a stall.
+STACK_LIMIT = 20
+
+
+@dataclass(frozen=True)
+class Stall:
+    """The code found holding the event loop by the watchdog.
+
+    Attributes:
+        source: The cron job, coroutine or function holding the loop.
+        stack: The innermost frames of the loop thread's stack, formatted.
+    """
+
+    source: str
+    stack: str
+
+
+def describe_stack(frame: FrameType) -> Stall:
+    """Describe what the given (innermost) frame of the loop thread is running.
+
+    The source is the cron job or coroutine whose task is running, i.e. the outermost
+    coroutine frame, or else the innermost frame in Merino code.
+    """
+    source: str | None = None
+    innermost_merino: str | None = None
+    current: FrameType | None = frame
+    while current is not None:
+        code = current.f_code
+        name = f"{current.f_globals.get('__name__', '')}.{code.co_qualname}"
+        if innermost_merino is None and name.startswith("merino"):
+            innermost_merino = name
+        if code.co_flags & inspect.CO_COROUTINE:
+            job = current.f_locals.get("self")
+            source = f"cron.{job.name}" if isinstance(job, cron.Job) else name
+        current = current.f_back
+    summary = traceback.StackSummary.extract(
+        traceback.walk_stack(frame), limit=STACK_LIMIT, lookup_lines=False
+    )
+    return Stall(
+        source=source or innermost_merino or "unknown",
+        stack="".join(summary.format()),
+    )
+
+
+class LoopMonitor:
+    """Measure the event loop lag and, optionally, attribute stalls to the code causing them.
+
+    Args:
+        metrics_client: The StatsD client.
+        interval_sec: The interval in seconds between two lag measurements.
+        slow_callback_threshold_sec: The number of seconds the loop has to be held for
+            to be sampled as a stall. None disables stall detection.
+    """
+
+    def __init__(
+        self,
+        metrics_client: aiodogstatsd.Client,
+        interval_sec: float,
+        slow_callback_threshold_sec: float | None = None,
+    ) -> None:
+        self.metrics_client = metrics_client
+        self.interval_sec = interval_sec
+        self.slow_callback_threshold_sec = slow_callback_threshold_sec
+        self._task: asyncio.Task | None = None
+        self._watchdog: threading.Thread | None = None
+        self._stopping = threading.Event()
+        # Monotonic time the monitor is next due to wake up at, for the watchdog.
+        self._due_at = float("inf")
+        self._stall: Stall | None = None
+
+    def start(self) -> None:
+        """Start monitoring the running event loop. No-op if already started."""
+        if self._task is not None:
+            return
+        self._stopping.clear()
+        self._task = asyncio.create_task(self._monitor(), name="event_loop_monitor")
+        if self.slow_callback_threshold_sec is not None:
+            self._watchdog = threading.Thread(
+                target=self._watch,
+                args=(threading.get_ident(),),
+                name="event_loop_watchdog",
+                daemon=True,
+            )
+            self._watchdog.start()
+
+    def shutdown(self) -> None:
+        """Stop monitoring."""
+        self._stopping.set()
+        if self._task is not None:
+            _ = self._task.cancel()
+            self._task = None
+        self._watchdog = None
+
+    async def _monitor(self) -> None:
+        """Record the lag of each wakeup, and the stall that delayed it, if any."""
+        loop = asyncio.get_running_loop()
+        while True:
+            scheduled_at = loop.time() + self.interval_sec
+            self._due_at = time.monotonic() + self.interval_sec
+            await asyncio.sleep(self.interval_sec)
+            lag_sec = max(loop.time() - scheduled_at, 0.0)
+            self._due_at = float("inf")
+            self.metrics_client.histogram("event_loop.lag_ms", value=lag_sec * 1000)
+            if (stall := self._stall) is not None:
+                self._stall = None
+                self.metrics_client.increment("event_loop.stall", tags={"source": stall.source})
+                logger.warning(
+                    f"Event loop held for {lag_sec * 1000:.0f}ms by {stall.source}",
+                    extra={"source": stall.source, "lag_ms": lag_sec * 1000, "stack": stall.stack},
+                )
+
+    def _watch(self, loop_thread_id: int) -> None:
+        """Sample the loop thread's stack once per overdue wakeup. Runs on its own thread."""
+        threshold_sec = self.slow_callback_threshold_sec or 0.0
+        sampled_due_at = None
+        while not self._stopping.wait(threshold_sec / 2):
+            due_at = self._due_at
+            if due_at == sampled_due_at or time.monotonic() - due_at < threshold_sec:
+                continue
+            if (frame := sys._current_frames().get(loop_thread_id)) is None:
+                continue
+            stall = describe_stack(frame)
+            del frame
+            # Drop the sample if the loop has resumed meanwhile, it shows the monitor.
+            if self._due_at == due_at:
+                self._stall = stall
+            sampled_due_at = due_at
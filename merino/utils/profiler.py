@@ -0,0 +1,208 @@
+"""A low overhead statistical CPU profiler for live Merino processes.
+
+The profiler arms a `SIGPROF` interval timer, which the kernel fires every `interval_sec`
+of CPU time the process spends, i.e. not while it is idle. On each signal it records the
+stack of every thread. The event loop thread's stack is prefixed with the name of the
+asyncio task it is running, if any, so the suggest hot path can be told apart from cron
+jobs. Samples are counted per distinct stack, and exported either as collapsed stacks
+(for `flamegraph.pl` and the like) or as a speedscope profile.
+
+Python only runs signal handlers on the main thread, which is also the thread Merino's
+event loop runs on, so a profile can only be started from there. Only one profile can run
+at a time per process.
+"""
+
+import asyncio
+import signal
+import sys
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass
+from types import FrameType
+from typing import Any, Final
+
+# A frame is identified by its function's (qualified name, file name, first line number).
+FrameKey = tuple[str, str, int]
+
+# The number of frames sampled per thread, innermost first. Deeper frames are dropped.
+MAX_STACK_DEPTH: Final[int] = 128
+
+
+class ProfilerError(Exception):
+    """Error raised when a profile cannot be started."""
+
+
+class ProfilerBusyError(ProfilerError):
+    """Error raised when a profile is already running."""
+
+
+@dataclass(frozen=True)
+class Profile:
+    """The result of a profiling session.
+
+    Attributes:
+        stacks: The number of samples of each stack, by root-first stack. The root is
+            the name of the thread, then of the asyncio task for the event loop thread.
+        duration_sec: The wall clock duration of the session.
+        overhead_sec: The time spent in the sampler itself.
+    """
+
+    stacks: Counter[tuple[FrameKey, ...]]
+    duration_sec: float
+    overhead_sec: float
+
+    @property
+    def sample_count(self) -> int:
+        """The number of samples, over all threads."""
+        return sum(self.stacks.values())
+
+    @property
+    def overhead_ratio(self) -> float:
+        """The fraction of the wall clock time spent sampling."""
+        return self.overhead_sec / self.duration_sec if self.duration_sec > 0 else 0.0
+
+    def to_collapsed(self) -> str:
+        """Export the profile as collapsed stacks: `root;caller;callee count` lines."""
+        return "".join(
+            f"{';'.join(_frame_label(key) for key in stack)} {count}\n"
+            for stack, count in sorted(self.stacks.items())
+        )
+
+    def to_speedscope(self) -> dict[str, Any]:
+        """Export the profile in the speedscope file format, with a profile per thread."""
+        frames: dict[FrameKey, int] = {}
+        profiles: dict[FrameKey, dict[str, Any]] = {}
+        for stack, count in sorted(self.stacks.items()):
+            thread, *rest = stack
+            profile = profiles.setdefault(
+                thread,
+                {
+                    "type": "sampled",
+                    "name": thread[0],
+                    "unit": "none",
+                    "startValue": 0,
+                    "endValue": 0,
+                    "samples": [],
+                    "weights": [],
+                },
+            )
+            profile["samples"].append([frames.setdefault(key, len(frames)) for key in rest])
+            profile["weights"].append(count)
+            profile["endValue"] += count
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "shared": {
+                "frames": [
+                    {"name": name, "file": file, "line": line} if file else {"name": name}
+                    for name, file, line in frames
+                ]
+            },
+            "profiles": list(profiles.values()),
+            "name": "merino",
+            "exporter": "merino",
+        }
+
+
+def _frame_label(key: FrameKey) -> str:
+    """Return the collapsed stack label of a frame."""
+    name, file, line = key
+    return f"{name} ({file}:{line})" if file else name
+
+
+def _stack(frame: FrameType | None) -> list[FrameKey]:
+    """Return the stack of a frame, innermost first."""
+    stack: list[FrameKey] = []
+    while frame is not None and len(stack) < MAX_STACK_DEPTH:
+        code = frame.f_code
+        stack.append((code.co_qualname, code.co_filename, code.co_firstlineno))
+        frame = frame.f_back
+    return stack
+
+
+class SamplingProfiler:
+    """Sample the stacks of all threads on `SIGPROF`, see the module docstring."""
+
+    def __init__(self) -> None:
+        self._running = False
+        self._samples: Counter[tuple[int, str | None, tuple[FrameKey, ...]]] = Counter()
+        self._overhead_sec = 0.0
+
+    @property
+    def running(self) -> bool:
+        """Whether a profile is running."""
+        return self._running
+
+    async def profile(self, duration_sec: float, interval_sec: float) -> Profile:
+        """Profile the process for `duration_sec`, sampling every `interval_sec` of CPU time.
+
+        Raises:
+            ProfilerBusyError: If a profile is already running.
+            ProfilerError: If not called from the main thread.
+        """
+        self._start(interval_sec)
+        started_at = time.perf_counter()
+        try:
+            await asyncio.sleep(duration_sec)
+        finally:
+            duration = time.perf_counter() - started_at
+            samples, overhead_sec = self._stop()
+        return Profile(
+            stacks=self._resolve(samples),
+            duration_sec=duration,
+            overhead_sec=overhead_sec,
+        )
+
+    def _start(self, interval_sec: float) -> None:
+        """Install the signal handler and arm the timer."""
+        if self._running:
+            raise ProfilerBusyError("A profile is already running")
+        if threading.current_thread() is not threading.main_thread():
+            raise ProfilerError("Profiles can only be started from the main thread")
+        self._running = True
+        self._samples = Counter()
+        self._overhead_sec = 0.0
+        self._previous_handler = signal.signal(signal.SIGPROF, self._sample)
+        signal.setitimer(signal.ITIMER_PROF, interval_sec, interval_sec)
+
+    def _stop(self) -> tuple[Counter[tuple[int, str | None, tuple[FrameKey, ...]]], float]:
+        """Disarm the timer, restore the signal handler and return the samples."""
+        signal.setitimer(signal.ITIMER_PROF, 0, 0)
+        signal.signal(signal.SIGPROF, self._previous_handler)
+        self._running = False
+        return self._samples, self._overhead_sec
+
+    def _sample(self, signum: int, frame: FrameType | None) -> None:
+        """Record the stack of every thread. Runs on the main thread, between bytecodes."""
+        started_at = time.perf_counter()
+        main_thread_id = threading.main_thread().ident
+        try:
+            task = asyncio.current_task()
+        except RuntimeError:
+            task = None
+        task_name = task.get_name() if task is not None else None
+        for thread_id, thread_frame in sys._current_frames().items():
+            if thread_id == main_thread_id:
+                # The main thread's current frame is this handler, start from its caller.
+                self._samples[(thread_id, task_name, tuple(_stack(frame)))] += 1
+            else:
+                self._samples[(thread_id, None, tuple(_stack(thread_frame)))] += 1
+        self._overhead_sec += time.perf_counter() - started_at
+
+    @staticmethod
+    def _resolve(
+        samples: Counter[tuple[int, str | None, tuple[FrameKey, ...]]],
+    ) -> Counter[tuple[FrameKey, ...]]:
+        """Turn raw samples into root-first stacks rooted at their thread (and task)."""
+        thread_names = {thread.ident: thread.name for thread in threading.enumerate()}
+        stacks: Counter[tuple[FrameKey, ...]] = Counter()
+        for (thread_id, task_name, stack), count in samples.items():
+            root: list[FrameKey] = [(thread_names.get(thread_id, f"thread-{thread_id}"), "", 0)]
+            if task_name is not None:
+                root.append((f"task:{task_name}", "", 0))
+            stacks[(*root, *reversed(stack))] += count
+        return stacks
+
+
+# The profiler of this process.
+profiler: SamplingProfiler = SamplingProfiler()
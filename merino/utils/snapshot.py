@@ -0,0 +1,159 @@
+"""Warm-start snapshots of provider data on local disk.
+
+Providers that build their data from upstreams on startup (e.g. the MARS suggestion
+indexes or the top picks index) can't serve traffic until every fetch and build has
+completed. A provider that saves a snapshot of its data after each successful refresh
+can instead load the last good data from local disk on startup, serve traffic right
+away, and refresh in the background.
+
+A snapshot file holds a single line of JSON header followed by the payload. The header
+records the payload version, size and SHA-256 checksum as well as the time it was
+saved, so that a payload of another format, a truncated or corrupted one, or one that
+is too old to serve is ignored rather than loaded.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Final
+
+import aiodogstatsd
+
+logger = logging.getLogger(__name__)
+
+# The version of the snapshot file layout, i.e. the header and the payload after it.
+SNAPSHOT_FORMAT: Final[int] = 1
+
+
+class Snapshot:
+    """A versioned and checksummed snapshot of provider data on local disk.
+
+    Args:
+        name: The name of the snapshot, e.g. `adm_mars`. It names the snapshot file in
+            `directory` and tags the `snapshot.load` and `snapshot.save` metrics.
+        directory: The directory of the snapshot file, created on the first save.
+        max_age_sec: The age in seconds after which a snapshot is too old to load.
+        metrics_client: The StatsD client.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        directory: str | Path,
+        max_age_sec: float,
+        metrics_client: aiodogstatsd.Client,
+    ) -> None:
+        self.name = name
+        self.directory = Path(directory)
+        self.max_age_sec = max_age_sec
+        self.metrics_client = metrics_client
+
+    @property
+    def path(self) -> Path:
+        """Return the path of the snapshot file."""
+        return self.directory / f"{self.name}.snapshot"
+
+    def load(self, version: int) -> bytes | None:
+        """Return the payload of the snapshot, or None if there is no snapshot of the given
+        payload version that is intact and recent enough to load.
+        """
+        try:
+            content = self.path.read_bytes()
+        except FileNotFoundError:
+            self._record_load("missing")
+            return None
+        except OSError as error:
+            logger.warning(f"Unable to read the {self.name} snapshot: {error}")
+            self._record_load("error")
+            return None
+
+        header_line, _, payload = content.partition(b"\n")
+        try:
+            header = json.loads(header_line)
+            saved_at = float(header["saved_at"])
+            snapshot_version = header["version"]
+            valid = (
+                header["format"] == SNAPSHOT_FORMAT
+                and header["size"] == len(payload)
+                and header["sha256"] == hashlib.sha256(payload).hexdigest()
+            )
+        except ValueError, TypeError, KeyError:
+            valid = False
+
+        if not valid:
+            logger.warning(f"Ignoring the corrupted {self.name} snapshot")
+            self._record_load("corrupted")
+            return None
+        if snapshot_version != version:
+            logger.info(
+                f"Ignoring the {self.name} snapshot of another version",
+                extra={"snapshot_version": snapshot_version, "version": version},
+            )
+            self._record_load("version_mismatch")
+            return None
+        if (age := time.time() - saved_at) > self.max_age_sec:
+            logger.info(f"Ignoring the stale {self.name} snapshot", extra={"age_sec": age})
+            self._record_load("stale")
+            return None
+
+        self._record_load("success")
+        return payload
+
+    async def save(self, payload: bytes, version: int) -> bool:
+        """Save a payload of the given version as the snapshot, replacing the previous
+        one atomically. Return whether it was saved, failures are logged.
+        """
+        try:
+            await asyncio.to_thread(self._write, payload, version)
+        except OSError as error:
+            logger.warning(f"Unable to save the {self.name} snapshot: {error}")
+            self.metrics_client.increment(
+                "snapshot.save", tags={"snapshot": self.name, "status": "error"}
+            )
+            return False
+
+        self.metrics_client.increment(
+            "snapshot.save", tags={"snapshot": self.name, "status": "success"}
+        )
+        self.metrics_client.gauge(
+            "snapshot.size_bytes", value=len(payload), tags={"snapshot": self.name}
+        )
+        return True
+
+    def _write(self, payload: bytes, version: int) -> None:
+        header = {
+            "format": SNAPSHOT_FORMAT,
+            "version": version,
+            "size": len(payload),
+            "sha256": hashlib.sha256(payload).hexdigest(),
+            "saved_at": time.time(),
+        }
+        self.directory.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file first so that a crash mid-write can't leave a partial
+        # snapshot behind, then move it over the previous snapshot.
+        with tempfile.NamedTemporaryFile(
+            dir=self.directory, prefix=f".{self.name}.", delete=False
+        ) as temp_file:
+            try:
+                temp_file.write(json.dumps(header).encode() + b"\n")
+                temp_file.write(payload)
+                temp_file.flush()
+                os.fsync(temp_file.fileno())
+            except OSError:
+                os.unlink(temp_file.name)
+                raise
+        try:
+            os.replace(temp_file.name, self.path)
+        except OSError:
+            os.unlink(temp_file.name)
+            raise
+
+    def _record_load(self, status: str) -> None:
+        self.metrics_client.increment(
+            "snapshot.load", tags={"snapshot": self.name, "status": status}
+        )
@@ -7,7 +7,9 @@
 import asyncio
 import logging
 import time
+from concurrent.futures import Executor
 from datetime import datetime, timezone
+from functools import partial
 from json import JSONDecodeError
 from typing import Callable, Generic, Optional, TypeVar
 
@@ -32,13 +34,22 @@ T = TypeVar("T", bound=BaseModel)
 class SyncedGcsBlobV2(Generic[T]):
     """Class to manage a synchronized Google Cloud Storage blob.
 
-    This class periodically fetches data from a GCS blob in the background.
+    This class periodically fetches data from a GCS blob in the background. Each check only
+    fetches the blob metadata. The blob is downloaded and passed to fetch_callback when its
+    generation changed, and a generation that failed to parse is not parsed again.
+
+    fetch_callback runs in a worker thread, or in callback_executor if one is given, so that
+    parsing large blobs does not block the event loop. A process pool executor requires a
+    picklable callback and result. The result is swapped in on the event loop once parsed,
+    so readers see either the previous or the new data.
     """
 
     cron_task: asyncio.Task
     last_updated: datetime
+    generation: Optional[str]
     metrics_namespace = "gcs.sync"
     _data: Optional[T]
+    _failed_generation: Optional[str]
 
     def __init__(
         self,
@@ -50,6 +61,7 @@ class SyncedGcsBlobV2(Generic[T]):
         cron_interval_seconds: float,
         cron_job_name: str,
         fetch_callback: Callable[[bytes], T],
+        callback_executor: Optional[Executor] = None,
     ) -> None:
         """Initialize the SyncedGcsBlob instance.
 
@@ -62,6 +74,7 @@ class SyncedGcsBlobV2(Generic[T]):
             cron_interval_seconds: Interval at which to check GCS for updates in seconds.
             cron_job_name: Name for the cron job
             fetch_callback: callback invoked upon fetched data.
+            callback_executor: Executor to run fetch_callback in. Defaults to a worker thread.
         """
         self.storage_client = storage_client
         self.metrics_client = metrics_client
@@ -71,7 +84,10 @@ class SyncedGcsBlobV2(Generic[T]):
         self.cron_interval_seconds = cron_interval_seconds
         self.cron_job_name = cron_job_name
         self.fetch_callback = fetch_callback
+        self.callback_executor = callback_executor
         self.last_updated = LAST_UPDATED_INITIAL_VALUE
+        self.generation = None
+        self._failed_generation = None
         self._update_count = 0
         self._bucket = Bucket(storage=storage_client, name=bucket_name)
         self._default_tags: MTags = {"bucket": self.bucket_name, "blob": self.blob_name}
@@ -126,6 +142,22 @@ class SyncedGcsBlobV2(Generic[T]):
             tags={**self._default_tags, "status": status_code},
         )
 
+    def _increment_skipped(self, reason: str):
+        self.metrics_client.increment(
+            f"{self.metrics_namespace}.fetch.skipped",
+            tags={**self._default_tags, "reason": reason},
+        )
+
+    async def _parse(self, raw: bytes) -> T:
+        """Run fetch_callback on the raw blob off the event loop."""
+        with self.metrics_client.timeit(
+            f"{self.metrics_namespace}.parse.timing", tags=self._default_tags
+        ):
+            if self.callback_executor is None:
+                return await asyncio.to_thread(self.fetch_callback, raw)
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.callback_executor, self.fetch_callback, raw)
+
     async def _update_task(self) -> None:
         """Task to update the data with the latest data from GCS."""
         try:
@@ -144,6 +176,11 @@ class SyncedGcsBlobV2(Generic[T]):
         blob_size = int(blob.size)
         # Populated at runtime
         blob_updated = datetime.fromisoformat(blob.updated)  # type: ignore[attr-defined]
+        blob_generation: Optional[str] = getattr(blob, "generation", None)
+        if blob_generation is not None:
+            unchanged = blob_generation == self.generation
+        else:
+            unchanged = blob_updated <= self.last_updated
 
         self.metrics_client.gauge(
             f"{self.metrics_namespace}.size", value=blob_size, tags=self._default_tags
@@ -151,25 +188,34 @@ class SyncedGcsBlobV2(Generic[T]):
         if self.max_size is not None and blob_size > self.max_size:
             logger.error(f"Blob '{self.blob_name}' size {blob_size} exceeds {self.max_size}")
             self._gauge_validity(0)
-        elif blob_updated <= self.last_updated:
+        elif unchanged:
             logger.info(f"{self.blob_name} unchanged since {self.last_updated}.")
+            self._increment_skipped("unchanged")
             # Set last_updated as this data is not stale, just unchanged
             self.last_updated = blob_updated
+        elif blob_generation is not None and blob_generation == self._failed_generation:
+            logger.info(f"{self.blob_name} generation {blob_generation} previously failed.")
+            self._increment_skipped("invalid")
+            self._gauge_validity(0)
         else:
             raw: bytes = await blob.download()
             try:
-                result = self.fetch_callback(raw)
+                result = await self._parse(raw)
                 self._data = result
                 self._update_count += 1
                 self.last_updated = blob_updated
+                self.generation = blob_generation
                 self._gauge_validity(1)
             except JSONDecodeError as json_error:
+                self._failed_generation = blob_generation
                 self._gauge_validity(0)
                 logger.error(f"Failed to decode blob JSON: {json_error}")
             except ValidationError as val_err:
+                self._failed_generation = blob_generation
                 self._gauge_validity(0)
                 logger.error(f"Invalid blob content: {val_err}")
             except Exception as generic_err:
+                self._failed_generation = blob_generation
                 self._gauge_validity(0)
                 logger.error(f"Blob fetch failure: {generic_err}")
 
@@ -182,6 +228,11 @@ class SyncedGcsBlobV2(Generic[T]):
             )
 
 
+def _validate_json_blob(model: type[T], data: bytes) -> T:
+    """Parse a JSON blob and validate it as the model."""
+    return model.model_validate(orjson.loads(data))
+
+
 def typed_gcs_json_blob_factory(
     model: type[T],
     storage_client: Storage,
@@ -191,6 +242,7 @@ def typed_gcs_json_blob_factory(
     max_size: Optional[int],
     cron_interval_seconds: float,
     cron_job_name: str,
+    callback_executor: Optional[Executor] = None,
 ) -> SyncedGcsBlobV2[T]:
     """Generate a SyncedGcsBlobV2 object
     which pulls and validates a JSON file according to the
@@ -198,15 +250,6 @@ def typed_gcs_json_blob_factory(
     Raises errors if JSON is invalid or model validation fails,
     to be handled by the caller.
     """
-
-    def fetch_callback(data: bytes) -> T:
-        default_tags: MTags = {"bucket": bucket_name, "blob": blob_name}
-        parsed = model.model_validate(orjson.loads(data))
-        metrics_client.gauge(
-            f"{SyncedGcsBlobV2.metrics_namespace}.valid", value=1, tags=default_tags
-        )
-        return parsed
-
     return SyncedGcsBlobV2(
         storage_client,
         metrics_client,
@@ -215,5 +258,6 @@ def typed_gcs_json_blob_factory(
         max_size,
         cron_interval_seconds,
         cron_job_name,
-        fetch_callback,
+        partial(_validate_json_blob, model),
+        callback_executor,
     )
@@ -1,10 +1,11 @@
 """Merino V1 API"""
 
 import logging
+import time
 from asyncio import Task
 from functools import partial
 from itertools import chain
-from typing import Annotated, Literal
+from typing import Annotated, Any, Literal
 
 from asgi_correlation_id.context import correlation_id
 from fastapi import APIRouter, Depends, Header, HTTPException, Query, status
@@ -35,6 +36,7 @@ from merino.curated_recommendations.legacy.protocol import (
     CuratedRecommendationsLegacyFx115Fx129Response,
     CuratedRecommendationsLegacyFx114Response,
 )
+from merino.governance.admission import AdmissionControllers
 from merino.middleware import ScopeKey
 from merino.middleware.user_agent import UserAgent
 from merino.providers.rss import get_wikimedia_potd_provider
@@ -44,7 +46,7 @@ from merino.providers.rss.wikimedia_potd.provider import (
 )
 from merino.providers.suggest import get_providers as get_suggest_providers
 from merino.providers.suggest import get_weather_provider
-from merino.providers.suggest.adm.provider import AMP_FUZZY_VARIANT
+from merino.providers.suggest.adm import AMP_FUZZY_VARIANT
 from merino.providers.suggest.manager import ProviderType
 from merino.providers.manifest import get_provider as get_manifest_provider
 from merino.providers.suggest.base import (
@@ -71,6 +73,7 @@ from merino.utils.api.metrics import (
     emit_normalization_metrics,
     emit_suggestions_per_metrics,
 )
+from merino.utils.api.response_cache import ResponseCacheKey, SuggestResponseCache, dump_json
 from merino.utils.query_processing.query_patterns import (
     QueryPatternMatcher,
     build_query_pattern_matcher,
@@ -137,6 +140,34 @@ SOURCE_TYPE = Literal["urlbar", "newtab", "unknown"]
 
 MANIFEST_TTL_SEC = settings.runtime.default_manifest_response_ttl_sec
 
+# In-process cache of whole suggest responses, or None when the feature is disabled.
+_RESPONSE_CACHE: SuggestResponseCache | None = (
+    SuggestResponseCache(
+        max_entries=settings.web.api.v1.response_cache.max_entries,
+        ttl_sec=settings.web.api.v1.response_cache.ttl_sec,
+        bypass_providers=settings.web.api.v1.response_cache.bypass_providers,
+    )
+    if settings.web.api.v1.response_cache.enabled
+    else None
+)
+
+# Per-provider admission control of suggest queries, or None when the feature is disabled.
+_ADMISSION: AdmissionControllers | None = (
+    AdmissionControllers(
+        max_concurrency={
+            name: provider_settings.max_concurrency
+            for name, provider_settings in settings.providers.items()
+            if provider_settings.get("max_concurrency") is not None
+        },
+        min_concurrency=settings.governance.admission.min_concurrency,
+        decrease_ratio=settings.governance.admission.decrease_ratio,
+        latency_target_ratio=settings.governance.admission.latency_target_ratio,
+        latency_ewma_weight=settings.governance.admission.latency_ewma_weight,
+    )
+    if settings.governance.admission.enabled
+    else None
+)
+
 
 @router.get(
     "/suggest",
@@ -293,12 +324,46 @@ async def suggest(
             pass
 
     lookups: list[Task] = []
+    # Only responses with the results of every provider searched are cached.
+    complete = True
     languages = get_accepted_languages(accept_language)
 
     validate_suggest_custom_location_params(city, region, country, source)
     geolocation = refine_geolocation_for_suggestion(request, city, region, country)
     client_variants_list = client_variants.split(",") if client_variants else []
 
+    response_cache_key: ResponseCacheKey | None = None
+    if _RESPONSE_CACHE is not None:
+        response_cache_key = _RESPONSE_CACHE.key(
+            q,
+            search_from,
+            geolocation.country,
+            geolocation.regions,
+            user_agent.form_factor if user_agent else None,
+            languages,
+            client_variants_list,
+            source,
+            request_type,
+        )
+        if response_cache_key is None:
+            metrics_client.increment("suggestions.response_cache", tags={"outcome": "bypass"})
+        elif cached := _RESPONSE_CACHE.get(response_cache_key):
+            metrics_client.increment("suggestions.response_cache", tags={"outcome": "hit"})
+            metrics_client.histogram(
+                "suggestions.response_cache.saved_ms", value=cached.compute_ms
+            )
+            emit_suggestions_per_metrics(metrics_client, cached.suggestions, search_from)
+            return Response(
+                content=cached.render(
+                    correlation_id.get(), _response_client_variants(client_variants)
+                ),
+                media_type="application/json",
+                headers={"Cache-Control": cached.cache_control},
+            )
+        else:
+            metrics_client.increment("suggestions.response_cache", tags={"outcome": "miss"})
+    started_at = time.perf_counter()
+
     # Query normalization (sports/finance always-on; AMP gated on the experiment variant)
     pipeline = get_pipeline()
     use_normalization = pipeline is not None
@@ -325,12 +390,20 @@ async def suggest(
             client_variants=client_variants_list,
         )
         p.validate(srequest)
+        admission = _ADMISSION.get(p.name, p.query_timeout_sec) if _ADMISSION is not None else None
+        if admission is not None and not admission.try_acquire():
+            # The provider has too many queries in flight, skip it for this request.
+            metrics_client.increment(f"providers.{p.name}.query.shed")
+            complete = False
+            continue
         task = metrics_client.timeit_task(p.query(srequest), f"providers.{p.name}.query")
         # `timeit_task()` doesn't support task naming, need to set the task name manually
         task.set_name(p.name)
+        if admission is not None:
+            admission.track(task)
         lookups.append(task)
 
-    completed_tasks, _ = await task_runner.gather(
+    completed_tasks, pending_tasks = await task_runner.gather(
         lookups,
         timeout=max(
             (provider.query_timeout_sec for provider in search_from),
@@ -367,34 +440,60 @@ async def suggest(
             query_changed=q_normalized != tier_a(q),
         )
 
-    return build_suggestion_response(client_variants, search_from, suggestions)
+    response = build_suggestion_response(client_variants, search_from, suggestions)
+    complete = (
+        complete
+        and not pending_tasks
+        and all(task.exception() is None for task in completed_tasks)
+    )
+    if _RESPONSE_CACHE is not None and response_cache_key is not None and complete:
+        _RESPONSE_CACHE.put(
+            response_cache_key,
+            suggestions,
+            dump_json(response.suggestions_content),
+            response.ttl,
+            compute_ms=(time.perf_counter() - started_at) * 1000,
+        )
+    return response
+
+
+def _response_client_variants(client_variants: str | None) -> list[str]:
+    """Return the client variants echoed back in the suggest response."""
+    # [:CLIENT_VARIANT_MAX] filter at end to drop any trailing string beyond max_split.
+    return (
+        client_variants.split(",", maxsplit=CLIENT_VARIANT_MAX)[:CLIENT_VARIANT_MAX]
+        if client_variants
+        else []
+    )
+
+
+class SuggestionResponse(JSONResponse):
+    """The JSON response of the suggest endpoint.
+
+    Keeps the encoded suggestions and the `Cache-Control` TTL around so the response
+    can be stored in the response cache.
+    """
+
+    def __init__(self, content: dict[str, Any], ttl: int) -> None:
+        self.suggestions_content = content["suggestions"]
+        self.ttl = ttl
+        super().__init__(content=content, headers={"Cache-Control": f"private, max-age={ttl}"})
 
 
 def build_suggestion_response(
     client_variants: str | None,
     search_from: list[BaseProvider],
     suggestions: list[BaseSuggestion],
-) -> Response:
+) -> SuggestionResponse:
     """Build the Suggestion Response."""
     response = SuggestResponse(
         suggestions=suggestions,
         request_id=correlation_id.get(),
-        # [:CLIENT_VARIANT_MAX] filter at end to drop any trailing string beyond max_split.
-        client_variants=(
-            client_variants.split(",", maxsplit=CLIENT_VARIANT_MAX)[:CLIENT_VARIANT_MAX]
-            if client_variants
-            else []
-        ),
+        client_variants=_response_client_variants(client_variants),
     )
-    # response headers
-    response_headers = {}
     # could be specific or default
     ttl = get_ttl_for_cache_control_header_for_suggestions(search_from, suggestions)
-    response_headers["Cache-Control"] = f"private, max-age={ttl}"
-    return JSONResponse(
-        content=jsonable_encoder(response, exclude_none=True),
-        headers=response_headers,
-    )
+    return SuggestionResponse(content=jsonable_encoder(response, exclude_none=True), ttl=ttl)
 
 
 @router.get(
@@ -0,0 +1,66 @@
+"""Internal endpoint to capture a CPU profile of a running Merino process.
+
+Disabled by default. When enabled, requests must carry the configured token as
+`Authorization: Bearer <token>`.
+"""
+
+import logging
+import secrets
+from typing import Annotated, Literal
+
+from fastapi import APIRouter, Header, HTTPException, Query, status
+from fastapi.responses import JSONResponse, PlainTextResponse, Response
+
+from merino.configs import settings
+from merino.utils.profiler import ProfilerBusyError, ProfilerError, profiler
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+MAX_DURATION_SEC: float = settings.profiler.max_duration_sec
+DEFAULT_INTERVAL_MS: float = settings.profiler.interval_ms
+
+
+def _authorize(authorization: str | None) -> None:
+    """Reject requests that don't carry the configured bearer token."""
+    token = settings.profiler.auth_token
+    scheme, _, credentials = (authorization or "").partition(" ")
+    if (
+        not token
+        or scheme.lower() != "bearer"
+        or not secrets.compare_digest(credentials.encode(), token.encode())
+    ):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Unauthorized")
+
+
+@router.get("/__profile__", include_in_schema=False)
+async def profile(
+    authorization: Annotated[str | None, Header()] = None,
+    seconds: Annotated[float, Query(gt=0)] = 10.0,
+    interval_ms: Annotated[float, Query(ge=1, le=1000)] = DEFAULT_INTERVAL_MS,
+    format: Literal["collapsed", "speedscope"] = "collapsed",
+) -> Response:
+    """Profile the process for `seconds` (capped at `profiler.max_duration_sec`) and
+    return the sampled stacks, as collapsed stacks or a speedscope profile.
+
+    Returns 409 if a profile is already running.
+    """
+    _authorize(authorization)
+    duration_sec = min(seconds, MAX_DURATION_SEC)
+    logger.info(f"Profiling for {duration_sec}s every {interval_ms}ms")
+    try:
+        result = await profiler.profile(duration_sec, interval_ms / 1000)
+    except ProfilerBusyError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    except ProfilerError as e:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(e))
+
+    headers = {
+        "X-Profile-Samples": str(result.sample_count),
+        "X-Profile-Duration": f"{result.duration_sec:.3f}",
+        "X-Profile-Overhead": f"{result.overhead_ratio:.5f}",
+    }
+    if format == "speedscope":
+        return JSONResponse(content=result.to_speedscope(), headers=headers)
+    return PlainTextResponse(content=result.to_collapsed(), headers=headers)
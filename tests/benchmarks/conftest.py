@@ -0,0 +1,134 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""Module for test configurations for the benchmarks directory.
+
+Adds the `--bench-*` command line options, and reports and compares the measurements
+at the end of the session.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from tests.benchmarks.harness import (
+    Bench,
+    Measurement,
+    Regression,
+    baseline_path,
+    compare,
+    load_baseline,
+    save_baseline,
+)
+
+QUERIES_PATH = Path(__file__).parent / "data" / "queries.txt"
+
+MEASUREMENTS_KEY = pytest.StashKey[list[Measurement]]()
+REGRESSIONS_KEY = pytest.StashKey[list[Regression]]()
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Add the benchmark options."""
+    group = parser.getgroup("benchmarks")
+    group.addoption(
+        "--bench-rounds",
+        type=int,
+        default=20,
+        help="Number of times each stage is run over the query corpus (default: 20)",
+    )
+    group.addoption(
+        "--bench-dir",
+        type=Path,
+        default=Path(".benchmarks"),
+        help="Directory of the saved baselines (default: .benchmarks)",
+    )
+    group.addoption(
+        "--bench-save",
+        metavar="NAME",
+        help="Save the measurements as the named baseline for this machine",
+    )
+    group.addoption(
+        "--bench-compare",
+        metavar="NAME",
+        help="Compare the measurements to the named baseline, and fail on regressions",
+    )
+    group.addoption(
+        "--bench-threshold",
+        type=float,
+        default=10.0,
+        help="Percentage a stat can regress by before failing the comparison (default: 10)",
+    )
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Set up the measurements of the session."""
+    if name := config.getoption("bench_compare"):
+        path = baseline_path(config.getoption("bench_dir"), name)
+        if not path.exists():
+            raise pytest.UsageError(f"No baseline {path}, save one with --bench-save={name}")
+    config.stash[MEASUREMENTS_KEY] = []
+    config.stash[REGRESSIONS_KEY] = []
+
+
+@pytest.fixture(name="bench")
+def fixture_bench(request: pytest.FixtureRequest) -> Bench:
+    """Return the benchmark runner of the session."""
+    config = request.config
+    return Bench(config.getoption("bench_rounds"), config.stash[MEASUREMENTS_KEY])
+
+
+@pytest.fixture(name="queries", scope="session")
+def fixture_queries() -> list[str]:
+    """Return the query corpus, as typed: every prefix of every recorded query, since
+    Firefox sends a suggest request per keystroke.
+    """
+    queries = [line for line in QUERIES_PATH.read_text().splitlines() if line.strip()]
+    return [query[:end] for query in queries for end in range(1, len(query) + 1)]
+
+
+def pytest_sessionfinish(session: pytest.Session) -> None:
+    """Save and compare the measurements, failing the session on regressions."""
+    config = session.config
+    measurements = config.stash[MEASUREMENTS_KEY]
+    if not measurements:
+        return
+    directory = config.getoption("bench_dir")
+    if name := config.getoption("bench_save"):
+        save_baseline(baseline_path(directory, name), measurements)
+    if name := config.getoption("bench_compare"):
+        baseline = load_baseline(baseline_path(directory, name))
+        regressions = compare(baseline, measurements, config.getoption("bench_threshold") / 100)
+        config.stash[REGRESSIONS_KEY] = regressions
+        if regressions and session.exitstatus == pytest.ExitCode.OK:
+            session.exitstatus = pytest.ExitCode.TESTS_FAILED
+
+
+def pytest_terminal_summary(terminalreporter, config: pytest.Config) -> None:
+    """Report the measurements, and the regressions if compared to a baseline."""
+    measurements = config.stash[MEASUREMENTS_KEY]
+    if not measurements:
+        return
+    terminalreporter.section("benchmarks")
+    terminalreporter.write_line(
+        f"{'stage':<32}{'calls':>8}{'median us':>12}{'p95 us':>12}{'p99 us':>12}"
+        f"{'stdev us':>12}{'alloc peak B':>14}{'blocks/call':>13}"
+    )
+    for m in measurements:
+        terminalreporter.write_line(
+            f"{m.stage:<32}{m.calls:>8}{m.median_us:>12.2f}{m.p95_us:>12.2f}{m.p99_us:>12.2f}"
+            f"{m.stdev_us:>12.2f}{m.alloc_peak_bytes:>14.0f}{m.alloc_blocks:>13.2f}"
+        )
+    if name := config.getoption("bench_save"):
+        path = baseline_path(config.getoption("bench_dir"), name)
+        terminalreporter.write_line(f"Saved baseline {path}")
+    if config.getoption("bench_compare"):
+        regressions = config.stash[REGRESSIONS_KEY]
+        for r in regressions:
+            terminalreporter.write_line(
+                f"REGRESSION {r.stage} {r.stat}: {r.baseline:.2f} -> {r.current:.2f} "
+                f"({r.change:+.1%})",
+                red=True,
+            )
+        if not regressions:
+            terminalreporter.write_line("No regressions against the baseline", green=True)
@@ -0,0 +1,257 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""A minimal benchmark harness for the suggest hot path.
+
+Each stage is timed call by call over a query corpus, then run once more over the corpus
+with `tracemalloc` on to measure its allocations, which would otherwise skew the timings.
+Results are saved as JSON baselines, keyed by the machine they were recorded on, so that
+a later run on the same machine can be compared against them.
+"""
+
+import gc
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from collections.abc import Awaitable, Callable, Iterable, Sequence
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+# The stats compared against a baseline, they're the least noisy ones.
+COMPARED_STATS: tuple[str, ...] = ("median_us", "alloc_peak_bytes")
+
+
+@dataclass(frozen=True)
+class Measurement:
+    """The timings and allocations of a benchmarked stage.
+
+    Attributes:
+        stage: The name of the stage.
+        calls: The number of timed calls.
+        median_us: The median latency of a call, in microseconds.
+        mean_us: The mean latency of a call, in microseconds.
+        p95_us: The 95th percentile latency of a call, in microseconds.
+        p99_us: The 99th percentile latency of a call, in microseconds.
+        min_us: The fastest call, in microseconds.
+        stdev_us: The standard deviation of the latencies, in microseconds.
+        alloc_peak_bytes: The median peak of memory allocated during a call.
+        alloc_blocks: The mean number of memory blocks still allocated after a call, a
+            sign of a leak or of a growing cache if it isn't close to 0.
+    """
+
+    stage: str
+    calls: int
+    median_us: float
+    mean_us: float
+    p95_us: float
+    p99_us: float
+    min_us: float
+    stdev_us: float
+    alloc_peak_bytes: float
+    alloc_blocks: float
+
+
+@dataclass(frozen=True)
+class Regression:
+    """A stat of a stage that got worse than its baseline by more than the threshold."""
+
+    stage: str
+    stat: str
+    baseline: float
+    current: float
+
+    @property
+    def change(self) -> float:
+        """The relative change from the baseline, e.g. 0.25 for 25% worse."""
+        if not self.baseline:
+            return float("inf") if self.current else 0.0
+        return self.current / self.baseline - 1
+
+
+def _summarize(stage: str, latencies_ns: list[int], peaks: list[int], blocks: int) -> Measurement:
+    """Summarize the raw latencies and allocations of a stage."""
+    latencies_us = sorted(latency / 1000 for latency in latencies_ns)
+    quantiles = statistics.quantiles(latencies_us, n=100, method="inclusive")
+    return Measurement(
+        stage=stage,
+        calls=len(latencies_us),
+        median_us=statistics.median(latencies_us),
+        mean_us=statistics.fmean(latencies_us),
+        p95_us=quantiles[94],
+        p99_us=quantiles[98],
+        min_us=latencies_us[0],
+        stdev_us=statistics.stdev(latencies_us),
+        alloc_peak_bytes=statistics.median(peaks),
+        alloc_blocks=blocks / len(peaks),
+    )
+
+
+def measure(
+    stage: str, func: Callable[[T], object], inputs: Sequence[T], rounds: int
+) -> Measurement:
+    """Benchmark a synchronous stage, calling it `rounds` times on each of the inputs."""
+    for item in inputs:
+        func(item)
+
+    latencies: list[int] = []
+    gc.collect()
+    gc.disable()
+    try:
+        for _ in range(rounds):
+            for item in inputs:
+                started_at = time.perf_counter_ns()
+                func(item)
+                latencies.append(time.perf_counter_ns() - started_at)
+    finally:
+        gc.enable()
+
+    peaks: list[int] = []
+    blocks = 0
+    tracemalloc.start()
+    for item in inputs:
+        tracemalloc.reset_peak()
+        current, _ = tracemalloc.get_traced_memory()
+        blocks_before = sys.getallocatedblocks()
+        func(item)
+        blocks += sys.getallocatedblocks() - blocks_before
+        peaks.append(tracemalloc.get_traced_memory()[1] - current)
+    tracemalloc.stop()
+    return _summarize(stage, latencies, peaks, blocks)
+
+
+async def measure_async(
+    stage: str, func: Callable[[T], Awaitable[object]], inputs: Sequence[T], rounds: int
+) -> Measurement:
+    """Benchmark an asynchronous stage, awaiting it `rounds` times on each of the inputs.
+
+    Calls are awaited one at a time on the running loop, so the latencies include the
+    loop's scheduling overhead but no contention between calls.
+    """
+    for item in inputs:
+        await func(item)
+
+    latencies: list[int] = []
+    gc.collect()
+    gc.disable()
+    try:
+        for _ in range(rounds):
+            for item in inputs:
+                started_at = time.perf_counter_ns()
+                await func(item)
+                latencies.append(time.perf_counter_ns() - started_at)
+    finally:
+        gc.enable()
+
+    peaks: list[int] = []
+    blocks = 0
+    tracemalloc.start()
+    for item in inputs:
+        tracemalloc.reset_peak()
+        current, _ = tracemalloc.get_traced_memory()
+        blocks_before = sys.getallocatedblocks()
+        await func(item)
+        blocks += sys.getallocatedblocks() - blocks_before
+        peaks.append(tracemalloc.get_traced_memory()[1] - current)
+    tracemalloc.stop()
+    return _summarize(stage, latencies, peaks, blocks)
+
+
+def machine_info() -> dict[str, Any]:
+    """Describe the machine and interpreter, baselines are only comparable on the same."""
+    return {
+        "node": platform.node(),
+        "system": platform.system(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+        "python_implementation": platform.python_implementation(),
+        "python_version": platform.python_version(),
+    }
+
+
+def machine_id(info: dict[str, Any]) -> str:
+    """Return the directory name of the baselines recorded on a machine."""
+    return "-".join(
+        str(info[key]) for key in ("node", "system", "machine", "python_version")
+    ).replace("/", "_")
+
+
+def baseline_path(directory: Path, name: str) -> Path:
+    """Return the path of a named baseline for the current machine."""
+    return directory / machine_id(machine_info()) / f"{name}.json"
+
+
+def save_baseline(path: Path, measurements: Iterable[Measurement]) -> None:
+    """Save measurements as a baseline."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    content = {
+        "machine": machine_info(),
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "measurements": {m.stage: asdict(m) for m in measurements},
+    }
+    path.write_text(json.dumps(content, indent=2))
+
+
+def load_baseline(path: Path) -> dict[str, Measurement]:
+    """Load the measurements of a baseline, by stage."""
+    content = json.loads(path.read_text())
+    return {
+        stage: Measurement(**measurement) for stage, measurement in content["measurements"].items()
+    }
+
+
+def compare(
+    baseline: dict[str, Measurement],
+    measurements: Iterable[Measurement],
+    threshold: float,
+) -> list[Regression]:
+    """Return the compared stats that are worse than their baseline by more than
+    `threshold`, a ratio. Stages missing from the baseline are skipped.
+    """
+    regressions = []
+    for measurement in measurements:
+        if (reference := baseline.get(measurement.stage)) is None:
+            continue
+        for stat in COMPARED_STATS:
+            regression = Regression(
+                stage=measurement.stage,
+                stat=stat,
+                baseline=getattr(reference, stat),
+                current=getattr(measurement, stat),
+            )
+            if regression.change > threshold:
+                regressions.append(regression)
+    return regressions
+
+
+class Bench:
+    """Benchmark stages and record their measurements for the session report."""
+
+    def __init__(self, rounds: int, measurements: list[Measurement]) -> None:
+        self.rounds = rounds
+        self.measurements = measurements
+
+    def __call__(
+        self, stage: str, func: Callable[[T], object], inputs: Sequence[T]
+    ) -> Measurement:
+        """Benchmark a synchronous stage over the inputs."""
+        measurement = measure(stage, func, inputs, self.rounds)
+        self.measurements.append(measurement)
+        return measurement
+
+    async def run_async(
+        self, stage: str, func: Callable[[T], Awaitable[object]], inputs: Sequence[T]
+    ) -> Measurement:
+        """Benchmark an asynchronous stage over the inputs."""
+        measurement = await measure_async(stage, func, inputs, self.rounds)
+        self.measurements.append(measurement)
+        return measurement
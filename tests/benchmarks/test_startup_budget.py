@@ -0,0 +1,65 @@
+"""Startup budget tests: import time and baseline memory.
+
+Each check runs in a fresh interpreter, since the test session has already imported
+most of Merino. Their timings depend on the machine, so they run with the benchmarks
+(`make benchmarks`) rather than the unit tests. That the same startup imports no lazily
+loaded provider module is checked by `tests/unit/test_lazy_modules.py`.
+"""
+
+import json
+import os
+from pathlib import Path
+
+# subprocess is used only for fixed-argv fresh interpreter checks.
+import subprocess  # nosec B404
+import sys
+from typing import Any
+
+import pytest
+
+from merino.runtime import RuntimeMode
+
+# Budgets for importing `merino.main`, which creates the app for the configured runtime
+# mode, with plenty of headroom for slow CI runners. Startup regressions that blow them
+# are usually a heavy module imported eagerly again.
+IMPORT_TIME_BUDGET_SEC = 10.0
+BASELINE_RSS_BUDGET_MB = 400.0
+
+STARTUP_SCRIPT = """
+import json, resource, sys, time
+
+started_at = time.perf_counter()
+import merino.main
+import_sec = time.perf_counter() - started_at
+
+max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+# ru_maxrss is in bytes on macOS and in kilobytes elsewhere.
+rss_mb = max_rss / (1024 * 1024 if sys.platform == "darwin" else 1024)
+print(json.dumps({"import_sec": import_sec, "rss_mb": rss_mb}))
+"""
+
+
+def _run(script: str, env: dict[str, str] | None = None) -> dict[str, Any]:
+    """Run a script in a fresh interpreter and return the JSON it prints."""
+    # Fixed argv, shell=False, no untrusted input.
+    result = subprocess.run(  # nosec B603
+        [sys.executable, "-c", script],
+        cwd=Path(__file__).parents[2],
+        env=os.environ | (env or {}),
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    output: dict[str, Any] = json.loads(result.stdout.splitlines()[-1])
+    return output
+
+
+@pytest.mark.parametrize("mode", list(RuntimeMode))
+def test_startup_budget_by_mode(mode: RuntimeMode, record_property: Any) -> None:
+    """Creating the app stays within the import time and memory budgets."""
+    startup = _run(STARTUP_SCRIPT, env={"MERINO_RUNTIME__MODE": mode.value})
+
+    record_property("import_sec", round(startup["import_sec"], 3))
+    record_property("rss_mb", round(startup["rss_mb"], 1))
+    assert startup["import_sec"] <= IMPORT_TIME_BUDGET_SEC
+    assert startup["rss_mb"] <= BASELINE_RSS_BUDGET_MB
@@ -0,0 +1,274 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""Benchmarks of the suggest hot path, stage by stage and end to end.
+
+The providers are the real AdM and Top Picks providers, loaded with local data: the
+Top Picks domain list of the dev setup, and an AMP index built from it.
+"""
+
+import json
+from collections.abc import AsyncIterator
+from typing import Any
+
+import httpx
+import pytest
+import pytest_asyncio
+from fastapi import FastAPI
+from moz_merino_ext.amp import AmpIndexManager, PyAmpResult
+
+from merino.main import create_app
+from merino.middleware.geolocation import Location
+from merino.middleware.user_agent import UserAgent
+from merino.optimizers.models import ThompsonConfig
+from merino.optimizers.thompson import ThompsonSampler
+from merino.providers.suggest import get_providers
+from merino.providers.suggest.adm.backends.protocol import (
+    EngagementData,
+    FormFactor,
+    KeywordEntry,
+    KeywordMetrics,
+    SuggestionContent,
+)
+from merino.providers.suggest.adm.provider import Provider as AdmProvider
+from merino.providers.suggest.base import BaseProvider, BaseSuggestion, SuggestionRequest
+from merino.providers.suggest.top_picks.backends.top_picks import TopPicksBackend
+from merino.providers.suggest.top_picks.provider import Provider as TopPicksProvider
+from merino.runtime import RuntimeMode
+from merino.utils.metrics import get_metrics_client
+from merino.utils.query_processing.normalization import get_pipeline, init_pipeline
+from merino.utils.query_processing.normalization.pipeline import NormalizePipeline
+from merino.utils.query_processing.query_patterns import (
+    QueryPatternMatcher,
+    build_query_pattern_matcher,
+    match_query,
+)
+from merino.web.api_v1 import build_suggestion_response
+from tests.benchmarks.harness import Bench
+
+TOP_PICKS_FILE_PATH = "dev/top_picks.json"
+AMP_INDEX_ID = f"US/({FormFactor.DESKTOP.value},)"
+LOCATION = Location(country="US", regions=["CA"], city="San Francisco")
+USER_AGENT = UserAgent(browser="Firefox(130.0)", os_family="macos", form_factor="desktop")
+
+# Representative query patterns, the shipped config has none enabled.
+QUERY_PATTERNS = [
+    {"id": "url", "regex": r"^(https?://|www\.)|\.(com|org|net)\b"},
+    {"id": "weather", "regex": r"\bweather\b"},
+    {"id": "stock", "regex": r"\b(stock|stocks|[a-z]{1,5} stock)\b"},
+    {"id": "flight", "regex": r"\b([a-z]{2}|[a-z]\d|\d[a-z])\s?\d{1,4}\b"},
+    {"id": "near_me", "regex": r"\bnear me$"},
+    {"id": "question", "regex": r"^(how|what|why|when|where|who)\b"},
+]
+
+
+class LocalAdmBackend:
+    """AdM backend serving fixed suggestion content."""
+
+    def __init__(self, content: SuggestionContent) -> None:
+        self.content = content
+
+    async def fetch(self) -> SuggestionContent:
+        """Return the suggestion content."""
+        return self.content
+
+
+def request_for(query: str) -> SuggestionRequest:
+    """Return a suggestion request for the query, from a US desktop client."""
+    return SuggestionRequest(query=query, geolocation=LOCATION, user_agent=USER_AGENT)
+
+
+@pytest.fixture(name="domains", scope="module")
+def fixture_domains() -> list[dict[str, Any]]:
+    """Return the Top Picks domain list."""
+    return TopPicksBackend.read_domain_list(TOP_PICKS_FILE_PATH)["domains"]
+
+
+@pytest.fixture(name="amp_records", scope="module")
+def fixture_amp_records(domains: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Return an AMP suggestion per domain, matching every prefix of the domain name."""
+    return [
+        {
+            "id": domain["rank"],
+            "advertiser": domain["title"],
+            "click_url": f"{domain['url']}/click",
+            "impression_url": f"{domain['url']}/impression",
+            "full_keywords": [[domain["domain"], len(domain["domain"]) - 1]],
+            "iab_category": "22 - Shopping" if domain["rank"] % 2 else "5 - Education",
+            "icon": "01",
+            "serp_categories": domain["serp_categories"],
+            "keywords": [domain["domain"][:end] for end in range(2, len(domain["domain"]) + 1)],
+            "title": domain["title"],
+            "url": domain["url"],
+            "header_text": f"{domain['title']} header text",
+            "suggestion_id": f"{domain['rank']:08d}-0000-0000-0000-000000000000",
+        }
+        for domain in domains
+        if len(domain["domain"]) > 2
+    ]
+
+
+@pytest.fixture(name="adm", scope="module")
+def fixture_adm(amp_records: list[dict[str, Any]]) -> AdmProvider:
+    """Return an AdM provider serving the AMP records, with Thompson sampling."""
+    index_manager = AmpIndexManager()  # type: ignore[no-untyped-call]
+    index_manager.build(AMP_INDEX_ID, json.dumps(amp_records))
+    content = SuggestionContent(
+        index_manager=index_manager, icons={"01": "https://example.com/icon-01"}
+    )
+    provider = AdmProvider(
+        backend=LocalAdmBackend(content),
+        metrics_client=get_metrics_client(),
+        score=0.3,
+        name="adm",
+        resync_interval_sec=10800,
+        cron_interval_sec=60,
+        engagement_gcs_bucket="",
+        engagement_resync_interval_sec=3600,
+        engagement_blob_name="",
+        thompson=ThompsonSampler(config=ThompsonConfig(random_seed=0)),
+    )
+    # Skip `initialize()`, it would start the resync cron jobs.
+    provider.suggestion_content = content
+    provider.engagement_data = EngagementData(
+        amp={
+            f"{record['advertiser'].lower()}/{keyword}": KeywordEntry(
+                live=KeywordMetrics(impressions=1000, clicks=record["id"] % 100)
+            )
+            for record in amp_records
+            for keyword in record["keywords"]
+        },
+        amp_aggregated={"impressions": 1000 * len(amp_records), "clicks": 50},
+    )
+    return provider
+
+
+@pytest.fixture(name="top_picks", scope="module")
+def fixture_top_picks(domains: list[dict[str, Any]]) -> TopPicksProvider:
+    """Return a Top Picks provider serving the dev domain list."""
+    backend = TopPicksBackend(
+        top_picks_file_path=TOP_PICKS_FILE_PATH,
+        query_char_limit=4,
+        firefox_char_limit=2,
+        domain_blocklist=set(),
+    )
+    provider = TopPicksProvider(backend=backend, score=0.25, name="top_picks")
+    provider.top_picks_data = backend.build_index({"domains": domains})
+    return provider
+
+
+@pytest.fixture(name="providers", scope="module")
+def fixture_providers(adm: AdmProvider, top_picks: TopPicksProvider) -> list[BaseProvider]:
+    """Return the providers of the end to end benchmark."""
+    return [adm, top_picks]
+
+
+@pytest_asyncio.fixture(name="pipeline")
+async def fixture_pipeline() -> NormalizePipeline:
+    """Return the query normalization pipeline."""
+    await init_pipeline()
+    pipeline = get_pipeline()
+    assert pipeline is not None
+    return pipeline
+
+
+@pytest.fixture(name="matcher")
+def fixture_matcher() -> QueryPatternMatcher:
+    """Return a query pattern matcher with the representative patterns."""
+    matcher = build_query_pattern_matcher(enabled=True, sample_rate=1.0, patterns=QUERY_PATTERNS)
+    assert matcher is not None
+    return matcher
+
+
+@pytest_asyncio.fixture(name="client")
+async def fixture_client(
+    providers: list[BaseProvider], pipeline: NormalizePipeline
+) -> AsyncIterator[httpx.AsyncClient]:
+    """Return a client of a Merino app serving the providers, with the full middleware
+    stack and query normalization, in-process.
+    """
+    app: FastAPI = create_app(RuntimeMode.REGULAR)
+    app.dependency_overrides[get_providers] = lambda: (
+        {provider.name: provider for provider in providers},
+        providers,
+    )
+    transport = httpx.ASGITransport(app=app, client=("127.0.0.1", 12345))
+    async with httpx.AsyncClient(transport=transport, base_url="http://merino") as client:
+        yield client
+
+
+@pytest.mark.asyncio
+async def test_normalize(bench: Bench, queries: list[str], pipeline: NormalizePipeline) -> None:
+    """Benchmark query normalization."""
+    bench("normalize", pipeline.normalize, queries)
+
+
+def test_match_query(bench: Bench, queries: list[str], matcher: QueryPatternMatcher) -> None:
+    """Benchmark query pattern matching."""
+    bench("match_query", lambda query: match_query(matcher, query), queries)
+
+
+@pytest.mark.asyncio
+async def test_adm_query(bench: Bench, queries: list[str], adm: AdmProvider) -> None:
+    """Benchmark the AdM provider query, AMP index lookup and selection included."""
+    requests = [request_for(adm.normalize_query(query)) for query in queries]
+
+    await bench.run_async("adm.query", adm.query, requests)
+
+
+def test_adm_select(bench: Bench, queries: list[str], adm: AdmProvider) -> None:
+    """Benchmark the Thompson sampling selection of AMP suggestions."""
+    candidates: list[tuple[list[PyAmpResult], str]] = [
+        (suggestions, query)
+        for query in map(adm.normalize_query, queries)
+        if (
+            suggestions := adm.suggestion_content.index_manager.query(
+                AMP_INDEX_ID, query, fuzzy=False
+            )
+        )
+    ]
+
+    bench("adm._select", lambda candidate: adm._select(*candidate), candidates)
+
+
+@pytest.mark.asyncio
+async def test_top_picks_query(
+    bench: Bench, queries: list[str], top_picks: TopPicksProvider
+) -> None:
+    """Benchmark the Top Picks provider query."""
+    requests = [request_for(top_picks.normalize_query(query)) for query in queries]
+
+    await bench.run_async("top_picks.query", top_picks.query, requests)
+
+
+@pytest.mark.asyncio
+async def test_response_encoding(
+    bench: Bench, queries: list[str], providers: list[BaseProvider]
+) -> None:
+    """Benchmark the encoding of suggest responses."""
+    responses: list[list[BaseSuggestion]] = []
+    for query in queries:
+        suggestions = []
+        for provider in providers:
+            suggestions += await provider.query(request_for(provider.normalize_query(query)))
+        responses.append(suggestions)
+
+    bench(
+        "response.encode",
+        lambda suggestions: build_suggestion_response(None, providers, suggestions).body,
+        responses,
+    )
+
+
+@pytest.mark.asyncio
+async def test_suggest(bench: Bench, queries: list[str], client: httpx.AsyncClient) -> None:
+    """Benchmark `/api/v1/suggest` end to end, from the ASGI app to the response body."""
+
+    async def suggest(query: str) -> None:
+        response = await client.get(
+            "/api/v1/suggest", params={"q": query, "providers": "adm,top_picks"}
+        )
+        assert response.status_code == 200
+
+    await bench.run_async("suggest", suggest, queries)
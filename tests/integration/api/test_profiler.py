@@ -0,0 +1,114 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""Integration tests for the profiler endpoint.
+
+The profiler itself is mocked: it samples on `SIGPROF`, whose handler only runs on the
+main thread, and the test client serves requests from another thread.
+"""
+
+from collections import Counter
+from unittest.mock import AsyncMock
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from pytest_mock import MockerFixture
+
+from merino.configs import settings
+from merino.utils.profiler import Profile, ProfilerBusyError
+from merino.web import profiler
+
+TOKEN = "test-token"
+
+PROFILE = Profile(
+    stacks=Counter({(("MainThread", "", 0), ("handler", "api_v1.py", 10)): 2}),
+    duration_sec=1.0,
+    overhead_sec=0.001,
+)
+
+
+@pytest.fixture(name="profile_mock")
+def fixture_profile_mock(mocker: MockerFixture) -> AsyncMock:
+    """Return a mock of the process profiler's `profile` method."""
+    return mocker.patch.object(
+        profiler.profiler, "profile", new_callable=AsyncMock, return_value=PROFILE
+    )
+
+
+@pytest.fixture(name="profiler_client")
+def fixture_profiler_client(monkeypatch: pytest.MonkeyPatch) -> TestClient:
+    """Return a test client for an app serving the profiler endpoint."""
+    monkeypatch.setattr(settings.profiler, "auth_token", TOKEN)
+    app = FastAPI()
+    app.include_router(profiler.router)
+    return TestClient(app)
+
+
+def test_profiler_disabled_by_default(client: TestClient) -> None:
+    """The endpoint isn't served unless enabled."""
+    assert client.get("/__profile__").status_code == 404
+
+
+@pytest.mark.parametrize(
+    "headers",
+    [{}, {"Authorization": "Bearer wrong"}, {"Authorization": f"Basic {TOKEN}"}],
+    ids=["missing", "wrong_token", "wrong_scheme"],
+)
+def test_profiler_unauthorized(
+    profiler_client: TestClient, profile_mock: AsyncMock, headers: dict[str, str]
+) -> None:
+    """Requests without the configured bearer token are rejected."""
+    response = profiler_client.get("/__profile__", headers=headers)
+
+    assert response.status_code == 401
+    profile_mock.assert_not_called()
+
+
+def test_profiler_collapsed(profiler_client: TestClient, profile_mock: AsyncMock) -> None:
+    """The profile is returned as collapsed stacks by default."""
+    response = profiler_client.get(
+        "/__profile__",
+        params={"seconds": 1, "interval_ms": 5},
+        headers={"Authorization": f"Bearer {TOKEN}"},
+    )
+
+    assert response.status_code == 200
+    assert response.text == "MainThread;handler (api_v1.py:10) 2\n"
+    assert response.headers["X-Profile-Samples"] == "2"
+    assert response.headers["X-Profile-Overhead"] == "0.00100"
+    profile_mock.assert_awaited_once_with(1.0, 0.005)
+
+
+def test_profiler_speedscope(profiler_client: TestClient, profile_mock: AsyncMock) -> None:
+    """The profile is returned in the speedscope format on request."""
+    response = profiler_client.get(
+        "/__profile__",
+        params={"format": "speedscope"},
+        headers={"Authorization": f"Bearer {TOKEN}"},
+    )
+
+    assert response.status_code == 200
+    assert response.json()["profiles"][0]["weights"] == [2]
+
+
+def test_profiler_duration_capped(profiler_client: TestClient, profile_mock: AsyncMock) -> None:
+    """Profiles are no longer than the configured max duration."""
+    response = profiler_client.get(
+        "/__profile__",
+        params={"seconds": 3600},
+        headers={"Authorization": f"Bearer {TOKEN}"},
+    )
+
+    assert response.status_code == 200
+    assert profile_mock.await_args.args[0] == settings.profiler.max_duration_sec
+
+
+def test_profiler_busy(profiler_client: TestClient, profile_mock: AsyncMock) -> None:
+    """A conflict is returned while another profile is running."""
+    profile_mock.side_effect = ProfilerBusyError("A profile is already running")
+
+    response = profiler_client.get("/__profile__", headers={"Authorization": f"Bearer {TOKEN}"})
+
+    assert response.status_code == 409
@@ -298,3 +298,21 @@ async def test_gcs_engagement_metrics(gcs_storage_client, gcs_bucket, metrics_cl
     ), (
         "The gauge recommendation.engagement.last_updated was not called with value between 0 and 10"
     )
+
+
+@pytest.mark.asyncio
+async def test_gcs_engagement_get_many(gcs_storage_client, gcs_bucket, metrics_client, blob):
+    """Test that engagement of a batch of items is returned as parallel arrays."""
+    gcs_engagement = create_gcs_engagement(gcs_storage_client, gcs_bucket, metrics_client)
+    await wait_until_engagement_is_updated(gcs_engagement)
+
+    engagement = gcs_engagement.get_many(["AA", "missing", "6A", "1A"], "US")
+
+    assert engagement.found.tolist() == [True, False, True, True]
+    assert engagement.clicks.tolist() == [12, 0, 4, 3]
+    assert engagement.impressions.tolist() == [1020, 0, 9, 9]
+    assert engagement.reports.tolist() == [1, 0, 0, 6]
+
+    no_region_data = gcs_engagement.get_many(["AA", "6A"], "AU")
+    assert no_region_data.found.tolist() == [False, False]
+    assert no_region_data.clicks.tolist() == [0, 0]
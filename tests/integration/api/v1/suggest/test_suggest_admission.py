@@ -0,0 +1,74 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""Integration tests for the suggest endpoint's per-provider admission control."""
+
+import aiodogstatsd
+import pytest
+from fastapi.testclient import TestClient
+from pytest_mock import MockerFixture
+
+from merino.governance.admission import AdmissionControllers
+from tests.integration.api.v1.fake_providers import FakeProviderFactory
+from tests.integration.api.v1.types import Providers
+
+
+@pytest.fixture(name="providers")
+def fixture_providers() -> Providers:
+    """Define a limited slow provider and an unlimited one."""
+    return {
+        "timedout-sponsored": FakeProviderFactory.timeout_sponsored(enabled_by_default=True),
+        "sponsored": FakeProviderFactory.sponsored(enabled_by_default=True),
+    }
+
+
+@pytest.fixture(name="admission", autouse=True)
+def fixture_admission(mocker: MockerFixture) -> AdmissionControllers:
+    """Limit the slow provider to a single in-flight query for the tests in this module."""
+    admission = AdmissionControllers(
+        max_concurrency={"timedout-sponsored": 1},
+        min_concurrency=1,
+        decrease_ratio=0.5,
+        latency_target_ratio=0.8,
+    )
+    mocker.patch("merino.web.api_v1._ADMISSION", admission)
+    return admission
+
+
+def test_over_limit_provider_is_shed(
+    mocker: MockerFixture, client: TestClient, admission: AdmissionControllers
+) -> None:
+    """A provider at its limit is skipped and counted as shed, while the others are
+    queried as usual.
+    """
+    controller = admission.get("timedout-sponsored", query_timeout_sec=1.0)
+    assert controller is not None
+    # Hold the only slot, as a concurrent request still waiting on the provider would.
+    assert controller.try_acquire()
+    report = mocker.patch.object(aiodogstatsd.Client, "_report")
+
+    response = client.get("/api/v1/suggest?q=sponsored")
+
+    assert response.status_code == 200
+    assert [s["provider"] for s in response.json()["suggestions"]] == ["sponsored"]
+    metric_keys = [call.args[0] for call in report.call_args_list]
+    assert "providers.timedout-sponsored.query.shed" in metric_keys
+    assert "providers.timedout-sponsored.query" not in metric_keys
+    assert "providers.timedout-sponsored.query.timeout" not in metric_keys
+    assert controller.in_flight == 1
+
+
+def test_timed_out_queries_release_their_slot(
+    client: TestClient, admission: AdmissionControllers
+) -> None:
+    """A query that times out gives back its slot and cuts the provider's limit."""
+    response = client.get("/api/v1/suggest?q=sponsored")
+
+    assert response.status_code == 200
+    controller = admission.get("timedout-sponsored", query_timeout_sec=1.0)
+    assert controller is not None
+    assert controller.in_flight == 0
+    assert controller.limit == 1.0
+    # The slot is free for the next request.
+    assert controller.try_acquire()
@@ -0,0 +1,159 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""Integration tests for the suggest endpoint's in-process response cache."""
+
+from typing import Any
+
+import aiodogstatsd
+import pytest
+from fastapi.testclient import TestClient
+from pytest_mock import MockerFixture
+
+from merino.governance.admission import AdmissionControllers
+from merino.providers.suggest.base import BaseSuggestion, SuggestionRequest
+from merino.utils.api.response_cache import SuggestResponseCache
+from tests.integration.api.v1.fake_providers import FakeProvider, FakeProviderFactory
+from tests.integration.api.v1.types import Providers
+
+
+class CountingQuery:
+    """Query callable that counts its calls and returns no suggestions."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def __call__(self, srequest: SuggestionRequest) -> list[BaseSuggestion]:
+        """Count the call."""
+        self.calls += 1
+        return []
+
+
+@pytest.fixture(name="providers")
+def fixture_providers() -> Providers:
+    """Define a cacheable provider, a bypassed one and ones that fail or time out."""
+    return {
+        "sponsored": FakeProviderFactory.sponsored(enabled_by_default=True),
+        "corrupted": FakeProviderFactory.corrupt(enabled_by_default=False),
+        "timedout-sponsored": FakeProviderFactory.timeout_sponsored(enabled_by_default=False),
+        "weather": FakeProvider(
+            name="weather",
+            enabled_by_default=False,
+            hidden=False,
+            query_callable=CountingQuery(),
+        ),
+    }
+
+
+@pytest.fixture(name="response_cache", autouse=True)
+def fixture_response_cache(mocker: MockerFixture) -> SuggestResponseCache:
+    """Enable the response cache for the tests in this module."""
+    cache = SuggestResponseCache(max_entries=100, ttl_sec=60, bypass_providers=["weather"])
+    mocker.patch("merino.web.api_v1._RESPONSE_CACHE", cache)
+    return cache
+
+
+def _cache_outcomes(report: Any) -> list[str]:
+    """Return the outcome tags of the reported response cache lookups."""
+    return [
+        call.args[3]["outcome"]
+        for call in report.call_args_list
+        if call.args[0] == "suggestions.response_cache"
+    ]
+
+
+def test_repeated_request_served_from_cache(
+    mocker: MockerFixture, client: TestClient, response_cache: SuggestResponseCache
+) -> None:
+    """The second identical request is served from the cache, with an identical body
+    apart from its own request ID, and a `max-age` capped by the cache TTL.
+    """
+    query = mocker.spy(FakeProvider, "query")
+    report = mocker.patch.object(aiodogstatsd.Client, "_report")
+
+    first = client.get("/api/v1/suggest?q=sponsored&client_variants=foo,bar")
+    second = client.get("/api/v1/suggest?q=sponsored&client_variants=foo,bar")
+
+    assert query.call_count == 1
+    assert len(response_cache) == 1
+    assert second.status_code == 200
+    assert first.headers["Cache-Control"] == "private, max-age=300"
+    assert second.headers["Cache-Control"] == "private, max-age=60"
+    assert second.headers["Content-Type"] == first.headers["Content-Type"]
+    first_body, second_body = first.json(), second.json()
+    assert first_body.pop("request_id") != second_body.pop("request_id")
+    assert first_body == second_body
+    assert _cache_outcomes(report) == ["miss", "hit"]
+    assert any(
+        call.args[0] == "suggestions.response_cache.saved_ms" for call in report.call_args_list
+    )
+
+
+def test_segments_are_cached_separately(
+    mocker: MockerFixture, client: TestClient, response_cache: SuggestResponseCache
+) -> None:
+    """Requests differing in query or client variants don't share a response."""
+    query = mocker.spy(FakeProvider, "query")
+
+    client.get("/api/v1/suggest?q=sponsored")
+    client.get("/api/v1/suggest?q=sponsore")
+    client.get("/api/v1/suggest?q=sponsored&client_variants=foo")
+
+    assert query.call_count == 3
+    assert len(response_cache) == 3
+
+
+def test_bypassed_provider_is_never_cached(
+    mocker: MockerFixture, client: TestClient, response_cache: SuggestResponseCache
+) -> None:
+    """Requests searching a bypassed provider always query the providers."""
+    report = mocker.patch.object(aiodogstatsd.Client, "_report")
+
+    for _ in range(2):
+        client.get("/api/v1/suggest?q=sponsored&providers=sponsored,weather")
+
+    assert len(response_cache) == 0
+    assert _cache_outcomes(report) == ["bypass", "bypass"]
+
+
+@pytest.mark.parametrize("provider", ["corrupted", "timedout-sponsored"])
+def test_incomplete_response_is_never_cached(
+    mocker: MockerFixture,
+    client: TestClient,
+    response_cache: SuggestResponseCache,
+    provider: str,
+) -> None:
+    """Responses missing the results of a provider that failed or timed out aren't cached,
+    so the next request queries the providers again.
+    """
+    query = mocker.spy(FakeProvider, "query")
+
+    for _ in range(2):
+        response = client.get(f"/api/v1/suggest?q=sponsored&providers=sponsored,{provider}")
+        assert response.status_code == 200
+
+    assert query.call_count == 4
+    assert len(response_cache) == 0
+
+
+def test_response_with_shed_provider_is_never_cached(
+    mocker: MockerFixture, client: TestClient, response_cache: SuggestResponseCache
+) -> None:
+    """Responses missing the results of a provider shed by admission control aren't cached."""
+    admission = AdmissionControllers(
+        max_concurrency={"corrupted": 1},
+        min_concurrency=1,
+        decrease_ratio=0.5,
+        latency_target_ratio=0.8,
+    )
+    mocker.patch("merino.web.api_v1._ADMISSION", admission)
+    controller = admission.get("corrupted", query_timeout_sec=1.0)
+    assert controller is not None
+    # Hold the only slot, as a concurrent request still waiting on the provider would.
+    assert controller.try_acquire()
+
+    response = client.get("/api/v1/suggest?q=sponsored&providers=sponsored,corrupted")
+
+    assert response.status_code == 200
+    assert len(response_cache) == 0
@@ -13,7 +13,7 @@ from merino.jobs.navigational_suggestions.scrapers.web_scraper import WebScraper
 
 @pytest.fixture
 def mock_scraper_context():
-    """Fixture that provides a mock WebScraper context manager.
+    """Fixture that provides a mock WebScraper async context manager.
 
     Returns a tuple containing:
     1. The mock WebScraper class to patch with
@@ -26,10 +26,10 @@ def mock_scraper_context():
 
     # Create a context manager mock that will return our shared scraper
     class MockScraperContextManager:
-        def __enter__(self):
+        async def __aenter__(self):
             return shared_scraper
 
-        def __exit__(self, exc_type, exc_val, exc_tb):
+        async def __aexit__(self, exc_type, exc_val, exc_tb):
             return False
 
     # Create a mock class for WebScraper that returns our context manager
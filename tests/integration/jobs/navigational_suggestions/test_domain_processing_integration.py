@@ -8,6 +8,7 @@ import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 from bs4 import BeautifulSoup
 
+from merino.jobs.navigational_suggestions.models import ScrapedPage
 from merino.jobs.navigational_suggestions.processing.domain_processor import DomainProcessor
 from merino.jobs.navigational_suggestions.scrapers.web_scraper import WebScraper
 from merino.jobs.navigational_suggestions.scrapers.favicon_scraper import FaviconScraper
@@ -344,31 +345,29 @@ class TestDomainProcessorWebScrapingIntegration:
 
         # Create a mock scraper instance
         mock_scraper = MagicMock()
-        mock_scraper.open.return_value = "https://example.com"
-        mock_scraper.page = BeautifulSoup(
-            "<html><head><title>Example</title></head></html>", "html.parser"
-        )
+        mock_scraper.open = AsyncMock(return_value="https://example.com")
+        mock_scraper.page = ScrapedPage(title="Example")
         mock_scraper.scrape_title.return_value = "Example"
 
-        with patch.object(WebScraper, "__enter__", return_value=mock_scraper):
-            with patch.object(WebScraper, "__exit__", return_value=False):
+        with patch.object(WebScraper, "__aenter__", return_value=mock_scraper):
+            with patch.object(WebScraper, "__aexit__", return_value=False):
                 # Simulate context usage
-                with WebScraper() as scraper:
+                async with WebScraper() as scraper:
                     # Set in context variable (as would happen in real processing)
                     current_web_scraper.set(scraper)
 
                     # Verify context variable works
                     retrieved_scraper = current_web_scraper.get()
-                    # The scraper should be the mock instance returned by __enter__
+                    # The scraper should be the mock instance returned by __aenter__
                     assert retrieved_scraper == scraper
 
                     # Test basic scraping operations
-                    url = scraper.open("https://example.com")
+                    url = await scraper.open("https://example.com")
                     title = scraper.scrape_title()
 
                     assert url == "https://example.com"
                     assert title == "Example"
-                    assert scraper.page.title.string == "Example"
+                    assert scraper.page.title == "Example"
 
     @pytest.mark.asyncio
     async def test_favicon_extractor_integration(self):
@@ -823,8 +822,8 @@ class TestDomainProcessorMethodIntegration:
         ) as MockWebScraper:
             with patch.object(processor, "_extract_and_process_favicon") as mock_favicon_extract:
                 with patch.object(processor, "_extract_title") as mock_extract_title:
-                    mock_web_scraper = MockWebScraper.return_value.__enter__.return_value
-                    mock_web_scraper.open.return_value = "https://example.com/page"
+                    mock_web_scraper = MockWebScraper.return_value.__aenter__.return_value
+                    mock_web_scraper.open = AsyncMock(return_value="https://example.com/page")
                     mock_web_scraper.is_bot_blocked.return_value = False
 
                     mock_favicon_extract.return_value = (
@@ -860,8 +859,10 @@ class TestDomainProcessorMethodIntegration:
         ) as MockWebScraper:
             with patch.object(processor, "_extract_and_process_favicon") as mock_favicon_extract:
                 with patch.object(processor, "_extract_title") as mock_extract_title:
-                    mock_web_scraper = MockWebScraper.return_value.__enter__.return_value
-                    mock_web_scraper.open.side_effect = [None, "https://www.example.com/page"]
+                    mock_web_scraper = MockWebScraper.return_value.__aenter__.return_value
+                    mock_web_scraper.open = AsyncMock(
+                        side_effect=[None, "https://www.example.com/page"]
+                    )
                     mock_web_scraper.is_bot_blocked.return_value = False
 
                     mock_favicon_extract.return_value = (
@@ -898,8 +899,8 @@ class TestDomainProcessorMethodIntegration:
         with patch(
             "merino.jobs.navigational_suggestions.processing.domain_processor.WebScraper"
         ) as MockWebScraper:
-            mock_web_scraper = MockWebScraper.return_value.__enter__.return_value
-            mock_web_scraper.open.return_value = None
+            mock_web_scraper = MockWebScraper.return_value.__aenter__.return_value
+            mock_web_scraper.open = AsyncMock(return_value=None)
 
             result = await processor._try_scraping(
                 "failed-domain.com", "failed-domain", 32, mock_uploader
@@ -928,12 +929,12 @@ class TestDomainProcessorMethodIntegration:
         )
 
         # Mock exception during scraping
-        mock_web_scraper.open.side_effect = Exception("Network error")
+        mock_web_scraper.open = AsyncMock(side_effect=Exception("Network error"))
 
         with patch(
             "merino.jobs.navigational_suggestions.processing.domain_processor.WebScraper"
         ) as MockWebScraper:
-            MockWebScraper.return_value.__enter__.return_value = mock_web_scraper
+            MockWebScraper.return_value.__aenter__.return_value = mock_web_scraper
 
             result = await processor._try_scraping(
                 "error-domain.com", "error-domain", 32, mock_uploader
@@ -0,0 +1,244 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""Run an offline load test: start the upstream fakes and Merino, replay the query and
+IP data at a fixed rate, and write a JSON report.
+
+Run from the repository root with `make load-tests-offline`, or:
+
+    uv run python -m tests.load.offline --rate 100 --duration 60 --report report.json
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import random
+import socket
+import subprocess  # nosec
+import sys
+import time
+from contextlib import ExitStack, closing
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+from tests.load.offline import fakes
+from tests.load.offline.load import (
+    Budgets,
+    build_report,
+    build_scenarios,
+    read_ip_ranges,
+    read_queries,
+    run_load,
+)
+
+HOST = "127.0.0.1"
+DEFAULT_LATENCY = "lognormal:30:0.5"
+
+
+def _per_upstream(values: list[str], default: str, option: str) -> dict[str, str]:
+    """Resolve `NAME=VALUE` or `VALUE` (for all upstreams) options, by upstream."""
+    resolved = dict.fromkeys(fakes.UPSTREAMS, default)
+    for value in values:
+        name, _, spec = value.rpartition("=")
+        if name and name not in fakes.UPSTREAMS:
+            raise ValueError(f"{option}: unknown upstream {name!r}")
+        for upstream in [name] if name else list(fakes.UPSTREAMS):
+            resolved[upstream] = spec
+    return resolved
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse the command line."""
+    parser = argparse.ArgumentParser(prog="python -m tests.load.offline", description=__doc__)
+    load = parser.add_argument_group("load")
+    load.add_argument("--rate", type=float, default=50.0, help="Requests per second")
+    load.add_argument("--duration", type=float, default=60.0, help="Measured seconds")
+    load.add_argument(
+        "--warmup", type=float, default=10.0, help="Seconds of unmeasured load beforehand"
+    )
+    load.add_argument("--connections", type=int, default=100, help="Max open connections")
+    load.add_argument("--timeout", type=float, default=5.0, help="Request timeout in seconds")
+    load.add_argument("--seed", type=int, default=0, help="Seed of the random generators")
+    load.add_argument(
+        "--startup-timeout", type=float, default=60.0, help="Seconds to wait for Merino"
+    )
+    upstreams = parser.add_argument_group("upstreams")
+    upstreams.add_argument(
+        "--latency",
+        action="append",
+        default=[],
+        metavar="[UPSTREAM=]SPEC",
+        help=(
+            "Latency distribution of an upstream, or of all: constant:MS, "
+            f"uniform:LOW_MS:HIGH_MS or lognormal:MEDIAN_MS:SIGMA (default: {DEFAULT_LATENCY})"
+        ),
+    )
+    upstreams.add_argument(
+        "--error-rate",
+        action="append",
+        default=[],
+        metavar="[UPSTREAM=]RATE",
+        help="Share of the requests of an upstream, or of all, failing with a 503",
+    )
+    upstreams.add_argument(
+        "--redis",
+        metavar="URL",
+        help="A local Redis to cache upstream responses in, they aren't cached by default",
+    )
+    report = parser.add_argument_group("report")
+    report.add_argument("--report", type=Path, default=Path("load-report.json"))
+    report.add_argument(
+        "--max-error-rate", type=float, default=0.01, help="Error budget, per scenario"
+    )
+    report.add_argument("--p99-budget-ms", type=float, help="p99 latency budget, per scenario")
+    args = parser.parse_args(argv)
+
+    try:
+        args.latency = _per_upstream(args.latency, DEFAULT_LATENCY, "--latency")
+        args.error_rate = _per_upstream(args.error_rate, "0", "--error-rate")
+        args.behaviors = {
+            name: fakes.UpstreamBehavior(
+                fakes.parse_latency(args.latency[name]), float(args.error_rate[name])
+            )
+            for name in fakes.UPSTREAMS
+        }
+    except ValueError as error:
+        parser.error(str(error))
+    return args
+
+
+def merino_environment(urls: dict[str, str], redis_url: str | None) -> dict[str, str]:
+    """Return the environment of a Merino process using the fakes."""
+    cache = "redis" if redis_url else "none"
+    environment = {
+        "MERINO_ENV": "development",
+        "MERINO_LOGGING__LEVEL": "WARNING",
+        "MERINO_LOGGING__FORMAT": "mozlog",
+        "MERINO_METRICS__DEV_LOGGER": "false",
+        "MERINO_RUNTIME__DISABLED_PROVIDERS": '["amo", "sports"]',
+        "MERINO_MARS__BASE_URL": f"{urls['mars']}/v1/suggest/",
+        "MERINO_ACCUWEATHER__URL_BASE": urls["accuweather"],
+        "MERINO_ACCUWEATHER__API_KEY": "offline",
+        "MERINO_POLYGON__URL_BASE": urls["polygon"],
+        "MERINO_POLYGON__API_KEY": "offline",
+        "MERINO_FLIGHTAWARE__BASE_URL": f"{urls['aeroapi']}/aeroapi/",
+        "MERINO_FLIGHTAWARE__API_KEY": "offline",
+        "MERINO_YELP__URL_BASE": f"{urls['yelp']}/v3",
+        "MERINO_YELP__API_KEY": "offline",
+        "MERINO_PROVIDERS__WIKIPEDIA__BACKEND": "elasticsearch",
+        "MERINO_PROVIDERS__WIKIPEDIA__ES_URL": urls["elasticsearch"],
+        "MERINO_PROVIDERS__WIKIPEDIA__ES_API_KEY": "offline",
+        "MERINO_PROVIDERS__ACCUWEATHER__CACHE": cache,
+        "MERINO_PROVIDERS__POLYGON__CACHE": cache,
+        "MERINO_PROVIDERS__FLIGHTAWARE__CACHE": cache,
+        "MERINO_PROVIDERS__YELP__CACHE": cache,
+    }
+    if redis_url:
+        environment |= {"MERINO_REDIS__SERVER": redis_url, "MERINO_REDIS__REPLICA": redis_url}
+    return environment
+
+
+def start_merino(stack: ExitStack, environment: dict[str, str], timeout_sec: float) -> str:
+    """Start Merino on a free local port, stopped with the exit stack, and wait for it to
+    serve requests.
+    """
+    with closing(socket.socket()) as sock:
+        sock.bind((HOST, 0))
+        port = sock.getsockname()[1]
+    process = subprocess.Popen(  # nosec
+        [sys.executable, "-m", "uvicorn", "merino.main:app"]
+        + ["--host", HOST, "--port", str(port), "--no-access-log", "--log-level", "warning"],
+        env=os.environ | environment,
+    )
+    stack.callback(process.wait)
+    stack.callback(process.terminate)
+    url = f"http://{HOST}:{port}"
+    deadline = time.monotonic() + timeout_sec
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise SystemExit(f"Merino exited with status {process.returncode} on startup")
+        try:
+            if httpx.get(f"{url}/__lbheartbeat__", timeout=1.0).is_success:
+                return url
+        except httpx.TransportError:
+            pass
+        time.sleep(0.5)
+    raise SystemExit(f"Merino didn't start within {timeout_sec}s")
+
+
+async def load(args: argparse.Namespace, url: str, adm_keywords: list[str]) -> dict[str, Any]:
+    """Warm Merino up, then load it and report on the measured part."""
+    scenarios = build_scenarios(read_queries(), adm_keywords, read_ip_ranges())
+    rng = random.Random(args.seed)
+    async with httpx.AsyncClient(
+        base_url=url,
+        limits=httpx.Limits(max_connections=args.connections),
+        timeout=args.timeout,
+    ) as client:
+        if args.warmup > 0:
+            await run_load(client, scenarios, args.rate, args.warmup, rng)
+        samples = await run_load(client, scenarios, args.rate, args.duration, rng)
+    config = {
+        "rate": args.rate,
+        "duration_sec": args.duration,
+        "warmup_sec": args.warmup,
+        "seed": args.seed,
+        "redis": args.redis is not None,
+        "upstreams": {
+            name: {"latency": args.latency[name], "error_rate": behavior.error_rate}
+            for name, behavior in args.behaviors.items()
+        },
+    }
+    return build_report(
+        samples, args.duration, Budgets(args.max_error_rate, args.p99_budget_ms), config
+    )
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the load test, returning 1 if it doesn't meet its budgets."""
+    args = parse_args(argv)
+    domains = fakes.read_domains()
+    adm_keywords = [
+        keyword for record in fakes.amp_records(domains, "") for keyword in record["keywords"]
+    ]
+
+    with ExitStack() as stack:
+        sockets = {}
+        for name in fakes.UPSTREAMS:
+            sock = stack.enter_context(socket.socket())
+            sock.bind((HOST, 0))
+            # Queue the connections made before the fakes are served.
+            sock.listen()
+            sockets[name] = sock
+        upstreams = multiprocessing.Process(
+            target=fakes.run, args=(sockets, args.behaviors, args.seed), daemon=True
+        )
+        upstreams.start()
+        stack.callback(upstreams.kill)
+
+        environment = merino_environment(
+            {name: fakes.base_url(sock) for name, sock in sockets.items()}, args.redis
+        )
+        url = start_merino(stack, environment, args.startup_timeout)
+
+        report = asyncio.run(load(args, url, adm_keywords))
+
+    args.report.write_text(json.dumps(report, indent=2))
+    for name, summary in report["scenarios"].items():
+        latency = summary["latency_ms"]
+        print(
+            f"{name:<12} {summary['throughput_rps']:>8.1f} rps"
+            f"  p50 {latency['p50']:>8.1f} ms  p95 {latency['p95']:>8.1f} ms"
+            f"  p99 {latency['p99']:>8.1f} ms  errors {summary['error_rate']:>7.2%}"
+        )
+    print(f"{'PASSED' if report['passed'] else 'FAILED'}, report written to {args.report}")
+    return 0 if report["passed"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
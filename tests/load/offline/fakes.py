@@ -0,0 +1,486 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""Fakes of Merino's HTTP upstreams: MARS, AccuWeather, Polygon, AeroAPI, Yelp and
+Elasticsearch.
+
+Each fake serves the routes Merino calls with canned but well formed responses, after a
+delay drawn from a configurable latency distribution, and fails a configurable share of
+requests with a 503. All the fakes run in one process, on one event loop.
+"""
+
+import asyncio
+import datetime
+import hashlib
+import json
+import math
+import random
+import socket
+from collections.abc import Callable
+from dataclasses import dataclass
+from email.utils import format_datetime
+from pathlib import Path
+from typing import Any, Protocol
+
+import uvicorn
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
+from starlette.routing import Route
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+TOP_PICKS_FILE_PATH = Path("dev/top_picks.json")
+
+MARS_ETAG = '"offline-v1"'
+ELASTIC_HEADERS = {"X-Elastic-Product": "Elasticsearch"}
+
+
+class Latency(Protocol):
+    """A distribution of upstream response latencies."""
+
+    def sample(self, rng: random.Random) -> float:
+        """Return a latency, in seconds."""
+        ...
+
+
+@dataclass(frozen=True)
+class ConstantLatency:
+    """The same latency for every response."""
+
+    ms: float
+
+    def sample(self, rng: random.Random) -> float:
+        """Return the constant latency, in seconds."""
+        return self.ms / 1000
+
+
+@dataclass(frozen=True)
+class UniformLatency:
+    """Latencies spread evenly between a low and a high bound."""
+
+    low_ms: float
+    high_ms: float
+
+    def sample(self, rng: random.Random) -> float:
+        """Return a latency between the bounds, in seconds."""
+        return rng.uniform(self.low_ms, self.high_ms) / 1000
+
+
+@dataclass(frozen=True)
+class LogNormalLatency:
+    """Log-normally distributed latencies, the usual shape of network services: most
+    responses are close to the median, with a long tail of slow ones.
+    """
+
+    median_ms: float
+    sigma: float
+
+    def sample(self, rng: random.Random) -> float:
+        """Return a latency from the distribution, in seconds."""
+        return rng.lognormvariate(math.log(self.median_ms), self.sigma) / 1000
+
+
+def parse_latency(spec: str) -> Latency:
+    """Parse a latency distribution from its spec, one of `constant:MS`,
+    `uniform:LOW_MS:HIGH_MS` or `lognormal:MEDIAN_MS:SIGMA`.
+
+    Raises:
+        ValueError: If the spec is invalid.
+    """
+    kind, *raw_params = spec.split(":")
+    try:
+        params = [float(param) for param in raw_params]
+        match kind, params:
+            case "constant", [ms] if ms >= 0:
+                return ConstantLatency(ms)
+            case "uniform", [low_ms, high_ms] if 0 <= low_ms <= high_ms:
+                return UniformLatency(low_ms, high_ms)
+            case "lognormal", [median_ms, sigma] if median_ms > 0 and sigma >= 0:
+                return LogNormalLatency(median_ms, sigma)
+    except ValueError:
+        pass
+    raise ValueError(f"Invalid latency distribution: {spec!r}")
+
+
+@dataclass(frozen=True)
+class UpstreamBehavior:
+    """How a fake upstream responds: after a delay, and sometimes with an error."""
+
+    latency: Latency
+    error_rate: float = 0.0
+
+
+class UpstreamBehaviorMiddleware:
+    """Delay every response of a fake, and fail some of them with a 503."""
+
+    def __init__(self, app: ASGIApp, behavior: UpstreamBehavior, rng: random.Random) -> None:
+        self.app = app
+        self.behavior = behavior
+        self.rng = rng
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Apply the behavior to HTTP requests."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        await asyncio.sleep(self.behavior.latency.sample(self.rng))
+        if self.rng.random() < self.behavior.error_rate:
+            await Response(status_code=503)(scope, receive, send)
+            return
+        await self.app(scope, receive, send)
+
+
+def _stable_int(value: str, modulo: int) -> int:
+    """Return an integer derived from a value, stable across processes."""
+    return int(hashlib.sha1(value.encode(), usedforsecurity=False).hexdigest(), 16) % modulo
+
+
+def _expires(hours: int = 1) -> str:
+    """Return an HTTP `Expires` header value, some hours from now."""
+    now = datetime.datetime.now(datetime.timezone.utc)
+    return format_datetime(now + datetime.timedelta(hours=hours), usegmt=True)
+
+
+def read_domains() -> list[dict[str, Any]]:
+    """Return the Top Picks domains of the dev setup, the source of the fake AMP data."""
+    return list(json.loads(TOP_PICKS_FILE_PATH.read_text())["domains"])
+
+
+def amp_records(domains: list[dict[str, Any]], icon_url_base: str) -> list[dict[str, Any]]:
+    """Return an AMP suggestion per domain, matching every prefix of the domain name."""
+    return [
+        {
+            "id": domain["rank"],
+            "advertiser": domain["title"],
+            "click_url": f"{domain['url']}/click",
+            "impression_url": f"{domain['url']}/impression",
+            "full_keywords": [[domain["domain"], len(domain["domain"]) - 1]],
+            "iab_category": "22 - Shopping" if domain["rank"] % 2 else "5 - Education",
+            "icon": f"{icon_url_base}/icons/{domain['rank']}.png",
+            "serp_categories": domain["serp_categories"],
+            "keywords": [domain["domain"][:end] for end in range(2, len(domain["domain"]) + 1)],
+            "title": domain["title"],
+            "url": domain["url"],
+            "header_text": f"{domain['title']} header text",
+            "suggestion_id": f"{domain['rank']:08d}-0000-0000-0000-000000000000",
+        }
+        for domain in domains
+        if len(domain["domain"]) > 2
+    ]
+
+
+def mars_app(records: list[dict[str, Any]]) -> Starlette:
+    """Return a fake of the MARS suggestion data API.
+
+    Every segment gets the same suggestions. Icons are not served, so that Merino keeps
+    their original URLs instead of uploading them to GCS.
+    """
+    body = json.dumps({"suggestions": records}).encode()
+
+    async def data(request: Request) -> Response:
+        if request.headers.get("If-None-Match") == MARS_ETAG:
+            return Response(status_code=304)
+        return Response(body, media_type="application/json", headers={"ETag": MARS_ETAG})
+
+    async def icon(request: Request) -> Response:
+        return Response(status_code=404)
+
+    return Starlette(
+        routes=[
+            Route("/v1/suggest/data", data),
+            Route("/icons/{name}", icon),
+        ]
+    )
+
+
+def accuweather_app() -> Starlette:
+    """Return a fake of the AccuWeather locations, current conditions and forecasts APIs.
+
+    Any city is found, with a location key derived from its name.
+    """
+
+    def location(request: Request) -> dict[str, Any]:
+        country = request.path_params["country_code"]
+        admin_code = request.path_params.get("admin_code", "XX")
+        city = request.query_params.get("q", "Springfield")
+        return {
+            "Key": str(_stable_int(f"{country}/{admin_code}/{city}", 10**6)),
+            "Rank": 15,
+            "Type": "City",
+            "LocalizedName": city,
+            "Country": {"ID": country, "LocalizedName": country},
+            "AdministrativeArea": {"ID": admin_code, "LocalizedName": admin_code},
+        }
+
+    async def search(request: Request) -> Response:
+        return JSONResponse([location(request)], headers={"Expires": _expires(24)})
+
+    async def autocomplete(request: Request) -> Response:
+        return JSONResponse([location(request)], headers={"Expires": _expires(24)})
+
+    async def current_conditions(request: Request) -> Response:
+        key = request.path_params["location_key"]
+        return JSONResponse(
+            [
+                {
+                    "Link": f"https://www.accuweather.com/en/current-weather/{key}",
+                    "WeatherText": "Mostly sunny",
+                    "WeatherIcon": 2,
+                    "Temperature": {"Metric": {"Value": 20.5}, "Imperial": {"Value": 69.0}},
+                }
+            ],
+            headers={"Expires": _expires()},
+        )
+
+    async def daily_forecast(request: Request) -> Response:
+        key = request.path_params["location_key"]
+        return JSONResponse(
+            {
+                "Headline": {
+                    "Text": "Pleasant this weekend",
+                    "Link": f"https://www.accuweather.com/en/weather-forecast/{key}",
+                },
+                "DailyForecasts": [
+                    {
+                        "Temperature": {
+                            "Maximum": {"Value": 75.0, "Unit": "F"},
+                            "Minimum": {"Value": 55.0, "Unit": "F"},
+                        }
+                    }
+                ],
+            },
+            headers={"Expires": _expires()},
+        )
+
+    async def hourly_forecast(request: Request) -> Response:
+        key = request.path_params["location_key"]
+        now = datetime.datetime.now(datetime.timezone.utc).replace(minute=0, second=0)
+        hours = [now + datetime.timedelta(hours=hour) for hour in range(1, 13)]
+        return JSONResponse(
+            [
+                {
+                    "DateTime": hour.isoformat(),
+                    "EpochDateTime": int(hour.timestamp()),
+                    "WeatherIcon": 2,
+                    "IconPhrase": "Mostly sunny",
+                    "Temperature": {"Value": 70.0, "Unit": "F"},
+                    "Link": f"https://www.accuweather.com/en/hourly-weather-forecast/{key}",
+                }
+                for hour in hours
+            ],
+            headers={"Expires": _expires()},
+        )
+
+    return Starlette(
+        routes=[
+            Route("/locations/v1/cities/{country_code}/autocomplete.json", autocomplete),
+            Route("/locations/v1/cities/{country_code}/search.json", search),
+            Route("/locations/v1/cities/{country_code}/{admin_code}/search.json", search),
+            Route("/currentconditions/v1/{location_key}.json", current_conditions),
+            Route("/forecasts/v1/daily/1day/{location_key}.json", daily_forecast),
+            Route("/forecasts/v1/hourly/12hour/{location_key}.json", hourly_forecast),
+        ]
+    )
+
+
+def polygon_app() -> Starlette:
+    """Return a fake of the Polygon ticker snapshot and overview APIs."""
+
+    async def snapshot(request: Request) -> Response:
+        ticker = request.query_params.get("ticker", "")
+        return JSONResponse(
+            {
+                "results": [
+                    {
+                        "ticker": ticker,
+                        "market_status": "open",
+                        "session": {
+                            "price": 100 + _stable_int(ticker, 400),
+                            "change_percent": _stable_int(ticker, 600) / 100 - 3,
+                        },
+                    }
+                ],
+                "status": "OK",
+            }
+        )
+
+    async def overview(request: Request) -> Response:
+        return JSONResponse({"results": {"ticker": request.path_params["ticker"]}})
+
+    return Starlette(
+        routes=[
+            Route("/v3/snapshot", snapshot),
+            Route("/v3/reference/tickers/{ticker}", overview),
+        ]
+    )
+
+
+def aeroapi_app() -> Starlette:
+    """Return a fake of the AeroAPI flights API, with one flight en route per ident."""
+
+    def timestamp(delta: datetime.timedelta) -> str:
+        now = datetime.datetime.now(datetime.timezone.utc).replace(microsecond=0)
+        return (now + delta).isoformat().replace("+00:00", "Z")
+
+    async def flights(request: Request) -> Response:
+        ident = request.path_params["ident"]
+        return JSONResponse(
+            {
+                "flights": [
+                    {
+                        "ident_icao": ident,
+                        "ident_iata": ident,
+                        "codeshares": [],
+                        "codeshares_iata": [],
+                        "origin": {
+                            "code_iata": "SFO",
+                            "city": "San Francisco",
+                            "timezone": "America/Los_Angeles",
+                        },
+                        "destination": {
+                            "code_iata": "JFK",
+                            "city": "New York",
+                            "timezone": "America/New_York",
+                        },
+                        "scheduled_out": timestamp(datetime.timedelta(hours=-2)),
+                        "estimated_out": timestamp(datetime.timedelta(hours=-2)),
+                        "actual_out": timestamp(datetime.timedelta(hours=-2)),
+                        "scheduled_in": timestamp(datetime.timedelta(hours=3)),
+                        "estimated_in": timestamp(datetime.timedelta(hours=3)),
+                        "progress_percent": 40,
+                        "departure_delay": 0,
+                        "cancelled": False,
+                    }
+                ],
+                "links": None,
+                "num_pages": 1,
+            }
+        )
+
+    return Starlette(routes=[Route("/aeroapi/flights/{ident}", flights)])
+
+
+def yelp_app() -> Starlette:
+    """Return a fake of the Yelp business search API, with a business open all week."""
+
+    async def search(request: Request) -> Response:
+        term = request.query_params.get("term", "")
+        city = request.query_params.get("location", "")
+        return JSONResponse(
+            {
+                "businesses": [
+                    {
+                        "name": f"The {term.title()} Place",
+                        "url": f"https://www.yelp.com/biz/{_stable_int(term + city, 10**6)}",
+                        "location": {"address1": "1 Main St", "city": city},
+                        "business_hours": [
+                            {
+                                "open": [
+                                    {"day": day, "start": "0000", "end": "0000"}
+                                    for day in range(7)
+                                ]
+                            }
+                        ],
+                        "price": "$$",
+                        "rating": 4.5,
+                        "review_count": 120,
+                    }
+                ]
+            }
+        )
+
+    return Starlette(routes=[Route("/v3/businesses/search", search)])
+
+
+def elasticsearch_app() -> Starlette:
+    """Return a stub of the Elasticsearch search API, completing any prefix with a few
+    Wikipedia titles.
+    """
+
+    async def info(request: Request) -> Response:
+        return JSONResponse(
+            {"name": "offline", "version": {"number": "8.19.0"}}, headers=ELASTIC_HEADERS
+        )
+
+    async def search(request: Request) -> Response:
+        body = await request.json()
+        suggest: dict[str, Any] = body.get("suggest", {})
+        completions = {
+            name: [
+                {
+                    "text": query["prefix"],
+                    "offset": 0,
+                    "length": len(query["prefix"]),
+                    "options": [
+                        {
+                            "text": f"{query['prefix']} {suffix}",
+                            "_index": request.path_params["index"],
+                            "_id": str(_stable_int(query["prefix"] + suffix, 10**9)),
+                            "_score": 1.0,
+                            "_source": {"title": f"{query['prefix'].title()} {suffix}"},
+                        }
+                        for suffix in ("(disambiguation)", "(film)", "(band)")
+                    ][: query.get("completion", {}).get("size", 3)],
+                }
+            ]
+            for name, query in suggest.items()
+        }
+        return JSONResponse(
+            {
+                "took": 1,
+                "timed_out": False,
+                "_shards": {"total": 1, "successful": 1, "skipped": 0, "failed": 0},
+                "hits": {"total": {"value": 0, "relation": "eq"}, "max_score": None, "hits": []},
+                "suggest": completions,
+            },
+            headers=ELASTIC_HEADERS,
+        )
+
+    return Starlette(
+        routes=[
+            Route("/", info),
+            Route("/{index}/_search", search, methods=["GET", "POST"]),
+        ]
+    )
+
+
+# The fakes, by the name of the upstream they stand in for. They are built with the base
+# URL they are served at.
+UPSTREAMS: dict[str, Callable[[str], Starlette]] = {
+    "mars": lambda base_url: mars_app(amp_records(read_domains(), base_url)),
+    "accuweather": lambda _: accuweather_app(),
+    "polygon": lambda _: polygon_app(),
+    "aeroapi": lambda _: aeroapi_app(),
+    "yelp": lambda _: yelp_app(),
+    "elasticsearch": lambda _: elasticsearch_app(),
+}
+
+
+def base_url(sock: socket.socket) -> str:
+    """Return the base URL of a fake served on a bound socket."""
+    host, port = sock.getsockname()[:2]
+    return f"http://{host}:{port}"
+
+
+async def serve(
+    sockets: dict[str, socket.socket], behaviors: dict[str, UpstreamBehavior], seed: int
+) -> None:
+    """Serve the fakes on their bound sockets until cancelled."""
+    servers = []
+    for name, sock in sockets.items():
+        app = UpstreamBehaviorMiddleware(
+            UPSTREAMS[name](base_url(sock)), behaviors[name], random.Random(f"{seed}/{name}")
+        )
+        config = uvicorn.Config(app, log_level="warning", access_log=False, lifespan="off")
+        servers.append(uvicorn.Server(config))
+    async with asyncio.TaskGroup() as task_group:
+        for server, sock in zip(servers, sockets.values()):
+            task_group.create_task(server.serve(sockets=[sock]))
+
+
+def run(
+    sockets: dict[str, socket.socket], behaviors: dict[str, UpstreamBehavior], seed: int
+) -> None:
+    """Serve the fakes, the entry point of the fakes process."""
+    asyncio.run(serve(sockets, behaviors, seed))
@@ -0,0 +1,263 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""An open-loop load generator for the suggest API, and its report.
+
+Requests are sent at a fixed mean rate with exponentially distributed gaps (a Poisson
+process), whether or not earlier requests have completed. Latencies are measured from the
+time a request was scheduled, not sent, so that a stalled server can't hide its queueing
+delay by slowing the load generator down (coordinated omission).
+"""
+
+import asyncio
+import csv
+import gzip
+import ipaddress
+import random
+import statistics
+import time
+from collections import defaultdict
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+from tests.load.common.client_info import DESKTOP_FIREFOX, LOCALES
+
+SUGGEST_API: str = "/api/v1/suggest"
+
+QUERIES_PATH = Path("tests/benchmarks/data/queries.txt")
+
+# IP RANGE CSV FILES (GZIP)
+# This test framework uses IP2Location LITE data available from
+# https://lite.ip2location.com
+IP_RANGE_FILES: list[Path] = [
+    Path("tests/load/data/ip2location_canada_ip_address_ranges.gz"),
+    Path("tests/load/data/ip2location_united_states_of_america_ip_address_ranges.gz"),
+]
+
+# An address located in Milton, WA by the test GeoIP database of the dev setup. The
+# addresses of the IP ranges aren't in it, and Yelp needs the time zone of a located city.
+LOCATED_IP: str = "216.160.83.56"
+
+# Cities sent explicitly with weather requests, as (country, region, city).
+CITIES: list[tuple[str, str, str]] = [
+    ("US", "CA", "San Francisco"),
+    ("US", "NY", "New York"),
+    ("US", "WA", "Seattle"),
+    ("CA", "ON", "Toronto"),
+    ("CA", "BC", "Vancouver"),
+]
+
+STOCK_QUERIES: list[str] = ["aapl", "msft stock", "nvda", "tsla stock", "amzn", "googl stock"]
+FLIGHT_QUERIES: list[str] = ["ua 123", "aa100", "dl 2345", "ac 100", "ba 286"]
+YELP_QUERIES: list[str] = ["coffeeshops near me", "ramen", "gelato nearby", "pancakes"]
+
+RequestFactory = Callable[[random.Random], tuple[dict[str, str], dict[str, str]]]
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """A kind of suggest request, picked in proportion to its weight.
+
+    Attributes:
+        name: The name of the scenario in the report.
+        weight: The relative frequency of the scenario.
+        make_request: Return the query parameters and headers of a request.
+    """
+
+    name: str
+    weight: float
+    make_request: RequestFactory
+
+
+@dataclass(frozen=True)
+class Sample:
+    """The outcome of a request: its status code, 0 for a transport error, and latency."""
+
+    scenario: str
+    status: int
+    latency_sec: float
+
+
+@dataclass(frozen=True)
+class Budgets:
+    """The error and latency budgets a run passes or fails on.
+
+    Attributes:
+        max_error_rate: The share of failed requests allowed, per scenario.
+        p99_ms: The 99th percentile latency allowed, per scenario, if any.
+    """
+
+    max_error_rate: float
+    p99_ms: float | None = None
+
+
+def read_queries(path: Path = QUERIES_PATH) -> list[str]:
+    """Return the query corpus, as typed: every prefix of every recorded query, since
+    Firefox sends a suggest request per keystroke.
+    """
+    queries = [line for line in path.read_text().splitlines() if line.strip()]
+    return [query[:end] for query in queries for end in range(1, len(query) + 1)]
+
+
+def read_ip_ranges(paths: Iterable[Path] = IP_RANGE_FILES) -> list[tuple[int, int]]:
+    """Return the IP address ranges of the gzip CSV files, as pairs of integers."""
+    ranges: list[tuple[int, int]] = []
+    for path in paths:
+        with gzip.open(path, mode="rt") as csv_file:
+            for row in csv.DictReader(csv_file, delimiter=","):
+                ranges.append(
+                    (
+                        int(ipaddress.IPv4Address(row["Begin IP Address"])),
+                        int(ipaddress.IPv4Address(row["End IP Address"])),
+                    )
+                )
+    return ranges
+
+
+def _headers(rng: random.Random, ip: str) -> dict[str, str]:
+    return {
+        "Accept-Language": rng.choice(LOCALES),
+        "User-Agent": rng.choice(DESKTOP_FIREFOX),
+        "X-Forwarded-For": ip,
+    }
+
+
+def build_scenarios(
+    queries: list[str], adm_keywords: list[str], ip_ranges: list[tuple[int, int]]
+) -> list[Scenario]:
+    """Return the scenarios of the load, weighted roughly like the production traffic
+    modelled by the Locust tests.
+    """
+
+    def random_ip(rng: random.Random) -> str:
+        return str(ipaddress.IPv4Address(rng.randint(*rng.choice(ip_ranges))))
+
+    def default_providers(rng: random.Random) -> tuple[dict[str, str], dict[str, str]]:
+        return {"q": rng.choice(queries)}, _headers(rng, random_ip(rng))
+
+    def adm(rng: random.Random) -> tuple[dict[str, str], dict[str, str]]:
+        return {"q": rng.choice(adm_keywords), "providers": "adm"}, _headers(rng, random_ip(rng))
+
+    def wikipedia(rng: random.Random) -> tuple[dict[str, str], dict[str, str]]:
+        params = {"q": rng.choice(queries), "providers": "wikipedia"}
+        return params, _headers(rng, random_ip(rng))
+
+    def weather(rng: random.Random) -> tuple[dict[str, str], dict[str, str]]:
+        # Like Firefox, which matches weather keywords locally and sends an empty query.
+        params = {"q": "", "providers": "accuweather"}
+        if rng.random() < 0.5:
+            country, region, city = rng.choice(CITIES)
+            params |= {"country": country, "region": region, "city": city}
+        return params, _headers(rng, random_ip(rng))
+
+    def stocks(rng: random.Random) -> tuple[dict[str, str], dict[str, str]]:
+        params = {"q": rng.choice(STOCK_QUERIES), "providers": "polygon"}
+        return params, _headers(rng, random_ip(rng))
+
+    def flights(rng: random.Random) -> tuple[dict[str, str], dict[str, str]]:
+        params = {"q": rng.choice(FLIGHT_QUERIES), "providers": "flightaware"}
+        return params, _headers(rng, random_ip(rng))
+
+    def yelp(rng: random.Random) -> tuple[dict[str, str], dict[str, str]]:
+        return {"q": rng.choice(YELP_QUERIES), "providers": "yelp"}, _headers(rng, LOCATED_IP)
+
+    return [
+        Scenario("suggest", 300, default_providers),
+        Scenario("adm", 200, adm),
+        Scenario("wikipedia", 100, wikipedia),
+        Scenario("weather", 250, weather),
+        Scenario("polygon", 50, stocks),
+        Scenario("flightaware", 50, flights),
+        Scenario("yelp", 50, yelp),
+    ]
+
+
+async def run_load(
+    client: httpx.AsyncClient,
+    scenarios: list[Scenario],
+    rate: float,
+    duration_sec: float,
+    rng: random.Random,
+) -> list[Sample]:
+    """Send requests of the scenarios at a mean rate per second, for a duration."""
+    samples: list[Sample] = []
+    weights = [scenario.weight for scenario in scenarios]
+
+    async def send(scenario: Scenario, scheduled_at: float) -> None:
+        params, headers = scenario.make_request(rng)
+        try:
+            response = await client.get(SUGGEST_API, params=params, headers=headers)
+            status = response.status_code
+        except httpx.HTTPError:
+            status = 0
+        samples.append(Sample(scenario.name, status, time.perf_counter() - scheduled_at))
+
+    async with asyncio.TaskGroup() as task_group:
+        started_at = time.perf_counter()
+        scheduled_at = started_at
+        while (scheduled_at := scheduled_at + rng.expovariate(rate)) < started_at + duration_sec:
+            if (delay := scheduled_at - time.perf_counter()) > 0:
+                await asyncio.sleep(delay)
+            scenario = rng.choices(scenarios, weights)[0]
+            task_group.create_task(send(scenario, scheduled_at))
+    return samples
+
+
+def _summarize(samples: list[Sample], duration_sec: float, budgets: Budgets) -> dict[str, Any]:
+    latencies_ms = sorted(sample.latency_sec * 1000 for sample in samples)
+    errors = sum(1 for sample in samples if not 200 <= sample.status < 400)
+    statuses: dict[str, int] = defaultdict(int)
+    for sample in samples:
+        statuses[str(sample.status)] += 1
+    quantiles = (
+        statistics.quantiles(latencies_ms, n=100, method="inclusive")
+        if len(latencies_ms) > 1
+        else latencies_ms * 99
+    )
+    error_rate = errors / len(samples)
+    p99_ms = quantiles[98]
+    return {
+        "requests": len(samples),
+        "errors": errors,
+        "error_rate": error_rate,
+        "throughput_rps": len(samples) / duration_sec,
+        "statuses": dict(sorted(statuses.items())),
+        "latency_ms": {
+            "p50": quantiles[49],
+            "p95": quantiles[94],
+            "p99": p99_ms,
+            "max": latencies_ms[-1],
+        },
+        "budgets": {
+            "error_rate": error_rate <= budgets.max_error_rate,
+            "p99": budgets.p99_ms is None or p99_ms <= budgets.p99_ms,
+        },
+    }
+
+
+def build_report(
+    samples: list[Sample], duration_sec: float, budgets: Budgets, config: dict[str, Any]
+) -> dict[str, Any]:
+    """Return the machine readable report of a run: throughput, latency percentiles and
+    error rates, overall and per scenario, checked against the budgets.
+    """
+    by_scenario: dict[str, list[Sample]] = defaultdict(list)
+    for sample in samples:
+        by_scenario[sample.scenario].append(sample)
+    scenarios = {
+        name: _summarize(scenario_samples, duration_sec, budgets)
+        for name, scenario_samples in sorted(by_scenario.items())
+    }
+    return {
+        "config": config,
+        "budgets": {"max_error_rate": budgets.max_error_rate, "p99_ms": budgets.p99_ms},
+        "passed": bool(samples)
+        and all(all(summary["budgets"].values()) for summary in scenarios.values()),
+        "total": _summarize(samples, duration_sec, budgets) if samples else None,
+        "scenarios": scenarios,
+    }
@@ -13,6 +13,7 @@ and verifies:
   - unknown items get bias + topic_main only (cold-start escape hatch)
   - cache time expiry triggers ``is_valid`` → False
   - empty-stub backend always reports invalid
+  - the in-memory safetensors reader returns zero-copy views
 """
 
 from __future__ import annotations
@@ -36,6 +37,7 @@ from merino.curated_recommendations.ml_backends.lints_interest_model import (
     L_FORMAT_LAPACK_LOWER_PACKED,
     SCHEMA_VERSION,
     VALIDITY_PERIOD_MINUTES,
+    read_safetensors,
 )
 
 # Default topic_names for synthetic bundles — match the `Topic.<…>.value` enum
@@ -209,7 +211,7 @@ def test_is_valid_after_fresh_load() -> None:
     backend._fetch_callback(blob, surface_id=SurfaceId.NEW_TAB_EN_US)
 
     assert backend.is_valid(SurfaceId.NEW_TAB_EN_US)
-    assert backend._dim[SurfaceId.NEW_TAB_EN_US] == expected["d"]
+    assert backend._states[SurfaceId.NEW_TAB_EN_US].dim == expected["d"]
 
 
 def test_metadata_round_trips() -> None:
@@ -218,11 +220,12 @@ def test_metadata_round_trips() -> None:
     backend = _make_backend()
     backend._fetch_callback(blob, surface_id=SurfaceId.NEW_TAB_EN_US)
 
-    assert backend._item_to_idx[SurfaceId.NEW_TAB_EN_US] == expected["item_to_idx"]
-    assert backend._topic_main_to_idx[SurfaceId.NEW_TAB_EN_US] == expected["topic_main_to_idx"]
-    assert backend._item_topic_to_idx[SurfaceId.NEW_TAB_EN_US] == expected["item_topic_to_idx"]
-    assert backend._bias_idx[SurfaceId.NEW_TAB_EN_US] == expected["bias_idx"]
-    assert backend._v[SurfaceId.NEW_TAB_EN_US] == pytest.approx(expected["v"])
+    state = backend._states[SurfaceId.NEW_TAB_EN_US]
+    assert state.item_to_idx == expected["item_to_idx"]
+    assert state.topic_main_to_idx == expected["topic_main_to_idx"]
+    assert state.item_topic_to_idx == expected["item_topic_to_idx"]
+    assert state.bias_idx == expected["bias_idx"]
+    assert state.v == pytest.approx(expected["v"])
 
 
 def test_has_item_returns_true_for_known() -> None:
@@ -246,7 +249,7 @@ def test_schema_version_mismatch_keeps_state_unset() -> None:
     backend._fetch_callback(bad_blob, surface_id=SurfaceId.NEW_TAB_EN_US)
 
     assert not backend.is_valid(SurfaceId.NEW_TAB_EN_US)
-    assert SurfaceId.NEW_TAB_EN_US not in backend._dim
+    assert SurfaceId.NEW_TAB_EN_US not in backend._states
 
 
 def test_l_format_mismatch_keeps_state_unset() -> None:
@@ -314,6 +317,32 @@ def test_valid_topic_names_emit_no_warning(caplog) -> None:
     assert not any("topic_names" in m for m in msgs), msgs
 
 
+def test_read_safetensors_returns_views_into_data() -> None:
+    """Tensors and metadata round-trip, and float32 tensors are views into the bytes."""
+    theta = np.arange(6, dtype=np.float32).reshape(2, 3)
+    ids = np.array([7, 8, 9], dtype=np.int64)
+    data = save({"theta": theta, "ids": ids}, metadata={"dim": "3"})
+
+    metadata, tensors = read_safetensors(data)
+
+    assert metadata == {"dim": "3"}
+    np.testing.assert_array_equal(tensors["theta"], theta)
+    np.testing.assert_array_equal(tensors["ids"], ids)
+    assert np.shares_memory(tensors["theta"], np.frombuffer(data, dtype=np.uint8))
+    assert not tensors["theta"].flags.writeable
+
+
+@pytest.mark.parametrize(
+    "data",
+    [b"\x01", (1000).to_bytes(8, "little") + b"{}", save({"x": np.zeros(4, np.float32)})[:-4]],
+    ids=["truncated", "header_too_long", "tensor_out_of_bounds"],
+)
+def test_read_safetensors_rejects_corrupt_data(data: bytes) -> None:
+    """Truncated or inconsistent data raises instead of returning garbage views."""
+    with pytest.raises(ValueError):
+        read_safetensors(data)
+
+
 def test_float16_l_lower_upconverts_on_load() -> None:
     """A bundle with float16 L_lower (the inference flow's storage format)
     loads cleanly — the loader upconverts to float32 before validation.
@@ -323,8 +352,11 @@ def test_float16_l_lower_upconverts_on_load() -> None:
     backend._fetch_callback(blob, surface_id=SurfaceId.NEW_TAB_EN_US)
 
     assert backend.is_valid(SurfaceId.NEW_TAB_EN_US)
-    # After load, the in-memory L is float32 (BLAS stpsv requirement).
-    assert backend._L_packed[SurfaceId.NEW_TAB_EN_US].dtype == np.float32
+    # After load, the in-memory L is float32 (BLAS stpsv requirement), and no
+    # tensor keeps the downloaded bytes alive.
+    state = backend._states[SurfaceId.NEW_TAB_EN_US]
+    assert state.L_packed.dtype == np.float32
+    assert not np.shares_memory(state.theta_hat, np.frombuffer(blob, dtype=np.uint8))
     # Sanity: a score request runs without raising.
     rng = np.random.default_rng(0)
     scores = backend.score_request(
@@ -344,11 +376,11 @@ def test_bad_bundle_does_not_clobber_existing_good_state() -> None:
     backend = _make_backend()
 
     backend._fetch_callback(good_blob, surface_id=SurfaceId.NEW_TAB_EN_US)
-    good_dim = backend._dim[SurfaceId.NEW_TAB_EN_US]
+    good_dim = backend._states[SurfaceId.NEW_TAB_EN_US].dim
 
     backend._fetch_callback(bad_blob, surface_id=SurfaceId.NEW_TAB_EN_US)
     assert backend.is_valid(SurfaceId.NEW_TAB_EN_US)
-    assert backend._dim[SurfaceId.NEW_TAB_EN_US] == good_dim
+    assert backend._states[SurfaceId.NEW_TAB_EN_US].dim == good_dim
 
 
 # -----------------------------------------------------------------------------
@@ -428,6 +460,37 @@ def test_unknown_item_gets_bias_plus_topic_main_only() -> None:
     assert float(score_unknown[0]) == pytest.approx(ref, rel=1e-4, abs=1e-5)
 
 
+def test_batch_scores_match_single_candidate_scores() -> None:
+    """Scoring a mixed batch (known, unknown, repeated items) matches scoring each
+    candidate on its own with the same θ̃ draw.
+    """
+    tz_pred_values = np.array([[0.9, 0.1, 0.0, 0.0]] * 4, dtype=np.float32)
+    blob, expected = _build_synthetic_bundle(
+        n_items=4, with_tz_pred=True, tz_pred_values=tz_pred_values
+    )
+    backend = _make_backend()
+    backend._fetch_callback(blob, surface_id=SurfaceId.NEW_TAB_EN_US)
+
+    strengths = {
+        DEFAULT_SYNTHETIC_TOPIC_NAMES[0]: 1.5,
+        DEFAULT_SYNTHETIC_TOPIC_NAMES[2]: 0.46,
+        TIME_ZONE_OFFSET_INFERRED_KEY: 0,
+    }
+    items = ["item_03", "NEVER_SEEN", "item_00", "item_03", "item_01"]
+    batch = backend.score_request(
+        SurfaceId.NEW_TAB_EN_US, strengths, items, np.random.default_rng(3)
+    )
+    singles = [
+        backend.score_request(SurfaceId.NEW_TAB_EN_US, strengths, [iid], np.random.default_rng(3))[
+            0
+        ]
+        for iid in items
+    ]
+
+    np.testing.assert_allclose(batch, singles, rtol=1e-6)
+    assert batch[0] == batch[3]
+
+
 def test_score_request_raises_on_invalid_surface() -> None:
     """Scoring against a surface with no loaded state raises RuntimeError."""
     backend = _make_backend()  # no bundle ever loaded
@@ -509,10 +572,10 @@ def test_legacy_bundle_without_tz_pred_loads() -> None:
     backend._fetch_callback(blob, surface_id=SurfaceId.NEW_TAB_EN_US)
 
     assert backend.is_valid(SurfaceId.NEW_TAB_EN_US)
-    assert backend._tz_pred_idx[SurfaceId.NEW_TAB_EN_US] == -1
-    assert backend._tz_baseline_idx[SurfaceId.NEW_TAB_EN_US] == -1
-    assert backend._tz_preds[SurfaceId.NEW_TAB_EN_US].size == 0
-    assert backend._tz_pred_item_to_idx[SurfaceId.NEW_TAB_EN_US] == {}
+    assert backend._states[SurfaceId.NEW_TAB_EN_US].tz_pred_idx == -1
+    assert backend._states[SurfaceId.NEW_TAB_EN_US].tz_baseline_idx == -1
+    assert backend._states[SurfaceId.NEW_TAB_EN_US].tz_preds.size == 0
+    assert backend._states[SurfaceId.NEW_TAB_EN_US].tz_pred_item_to_idx == {}
 
 
 def test_tz_pred_bundle_round_trips() -> None:
@@ -534,10 +597,11 @@ def test_tz_pred_bundle_round_trips() -> None:
     backend = _make_backend()
     backend._fetch_callback(blob, surface_id=SurfaceId.NEW_TAB_EN_US)
 
-    assert backend._tz_pred_idx[SurfaceId.NEW_TAB_EN_US] == expected["tz_pred_idx"]
-    assert backend._tz_baseline_idx[SurfaceId.NEW_TAB_EN_US] == 3
-    assert backend._tz_pred_item_to_idx[SurfaceId.NEW_TAB_EN_US] == expected["tz_pred_item_to_idx"]
-    np.testing.assert_array_equal(backend._tz_preds[SurfaceId.NEW_TAB_EN_US], tz_pred_values)
+    state = backend._states[SurfaceId.NEW_TAB_EN_US]
+    assert state.tz_pred_idx == expected["tz_pred_idx"]
+    assert state.tz_baseline_idx == 3
+    assert state.tz_pred_item_to_idx == expected["tz_pred_item_to_idx"]
+    np.testing.assert_array_equal(state.tz_preds, tz_pred_values)
 
 
 def test_score_request_includes_tz_pred_contribution_for_non_baseline_user() -> None:
@@ -654,7 +718,7 @@ def test_tz_preds_size_mismatch_rejects_bundle() -> None:
     blob, _ = _build_synthetic_bundle()
     backend = _make_backend()
     backend._fetch_callback(blob, surface_id=SurfaceId.NEW_TAB_EN_US)
-    pre_dim = backend._dim[SurfaceId.NEW_TAB_EN_US]
+    pre_dim = backend._states[SurfaceId.NEW_TAB_EN_US].dim
 
     # ratios has 1 row, but item_to_idx claims 5.
     bad_blob, _ = _build_synthetic_bundle(
@@ -665,7 +729,7 @@ def test_tz_preds_size_mismatch_rejects_bundle() -> None:
     )
     backend._fetch_callback(bad_blob, surface_id=SurfaceId.NEW_TAB_EN_US)
     # Old state preserved because the new bundle was rejected.
-    assert backend._dim[SurfaceId.NEW_TAB_EN_US] == pre_dim
+    assert backend._states[SurfaceId.NEW_TAB_EN_US].dim == pre_dim
 
 
 def test_tz_preds_1d_rejects_bundle() -> None:
@@ -673,7 +737,7 @@ def test_tz_preds_1d_rejects_bundle() -> None:
     blob, _ = _build_synthetic_bundle()
     backend = _make_backend()
     backend._fetch_callback(blob, surface_id=SurfaceId.NEW_TAB_EN_US)
-    pre_tz_idx = backend._tz_pred_idx[SurfaceId.NEW_TAB_EN_US]
+    pre_tz_idx = backend._states[SurfaceId.NEW_TAB_EN_US].tz_pred_idx
     assert pre_tz_idx == -1
 
     bad_blob, _ = _build_synthetic_bundle(
@@ -684,4 +748,4 @@ def test_tz_preds_1d_rejects_bundle() -> None:
     )
     backend._fetch_callback(bad_blob, surface_id=SurfaceId.NEW_TAB_EN_US)
     # Old (legacy) state untouched — tz_pred_idx still sentinel.
-    assert backend._tz_pred_idx[SurfaceId.NEW_TAB_EN_US] == -1
+    assert backend._states[SurfaceId.NEW_TAB_EN_US].tz_pred_idx == -1
@@ -0,0 +1,321 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""Unit tests for the precomputed candidate snapshots of curated recommendations."""
+
+import asyncio
+
+import pytest
+from pydantic import HttpUrl
+
+from merino.curated_recommendations.candidate_snapshots import (
+    CandidateSnapshotStore,
+    SnapshotKey,
+    SnapshotVersion,
+    build_candidate_snapshot,
+)
+from merino.curated_recommendations.corpus_backends.protocol import (
+    CorpusItem,
+    CorpusSection,
+    CreateSource,
+    SurfaceId,
+)
+from merino.curated_recommendations.engagement_backends.protocol import (
+    Engagement,
+    EngagementBackend,
+)
+from merino.curated_recommendations.prior_backends.engagment_rescaler import (
+    CrawledContentRescaler,
+)
+from merino.curated_recommendations.prior_backends.protocol import Prior, PriorBackend
+from merino.curated_recommendations.rankers import (
+    ThompsonSamplingRanker,
+    takedown_reported_recommendations,
+)
+from tests.unit.curated_recommendations.fixtures import generate_recommendations
+
+
+class DictEngagementBackend(EngagementBackend):
+    """Engagement backend serving (clicks, impressions, reports) keyed by item and region."""
+
+    def __init__(self, metrics: dict[tuple[str, str | None], tuple[int, int, int]]):
+        self.metrics = metrics
+        self.updates = 0
+
+    def get(self, corpus_item_id: str, region: str | None = None) -> Engagement | None:
+        """Return engagement for a corpus item and exact region key."""
+        if (corpus_item_id, region) not in self.metrics:
+            return None
+        clicks, impressions, reports = self.metrics[(corpus_item_id, region)]
+        return Engagement(
+            corpus_item_id=corpus_item_id,
+            region=region,
+            click_count=clicks,
+            impression_count=impressions,
+            report_count=reports,
+        )
+
+    @property
+    def update_count(self) -> int:
+        """Return the number of times the metrics were replaced."""
+        return self.updates
+
+
+class DictPriorBackend(PriorBackend):
+    """Prior backend serving priors keyed by exact region."""
+
+    def __init__(self, priors: dict[str | None, Prior]):
+        self.priors = priors
+
+    def get(self, region: str | None = None) -> Prior | None:
+        """Return the prior for the region."""
+        return self.priors.get(region)
+
+    @property
+    def update_count(self) -> int:
+        """Update count stub"""
+        return 0
+
+
+class StubSectionsBackend:
+    """Sections backend returning the same list of corpus sections until it is replaced."""
+
+    def __init__(self, corpus_sections: list[CorpusSection]):
+        self.corpus_sections = corpus_sections
+
+    async def fetch(self, surface_id: SurfaceId) -> list[CorpusSection]:
+        """Return the corpus sections."""
+        return self.corpus_sections
+
+
+def generate_corpus_section(section_id: str, item_ids: list[str]) -> CorpusSection:
+    """Create a corpus section with the given items."""
+    return CorpusSection(
+        sectionItems=[
+            CorpusItem(
+                corpusItemId=item_id,
+                url=HttpUrl(f"https://example.com/{item_id}"),
+                title=f"Title_{item_id}",
+                excerpt=f"Excerpt_{item_id}",
+                publisher=f"Pub_{item_id}",
+                isTimeSensitive=False,
+                imageUrl=HttpUrl(f"https://example.com/img/{item_id}"),
+            )
+            for item_id in item_ids
+        ],
+        title=f"Title_{section_id}",
+        externalId=section_id,
+        createSource=CreateSource.ML,
+    )
+
+
+KEY = SnapshotKey(SurfaceId.NEW_TAB_EN_US, "US", "US_B")
+VERSION = SnapshotVersion(corpus_sections_id=0, engagement_update_count=0, prior_update_count=0)
+
+
+@pytest.fixture
+def engagement_backend() -> DictEngagementBackend:
+    """Engagement in all regions, the US and a branch region for some items."""
+    return DictEngagementBackend(
+        {
+            ("a", None): (10, 1000, 0),
+            ("a", "US"): (8, 400, 0),
+            ("b", None): (30, 100, 25),
+            ("b", "US"): (20, 50, 25),
+            ("c", "US"): (3, 30, 0),
+            ("d", None): (5, 500, 0),
+            ("d", "US_B"): (2, 90, 0),
+        }
+    )
+
+
+@pytest.fixture
+def prior_backend() -> DictPriorBackend:
+    """Global and US priors."""
+    return DictPriorBackend(
+        {
+            None: Prior(alpha=2, beta=200, total_impressions_per_day=1000),
+            "US": Prior(alpha=3, beta=150, total_impressions_per_day=500),
+        }
+    )
+
+
+@pytest.fixture
+def corpus_sections() -> list[CorpusSection]:
+    """Two corpus sections sharing an item, one of which has an alternate slate."""
+    section = generate_corpus_section("news", ["a", "b"])
+    section.alternateSection = generate_corpus_section("news__1", ["b", "d"])
+    return [section, generate_corpus_section("sports", ["a", "c"])]
+
+
+def test_build_candidate_snapshot(corpus_sections, engagement_backend, prior_backend):
+    """Test that each unique item gets a row with its engagement in every region."""
+    snapshot = build_candidate_snapshot(
+        KEY, VERSION, corpus_sections, engagement_backend, prior_backend
+    )
+
+    assert snapshot.item_rows == {"a": 0, "b": 1, "d": 2, "c": 3}
+    assert snapshot.rows(["c", "x", "a"]).tolist() == [3, -1, 0]
+    assert snapshot.covers(None, "US", "US_B")
+    assert not snapshot.covers("CA")
+    assert snapshot.engagement[None].clicks.tolist() == [10, 30, 5, 0]
+    assert snapshot.engagement[None].reports.tolist() == [0, 25, 0, 0]
+    assert snapshot.engagement["US"].impressions.tolist() == [400, 50, 0, 30]
+    assert snapshot.engagement["US_B"].has_engagement.tolist() == [False, False, True, False]
+    assert snapshot.priors["US"] == prior_backend.get("US")
+    assert snapshot.priors["US_B"] is None
+
+
+@pytest.mark.parametrize("blend_region_with_global", [True, False])
+@pytest.mark.parametrize("rescaler", [None, CrawledContentRescaler()])
+@pytest.mark.parametrize(
+    ["region", "engagement_region"], [(None, None), ("US", None), ("US", "US_B")]
+)
+def test_compute_interactions_many_matches_compute_interactions(
+    corpus_sections,
+    engagement_backend,
+    prior_backend,
+    region,
+    engagement_region,
+    rescaler,
+    blend_region_with_global,
+):
+    """Test that interactions from the snapshot equal interactions looked up per item,
+    including for items that are not in the snapshot.
+    """
+    snapshot = build_candidate_snapshot(
+        KEY, VERSION, corpus_sections, engagement_backend, prior_backend
+    )
+    recs = generate_recommendations(item_ids=["a", "b", "c", "d", "new"])
+    engagement_backend.metrics[("new", "US")] = (4, 40, 0)
+    ranker = ThompsonSamplingRanker(engagement_backend, prior_backend)
+    snapshot_ranker = ThompsonSamplingRanker(
+        engagement_backend, prior_backend, candidate_snapshot=snapshot
+    )
+
+    kwargs = dict(
+        rescaler=rescaler,
+        region=region,
+        engagement_region=engagement_region,
+        blend_region_with_global=blend_region_with_global,
+    )
+    expected = [ranker.compute_interactions(rec, **kwargs) for rec in recs]
+
+    assert ranker.compute_interactions_many(recs, **kwargs) == expected
+    assert snapshot_ranker.compute_interactions_many(recs, **kwargs) == expected
+
+
+def test_resolve_engagement_region_uses_snapshot(
+    corpus_sections, engagement_backend, prior_backend, mocker
+):
+    """Test that the engagement region is resolved without looking up items in the snapshot."""
+    snapshot = build_candidate_snapshot(
+        KEY, VERSION, corpus_sections, engagement_backend, prior_backend
+    )
+    ranker = ThompsonSamplingRanker(engagement_backend, prior_backend, candidate_snapshot=snapshot)
+    spy = mocker.spy(engagement_backend, "get")
+
+    with_branch = generate_recommendations(item_ids=["a", "d"])
+    without_branch = generate_recommendations(item_ids=["a", "b", "new"])
+
+    assert ranker.resolve_engagement_region(with_branch, "US", "US_B") == "US_B"
+    assert ranker.resolve_engagement_region(without_branch, "US", "US_B") == "US"
+    assert [call.args for call in spy.call_args_list] == [("new", "US_B")]
+
+
+def test_takedown_with_snapshot(corpus_sections, engagement_backend, prior_backend, mocker):
+    """Test that reported items in the snapshot are taken down without engagement lookups."""
+    snapshot = build_candidate_snapshot(
+        KEY, VERSION, corpus_sections, engagement_backend, prior_backend
+    )
+    recs = generate_recommendations(item_ids=["a", "b", "c", "d"])
+    spy = mocker.spy(engagement_backend, "get")
+
+    remaining = takedown_reported_recommendations(
+        recs, engagement_backend, region="US", candidate_snapshot=snapshot
+    )
+
+    assert [rec.corpusItemId for rec in remaining] == ["a", "c", "d"]
+    assert remaining == takedown_reported_recommendations(recs, engagement_backend, region="US")
+    assert spy.call_count == len(recs)  # Only the lookups of the call without a snapshot
+
+
+@pytest.mark.parametrize("item_ids", [[], ["a", "b"]], ids=["empty", "partial"])
+def test_takedown_with_items_missing_from_snapshot(item_ids, engagement_backend, prior_backend):
+    """Test that items missing from the snapshot, or all items of an empty snapshot, are
+    looked up in the engagement backend rather than read from another row.
+    """
+    snapshot = build_candidate_snapshot(
+        KEY,
+        VERSION,
+        [generate_corpus_section("news", item_ids)],
+        engagement_backend,
+        prior_backend,
+    )
+    engagement_backend.metrics[("new", "US")] = (1, 40, 20)
+    recs = generate_recommendations(item_ids=["a", "b", "c", "new", "x"])
+
+    remaining = takedown_reported_recommendations(
+        recs, engagement_backend, region="US", candidate_snapshot=snapshot
+    )
+
+    assert [rec.corpusItemId for rec in remaining] == ["a", "c", "x"]
+    assert remaining == takedown_reported_recommendations(recs, engagement_backend, region="US")
+
+
+@pytest.mark.asyncio
+async def test_store_reuses_snapshot_until_data_changes(
+    corpus_sections, engagement_backend, prior_backend
+):
+    """Test that a snapshot is built once per version and rebuilt in the background."""
+    sections_backend = StubSectionsBackend(corpus_sections)
+    store = CandidateSnapshotStore(sections_backend, engagement_backend, prior_backend)
+
+    first = await store.get(SurfaceId.NEW_TAB_EN_US, "US", "US_B")
+    assert first is not None
+    assert await store.get(SurfaceId.NEW_TAB_EN_US, "US", "US_B") is first
+
+    engagement_backend.metrics[("c", None)] = (1, 10, 0)
+    engagement_backend.updates += 1
+
+    # The previous snapshot is served while the new version is built.
+    assert await store.get(SurfaceId.NEW_TAB_EN_US, "US", "US_B") is first
+    await asyncio.gather(*store._pending.values())
+
+    second = await store.get(SurfaceId.NEW_TAB_EN_US, "US", "US_B")
+    assert second is not first
+    assert second is not None
+    assert second.engagement[None].clicks[second.item_rows["c"]] == 1
+
+
+@pytest.mark.asyncio
+async def test_store_builds_snapshot_once_for_concurrent_requests(
+    corpus_sections, engagement_backend, prior_backend, mocker
+):
+    """Test that concurrent first requests share a single build."""
+    store = CandidateSnapshotStore(
+        StubSectionsBackend(corpus_sections), engagement_backend, prior_backend
+    )
+    spy = mocker.spy(prior_backend, "get")
+
+    snapshots = await asyncio.gather(
+        *(store.get(SurfaceId.NEW_TAB_EN_US, "US", "US_B") for _ in range(5))
+    )
+
+    assert all(snapshot is snapshots[0] for snapshot in snapshots)
+    assert spy.call_count == 3  # Global, US and US_B priors
+
+
+@pytest.mark.asyncio
+async def test_store_returns_none_when_build_fails(
+    corpus_sections, engagement_backend, prior_backend, mocker, caplog
+):
+    """Test that a failed build is logged and rankers fall back to the backends."""
+    store = CandidateSnapshotStore(
+        StubSectionsBackend(corpus_sections), engagement_backend, prior_backend
+    )
+    mocker.patch.object(engagement_backend, "get", side_effect=ValueError("boom"))
+
+    assert await store.get(SurfaceId.NEW_TAB_EN_US, "US") is None
+    assert "Failed to build candidate snapshot" in caplog.text
@@ -265,6 +265,29 @@ class TestAdjustAdsInSections:
         # Rank 0 normally allows ads, but allowAds=False should override
         assert not self.ads_in_section(sample_feed["top_stories_section"])
 
+    def test_shared_layouts_are_not_modified(self):
+        """Test that disabling ads replaces the layout instead of changing the shared one."""
+        sections = {
+            sid: Section(
+                receivedFeedRank=rank,
+                recommendations=[],
+                title=sid,
+                layout=layout_4_medium,
+                allowAds=sid != "no_ads",
+            )
+            for rank, sid in enumerate(["with_ads", "no_ads", "ranked_too_low"])
+        }
+        sections["ranked_too_low"].receivedFeedRank = 3
+
+        adjust_ads_in_sections(sections)
+
+        assert sections["with_ads"].layout is layout_4_medium
+        assert self.ads_in_section(sections["with_ads"])
+        assert not self.ads_in_section(sections["no_ads"])
+        # The ad-free variant is built once per layout.
+        assert sections["no_ads"].layout is sections["ranked_too_low"].layout
+        assert sections["no_ads"].layout.name == layout_4_medium.name
+
 
 class TestRawSectionExperimentResolution:
     """Tests covering linked section experiment resolution helpers."""
@@ -704,6 +727,36 @@ class TestMapCorpusSectionToSection:
         assert [rec.corpusItemId for rec in sec.recommendations] == ["dup", "unique"]
         assert [rec.receivedRank for rec in sec.recommendations] == [0, 1]
 
+    def test_recommendations_are_built_once_per_corpus_section(self, mocker):
+        """Mapping the same corpus section again copies its prebuilt recommendations."""
+        cs = generate_corpus_section("prebuilt", count=3)
+        map_spy = mocker.patch(
+            "merino.curated_recommendations.sections.map_section_item_to_recommendation",
+            wraps=map_section_item_to_recommendation,
+        )
+
+        first = map_corpus_section_to_section(cs, 1)
+        second = map_corpus_section_to_section(cs, 2)
+        first.recommendations[0].receivedRank = 10
+
+        assert map_spy.call_count == 3
+        assert second.recommendations[0].receivedRank == 0
+        assert second.recommendations == [
+            rec.model_copy(update={"receivedRank": idx})
+            for idx, rec in enumerate(first.recommendations)
+        ]
+        assert all(a is not b for a, b in zip(first.recommendations, second.recommendations))
+
+    def test_recommendations_are_rebuilt_when_section_items_change(self):
+        """Replacing the items of a corpus section invalidates its prebuilt recommendations."""
+        cs = generate_corpus_section("prebuilt", count=3)
+        map_corpus_section_to_section(cs, 1)
+
+        cs.sectionItems = cs.sectionItems[:1]
+        sec = map_corpus_section_to_section(cs, 1)
+
+        assert [rec.corpusItemId for rec in sec.recommendations] == ["prebuilt_item0"]
+
     def test_headlines_items_flagged_as_headlines(self):
         """Headlines items should carry ITEM_HEADLINES_FLAG."""
         cs = CorpusSection(
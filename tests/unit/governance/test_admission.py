@@ -0,0 +1,223 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""Unit tests for the admission control module."""
+
+import asyncio
+import time
+from collections.abc import Coroutine
+from typing import Any
+
+import pytest
+from circuitbreaker import circuit
+
+from merino.governance.admission import AdmissionController, AdmissionControllers
+
+
+def make_controller(
+    max_concurrency: int = 8, min_concurrency: int = 2, latency_target_sec: float = 1.0
+) -> AdmissionController:
+    """Return an admission controller for a fake provider."""
+    return AdmissionController(
+        name="fake",
+        max_concurrency=max_concurrency,
+        min_concurrency=min_concurrency,
+        latency_target_sec=latency_target_sec,
+    )
+
+
+async def slow_query(latency: float) -> list[str]:
+    """Fake provider query taking `latency` seconds."""
+    await asyncio.sleep(latency)
+    return ["suggestion"]
+
+
+async def failing_query() -> list[str]:
+    """Fake provider query whose backend errors out."""
+    raise RuntimeError("backend error")
+
+
+def test_invalid_bounds() -> None:
+    """A min concurrency above the max is rejected."""
+    with pytest.raises(ValueError):
+        make_controller(max_concurrency=2, min_concurrency=4)
+
+
+def test_sheds_over_limit() -> None:
+    """Queries are admitted up to the limit, and the slot of a finished one is reusable."""
+    controller = make_controller(max_concurrency=2)
+
+    assert controller.try_acquire()
+    assert controller.try_acquire()
+    assert not controller.try_acquire()
+
+    controller.release(time.monotonic(), congested=False)
+
+    assert controller.in_flight == 1
+    assert controller.try_acquire()
+
+
+def test_decrease_on_congestion() -> None:
+    """A congested query halves the limit, down to the min concurrency."""
+    controller = make_controller(max_concurrency=8, min_concurrency=3)
+
+    limits = []
+    for _ in range(3):
+        controller.try_acquire()
+        controller.release(time.monotonic(), congested=True)
+        limits.append(controller.limit)
+
+    assert limits == [4.0, 3.0, 3.0]
+
+
+def test_decrease_once_per_burst() -> None:
+    """Queries in flight when the limit was cut don't cut it again."""
+    controller = make_controller(max_concurrency=8)
+    started_at = time.monotonic()
+    for _ in range(3):
+        controller.try_acquire()
+
+    for _ in range(3):
+        controller.release(started_at, congested=True)
+
+    assert controller.limit == 4.0
+    assert controller.in_flight == 0
+
+
+def test_slow_queries_count_as_congestion() -> None:
+    """Successful queries cut the limit once their average latency misses the target."""
+    controller = make_controller(max_concurrency=8, latency_target_sec=0.5)
+
+    limits = []
+    for _ in range(4):
+        controller.try_acquire()
+        controller.release(time.monotonic() - 1.0, congested=False)
+        limits.append(controller.limit)
+
+    assert limits == [8.0, 8.0, 8.0, 4.0]
+
+
+def test_additive_increase() -> None:
+    """Fast successful queries grow the limit back by about one per limit's worth."""
+    controller = make_controller(max_concurrency=8, min_concurrency=4)
+    controller.try_acquire()
+    controller.release(time.monotonic(), congested=True)
+
+    for _ in range(4):
+        controller.try_acquire()
+        controller.release(time.monotonic(), congested=False)
+
+    assert 4.9 < controller.limit < 5.0
+    controller.try_acquire()
+    controller.release(time.monotonic(), congested=False)
+    assert int(controller.limit) == 5
+
+
+def test_increase_capped_at_max() -> None:
+    """The limit never grows past the max concurrency."""
+    controller = make_controller(max_concurrency=2)
+
+    for _ in range(10):
+        controller.try_acquire()
+        controller.release(time.monotonic(), congested=False)
+
+    assert controller.limit == 2.0
+
+
+@pytest.mark.asyncio
+async def test_track_slow_provider() -> None:
+    """Queries to a slow provider are shed once its limit is reached, and timed out
+    queries cut the limit.
+    """
+    controller = make_controller(max_concurrency=4, min_concurrency=1, latency_target_sec=0.05)
+    tasks = []
+    shed = 0
+    for _ in range(6):
+        if not controller.try_acquire():
+            shed += 1
+            continue
+        task = asyncio.create_task(slow_query(1.0))
+        controller.track(task)
+        tasks.append(task)
+
+    assert shed == 2
+    assert controller.in_flight == 4
+
+    # Time out the in-flight queries the way the task runner does.
+    _, pending = await asyncio.wait(tasks, timeout=0.01)
+    for task in pending:
+        task.cancel()
+    await asyncio.wait(pending)
+
+    assert controller.in_flight == 0
+    assert controller.limit == 2.0
+
+
+@pytest.mark.asyncio
+async def test_track_provider_with_outliers() -> None:
+    """A fast provider with isolated queries slower than the latency target (but not
+    timed out) is never shed nor has its limit cut.
+    """
+    controller = make_controller(max_concurrency=2, min_concurrency=1, latency_target_sec=0.1)
+    latencies = [0.12 if i % 5 == 4 else 0.0 for i in range(15)]
+
+    shed = 0
+    for latency in latencies:
+        if not controller.try_acquire():
+            shed += 1
+            continue
+        task = asyncio.create_task(slow_query(latency))
+        controller.track(task)
+        await asyncio.wait([task])
+
+    assert shed == 0
+    assert controller.limit == 2.0
+    assert controller.latency_ewma < controller.latency_target_sec
+
+
+@pytest.mark.asyncio
+async def test_track_outcomes() -> None:
+    """Failures cut the limit, fast successes grow it, and an open circuit does neither."""
+    controller = make_controller(max_concurrency=8, min_concurrency=1)
+
+    @circuit(name="test-admission-circuit", failure_threshold=1, recovery_timeout=60)
+    async def guarded_query() -> list[str]:
+        raise RuntimeError("backend error")
+
+    with pytest.raises(RuntimeError):
+        await guarded_query()
+
+    async def run(coro: Coroutine[Any, Any, list[str]]) -> None:
+        controller.try_acquire()
+        task = asyncio.create_task(coro)
+        controller.track(task)
+        await asyncio.wait([task])
+
+    await run(failing_query())
+    assert controller.limit == 4.0
+
+    await run(guarded_query())
+    assert controller.limit == 4.0
+
+    await run(slow_query(0))
+    assert controller.limit == 4.25
+    assert controller.in_flight == 0
+
+
+def test_controllers_only_for_limited_providers() -> None:
+    """Controllers exist for providers with a max concurrency, with their own target."""
+    controllers = AdmissionControllers(
+        max_concurrency={"wikipedia": 100, "polygon": 2},
+        min_concurrency=4,
+        decrease_ratio=0.5,
+        latency_target_ratio=0.8,
+    )
+
+    wikipedia = controllers.get("wikipedia", query_timeout_sec=0.5)
+    polygon = controllers.get("polygon", query_timeout_sec=1.0)
+
+    assert controllers.get("adm", query_timeout_sec=0.2) is None
+    assert wikipedia is not None and wikipedia is controllers.get("wikipedia", 0.5)
+    assert wikipedia.latency_target_sec == pytest.approx(0.4)
+    assert polygon is not None and polygon.min_concurrency == 2
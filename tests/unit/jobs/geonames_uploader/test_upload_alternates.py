@@ -22,7 +22,7 @@ from merino.jobs.utils.rs_client import RemoteSettingsClient
 
 from tests.unit.jobs.utils.rs_utils import (
     Record,
-    check_delete_requests,
+    check_batch_delete_requests,
     check_upload_requests,
     mock_responses,
     SERVER_DATA as RS_SERVER_DATA,
@@ -142,7 +142,7 @@ def do_test(
     rs_requests = [r for r in requests_mock.request_history if r.url.startswith(rs_server)]
 
     check_upload_requests(rs_requests, expected_uploaded_records)
-    check_delete_requests(rs_requests, expected_deleted_records)
+    check_batch_delete_requests(rs_requests, sorted(expected_deleted_records, key=lambda r: r.id))
 
 
 def test_basic_no_existing_record(
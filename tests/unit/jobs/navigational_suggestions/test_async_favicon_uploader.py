@@ -0,0 +1,110 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""Unit tests for async_favicon_uploader module."""
+
+import asyncio
+import threading
+
+import pytest
+
+from merino.jobs.navigational_suggestions.io import AsyncFaviconUploader
+from merino.utils.gcs.models import Image
+
+
+@pytest.fixture
+def image() -> Image:
+    """Return a favicon image for testing."""
+    return Image(content=b"\x89PNG favicon", content_type="image/png")
+
+
+@pytest.fixture
+def mock_uploader(mocker):
+    """Mock DomainMetadataUploader for testing."""
+    uploader = mocker.MagicMock()
+    uploader.destination_favicon_name.return_value = "favicons/abc_12.png"
+    uploader.upload_image.side_effect = lambda image, name, **kwargs: f"https://cdn/{name}"
+    return uploader
+
+
+@pytest.mark.asyncio
+async def test_destination_favicon_name(image, mock_uploader):
+    """Test that the destination name comes from the uploader."""
+    name = await AsyncFaviconUploader.destination_favicon_name(image, mock_uploader)
+
+    assert name == "favicons/abc_12.png"
+    mock_uploader.destination_favicon_name.assert_called_once_with(image)
+
+
+@pytest.mark.asyncio
+async def test_upload_skips_already_uploaded_favicon(image, mock_uploader):
+    """Test that an identical favicon is only uploaded once."""
+    favicon_uploader = AsyncFaviconUploader()
+
+    first = await favicon_uploader.upload(image, "favicons/abc_12.png", mock_uploader)
+    second = await favicon_uploader.upload(image, "favicons/abc_12.png", mock_uploader)
+
+    assert first == second == "https://cdn/favicons/abc_12.png"
+    mock_uploader.upload_image.assert_called_once_with(
+        image, "favicons/abc_12.png", forced_upload=True, cache_control=None
+    )
+    assert favicon_uploader.upload_count == 1
+    assert favicon_uploader.dedupe_count == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_uploads_of_same_favicon_are_shared(image, mock_uploader):
+    """Test that concurrent uploads of the same favicon wait for the one in flight."""
+    favicon_uploader = AsyncFaviconUploader()
+
+    results = await asyncio.gather(
+        *(favicon_uploader.upload(image, "favicons/abc_12.png", mock_uploader) for _ in range(5))
+    )
+
+    assert set(results) == {"https://cdn/favicons/abc_12.png"}
+    mock_uploader.upload_image.assert_called_once()
+    assert favicon_uploader.dedupe_count == 4
+
+
+@pytest.mark.asyncio
+async def test_upload_concurrency_is_bounded(image, mock_uploader):
+    """Test that no more than `max_concurrent_uploads` uploads run at once."""
+    lock = threading.Lock()
+    in_flight = 0
+    max_in_flight = 0
+
+    def upload_image(image, name, **kwargs):
+        nonlocal in_flight, max_in_flight
+        with lock:
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+        threading.Event().wait(0.01)
+        with lock:
+            in_flight -= 1
+        return f"https://cdn/{name}"
+
+    mock_uploader.upload_image.side_effect = upload_image
+    favicon_uploader = AsyncFaviconUploader(max_concurrent_uploads=2)
+
+    await asyncio.gather(
+        *(favicon_uploader.upload(image, f"favicons/{i}.png", mock_uploader) for i in range(6))
+    )
+
+    assert mock_uploader.upload_image.call_count == 6
+    assert max_in_flight <= 2
+
+
+@pytest.mark.asyncio
+async def test_failed_upload_is_retried_later(image, mock_uploader):
+    """Test that upload errors are raised and not cached."""
+    mock_uploader.upload_image.side_effect = [Exception("GCS error"), "https://cdn/retry.png"]
+    favicon_uploader = AsyncFaviconUploader()
+
+    with pytest.raises(Exception, match="GCS error"):
+        await favicon_uploader.upload(image, "favicons/abc_12.png", mock_uploader)
+
+    result = await favicon_uploader.upload(image, "favicons/abc_12.png", mock_uploader)
+
+    assert result == "https://cdn/retry.png"
+    assert mock_uploader.upload_image.call_count == 2
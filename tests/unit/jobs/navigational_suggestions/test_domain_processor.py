@@ -4,6 +4,8 @@
 
 """Unit tests for domain_processor module."""
 
+import asyncio
+
 import pytest
 
 from merino.configs import settings
@@ -178,3 +180,149 @@ class TestDomainProcessorTryCustomFavicon:
             forced_upload=uploader_mock.force_upload,
             cache_control=settings.jobs.navigational_suggestions.cache_control,
         )
+
+
+def _domain(name: str) -> dict:
+    """Build minimal domain data for the given domain name."""
+    return {"domain": name, "suffix": name.rsplit(".", 1)[-1]}
+
+
+def _result(domain_data: dict) -> dict:
+    """Build a successful processing result for the given domain data."""
+    return {
+        "url": f"https://{domain_data['domain']}",
+        "title": domain_data["domain"],
+        "icon": "icon",
+        "domain": domain_data["domain"],
+    }
+
+
+class TestDomainProcessorProcessDomains:
+    """Tests for the sliding-window DomainProcessor._process_domains method."""
+
+    @pytest.mark.asyncio
+    async def test_slow_domain_does_not_block_others(self, mocker):
+        """Test that fast domains keep flowing while a slow domain is in flight."""
+        domains = [_domain("slow.com")] + [_domain(f"fast{i}.com") for i in range(6)]
+        fast_done = asyncio.Event()
+        finished: list[str] = []
+
+        async def process_single_domain(domain_data, favicon_min_width, uploader):
+            if domain_data["domain"] == "slow.com":
+                # Only completes once every fast domain has been processed, which would
+                # deadlock if domains were processed in fixed batches.
+                await fast_done.wait()
+            finished.append(domain_data["domain"])
+            if len(finished) == len(domains) - 1:
+                fast_done.set()
+            return _result(domain_data)
+
+        processor = DomainProcessor(
+            blocked_domains=set(), favicon_downloader=mocker.AsyncMock(), chunk_size=2
+        )
+        mocker.patch.object(processor, "_process_single_domain", process_single_domain)
+
+        results = await asyncio.wait_for(
+            processor._process_domains(domains, 32, mocker.MagicMock()), timeout=5
+        )
+
+        assert finished[-1] == "slow.com"
+        assert [r["domain"] for r in results] == [d["domain"] for d in domains]
+        processor.favicon_downloader.reset.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_per_host_limit(self, mocker):
+        """Test that concurrent requests for the same registered domain are limited, while
+        domains that only share a label with it aren't.
+        """
+        domains = [
+            _domain("example.com"),
+            _domain("www.example.com"),
+            _domain("m.example.com"),
+            _domain("example.org"),
+            _domain("example.co.uk"),
+        ]
+        in_flight: dict[str, int] = {}
+        max_in_flight: dict[str, int] = {}
+
+        async def process_single_domain(domain_data, favicon_min_width, uploader):
+            suffix = domain_data["domain"].split("example.", 1)[1]
+            in_flight[suffix] = in_flight.get(suffix, 0) + 1
+            max_in_flight[suffix] = max(max_in_flight.get(suffix, 0), in_flight[suffix])
+            await asyncio.sleep(0.01)
+            in_flight[suffix] -= 1
+            return _result(domain_data)
+
+        processor = DomainProcessor(
+            blocked_domains=set(),
+            favicon_downloader=mocker.AsyncMock(),
+            chunk_size=10,
+            per_host_limit=1,
+        )
+        mocker.patch.object(processor, "_process_single_domain", process_single_domain)
+
+        results = await processor._process_domains(domains, 32, mocker.MagicMock())
+
+        assert [r["domain"] for r in results] == [d["domain"] for d in domains]
+        assert max_in_flight == {"com": 1, "org": 1, "co.uk": 1}
+        assert sum(max_in_flight.values()) == 3
+
+    @pytest.mark.asyncio
+    async def test_busy_host_does_not_hold_a_worker(self, mocker):
+        """Test that a worker skips past a domain whose host is at its limit, rather than
+        waiting for the host while other domains could be processed.
+        """
+        domains = [_domain("example.com"), _domain("www.example.com"), _domain("other.com")]
+        other_done = asyncio.Event()
+        finished: list[str] = []
+
+        async def process_single_domain(domain_data, favicon_min_width, uploader):
+            if domain_data["domain"] == "example.com":
+                # Only completes once the other host's domain has been processed, which
+                # would deadlock if the second worker waited for the example.com host.
+                await other_done.wait()
+            if domain_data["domain"] == "other.com":
+                other_done.set()
+            finished.append(domain_data["domain"])
+            return _result(domain_data)
+
+        processor = DomainProcessor(
+            blocked_domains=set(),
+            favicon_downloader=mocker.AsyncMock(),
+            chunk_size=2,
+            per_host_limit=1,
+        )
+        mocker.patch.object(processor, "_process_single_domain", process_single_domain)
+
+        results = await asyncio.wait_for(
+            processor._process_domains(domains, 32, mocker.MagicMock()), timeout=5
+        )
+
+        assert finished == ["other.com", "example.com", "www.example.com"]
+        assert [r["domain"] for r in results] == [d["domain"] for d in domains]
+
+    @pytest.mark.asyncio
+    async def test_timeout_and_errors_keep_results_aligned(self, mocker):
+        """Test that timed out or failing domains produce an error result in place."""
+        domains = [_domain("hang.com"), _domain("boom.com"), _domain("ok.com")]
+
+        async def process_single_domain(domain_data, favicon_min_width, uploader):
+            if domain_data["domain"] == "hang.com":
+                await asyncio.Event().wait()
+            if domain_data["domain"] == "boom.com":
+                raise ValueError("boom")
+            return _result(domain_data)
+
+        processor = DomainProcessor(
+            blocked_domains=set(),
+            favicon_downloader=mocker.AsyncMock(),
+            domain_timeout=0.05,
+        )
+        mocker.patch.object(processor, "_process_single_domain", process_single_domain)
+
+        results = await processor._process_domains(domains, 32, mocker.MagicMock())
+
+        assert len(results) == 3
+        assert results[0]["error_reason"].startswith("domain_timeout")
+        assert results[1]["error_reason"] == "processing_exception_ValueError: boom"
+        assert results[2]["domain"] == "ok.com"
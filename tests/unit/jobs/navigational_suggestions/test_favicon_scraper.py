@@ -9,12 +9,25 @@ from bs4 import BeautifulSoup
 from unittest.mock import AsyncMock
 
 from merino.jobs.navigational_suggestions.scrapers.favicon_scraper import FaviconScraper
-from merino.jobs.navigational_suggestions.models import FaviconData
+from merino.jobs.navigational_suggestions.models import FaviconData, ScrapedPage
 
 
 class TestFaviconScraperScrapeData:
     """Tests for FaviconScraper.scrape_favicon_data method."""
 
+    def test_scrape_scraped_page(self):
+        """Test that tags already extracted by the web scraper are used as is."""
+        page = ScrapedPage(
+            links=[{"rel": ["icon"], "href": "/favicon.ico"}],
+            metas=[{"name": "apple-touch-icon", "content": "/apple.png"}],
+            manifests=[{"rel": ["manifest"], "href": "/manifest.json"}],
+        )
+        scraper = FaviconScraper()
+
+        result = scraper.scrape_favicon_data(page)
+
+        assert result == FaviconData(links=page.links, metas=page.metas, manifests=page.manifests)
+
     def test_scrape_link_tags(self):
         """Test scraping favicon from link tags."""
         html = """
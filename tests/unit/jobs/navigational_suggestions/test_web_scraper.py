@@ -4,274 +4,268 @@
 
 """Unit tests for web_scraper module."""
 
+import httpx
 import pytest
-from bs4 import BeautifulSoup
 
-from merino.jobs.navigational_suggestions.scrapers.web_scraper import WebScraper
+from merino.jobs.navigational_suggestions.models import ScrapedPage
+from merino.jobs.navigational_suggestions.scrapers.page_parser import PageParser
+from merino.jobs.navigational_suggestions.scrapers.web_scraper import (
+    WebScraper,
+    create_scraper_client,
+)
+
+PAGE = b"""
+<!DOCTYPE html>
+<html>
+<head>
+    <title>Example &amp; Co</title>
+    <link rel="icon" href="/favicon.ico">
+    <link rel="shortcut icon" href="/shortcut.ico">
+    <link rel="apple-touch-icon" sizes="180x180" href="/apple.png" />
+    <link rel="stylesheet" href="/style.css">
+    <link rel="manifest" href="/manifest.json">
+    <meta name="msapplication-TileImage" content="/tile.png">
+    <meta name="description" content="ignored">
+</head>
+<body><h1>Welcome</h1></body>
+</html>
+"""
+
+
+def _client(handler) -> httpx.AsyncClient:
+    """Create an async client that serves requests from `handler`."""
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler), follow_redirects=True)
+
+
+class TestPageParser:
+    """Tests for the incremental PageParser."""
+
+    def test_extracts_relevant_tags(self):
+        """Test that only the title, icon links, metas and manifests are kept."""
+        parser = PageParser()
+        parser.feed(PAGE.decode())
+        page = parser.result()
+
+        assert page.title == "Example & Co"
+        assert [link["href"] for link in page.links] == [
+            "/favicon.ico",
+            "/shortcut.ico",
+            "/apple.png",
+        ]
+        assert page.links[1]["rel"] == ["shortcut", "icon"]
+        assert page.metas == [{"name": "msapplication-TileImage", "content": "/tile.png"}]
+        assert page.manifests == [{"rel": ["manifest"], "href": "/manifest.json"}]
+        assert page.has_bot_blocking_element is False
+
+    def test_feed_in_small_chunks(self):
+        """Test that parsing data fed in arbitrary chunks gives the same result."""
+        whole = PageParser()
+        whole.feed(PAGE.decode())
+
+        chunked = PageParser()
+        text = PAGE.decode()
+        for i in range(0, len(text), 7):
+            chunked.feed(text[i : i + 7])
+
+        assert chunked.result() == whole.result()
+
+    def test_title_outside_head_is_ignored(self):
+        """Test that a title outside of the head element is not used."""
+        parser = PageParser()
+        parser.feed("<html><body><title>Not a title</title></body></html>")
+
+        assert parser.result().title is None
+
+    def test_manifest_outside_head_is_ignored(self):
+        """Test that manifest links outside of the head element are not used."""
+        parser = PageParser()
+        parser.feed('<html><body><link rel="manifest" href="/m.json"></body></html>')
+
+        assert parser.result().manifests == []
+
+    @pytest.mark.parametrize(
+        "div",
+        ['<div id="challenge-form"></div>', '<div class="main cf-browser-verification"></div>'],
+    )
+    def test_detects_bot_blocking_elements(self, div):
+        """Test detection of elements used by bot protection services."""
+        parser = PageParser()
+        parser.feed(f"<html><head></head><body>{div}</body></html>")
+
+        assert parser.result().has_bot_blocking_element is True
+
+
+class TestCreateScraperClient:
+    """Tests for the create_scraper_client function."""
+
+    @pytest.mark.asyncio
+    async def test_negotiates_http2(self):
+        """Test that the scraper client offers HTTP/2, which requires `h2` to be installed."""
+        client = create_scraper_client(max_connections=4)
+        try:
+            assert client._transport._pool._http2  # type: ignore[attr-defined]
+        finally:
+            await client.aclose()
 
 
 class TestWebScraperContextManager:
-    """Tests for WebScraper context manager functionality."""
+    """Tests for WebScraper async context manager functionality."""
 
-    def test_context_manager_enter_exit(self, mocker):
-        """Test that WebScraper works as a context manager."""
-        mock_close = mocker.patch.object(WebScraper, "close")
+    @pytest.mark.asyncio
+    async def test_owned_client_is_closed(self):
+        """Test that a client created by the scraper is closed on exit."""
+        async with WebScraper() as scraper:
+            client = scraper.client
 
-        with WebScraper() as scraper:
-            assert scraper is not None
-            assert hasattr(scraper, "browser")
+        assert client.is_closed
 
-        mock_close.assert_called_once()
+    @pytest.mark.asyncio
+    async def test_shared_client_is_not_closed(self):
+        """Test that a client passed in by the caller is left open."""
+        client = _client(lambda request: httpx.Response(200))
 
-    def test_context_manager_exit_on_exception(self, mocker):
-        """Test that close is called even when exception occurs."""
-        mock_close = mocker.patch.object(WebScraper, "close")
+        async with WebScraper(client):
+            pass
 
-        with pytest.raises(ValueError):
-            with WebScraper():
-                raise ValueError("Test exception")
-
-        mock_close.assert_called_once()
+        assert not client.is_closed
+        await client.aclose()
 
 
 class TestWebScraperOpen:
     """Tests for WebScraper.open method."""
 
-    def test_open_successful(self, mocker):
-        """Test successful URL opening."""
-        scraper = WebScraper()
-        mock_browser = mocker.MagicMock()
-        mock_response = mocker.MagicMock()
-        mock_response.status_code = 200
-        mock_browser.open.return_value = mock_response
-        mock_browser.url = "https://example.com"
-        scraper.browser = mock_browser
+    @pytest.mark.asyncio
+    async def test_open_successful(self):
+        """Test successful URL opening and parsing."""
+        client = _client(lambda request: httpx.Response(200, content=PAGE))
 
-        result = scraper.open("https://example.com")
+        async with WebScraper(client) as scraper:
+            result = await scraper.open("https://example.com")
 
         assert result == "https://example.com"
-        mock_browser.open.assert_called_once_with(
-            "https://example.com", timeout=mocker.ANY, allow_redirects=mocker.ANY
-        )
-
-    def test_open_with_redirect(self, mocker):
-        """Test opening URL that redirects."""
-        scraper = WebScraper()
-        mock_browser = mocker.MagicMock()
-        mock_response = mocker.MagicMock()
-        mock_response.status_code = 200
-        mock_browser.open.return_value = mock_response
-        mock_browser.url = "https://www.example.com/redirected"
-        scraper.browser = mock_browser
-
-        result = scraper.open("https://example.com")
-
-        assert result == "https://www.example.com/redirected"
-
-    def test_open_failure_returns_none(self, mocker):
-        """Test that open returns None on failure."""
-        scraper = WebScraper()
-        mock_browser = mocker.MagicMock()
-        mock_browser.open.side_effect = Exception("Connection failed")
-        scraper.browser = mock_browser
+        assert scraper.get_status_code() == 200
+        assert scraper.scrape_title() == "Example & Co"
+        assert isinstance(scraper.get_page(), ScrapedPage)
+        await client.aclose()
 
-        result = scraper.open("https://example.com")
+    @pytest.mark.asyncio
+    async def test_open_with_redirect(self):
+        """Test opening URL that redirects returns the final URL."""
 
-        assert result is None
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.host == "example.com":
+                return httpx.Response(301, headers={"Location": "https://www.example.com/home"})
+            return httpx.Response(200, content=PAGE)
 
-    def test_open_timeout_returns_none(self, mocker):
-        """Test that open returns None on timeout."""
-        scraper = WebScraper()
-        mock_browser = mocker.MagicMock()
-        mock_browser.open.side_effect = TimeoutError("Request timed out")
-        scraper.browser = mock_browser
+        client = _client(handler)
 
-        result = scraper.open("https://example.com")
-
-        assert result is None
+        async with WebScraper(client) as scraper:
+            result = await scraper.open("https://example.com")
 
+        assert result == "https://www.example.com/home"
+        assert scraper.get_current_url() == "https://www.example.com/home"
+        await client.aclose()
 
-class TestWebScraperScrapeTitle:
-    """Tests for WebScraper.scrape_title method."""
-
-    def test_scrape_title_success(self, mocker):
-        """Test successful title extraction."""
-        html = "<html><head><title>Example Title</title></head></html>"
-        soup = BeautifulSoup(html, "html.parser")
-
-        scraper = WebScraper()
-        mock_browser = mocker.MagicMock()
-        mock_browser.page = soup
-        scraper.browser = mock_browser
-
-        result = scraper.scrape_title()
+    @pytest.mark.asyncio
+    async def test_open_error_status_still_returns_url(self):
+        """Test that an HTTP error status is recorded and the page is still parsed."""
+        client = _client(lambda request: httpx.Response(403, content=b"<title>x</title>"))
 
-        assert result == "Example Title"
-
-    def test_scrape_title_with_whitespace(self, mocker):
-        """Test title extraction with whitespace."""
-        html = "<html><head><title>  Title with Spaces  </title></head></html>"
-        soup = BeautifulSoup(html, "html.parser")
-
-        scraper = WebScraper()
-        mock_browser = mocker.MagicMock()
-        mock_browser.page = soup
-        scraper.browser = mock_browser
-
-        result = scraper.scrape_title()
-
-        assert result == "  Title with Spaces  "
-
-    def test_scrape_title_missing_returns_none(self, mocker):
-        """Test that missing title returns None."""
-        html = "<html><head></head></html>"
-        soup = BeautifulSoup(html, "html.parser")
-
-        scraper = WebScraper()
-        mock_browser = mocker.MagicMock()
-        mock_browser.page = soup
-        scraper.browser = mock_browser
-
-        result = scraper.scrape_title()
-
-        assert result is None
-
-    def test_scrape_title_no_head_returns_none(self, mocker):
-        """Test that missing head tag returns None."""
-        html = "<html><body>No head</body></html>"
-        soup = BeautifulSoup(html, "html.parser")
-
-        scraper = WebScraper()
-        mock_browser = mocker.MagicMock()
-        mock_browser.page = soup
-        scraper.browser = mock_browser
-
-        result = scraper.scrape_title()
-
-        assert result is None
+        async with WebScraper(client) as scraper:
+            result = await scraper.open("https://example.com")
 
-    def test_scrape_title_exception_returns_none(self, mocker):
-        """Test that exception during scraping returns None."""
-        scraper = WebScraper()
-        mock_browser = mocker.MagicMock()
-        mock_browser.page.find.side_effect = Exception("Parse error")
-        scraper.browser = mock_browser
-
-        result = scraper.scrape_title()
-
-        assert result is None
-
-
-class TestWebScraperGetPage:
-    """Tests for WebScraper.get_page method."""
-
-    def test_get_page_returns_soup(self, mocker):
-        """Test that get_page returns BeautifulSoup object."""
-        html = "<html><body>Test</body></html>"
-        soup = BeautifulSoup(html, "html.parser")
-
-        scraper = WebScraper()
-        mock_browser = mocker.MagicMock()
-        mock_browser.page = soup
-        scraper.browser = mock_browser
-
-        result = scraper.get_page()
+        assert result == "https://example.com"
+        assert scraper.get_status_code() == 403
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "error",
+        [
+            httpx.ConnectError("Connection failed"),
+            httpx.ReadTimeout("Request timed out"),
+            httpx.TooManyRedirects("Too many redirects"),
+            ValueError("Unexpected"),
+        ],
+    )
+    async def test_open_failure_returns_none(self, error):
+        """Test that open returns None on failure."""
 
-        assert result is soup
-        assert isinstance(result, BeautifulSoup)
+        def handler(request: httpx.Request) -> httpx.Response:
+            raise error
 
-    def test_get_page_returns_none_when_no_page(self, mocker):
-        """Test that get_page returns None when no page loaded."""
-        scraper = WebScraper()
-        mock_browser = mocker.MagicMock()
-        mock_browser.page = None
-        scraper.browser = mock_browser
+        client = _client(handler)
 
-        result = scraper.get_page()
+        async with WebScraper(client) as scraper:
+            result = await scraper.open("https://example.com")
 
         assert result is None
+        assert scraper.get_page() is None
+        assert scraper.get_status_code() is None
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_open_caps_body_size(self):
+        """Test that no more than `max_page_bytes` of the body are parsed."""
+        body = b"<html><head>" + b" " * 1024 + b"<title>Too far</title></head></html>"
+        client = _client(lambda request: httpx.Response(200, content=body))
+
+        async with WebScraper(client, max_page_bytes=512) as scraper:
+            await scraper.open("https://example.com")
+
+        assert scraper.scrape_title() is None
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_open_decodes_declared_charset(self):
+        """Test that the body is decoded with the charset from the Content-Type header."""
+        body = "<html><head><title>Café</title></head></html>".encode("latin-1")
+        client = _client(
+            lambda request: httpx.Response(
+                200, content=body, headers={"Content-Type": "text/html; charset=latin-1"}
+            )
+        )
 
+        async with WebScraper(client) as scraper:
+            await scraper.open("https://example.com")
 
-class TestWebScraperGetCurrentUrl:
-    """Tests for WebScraper.get_current_url method."""
-
-    def test_get_current_url_success(self, mocker):
-        """Test getting current URL."""
-        scraper = WebScraper()
-        mock_browser = mocker.MagicMock()
-        mock_browser.url = "https://example.com/current"
-        scraper.browser = mock_browser
-
-        result = scraper.get_current_url()
-
-        assert result == "https://example.com/current"
+        assert scraper.scrape_title() == "Café"
+        await client.aclose()
 
-    def test_get_current_url_none_when_no_url(self, mocker):
-        """Test that None is returned when no URL."""
-        scraper = WebScraper()
-        mock_browser = mocker.MagicMock()
-        mock_browser.url = None
-        scraper.browser = mock_browser
 
-        result = scraper.get_current_url()
+class TestWebScraperIsBotBlocked:
+    """Tests for WebScraper.is_bot_blocked method."""
 
-        assert result is None
+    def test_no_page(self):
+        """Test that a scraper without a page is not considered blocked."""
+        assert WebScraper().is_bot_blocked() is False
 
-    def test_get_current_url_exception_returns_none(self, mocker):
-        """Test that exception returns None."""
+    @pytest.mark.parametrize(
+        ["page", "expected"],
+        [
+            (ScrapedPage(title="Just a moment..."), True),
+            (ScrapedPage(title="Example", has_bot_blocking_element=True), True),
+            (ScrapedPage(title="Example"), False),
+        ],
+    )
+    def test_is_bot_blocked(self, page, expected):
+        """Test bot-blocking detection from the title and page elements."""
         scraper = WebScraper()
-        mock_browser = mocker.MagicMock()
-        # Create a property that raises an exception when accessed
-        type(mock_browser).url = mocker.PropertyMock(side_effect=Exception("Error"))
-        scraper.browser = mock_browser
+        scraper.page = page
 
-        result = scraper.get_current_url()
-
-        assert result is None
+        assert scraper.is_bot_blocked() is expected
 
 
 class TestWebScraperClose:
     """Tests for WebScraper.close method."""
 
-    def test_close_closes_session(self, mocker):
-        """Test that close properly closes the session."""
-        scraper = WebScraper()
-        mock_session = mocker.MagicMock()
-        scraper.browser.session = mock_session
-
-        scraper.close()
-
-        mock_session.close.assert_called_once()
-
-    def test_close_calls_browser_close(self, mocker):
-        """Test that browser.close is called."""
-        scraper = WebScraper()
-        mock_browser = mocker.MagicMock()
-        scraper.browser = mock_browser
-
-        scraper.close()
-
-        mock_browser.close.assert_called_once()
-
-    def test_close_handles_exception(self, mocker, caplog):
+    @pytest.mark.asyncio
+    async def test_close_handles_exception(self, mocker, caplog):
         """Test that close handles exceptions gracefully."""
         scraper = WebScraper()
-        mock_browser = mocker.MagicMock()
-        mock_browser.session.close.side_effect = Exception("Close failed")
-        scraper.browser = mock_browser
+        mocker.patch.object(scraper.client, "aclose", side_effect=Exception("Close failed"))
 
         # Should not raise exception
-        scraper.close()
+        await scraper.close()
 
         assert "Error occurred when closing scraper session" in caplog.text
-
-    def test_close_cleans_up_browser_reference(self, mocker):
-        """Test that _browser reference is cleaned up."""
-        scraper = WebScraper()
-        mock_browser = mocker.MagicMock()
-        mock_browser._browser = "something"
-        scraper.browser = mock_browser
-
-        scraper.close()
-
-        assert scraper.browser._browser is None
@@ -146,14 +146,22 @@ def check_request(actual, expected: dict[str, Any]) -> None:
 def check_upload_requests(actual_requests: list, records: list[Record]) -> None:
     """Assert a list of actual requests matches expected upload requests for
     some records. Each record should correspond to two requests, one for
-    uploading the record and one for uploading the attachment.
+    uploading the record and one for uploading the attachment. Records may be
+    uploaded concurrently, so only the order of the two requests of each record
+    is checked.
 
     """
-    upload_requests = [r for r in actual_requests if r.method in ["PUT", "POST"]]
+    upload_requests = [
+        r for r in actual_requests if r.method in ["PUT", "POST"] and not r.url.endswith("/batch")
+    ]
     assert len(upload_requests) == 2 * len(records)
     for r in records:
-        check_request(upload_requests.pop(0), r.expected_record_request)
-        check_request(upload_requests.pop(0), r.expected_attachment_request)
+        record_requests = [
+            req for req in upload_requests if req.url in [r.url, r.post_attachment_url]
+        ]
+        assert len(record_requests) == 2
+        check_request(record_requests[0], r.expected_record_request)
+        check_request(record_requests[1], r.expected_attachment_request)
 
 
 def check_delete_requests(actual_requests: list, records: list[Record]) -> None:
@@ -167,6 +175,23 @@ def check_delete_requests(actual_requests: list, records: list[Record]) -> None:
         check_request(delete_requests.pop(0), r.expected_delete_request)
 
 
+def check_batch_delete_requests(actual_requests: list, records: list[Record]) -> None:
+    """Assert a list of actual requests contains batch requests that delete
+    exactly some records, in order.
+
+    """
+    batch_requests = [r for r in actual_requests if r.url.endswith("/batch")]
+    deletes = [
+        subrequest
+        for r in batch_requests
+        for subrequest in json.loads(r.text)["requests"]
+        if subrequest["method"] == "DELETE"
+    ]
+    assert [subrequest["path"] for subrequest in deletes] == [
+        f"/buckets/{r.bucket}/collections/{r.collection}/records/{r.id}" for r in records
+    ]
+
+
 def mock_responses(
     requests_mock,
     get: list[Record] = [],
@@ -186,6 +211,20 @@ def mock_responses(
                     "base_url": urljoin(server, "/"),
                 },
             },
+            "settings": {
+                "batch_max_requests": 25,
+            },
+        },
+    )
+
+    # batch requests
+    requests_mock.post(
+        f"{server}/batch",
+        json=lambda request, context: {
+            "responses": [
+                {"status": 200, "path": r["path"], "body": {"data": {}}, "headers": {}}
+                for r in request.json()["requests"]
+            ]
         },
     )
 
@@ -6,10 +6,19 @@
 
 from typing import Any
 
+import kinto_http
+import pytest
 
 from merino.jobs.csv_rs_uploader import ChunkedRemoteSettingsSuggestionUploader
+from merino.jobs.utils.chunked_rs_uploader import (
+    ChunkedRemoteSettingsUploader,
+    RecordUpload,
+    upload_records,
+)
+from merino.jobs.utils.rs_client import RemoteSettingsClient
 from tests.unit.jobs.utils.rs_utils import (
     Record as BaseRecord,
+    check_batch_delete_requests,
     check_upload_requests,
     mock_responses,
     SERVER_DATA,
@@ -233,3 +242,124 @@ def test_total_item_count(requests_mock):
             Record(1500, 1999, id=f"{record_type}-1500-1999"),
         ],
     )
+
+
+def test_concurrent_uploads(requests_mock):
+    """Tests uploading many chunks concurrently."""
+    do_upload_test(
+        requests_mock,
+        chunk_size=10,
+        suggestion_count=95,
+        uploader_kwargs={
+            "max_concurrent_uploads": 8,
+        },
+        expected_records=[Record(i, min(i + 10, 95)) for i in range(0, 95, 10)],
+    )
+
+
+def test_upload_retried_on_server_error(requests_mock):
+    """Tests that a chunk upload failing with a server error is retried."""
+    record = Record(0, 10)
+    mock_responses(requests_mock, update=[record])
+    requests_mock.put(record.url, [{"status_code": 503, "json": {}}, {"json": {}}])
+
+    with ChunkedRemoteSettingsUploader(
+        chunk_size=10, upload_retry_wait_sec=0, **TEST_UPLOADER_KWARGS
+    ) as uploader:
+        for i in range(10):
+            uploader.add_item({"i": i})
+
+    failed_request, *requests = requests_mock.request_history
+    assert failed_request.method == "PUT"
+    check_upload_requests(requests, [record])
+
+
+@pytest.mark.parametrize(
+    ["status_code", "expected_attempts"],
+    [(503, 3), (401, 1)],
+    ids=["server_error", "client_error"],
+)
+def test_upload_error_raised(requests_mock, status_code, expected_attempts):
+    """Tests that an upload error is raised once the attempts are exhausted,
+    and that client errors are not retried.
+    """
+    record = Record(0, 10)
+    mock_responses(requests_mock, update=[record])
+    requests_mock.put(record.url, status_code=status_code, json={})
+
+    with pytest.raises(kinto_http.KintoException):
+        with ChunkedRemoteSettingsUploader(
+            chunk_size=10, max_upload_attempts=3, upload_retry_wait_sec=0, **TEST_UPLOADER_KWARGS
+        ) as uploader:
+            for i in range(10):
+                uploader.add_item({"i": i})
+
+    put_requests = [r for r in requests_mock.request_history if r.method == "PUT"]
+    assert len(put_requests) == expected_attempts
+
+
+def test_delete_records(requests_mock):
+    """Tests that `delete_records()` only deletes the existing records that are
+    not uploaded again, and that unchanged records are not uploaded again.
+    """
+    unchanged = Record(0, 10)
+    changed = Record(10, 20)
+    obsolete = Record(20, 30)
+    other_type = Record(0, 10, type="other-type")
+    mock_responses(
+        requests_mock,
+        get=[
+            unchanged,
+            BaseRecord(data=changed.data, attachment=[{"i": -1}]),
+            obsolete,
+            other_type,
+        ],
+        update=[changed],
+    )
+
+    with ChunkedRemoteSettingsUploader(chunk_size=10, **TEST_UPLOADER_KWARGS) as uploader:
+        uploader.delete_records()
+        for i in range(20):
+            uploader.add_item({"i": i})
+
+    check_upload_requests(requests_mock.request_history, [changed])
+    check_batch_delete_requests(requests_mock.request_history, [obsolete])
+
+
+def test_delete_records_not_deleted_on_error(requests_mock):
+    """Tests that existing records are not deleted if the upload fails."""
+    mock_responses(requests_mock, get=[Record(20, 30)])
+
+    with pytest.raises(RuntimeError):
+        with ChunkedRemoteSettingsUploader(chunk_size=10, **TEST_UPLOADER_KWARGS) as uploader:
+            uploader.delete_records()
+            raise RuntimeError("Failed to load items")
+
+    check_batch_delete_requests(requests_mock.request_history, [])
+
+
+def test_upload_records(requests_mock):
+    """Tests that `upload_records()` returns whether each record was uploaded,
+    in order, and retries uploads failing with a server error.
+    """
+    retried = Record(0, 10)
+    unchanged = Record(10, 20)
+    uploaded = Record(20, 30)
+    mock_responses(requests_mock, update=[retried, uploaded])
+    requests_mock.put(retried.url, [{"status_code": 503, "json": {}}, {"json": {}}])
+
+    results = upload_records(
+        RemoteSettingsClient(**SERVER_DATA, dry_run=False),
+        [
+            RecordUpload(retried.data, retried.attachment),
+            RecordUpload(
+                unchanged.data, unchanged.attachment, existing_record=unchanged.all_data()
+            ),
+            RecordUpload(uploaded.data, uploaded.attachment),
+        ],
+        upload_retry_wait_sec=0,
+    )
+
+    assert results == [True, False, True]
+    put_requests = [r for r in requests_mock.request_history if r.method == "PUT"]
+    assert sorted(r.url for r in put_requests) == sorted([retried.url, retried.url, uploaded.url])
@@ -6,6 +6,7 @@
 
 from typing import Any
 
+import pytest
 
 from merino.jobs.utils.rs_client import (
     RemoteSettingsClient,
@@ -15,6 +16,7 @@ from merino.jobs.utils.rs_client import (
 
 from tests.unit.jobs.utils.rs_utils import (
     Record,
+    check_batch_delete_requests,
     check_delete_requests,
     check_upload_requests,
     mock_responses,
@@ -194,6 +196,21 @@ def test_delete_dry_run(requests_mock):
     )
 
 
+@pytest.mark.parametrize("dry_run", [False, True], ids=["run", "dry_run"])
+def test_delete_records(requests_mock, dry_run):
+    """Tests deleting many records in batch requests"""
+    mock_responses(requests_mock)
+    records = [Record(data={"id": f"test-{i}"}, attachment=None) for i in range(60)]
+
+    client = RemoteSettingsClient(**(TEST_CLIENT_KWARGS | {"dry_run": dry_run}))
+    client.delete_records(r.id for r in records)
+
+    batch_requests = [r for r in requests_mock.request_history if r.url.endswith("/batch")]
+    assert len(batch_requests) == (0 if dry_run else 3)
+    check_batch_delete_requests(requests_mock.request_history, [] if dry_run else records)
+    check_delete_requests(requests_mock.request_history, [])
+
+
 def test_filter_expression_none():
     """Test `filter_expression` function with no countries or locales"""
     assert filter_expression() == ""
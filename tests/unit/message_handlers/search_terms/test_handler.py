@@ -38,6 +38,26 @@ async def test_start_stop_lifecycle() -> None:
     assert not handler.is_running()
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("target_flush_latency_sec", "expected"), [(2.5, 2.5), (0, None), (0.0, None), (None, None)]
+)
+async def test_target_flush_latency_sets_adaptive_batching(
+    mocker: MockerFixture, target_flush_latency_sec: float | None, expected: float | None
+) -> None:
+    """Test that a target flush latency of 0 or None keeps a fixed batch size."""
+    mocker.patch.object(
+        settings.message_handler, "target_flush_latency_sec", target_flush_latency_sec
+    )
+    handler = MessageHandler(on_batch=_noop)
+    await handler.start()
+
+    assert handler._queue is not None
+    assert handler._queue.target_flush_latency_s == expected
+    assert handler._queue.batch_size == settings.message_handler.max_batch_size
+    await handler.stop()
+
+
 @pytest.mark.asyncio
 async def test_start_is_idempotent() -> None:
     """Test that a second start while running does not replace the queue."""
@@ -1,5 +1,6 @@
 """Unit tests for merino/optimizers/thompson.py"""
 
+import numpy as np
 import pytest
 
 from merino.optimizers.models import EngagementMetrics, ThompsonCandidate, ThompsonConfig
@@ -108,3 +109,44 @@ class TestThompsonSamplerMultipleCandidates:
         sampler = ThompsonSampler(config=ThompsonConfig(random_seed=seed))
         result = sampler.sample(candidates)
         assert result in candidates
+
+
+class TestThompsonSamplerSelect:
+    """Tests for sampling candidates given as arrays of Beta parameters."""
+
+    def test_empty_arrays_return_none(self) -> None:
+        """select() with no candidates returns None."""
+        sampler = ThompsonSampler(config=ThompsonConfig())
+        assert sampler.select(np.array([]), np.array([])) is None
+
+    def test_returns_index_of_best_candidate(self) -> None:
+        """With far apart priors, the index of the highest-CTR candidate is selected."""
+        sampler = ThompsonSampler(config=ThompsonConfig(random_seed=0))
+        alpha = np.array([1.0, 1000.0, 1.0])
+        beta = np.array([1000.0, 1.0, 1000.0])
+        assert sampler.select(alpha, beta) == 1
+
+    def test_dummy_suppresses_poor_candidates(self) -> None:
+        """A dominant dummy suppresses the winner, as in sample()."""
+        dummy = EngagementMetrics(engaged=1000, attempted=1001)
+        sampler = ThompsonSampler(config=ThompsonConfig(dummy_candidate=dummy, random_seed=0))
+        assert sampler.select(np.array([1.0, 2.0]), np.array([999.0, 998.0])) is None
+
+    def test_matches_sample(self) -> None:
+        """select() and sample() pick the same candidate from the same random stream."""
+        candidates = [make_candidate(str(i), engaged=i + 1, attempted=10) for i in range(5)]
+        index = ThompsonSampler(config=ThompsonConfig(random_seed=3)).select(
+            np.array([c.metrics.engaged for c in candidates], dtype=np.float64),
+            np.array([c.metrics.not_engaged for c in candidates], dtype=np.float64),
+        )
+        winner = ThompsonSampler(config=ThompsonConfig(random_seed=3)).sample(candidates)
+        assert index is not None
+        assert winner is candidates[index]
+
+    def test_ratio_below_threshold(self) -> None:
+        """ratio_below_threshold() compares a raw ratio with the dummy's CTR."""
+        dummy = EngagementMetrics(engaged=1, attempted=10)
+        sampler = ThompsonSampler(config=ThompsonConfig(dummy_candidate=dummy))
+        assert sampler.ratio_below_threshold(0.05)
+        assert not sampler.ratio_below_threshold(0.5)
+        assert not ThompsonSampler(config=ThompsonConfig()).ratio_below_threshold(0.0)
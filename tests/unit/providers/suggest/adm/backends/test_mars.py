@@ -6,6 +6,7 @@
 
 import json
 from collections import defaultdict
+from pathlib import Path
 from typing import Any
 
 import httpx
@@ -22,6 +23,7 @@ from merino.providers.suggest.adm.backends.protocol import (
     SuggestionContent,
 )
 from merino.utils.icon_processor import IconProcessor
+from merino.utils.snapshot import Snapshot
 from tests.types import FilterCaplogFixture
 
 
@@ -681,3 +683,113 @@ async def test_index_metrics_emitted_after_build(
 
     assert "amp.index.keyword_index_size" in index_calls
     assert index_calls["amp.index.keyword_index_size"]["value"] == 5
+
+
+@pytest.fixture(name="snapshot")
+def fixture_snapshot(statsd_mock: Any, tmp_path: Path) -> Snapshot:
+    """Create a local snapshot of the MARS suggestions in a temporary directory."""
+    return Snapshot("adm_mars", tmp_path, 3600.0, statsd_mock)
+
+
+def test_restore_snapshot_without_snapshot(mars_backend: MarsBackend) -> None:
+    """Test that nothing is restored when warm starts are disabled."""
+    assert mars_backend.restore_snapshot() is None
+
+
+@pytest.mark.asyncio
+async def test_restore_snapshot(
+    mocker: MockerFixture,
+    mock_icon_processor: IconProcessor,
+    statsd_mock: Any,
+    snapshot: Snapshot,
+    suggestion_response: httpx.Response,
+) -> None:
+    """Test that the suggestions saved on fetch are restored by the next backend, along
+    with their icons and ETags, so that its first fetch is conditional.
+    """
+    get = mocker.patch.object(httpx.AsyncClient, "get", return_value=suggestion_response)
+    backend = MarsBackend(
+        base_url="http://test-mars-api",
+        icon_processor=mock_icon_processor,
+        metrics_client=statsd_mock,
+        connect_timeout=5.0,
+        request_timeout=10.0,
+        snapshot=snapshot,
+    )
+    await backend.fetch()
+
+    restarted = MarsBackend(
+        base_url="http://test-mars-api",
+        icon_processor=mock_icon_processor,
+        metrics_client=statsd_mock,
+        connect_timeout=5.0,
+        request_timeout=10.0,
+        snapshot=snapshot,
+    )
+    content = restarted.restore_snapshot()
+
+    assert content is not None
+    assert content.index_manager.stats(
+        DEFAULT_IDX_ID
+    ) == backend.suggestion_content.index_manager.stats(DEFAULT_IDX_ID)
+    assert content.icons == backend.suggestion_content.icons
+    assert restarted.etags == {DEFAULT_IDX_ID: '"etag-v1"'}
+    assert restarted.last_new_data_at == backend.last_new_data_at
+
+    get.return_value = httpx.Response(
+        status_code=304,
+        request=httpx.Request(method="GET", url="http://test-mars-api/data"),
+    )
+    assert await restarted.fetch() is content
+    assert get.call_args.kwargs["headers"] == {"If-None-Match": '"etag-v1"'}
+
+
+@pytest.mark.asyncio
+async def test_save_snapshot_prunes_unconfigured_segments(
+    mocker: MockerFixture,
+    mars_backend: MarsBackend,
+    snapshot: Snapshot,
+    suggestion_array_json: str,
+    suggestion_response: httpx.Response,
+) -> None:
+    """Test that the suggestions of segments no longer configured aren't snapshotted."""
+    mocker.patch.object(httpx.AsyncClient, "get", return_value=suggestion_response)
+    mars_backend.snapshot = snapshot
+    mars_backend.raw_suggestions = {f"DE/{DEFAULT_SEGMENT}": suggestion_array_json}
+
+    await mars_backend.fetch()
+
+    payload = snapshot.load(1)
+    assert payload is not None
+    assert list(json.loads(payload)["suggestions"]) == [DEFAULT_IDX_ID]
+    assert list(mars_backend.raw_suggestions) == [DEFAULT_IDX_ID]
+
+
+@pytest.mark.asyncio
+async def test_restore_snapshot_skips_invalid_index(
+    caplog: LogCaptureFixture,
+    filter_caplog: FilterCaplogFixture,
+    mocker: MockerFixture,
+    mars_backend: MarsBackend,
+    snapshot: Snapshot,
+    suggestion_array_json: str,
+) -> None:
+    """Test that a snapshot of suggestions that don't build into an index isn't restored."""
+    mocker.patch.object(
+        moz_merino_ext.amp.AmpIndexManager,
+        "build",
+        side_effect=Exception("Build Index Error"),
+    )
+    payload = {
+        "suggestions": {DEFAULT_IDX_ID: suggestion_array_json},
+        "etags": {DEFAULT_IDX_ID: '"etag-v1"'},
+        "icons": {},
+        "last_new_data_at": 1.0,
+    }
+    await snapshot.save(json.dumps(payload).encode(), 1)
+    mars_backend.snapshot = snapshot
+
+    assert mars_backend.restore_snapshot() is None
+    assert mars_backend.etags == {}
+    records = filter_caplog(caplog.records, "merino.providers.suggest.adm.backends.mars")
+    assert records[0].message == f"Unable to build index {DEFAULT_IDX_ID} from the snapshot"
@@ -0,0 +1,87 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""Unit tests for the AMP engagement priors (`adm/priors.py`)."""
+
+import logging
+
+import pytest
+
+from merino.providers.suggest.adm.backends.protocol import (
+    EngagementData,
+    KeywordEntry,
+    KeywordMetrics,
+)
+from merino.providers.suggest.adm.priors import EngagementPriors
+
+
+def test_lookup_returns_priors_in_candidate_order(engagement_data: EngagementData) -> None:
+    """Priors come out as parallel arrays, in the order the advertisers are given."""
+    priors = EngagementPriors(engagement_data)
+
+    result = priors.lookup("firefox", ["example.org", "mozilla"])
+
+    assert result.alpha.tolist() == [10000, 5]
+    assert result.beta.tolist() == [1, 95]
+    assert result.attempted.tolist() == [10001, 100]
+    assert result.ratio(1) == pytest.approx(0.05)
+
+
+def test_lookup_prefers_live_metrics_and_falls_back_to_historical() -> None:
+    """Live metrics win over historical ones, which are used when live ones are absent."""
+    priors = EngagementPriors(
+        EngagementData(
+            amp={
+                "a/kw": KeywordEntry(
+                    live=KeywordMetrics(impressions=10, clicks=2),
+                    historical=KeywordMetrics(impressions=50, clicks=20),
+                ),
+                "b/kw": KeywordEntry(historical=KeywordMetrics(impressions=50, clicks=20)),
+            }
+        )
+    )
+
+    result = priors.lookup("kw", ["a", "b"])
+
+    assert result.alpha.tolist() == [2, 20]
+    assert result.attempted.tolist() == [10, 50]
+
+
+def test_lookup_defaults_unknown_pairs(engagement_data: EngagementData) -> None:
+    """Unknown keywords and advertisers get the uninformative (1, 1) prior."""
+    priors = EngagementPriors(engagement_data)
+
+    for keyword, advertisers in (("nothing", ["mozilla"]), ("firefox", ["unknown"])):
+        result = priors.lookup(keyword, advertisers)
+        assert result.alpha.tolist() == [1]
+        assert result.beta.tolist() == [1]
+        assert result.attempted.tolist() == [1]
+
+
+def test_keyword_may_contain_slashes() -> None:
+    """Only the first slash separates the advertiser from the keyword."""
+    priors = EngagementPriors(
+        EngagementData(
+            amp={"a/24/7 support": KeywordEntry(live=KeywordMetrics(impressions=9, clicks=3))}
+        )
+    )
+
+    assert priors.lookup("24/7 support", ["a"]).alpha.tolist() == [3]
+
+
+def test_invalid_entries_are_skipped(caplog: pytest.LogCaptureFixture) -> None:
+    """Entries with more clicks than impressions are skipped and logged, not raised."""
+    data = EngagementData(
+        amp={
+            "a/kw": KeywordEntry(live=KeywordMetrics(impressions=1, clicks=5)),
+            "b/kw": KeywordEntry(live=KeywordMetrics(impressions=10, clicks=5)),
+        }
+    )
+
+    with caplog.at_level(logging.WARNING):
+        priors = EngagementPriors(data)
+
+    assert len(priors) == 1
+    assert priors.lookup("kw", ["a"]).alpha.tolist() == [1]
+    assert "Skipped invalid keyword engagement entries" in caplog.text
@@ -4,6 +4,7 @@
 
 """Unit tests for the adm provider module."""
 
+from pathlib import Path
 from typing import Any
 from unittest.mock import patch
 
@@ -27,6 +28,7 @@ from merino.providers.suggest.adm.provider import (
     Provider,
 )
 from merino.providers.suggest.custom_details import AmpDetails, CustomDetails
+from merino.utils.snapshot import Snapshot
 
 from tests.types import FilterCaplogFixture
 from tests.unit.types import SuggestionRequestFixture
@@ -596,6 +598,67 @@ async def test_emit_staleness_with_mars_backend(
     assert call_args[1]["value"] > 0
 
 
+@pytest.mark.asyncio
+async def test_initialize_warm_start(
+    mocker: MockerFixture,
+    adm: Provider,
+    backend_mock: Any,
+    adm_parameters: dict[str, Any],
+    statsd_mock: Any,
+    tmp_path: Path,
+) -> None:
+    """Test a warm start restores the suggestions from the backend snapshot and the
+    engagement data saved to its snapshot on fetch, leaving both refreshes to the cron jobs.
+    """
+    mocker.patch.object(adm.filemanager, "get_file", return_value=SAMPLE_ENGAGEMENT_DATA)
+    adm.engagement_snapshot = Snapshot("adm_engagement", tmp_path, 3600.0, statsd_mock)
+    await adm._fetch_engagement_data()
+
+    content = backend_mock.fetch.return_value
+    backend_mock.restore_snapshot.return_value = content
+    restarted = Provider(
+        backend=backend_mock,
+        metrics_client=statsd_mock,
+        warm_start=True,
+        engagement_snapshot=adm.engagement_snapshot,
+        **adm_parameters,
+    )
+    get_file = mocker.patch.object(restarted.filemanager, "get_file")
+    mocker.patch("merino.providers.suggest.adm.provider.cron.Job", return_value=mocker.AsyncMock())
+
+    await restarted.initialize()
+
+    backend_mock.fetch.assert_not_awaited()
+    get_file.assert_not_called()
+    assert restarted.suggestion_content is content
+    assert restarted.engagement_data == SAMPLE_ENGAGEMENT_DATA
+    assert restarted.warm_started
+    assert restarted.last_fetch_at == 0
+    assert restarted.last_engagement_fetch_at == 0
+
+
+@pytest.mark.asyncio
+async def test_initialize_cold_start_without_snapshot(
+    mocker: MockerFixture,
+    backend_mock: Any,
+    adm_parameters: dict[str, Any],
+    statsd_mock: Any,
+) -> None:
+    """Test a warm start falls back to fetching when the backend has no snapshot."""
+    backend_mock.restore_snapshot.return_value = None
+    adm = Provider(
+        backend=backend_mock, metrics_client=statsd_mock, warm_start=True, **adm_parameters
+    )
+    mocker.patch.object(adm.filemanager, "get_file", return_value=None)
+    mocker.patch("merino.providers.suggest.adm.provider.cron.Job", return_value=mocker.AsyncMock())
+
+    await adm.initialize()
+
+    backend_mock.fetch.assert_awaited_once()
+    assert not adm.warm_started
+    assert adm.last_fetch_at > 0
+
+
 @pytest.mark.asyncio
 async def test_emit_staleness_without_mars_backend(
     adm: Provider,
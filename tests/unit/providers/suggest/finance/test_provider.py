@@ -6,6 +6,7 @@
 
 import asyncio
 import time
+from pathlib import Path
 from typing import Any
 from unittest.mock import AsyncMock, patch
 
@@ -31,6 +32,7 @@ from merino.providers.suggest.finance.provider import (
     BaseSuggestion,
     SuggestionRequest,
 )
+from merino.utils.snapshot import Snapshot
 
 
 @pytest.fixture(name="geolocation")
@@ -533,3 +535,48 @@ async def test_initialize_does_not_run_when_gcs_disabled(provider):
         mock_create_task.assert_not_called()
         mock_job.assert_not_called()
         assert not hasattr(provider, "cron_task_fetch")
+
+
+@pytest.mark.asyncio
+async def test_initialize_warm_starts_from_snapshot(
+    provider: Provider, mocker: MockerFixture, statsd_mock: Any, tmp_path: Path
+) -> None:
+    """Ensure a manifest saved to the snapshot on fetch is restored by the next provider
+    on initialize, leaving the refresh to the cron job.
+    """
+    manifest = FinanceManifest(tickers={"AAPL": "https://cdn.example.com/aapl.png"})
+    mocker.patch.object(
+        provider.backend,
+        "fetch_manifest_data",
+        return_value=(GetManifestResultCode.SUCCESS, manifest),
+    )
+    provider.snapshot = Snapshot("polygon", tmp_path, 3600.0, statsd_mock)
+    await provider._fetch_manifest()
+
+    restarted = Provider(
+        backend=provider.backend,
+        metrics_client=statsd_mock,
+        name="finance",
+        score=0.3,
+        query_timeout_sec=0.2,
+        cron_interval_sec=60,
+        resync_interval_sec=86400,
+        snapshot=provider.snapshot,
+    )
+    with (
+        patch("merino.providers.suggest.finance.provider.settings") as mock_settings,
+        patch.object(restarted, "_fetch_manifest", new=AsyncMock()) as mock_fetch_manifest,
+        patch("merino.providers.suggest.finance.provider.cron.Job") as mock_job,
+    ):
+        mock_settings.image_gcs.gcs_enabled = True
+        mock_job.return_value = AsyncMock(name="mock_cron_job")
+
+        await restarted.initialize()
+
+        mock_fetch_manifest.assert_not_awaited()
+        mock_job.assert_called_once()
+
+    assert restarted.manifest_data == manifest
+    assert restarted.warm_started
+    assert restarted.data_fetched_event.is_set()
+    assert restarted._should_fetch()
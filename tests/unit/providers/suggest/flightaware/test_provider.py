@@ -26,6 +26,7 @@ from merino.providers.suggest.flightaware.backends.protocol import (
     FlightSummary,
     GetFlightNumbersResultCode,
 )
+from merino.utils.snapshot import Snapshot
 
 
 @pytest.fixture
@@ -392,3 +393,50 @@ async def test_initialize_does_not_run_when_gcs_disabled(provider):
         mock_fetch.assert_not_awaited()
         mock_create_task.assert_not_called()
         assert not hasattr(provider, "cron_task")
+
+
+@pytest.fixture
+def snapshot(tmp_path):
+    """Return a local snapshot of the flight numbers in a temporary directory."""
+    return Snapshot("flightaware", tmp_path, 3600.0, MagicMock(spec=aiodogstatsd.Client))
+
+
+@pytest.mark.asyncio
+async def test_fetch_data_saves_snapshot(provider, snapshot):
+    """_fetch_data should save the fetched flight numbers to the snapshot."""
+    provider.snapshot = snapshot
+    provider.backend.fetch_flight_numbers.return_value = (
+        GetFlightNumbersResultCode.SUCCESS,
+        ["UA123", "AA100"],
+    )
+
+    await provider._fetch_data()
+
+    assert provider._restore_snapshot()
+    assert provider.flight_numbers == {"UA123", "AA100"}
+
+
+@pytest.mark.asyncio
+async def test_initialize_warm_starts_from_snapshot(provider, snapshot):
+    """Initialize should restore the flight numbers from the snapshot rather than fetch
+    them, and leave the refresh to the cron job.
+    """
+    await snapshot.save(b'["UA123", "AA100"]', 1)
+    provider.snapshot = snapshot
+    with (
+        patch("merino.providers.suggest.flightaware.provider.settings") as mock_settings,
+        patch.object(provider, "_fetch_data", new=AsyncMock()) as mock_fetch,
+        patch("merino.providers.suggest.flightaware.provider.cron.Job") as mock_job,
+    ):
+        mock_settings.image_gcs.gcs_enabled = True
+        mock_job.return_value = AsyncMock(name="mock_cron_job")
+
+        await provider.initialize()
+
+        mock_fetch.assert_not_awaited()
+        mock_job.assert_called_once()
+
+    assert provider.flight_numbers == {"UA123", "AA100"}
+    assert provider.warm_started
+    assert provider.data_fetched_event.is_set()
+    assert provider._should_fetch()
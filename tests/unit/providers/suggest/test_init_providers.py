@@ -4,6 +4,7 @@
 
 """Unit tests for the __init__ suggest provider module."""
 
+import asyncio
 import logging
 from unittest.mock import AsyncMock, patch
 
@@ -16,6 +17,7 @@ from merino.configs import settings
 from merino.exceptions import InvalidProviderError
 from merino.providers.suggest import (
     _initialize_provider,
+    _shutdown_provider,
     get_providers,
     init_providers,
     load_providers,
@@ -67,20 +69,34 @@ async def test_init_providers() -> None:
 @pytest.mark.asyncio
 async def test_initialize_provider_records_otel_duration(mocker: MockerFixture) -> None:
     """Test provider initialization duration is recorded with a provider attribute."""
-    provider = mocker.AsyncMock()
+    provider = mocker.AsyncMock(warm_started=False)
     histogram = mocker.patch("merino.providers.suggest._provider_initialize_duration")
     mocker.patch("merino.providers.suggest.timer", side_effect=[10.0, 10.125])
 
     await _initialize_provider("adm", provider)
 
     provider.initialize.assert_awaited_once_with()
-    histogram.record.assert_called_once_with(125.0, {"provider": "adm"})
+    histogram.record.assert_called_once_with(125.0, {"provider": "adm", "start": "cold"})
+
+
+@pytest.mark.asyncio
+async def test_initialize_provider_records_warm_start(mocker: MockerFixture) -> None:
+    """Test the initialization of a provider loaded from a snapshot is recorded as warm."""
+    provider = mocker.AsyncMock(warm_started=True)
+    histogram = mocker.patch("merino.providers.suggest._provider_initialize_duration")
+    mocker.patch("merino.providers.suggest.timer", side_effect=[10.0, 10.01])
+
+    await _initialize_provider("adm", provider)
+
+    histogram.record.assert_called_once_with(
+        pytest.approx(10.0), {"provider": "adm", "start": "warm"}
+    )
 
 
 @pytest.mark.asyncio
 async def test_initialize_provider_records_duration_on_error(mocker: MockerFixture) -> None:
     """Test failed initialization is timed and its error is propagated."""
-    provider = mocker.AsyncMock()
+    provider = mocker.AsyncMock(warm_started=False)
     provider.initialize.side_effect = RuntimeError("initialization failed")
     histogram = mocker.patch("merino.providers.suggest._provider_initialize_duration")
     mocker.patch("merino.providers.suggest.timer", side_effect=[20.0, 20.25])
@@ -88,13 +104,13 @@ async def test_initialize_provider_records_duration_on_error(mocker: MockerFixtu
     with pytest.raises(RuntimeError, match="initialization failed"):
         await _initialize_provider("accuweather", provider)
 
-    histogram.record.assert_called_once_with(250.0, {"provider": "accuweather"})
+    histogram.record.assert_called_once_with(250.0, {"provider": "accuweather", "start": "cold"})
 
 
 @pytest.mark.asyncio
 async def test_init_providers_propagates_initialization_error(mocker: MockerFixture) -> None:
     """Test initialization errors propagate and both provider durations are recorded."""
-    provider = mocker.AsyncMock()
+    provider = mocker.AsyncMock(warm_started=False)
     provider.initialize.side_effect = RuntimeError("initialization failed")
     mocker.patch("merino.providers.suggest.load_providers", return_value={"adm": provider})
     mocker.patch.dict("merino.providers.suggest.providers", {}, clear=True)
@@ -104,8 +120,8 @@ async def test_init_providers_propagates_initialization_error(mocker: MockerFixt
         await init_providers()
 
     assert [call.args[1] for call in histogram.record.call_args_list] == [
-        {"provider": "adm"},
-        {"provider": "__ALL__"},
+        {"provider": "adm", "start": "cold"},
+        {"provider": "__ALL__", "start": "cold"},
     ]
 
 
@@ -160,3 +176,111 @@ async def test_shutdown_providers(
     assert set(providers) == {
         provider.value for provider in ProviderType if provider.value not in DISABLED_PROVIDERS
     }
+
+
+@pytest.mark.asyncio
+async def test_shutdown_provider_records_otel_duration(mocker: MockerFixture) -> None:
+    """Test provider shutdown duration is recorded with a provider attribute."""
+    provider = mocker.AsyncMock()
+    histogram = mocker.patch("merino.providers.suggest._provider_shutdown_duration")
+    mocker.patch("merino.providers.suggest.timer", side_effect=[30.0, 30.5])
+
+    await _shutdown_provider("adm", provider)
+
+    provider.shutdown.assert_awaited_once_with()
+    histogram.record.assert_called_once_with(500.0, {"provider": "adm"})
+
+
+@pytest.mark.asyncio
+async def test_shutdown_providers_runs_concurrently(mocker: MockerFixture) -> None:
+    """Test providers shut down concurrently rather than one after another."""
+    running = 0
+    max_running = 0
+
+    async def shutdown() -> None:
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+
+    slow_providers = {name: mocker.AsyncMock() for name in ["adm", "wikipedia", "yelp"]}
+    for provider in slow_providers.values():
+        provider.shutdown.side_effect = shutdown
+    mocker.patch.dict("merino.providers.suggest.providers", slow_providers, clear=True)
+    histogram = mocker.patch("merino.providers.suggest._provider_shutdown_duration")
+
+    await shutdown_providers()
+
+    assert max_running == 3
+    assert sorted(call.args[1]["provider"] for call in histogram.record.call_args_list) == [
+        "__ALL__",
+        "adm",
+        "wikipedia",
+        "yelp",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_shutdown_providers_cancels_stragglers(
+    caplog: LogCaptureFixture,
+    filter_caplog: FilterCaplogFixture,
+    mocker: MockerFixture,
+) -> None:
+    """Test providers still shutting down at the deadline are cancelled."""
+    caplog.set_level(logging.INFO)
+    cancelled = asyncio.Event()
+
+    async def hang() -> None:
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    straggler = mocker.AsyncMock()
+    straggler.shutdown.side_effect = hang
+    mocker.patch.dict(
+        "merino.providers.suggest.providers",
+        {"adm": mocker.AsyncMock(), "wikipedia": straggler},
+        clear=True,
+    )
+    mocker.patch.dict(settings.runtime, values={"shutdown_timeout_sec": 0.01})
+
+    await asyncio.wait_for(shutdown_providers(), timeout=1)
+    await asyncio.wait_for(cancelled.wait(), timeout=1)
+
+    records = filter_caplog(caplog.records, "merino.providers.suggest")
+    assert [record.message for record in records] == [
+        "Provider shutdown timed out",
+        "Provider shutdown completed",
+    ]
+    assert records[0].__dict__["providers"] == ["wikipedia"]
+
+
+@pytest.mark.asyncio
+async def test_shutdown_providers_continues_after_error(
+    caplog: LogCaptureFixture,
+    filter_caplog: FilterCaplogFixture,
+    mocker: MockerFixture,
+) -> None:
+    """Test a failing provider is logged and doesn't stop the others from shutting down."""
+    caplog.set_level(logging.INFO)
+    failing = mocker.AsyncMock()
+    failing.shutdown.side_effect = RuntimeError("shutdown failed")
+    healthy = mocker.AsyncMock()
+    mocker.patch.dict(
+        "merino.providers.suggest.providers",
+        {"adm": failing, "wikipedia": healthy},
+        clear=True,
+    )
+
+    await shutdown_providers()
+
+    healthy.shutdown.assert_awaited_once_with()
+    records = filter_caplog(caplog.records, "merino.providers.suggest")
+    assert [record.message for record in records] == [
+        "Provider shutdown failed: shutdown failed",
+        "Provider shutdown completed",
+    ]
+    assert records[0].__dict__["provider"] == "adm"
@@ -6,6 +6,8 @@
 
 import time
 from collections import defaultdict
+from pathlib import Path
+from typing import Any
 
 import pytest
 from pydantic import HttpUrl
@@ -19,6 +21,7 @@ from merino.providers.suggest.top_picks.backends.top_picks import TopPicksBacken
 from merino.providers.suggest.top_picks.provider import Provider, Suggestion
 from merino.providers.suggest.base import BaseSuggestion
 from merino.utils.domain_categories.models import Category
+from merino.utils.snapshot import Snapshot
 from tests.types import FilterCaplogFixture
 from tests.unit.types import SuggestionRequestFixture
 
@@ -98,6 +101,31 @@ async def test_initialize_fail(
     assert top_picks.top_picks_data == expected_empty_top_picks_data
 
 
+@pytest.mark.asyncio
+async def test_initialize_warm_start(
+    mocker,
+    top_picks: Provider,
+    backend: TopPicksBackend,
+    top_picks_parameters: dict[str, Any],
+    statsd_mock: Any,
+    tmp_path: Path,
+) -> None:
+    """Test the data saved to the snapshot on fetch is restored by the next provider on
+    initialization, without fetching it.
+    """
+    top_picks.snapshot = Snapshot("top_picks", tmp_path, 3600.0, statsd_mock)
+    await top_picks._fetch_top_picks_data()
+
+    restarted = Provider(backend=backend, snapshot=top_picks.snapshot, **top_picks_parameters)
+    fetch = mocker.patch.object(backend, "fetch")
+    await restarted.initialize()
+
+    fetch.assert_not_called()
+    assert restarted.top_picks_data == top_picks.top_picks_data
+    assert restarted.warm_started
+    assert restarted.last_fetch_at == 0
+
+
 def test_should_fetch_true(top_picks: Provider):
     """Test that provider should fetch is true."""
     top_picks.last_fetch_at = time.time() - top_picks.resync_interval_sec - 100
@@ -59,6 +59,7 @@ from merino.providers.suggest.weather.backends.protocol import (
     WeatherReport,
     WeatherContext,
 )
+from merino.utils.hedging import Hedger
 from tests.types import FilterCaplogFixture
 
 ACCUWEATHER_CACHE_EXPIRY_DATE_FORMAT = "%a, %d %b %Y %H:%M:%S %Z"
@@ -2130,6 +2131,46 @@ async def test_request_upstream_cache_get_errors(
     ] == timeit_metrics_called
 
 
+@pytest.mark.asyncio
+async def test_request_upstream_hedged_per_request_type(
+    accuweather_parameters: dict[str, Any],
+    redis_mock_cache_miss: AsyncMock,
+    statsd_mock: Any,
+) -> None:
+    """Test that upstream requests go through the hedger of their request type, so the
+    latencies of one endpoint don't set the hedge delay of another.
+    """
+    hedgers: dict[RequestType, Hedger | None] = {
+        request_type: Hedger(
+            f"accuweather.upstream.{request_type}", statsd_mock, window_size=1, min_samples=1
+        )
+        for request_type in (RequestType.LOCATIONS, RequestType.FORECASTS)
+    }
+    accuweather: AccuweatherBackend = AccuweatherBackend(
+        cache=RedisAdapter(redis_mock_cache_miss), hedgers=hedgers, **accuweather_parameters
+    )
+    url = "/forecasts/v1/daily/1day/39376.json"
+    client_mock: AsyncMock = cast(AsyncMock, accuweather.http_client)
+    client_mock.get.return_value = Response(
+        status_code=200,
+        content=orjson.dumps({"hello": "world"}),
+        request=Request(method="GET", url=f"https://www.accuweather.com/{url}?apikey=test"),
+    )
+
+    await accuweather.request_upstream(
+        url,
+        {"apikey": "test"},
+        RequestType.FORECASTS,
+        lambda a: cast(Optional[dict[str, Any]], a),
+        should_cache=False,
+    )
+
+    forecasts_hedger = hedgers[RequestType.FORECASTS]
+    locations_hedger = hedgers[RequestType.LOCATIONS]
+    assert forecasts_hedger is not None and forecasts_hedger.delay_sec is not None
+    assert locations_hedger is not None and locations_hedger.delay_sec is None
+
+
 @freezegun.freeze_time("2023-04-09")
 @pytest.mark.asyncio
 async def test_get_request_cache_store_errors(
@@ -1,5 +1,6 @@
 """Unit tests for the Elastic Backend."""
 
+import asyncio
 import string
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock
@@ -19,6 +20,7 @@ from merino.providers.suggest.wikipedia.backends.elastic import (
     get_best_keyword,
 )
 from merino.search.async_elastic import AsyncElasticSearchAdapter
+from merino.utils.hedging import Hedger
 
 
 @pytest.fixture(name="es_backend")
@@ -347,6 +349,39 @@ async def test_es_backend_multiple_searches_reuse_adapter(
     assert async_mock.await_count == 2
 
 
+@pytest.mark.asyncio
+async def test_es_backend_search_hedged(mocker: MockerFixture, statsd_mock: Any) -> None:
+    """Verify a slow search is hedged with an identical one when a hedger is given."""
+    hedger = Hedger("wikipedia.es", statsd_mock, max_hedge_ratio=1.0, window_size=1, min_samples=1)
+    hedger._observe(0.01)
+    responses = [
+        {"suggest": {SUGGEST_ID: [{"options": [{"_source": {"title": "Slow"}}]}]}},
+        {"suggest": {SUGGEST_ID: [{"options": [{"_source": {"title": "Fast"}}]}]}},
+    ]
+    searches: list[dict[str, Any]] = []
+
+    async def search(**kwargs: Any) -> dict[str, Any]:
+        searches.append(kwargs)
+        response = responses[len(searches) - 1]
+        if len(searches) == 1:
+            await asyncio.sleep(1)
+        return response
+
+    mocker.patch.object(AsyncElasticSearchAdapter, "search", side_effect=search)
+    backend = ElasticBackend(
+        url="https://localhost:9200",
+        api_key=settings.providers.wikipedia.es_api_key,
+        metrics_client=statsd_mock,
+        hedger=hedger,
+    )
+
+    suggestions = await backend.search("foo", "en")
+
+    assert [suggestion["title"] for suggestion in suggestions] == ["Wikipedia - Fast"]
+    assert searches[0] == searches[1]
+    statsd_mock.increment.assert_any_call("wikipedia.es.hedge.won")
+
+
 def test_get_best_keyword_removes_trailing_punctuation() -> None:
     """Test that the get_best_keyword method removes any trailing punctuation for
     keywords.
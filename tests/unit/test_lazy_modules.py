@@ -0,0 +1,94 @@
+"""Tests that provider modules, and the heavy data and libraries they depend on, are
+only imported when the provider is enabled.
+
+Each check runs in a fresh interpreter, since the test session has already imported
+most of Merino. The import time and memory budgets of the same startup are checked by
+`tests/benchmarks/test_startup_budget.py`.
+"""
+
+import json
+import os
+from pathlib import Path
+
+# subprocess is used only for fixed-argv fresh interpreter checks.
+import subprocess  # nosec B404
+import sys
+from typing import Any
+
+import pytest
+
+from merino.runtime import RuntimeMode
+
+# Provider modules, and the heavy data and libraries they depend on, that are loaded only
+# when the provider is enabled in the settings or initialized on startup.
+LAZY_MODULES = [
+    "merino.optimizers.thompson",
+    "merino.providers.suggest.adm.provider",
+    "merino.providers.suggest.amo.provider",
+    "merino.providers.suggest.finance.backends.polygon.stock_ticker_company_mapping",
+    "merino.providers.suggest.finance.provider",
+    "merino.providers.suggest.flightaware.backends.airline_mappings",
+    "merino.providers.suggest.flightaware.provider",
+    "merino.providers.suggest.sports.backends.sportsdata.common.elastic",
+    "merino.providers.suggest.sports.provider",
+    "merino.providers.suggest.top_picks.provider",
+    "merino.providers.suggest.wikipedia.backends.elastic",
+    "merino.providers.suggest.wikipedia.provider",
+    "merino.providers.suggest.yelp.provider",
+    "torch",
+]
+
+STARTUP_SCRIPT = """
+import json, sys
+
+import merino.main
+
+print(json.dumps({"modules": list(sys.modules)}))
+"""
+
+LOAD_PROVIDERS_SCRIPT = """
+import json, sys
+
+from merino.configs import settings
+from merino.providers.suggest.manager import load_providers
+
+disabled = [
+    provider_id.lower()
+    for provider_id, setting in settings.providers.items()
+    if "type" in setting and provider_id != sys.argv[1]
+]
+providers = load_providers(disabled)
+print(json.dumps({"providers": list(providers), "modules": list(sys.modules)}))
+"""
+
+
+def _run(script: str, *args: str, env: dict[str, str] | None = None) -> dict[str, Any]:
+    """Run a script in a fresh interpreter and return the JSON it prints."""
+    # Fixed argv, shell=False, no untrusted input.
+    result = subprocess.run(  # nosec B603
+        [sys.executable, "-c", script, *args],
+        cwd=Path(__file__).parents[2],
+        env=os.environ | (env or {}),
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    output: dict[str, Any] = json.loads(result.stdout.splitlines()[-1])
+    return output
+
+
+@pytest.mark.parametrize("mode", list(RuntimeMode))
+def test_startup_imports_no_lazy_module(mode: RuntimeMode) -> None:
+    """Creating the app imports no lazily loaded module."""
+    startup = _run(STARTUP_SCRIPT, env={"MERINO_RUNTIME__MODE": mode.value})
+
+    assert not set(LAZY_MODULES) & set(startup["modules"])
+
+
+def test_load_providers_imports_enabled_providers_only() -> None:
+    """Loading providers imports the modules of the enabled providers only."""
+    loaded = _run(LOAD_PROVIDERS_SCRIPT, "geolocation")
+
+    assert loaded["providers"] == ["geolocation"]
+    assert "merino.providers.suggest.geolocation.provider" in loaded["modules"]
+    assert not set(LAZY_MODULES) & set(loaded["modules"])
@@ -190,10 +190,12 @@ async def test_cleanup_callbacks_ignore_non_awaitable_return_values() -> None:
                 "logging_start",
                 "sentry_start",
                 "metrics_start",
+                "loop_monitor_start",
                 "regular_start",
                 "governance_start",
                 "governance_shutdown",
                 "regular_shutdown",
+                "loop_monitor_shutdown",
                 "metrics_shutdown",
             ],
         ),
@@ -203,10 +205,12 @@ async def test_cleanup_callbacks_ignore_non_awaitable_return_values() -> None:
                 "logging_start",
                 "sentry_start",
                 "metrics_start",
+                "loop_monitor_start",
                 "regular_start",
                 "governance_start",
                 "governance_shutdown",
                 "regular_shutdown",
+                "loop_monitor_shutdown",
                 "metrics_shutdown",
             ],
         ),
@@ -242,12 +246,17 @@ def test_lifespan_starts_and_stops_services_by_mode(
         events.append("governance_start")
         cleanup_callbacks.append(record("governance_shutdown"))
 
+    def start_loop_monitor(cleanup_callbacks) -> None:
+        events.append("loop_monitor_start")
+        cleanup_callbacks.append(record("loop_monitor_shutdown"))
+
     mocker.patch.object(main, "configure_logging", side_effect=record("logging_start"))
     mocker.patch.object(main, "configure_sentry", side_effect=record("sentry_start"))
     mocker.patch.object(main, "configure_metrics", side_effect=configure_metrics)
     mocker.patch.object(main, "_close_metrics_client", side_effect=close_metrics_client)
     mocker.patch.object(main, "_start_regular_services", side_effect=start_regular)
     mocker.patch.object(main, "_start_governance", side_effect=start_governance)
+    mocker.patch.object(main, "_start_loop_monitor", side_effect=start_loop_monitor)
 
     with TestClient(create_app(mode)):
         pass
@@ -0,0 +1 @@
+"""Unit tests for the merino API utilities."""
@@ -0,0 +1,177 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""Unit tests for the response_cache.py utility module."""
+
+import json
+from typing import Any
+
+import pytest
+from pytest_mock import MockerFixture
+
+from merino.providers.suggest.base import BaseProvider, BaseSuggestion, SuggestionRequest
+from merino.utils.api.response_cache import ResponseCacheKey, SuggestResponseCache
+
+
+class NamedProvider(BaseProvider):
+    """Provider stub that only has a name."""
+
+    def __init__(self, name: str) -> None:
+        self._name = name
+        self._enabled_by_default = True
+
+    async def initialize(self) -> None:
+        """Nothing to initialize."""
+
+    async def query(self, srequest: SuggestionRequest) -> list[BaseSuggestion]:
+        """Return no suggestions."""
+        return []
+
+
+def make_key(cache: SuggestResponseCache, query: str = "w", *names: str) -> ResponseCacheKey:
+    """Return the cache key of a request searching the named providers."""
+    key = cache.key(
+        query,
+        [NamedProvider(name) for name in names or ("adm", "wikipedia")],
+        "US",
+        ["CA"],
+        "desktop",
+        ["en-US"],
+        [],
+        "urlbar",
+        None,
+    )
+    assert key is not None
+    return key
+
+
+@pytest.fixture(name="cache")
+def fixture_cache() -> SuggestResponseCache:
+    """Create a small response cache."""
+    return SuggestResponseCache(max_entries=2, ttl_sec=60, bypass_providers=["accuweather"])
+
+
+def test_key_ignores_provider_order(cache: SuggestResponseCache) -> None:
+    """Requests searching the same providers in another order share a key."""
+    assert make_key(cache, "w", "adm", "wikipedia") == make_key(cache, "w", "wikipedia", "adm")
+    assert make_key(cache, "w") != make_key(cache, "we")
+
+
+def test_key_bypasses_listed_providers(cache: SuggestResponseCache) -> None:
+    """Requests searching any bypassed provider, or none at all, are not cached."""
+    for names in (["adm", "accuweather"], []):
+        key = cache.key(
+            "w", [NamedProvider(n) for n in names], "US", None, None, [], [], "urlbar", None
+        )
+        assert key is None
+
+
+def test_put_and_get(cache: SuggestResponseCache, mocker: MockerFixture) -> None:
+    """A cached response is returned with a Cache-Control header no longer than the original."""
+    mocker.patch("merino.utils.api.response_cache.time.monotonic", return_value=0.0)
+    short, long = make_key(cache, "a"), make_key(cache, "b")
+
+    cache.put(short, [], b"[]", cache_control_ttl=30, compute_ms=12.5)
+    cache.put(long, [], b"[]", cache_control_ttl=300, compute_ms=1.0)
+
+    entry = cache.get(short)
+    assert entry is not None
+    assert entry.cache_control == "private, max-age=30"
+    assert entry.compute_ms == 12.5
+    entry = cache.get(long)
+    assert entry is not None
+    assert entry.cache_control == "private, max-age=60"
+
+
+def test_max_age_is_remaining_lifetime(cache: SuggestResponseCache, mocker: MockerFixture) -> None:
+    """A hit's Cache-Control max-age counts down with the entry's remaining lifetime."""
+    monotonic = mocker.patch("merino.utils.api.response_cache.time.monotonic", return_value=0.0)
+    key = make_key(cache)
+    cache.put(key, [], b"[]", cache_control_ttl=30, compute_ms=1.0)
+
+    for now, expected_max_age in [(10.0, 20), (25.5, 5), (29.9, 1)]:
+        monotonic.return_value = now
+        entry = cache.get(key)
+        assert entry is not None
+        assert entry.cache_control == f"private, max-age={expected_max_age}"
+
+    monotonic.return_value = 30.0
+    assert cache.get(key) is None
+
+
+def test_entry_ttl_capped_by_cache_control(
+    cache: SuggestResponseCache, mocker: MockerFixture
+) -> None:
+    """An entry expires after the smaller of the cache TTL and its Cache-Control max-age."""
+    monotonic = mocker.patch("merino.utils.api.response_cache.time.monotonic", return_value=0.0)
+    short, long = make_key(cache, "a"), make_key(cache, "b")
+    cache.put(short, [], b"[]", cache_control_ttl=10, compute_ms=1.0)
+    cache.put(long, [], b"[]", cache_control_ttl=300, compute_ms=1.0)
+
+    monotonic.return_value = 30.0
+    assert cache.get(short) is None
+    assert cache.get(long) is not None
+
+    monotonic.return_value = 61.0
+    assert cache.get(long) is None
+    assert len(cache) == 0
+
+
+def test_zero_ttl_is_not_cached(cache: SuggestResponseCache) -> None:
+    """Responses that must not be cached by clients are not cached either."""
+    key = make_key(cache)
+
+    cache.put(key, [], b"[]", cache_control_ttl=0, compute_ms=1.0)
+
+    assert cache.get(key) is None
+
+
+def test_evicts_least_recently_used(cache: SuggestResponseCache) -> None:
+    """The cache stays within `max_entries`, evicting the least recently used entry."""
+    a, b, c = make_key(cache, "a"), make_key(cache, "b"), make_key(cache, "c")
+    cache.put(a, [], b"[]", cache_control_ttl=300, compute_ms=1.0)
+    cache.put(b, [], b"[]", cache_control_ttl=300, compute_ms=1.0)
+    cache.get(a)
+
+    cache.put(c, [], b"[]", cache_control_ttl=300, compute_ms=1.0)
+
+    assert len(cache) == 2
+    assert cache.get(b) is None
+    assert cache.get(a) is not None
+
+
+@pytest.mark.parametrize(
+    ("request_id", "client_variants", "expected"),
+    [
+        (
+            "abc",
+            ["foo"],
+            {
+                "suggestions": [{"title": "ü"}],
+                "request_id": "abc",
+                "client_variants": ["foo"],
+                "server_variants": [],
+            },
+        ),
+        (
+            None,
+            [],
+            {"suggestions": [{"title": "ü"}], "client_variants": [], "server_variants": []},
+        ),
+    ],
+    ids=["with-request-id", "without-request-id"],
+)
+def test_render(
+    cache: SuggestResponseCache,
+    request_id: str | None,
+    client_variants: list[str],
+    expected: dict[str, Any],
+) -> None:
+    """The body is rendered per request with its own request ID and client variants."""
+    key = make_key(cache)
+    cache.put(key, [], '[{"title":"ü"}]'.encode(), cache_control_ttl=300, compute_ms=1.0)
+    entry = cache.get(key)
+    assert entry is not None
+
+    assert json.loads(entry.render(request_id, client_variants)) == expected
@@ -0,0 +1,167 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""Unit tests for the hedging module."""
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from merino.utils.hedging import Hedger
+
+
+class FakeUpstream:
+    """Fake upstream backend serving each request with the next of the given latencies."""
+
+    def __init__(self, *latencies: float, fail: bool = False) -> None:
+        self.latencies = list(latencies)
+        self.fail = fail
+        self.started = 0
+        self.finished = 0
+        self.cancelled = 0
+
+    async def request(self) -> int:
+        """Serve a request, returning its index."""
+        index = self.started
+        self.started += 1
+        try:
+            await asyncio.sleep(self.latencies[index])
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        self.finished += 1
+        if self.fail:
+            raise RuntimeError(f"request {index} failed")
+        return index
+
+
+@pytest.fixture(name="hedger")
+def fixture_hedger(statsd_mock: Any) -> Hedger:
+    """Return a hedger that hedges after the p50 of 4 samples, for every request."""
+    hedger = Hedger(
+        "upstream", statsd_mock, percentile=50, max_hedge_ratio=1.0, window_size=4, min_samples=4
+    )
+    for _ in range(4):
+        hedger._observe(0.01)
+    return hedger
+
+
+def increments(statsd_mock: Any) -> list[str]:
+    """Return the names of the incremented metrics."""
+    return [call.args[0] for call in statsd_mock.increment.call_args_list]
+
+
+def test_invalid_percentile(statsd_mock: Any) -> None:
+    """Percentiles outside of (0, 100) are rejected."""
+    with pytest.raises(ValueError):
+        Hedger("upstream", statsd_mock, percentile=100)
+
+
+@pytest.mark.asyncio
+async def test_no_hedging_before_min_samples(statsd_mock: Any) -> None:
+    """Requests are not hedged until enough latencies have been collected."""
+    hedger = Hedger("upstream", statsd_mock, max_hedge_ratio=1.0, min_samples=10)
+    upstream = FakeUpstream(0.05)
+
+    assert await hedger.run(upstream.request) == 0
+
+    assert hedger.delay_sec is None
+    assert upstream.started == 1
+    assert increments(statsd_mock) == []
+
+
+@pytest.mark.asyncio
+async def test_fast_request_not_hedged(hedger: Hedger, statsd_mock: Any) -> None:
+    """A request faster than the hedge delay is sent once."""
+    upstream = FakeUpstream(0.0)
+
+    assert await hedger.run(upstream.request) == 0
+
+    assert upstream.started == 1
+    assert increments(statsd_mock) == []
+
+
+@pytest.mark.asyncio
+async def test_hedge_wins(hedger: Hedger, statsd_mock: Any) -> None:
+    """A slow request is hedged, the hedge's result is used and the primary cancelled."""
+    upstream = FakeUpstream(1.0, 0.0)
+
+    assert await hedger.run(upstream.request) == 1
+
+    await asyncio.sleep(0)
+    assert upstream.cancelled == 1
+    assert increments(statsd_mock) == ["upstream.hedge.fired", "upstream.hedge.won"]
+
+
+@pytest.mark.asyncio
+async def test_primary_wins(hedger: Hedger, statsd_mock: Any) -> None:
+    """A hedged primary that finishes first is used, and the hedge is cancelled."""
+    upstream = FakeUpstream(0.03, 1.0)
+
+    assert await hedger.run(upstream.request) == 0
+
+    await asyncio.sleep(0)
+    assert upstream.started == 2
+    assert upstream.cancelled == 1
+    assert increments(statsd_mock) == ["upstream.hedge.fired"]
+
+
+@pytest.mark.asyncio
+async def test_all_attempts_fail(hedger: Hedger) -> None:
+    """The primary's error is raised when both attempts fail."""
+    upstream = FakeUpstream(0.02, 0.0, fail=True)
+
+    with pytest.raises(RuntimeError, match="request 0 failed"):
+        await hedger.run(upstream.request)
+
+    assert upstream.finished == 2
+
+
+@pytest.mark.asyncio
+async def test_hedge_rate_capped(statsd_mock: Any) -> None:
+    """At most `max_hedge_ratio` of the requests are hedged."""
+    hedger = Hedger(
+        "upstream", statsd_mock, percentile=50, max_hedge_ratio=0.25, window_size=4, min_samples=4
+    )
+    for _ in range(4):
+        hedger._observe(0.001)
+    upstream = FakeUpstream(*[0.01] * 16)
+
+    for _ in range(8):
+        await hedger.run(upstream.request)
+
+    assert increments(statsd_mock).count("upstream.hedge.fired") == 2
+
+
+@pytest.mark.asyncio
+async def test_cancelling_run_cancels_attempts(hedger: Hedger) -> None:
+    """Cancelling a hedged request, e.g. on a provider timeout, cancels every attempt."""
+    upstream = FakeUpstream(1.0, 1.0)
+    task = asyncio.create_task(hedger.run(upstream.request))
+    await asyncio.sleep(0.05)
+
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert upstream.started == 2
+    assert upstream.cancelled == 2
+
+
+def test_delay_follows_percentile(statsd_mock: Any) -> None:
+    """The hedge delay is the percentile of the recent latencies, floored at the min."""
+    hedger = Hedger(
+        "upstream", statsd_mock, percentile=90, min_delay_sec=0.005, window_size=10, min_samples=10
+    )
+    for latency in range(1, 11):
+        hedger._observe(latency / 1000)
+
+    assert hedger.delay_sec == pytest.approx(0.01)
+
+    floored = Hedger("upstream", statsd_mock, min_delay_sec=0.5, window_size=10, min_samples=10)
+    for latency in range(1, 11):
+        floored._observe(latency / 1000)
+
+    assert floored.delay_sec == 0.5
@@ -0,0 +1,97 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""Unit tests for the event loop monitor."""
+
+import asyncio
+import sys
+import time
+from typing import Any
+
+import pytest
+
+from merino_common.utils import cron
+from merino.utils.loop_monitor import LoopMonitor, describe_stack
+
+
+async def blocking_coroutine(duration_sec: float) -> None:
+    """Hold the event loop with synchronous work."""
+    time.sleep(duration_sec)
+
+
+def lags_ms(statsd_mock: Any) -> list[float]:
+    """Return the recorded event loop lags."""
+    return [
+        call.kwargs["value"]
+        for call in statsd_mock.histogram.call_args_list
+        if call.args[0] == "event_loop.lag_ms"
+    ]
+
+
+def stall_sources(statsd_mock: Any) -> list[str]:
+    """Return the sources of the recorded event loop stalls."""
+    return [
+        call.kwargs["tags"]["source"]
+        for call in statsd_mock.increment.call_args_list
+        if call.args[0] == "event_loop.stall"
+    ]
+
+
+@pytest.mark.asyncio
+async def test_lag_recorded(statsd_mock: Any) -> None:
+    """A blocked loop shows up as a lag of about the time it was blocked for."""
+    monitor = LoopMonitor(statsd_mock, interval_sec=0.01)
+    monitor.start()
+    await asyncio.sleep(0.02)
+
+    await blocking_coroutine(0.1)
+    await asyncio.sleep(0.02)
+    monitor.shutdown()
+
+    assert max(lags_ms(statsd_mock)) >= 80
+    assert stall_sources(statsd_mock) == []
+
+
+@pytest.mark.asyncio
+async def test_stall_attributed_to_coroutine(statsd_mock: Any) -> None:
+    """The coroutine holding the loop is recorded as the source of the stall."""
+    monitor = LoopMonitor(statsd_mock, interval_sec=0.01, slow_callback_threshold_sec=0.02)
+    monitor.start()
+    await asyncio.sleep(0.02)
+
+    await asyncio.create_task(blocking_coroutine(0.2))
+    await asyncio.sleep(0.03)
+    monitor.shutdown()
+
+    assert stall_sources(statsd_mock) == [f"{__name__}.blocking_coroutine"]
+
+
+@pytest.mark.asyncio
+async def test_stall_attributed_to_cron_job(statsd_mock: Any) -> None:
+    """A cron job holding the loop is recorded by its name."""
+
+    async def blocking_task() -> None:
+        time.sleep(0.2)
+
+    job = cron.Job(name="blocking_job", interval=60, condition=lambda: True, task=blocking_task)
+    monitor = LoopMonitor(statsd_mock, interval_sec=0.01, slow_callback_threshold_sec=0.02)
+    monitor.start()
+    await asyncio.sleep(0.02)
+
+    cron_task = asyncio.create_task(job())
+    await asyncio.sleep(0.05)
+    cron_task.cancel()
+    monitor.shutdown()
+
+    assert stall_sources(statsd_mock) == ["cron.blocking_job"]
+
+
+def test_describe_stack_outside_coroutines() -> None:
+    """A stack with neither a coroutine nor Merino code has an unknown source, and its
+    frames are still logged.
+    """
+    stall = describe_stack(sys._getframe())
+
+    assert stall.source == "unknown"
+    assert "test_describe_stack_outside_coroutines" in stall.stack
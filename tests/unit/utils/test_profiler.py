@@ -0,0 +1,131 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""Unit tests for the sampling profiler."""
+
+import asyncio
+import threading
+import time
+from collections import Counter
+
+import pytest
+
+from merino.utils.profiler import (
+    Profile,
+    ProfilerBusyError,
+    ProfilerError,
+    SamplingProfiler,
+)
+
+
+def busy_loop(duration_sec: float) -> int:
+    """Burn CPU for the given duration."""
+    count = 0
+    deadline = time.process_time() + duration_sec
+    while time.process_time() < deadline:
+        count += 1
+    return count
+
+
+async def profile_busy_loop(profiler: SamplingProfiler, duration_sec: float) -> Profile:
+    """Profile the event loop while it runs a busy loop."""
+    task = asyncio.create_task(profiler.profile(duration_sec, 0.01), name="profile")
+    await asyncio.sleep(0)
+    busy_loop(duration_sec)
+    return await task
+
+
+@pytest.mark.asyncio
+async def test_profile_samples_busy_code() -> None:
+    """The CPU bound function shows up in most samples, under the running task."""
+    profiler = SamplingProfiler()
+
+    profile = await profile_busy_loop(profiler, 0.5)
+
+    busy_samples = sum(
+        count
+        for stack, count in profile.stacks.items()
+        if any(name == "busy_loop" for name, _, _ in stack)
+    )
+    assert profile.sample_count >= 20
+    assert busy_samples >= 20
+    assert "busy_loop (" in profile.to_collapsed()
+    assert not profiler.running
+
+
+@pytest.mark.asyncio
+async def test_profile_overhead() -> None:
+    """Sampling every 10ms costs less than 5% of the profiled time."""
+    profile = await profile_busy_loop(SamplingProfiler(), 0.5)
+
+    assert profile.overhead_ratio < 0.05
+
+
+@pytest.mark.asyncio
+async def test_profile_already_running() -> None:
+    """Only one profile can run at a time."""
+    profiler = SamplingProfiler()
+    task = asyncio.create_task(profiler.profile(0.05, 0.01))
+    await asyncio.sleep(0)
+
+    with pytest.raises(ProfilerBusyError):
+        await profiler.profile(0.05, 0.01)
+
+    await task
+    assert not profiler.running
+
+
+def test_profile_outside_main_thread() -> None:
+    """Profiles can't be started outside of the main thread, signals only run there."""
+    errors: list[Exception] = []
+
+    def run() -> None:
+        try:
+            asyncio.run(SamplingProfiler().profile(0.01, 0.01))
+        except ProfilerError as e:
+            errors.append(e)
+
+    thread = threading.Thread(target=run)
+    thread.start()
+    thread.join()
+
+    assert len(errors) == 1
+
+
+def test_profile_exports() -> None:
+    """Stacks are exported root first as collapsed stacks, and per thread to speedscope."""
+    main = ("MainThread", "", 0)
+    task = ("task:suggest", "", 0)
+    handler = ("handler", "api_v1.py", 10)
+    query = ("query", "provider.py", 20)
+    profile = Profile(
+        stacks=Counter({(main, task, handler, query): 3, (main, task, handler): 1}),
+        duration_sec=1.0,
+        overhead_sec=0.01,
+    )
+
+    assert profile.sample_count == 4
+    assert profile.overhead_ratio == pytest.approx(0.01)
+    assert profile.to_collapsed() == (
+        "MainThread;task:suggest;handler (api_v1.py:10) 1\n"
+        "MainThread;task:suggest;handler (api_v1.py:10);query (provider.py:20) 3\n"
+    )
+
+    speedscope = profile.to_speedscope()
+    assert speedscope["shared"]["frames"] == [
+        {"name": "task:suggest"},
+        {"name": "handler", "file": "api_v1.py", "line": 10},
+        {"name": "query", "file": "provider.py", "line": 20},
+    ]
+    assert speedscope["profiles"] == [
+        {
+            "type": "sampled",
+            "name": "MainThread",
+            "unit": "none",
+            "startValue": 0,
+            "endValue": 4,
+            "samples": [[0, 1], [0, 1, 2]],
+            "weights": [1, 3],
+        }
+    ]
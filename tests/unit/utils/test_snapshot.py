@@ -0,0 +1,115 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""Unit tests for the snapshot module."""
+
+import json
+import time
+from pathlib import Path
+from typing import Any
+
+import pytest
+from pytest_mock import MockerFixture
+
+from merino.utils.snapshot import Snapshot
+
+
+@pytest.fixture(name="snapshot")
+def fixture_snapshot(tmp_path: Path, statsd_mock: Any) -> Snapshot:
+    """Return a snapshot in a temporary directory, loadable for an hour."""
+    return Snapshot("provider", tmp_path / "snapshots", 3600.0, statsd_mock)
+
+
+def load_statuses(statsd_mock: Any) -> list[str]:
+    """Return the statuses of the recorded snapshot loads."""
+    return [
+        call.kwargs["tags"]["status"]
+        for call in statsd_mock.increment.call_args_list
+        if call.args == ("snapshot.load",)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_save_and_load(snapshot: Snapshot, statsd_mock: Any) -> None:
+    """Test a saved payload is loaded back, replacing the previous one."""
+    assert await snapshot.save(b"first", 1)
+    assert await snapshot.save(b"second\nline", 1)
+
+    assert snapshot.load(1) == b"second\nline"
+    assert load_statuses(statsd_mock) == ["success"]
+    statsd_mock.gauge.assert_called_with(
+        "snapshot.size_bytes", value=11, tags={"snapshot": "provider"}
+    )
+    assert [path.name for path in snapshot.directory.iterdir()] == ["provider.snapshot"]
+
+
+def test_load_missing(snapshot: Snapshot, statsd_mock: Any) -> None:
+    """Test there is nothing to load before the first save."""
+    assert snapshot.load(1) is None
+    assert load_statuses(statsd_mock) == ["missing"]
+
+
+@pytest.mark.asyncio
+async def test_load_other_version(snapshot: Snapshot, statsd_mock: Any) -> None:
+    """Test a snapshot of another payload version isn't loaded."""
+    await snapshot.save(b"payload", 1)
+
+    assert snapshot.load(2) is None
+    assert load_statuses(statsd_mock) == ["version_mismatch"]
+
+
+@pytest.mark.asyncio
+async def test_load_stale(snapshot: Snapshot, statsd_mock: Any, mocker: MockerFixture) -> None:
+    """Test a snapshot older than the max age isn't loaded."""
+    await snapshot.save(b"payload", 1)
+    mocker.patch("merino.utils.snapshot.time.time", return_value=time.time() + 3601)
+
+    assert snapshot.load(1) is None
+    assert load_statuses(statsd_mock) == ["stale"]
+
+
+@pytest.mark.parametrize(
+    "corrupt",
+    [
+        pytest.param(lambda content: content[:-1], id="truncated"),
+        pytest.param(lambda content: content[:-1] + b"X", id="modified"),
+        pytest.param(lambda content: b"not a header\n" + content, id="header"),
+        pytest.param(lambda content: b"", id="empty"),
+    ],
+)
+@pytest.mark.asyncio
+async def test_load_corrupted(snapshot: Snapshot, statsd_mock: Any, corrupt: Any) -> None:
+    """Test a corrupted snapshot isn't loaded."""
+    await snapshot.save(b"payload", 1)
+    snapshot.path.write_bytes(corrupt(snapshot.path.read_bytes()))
+
+    assert snapshot.load(1) is None
+    assert load_statuses(statsd_mock) == ["corrupted"]
+
+
+@pytest.mark.asyncio
+async def test_load_other_format(snapshot: Snapshot, statsd_mock: Any) -> None:
+    """Test a snapshot of another file layout isn't loaded."""
+    await snapshot.save(b"payload", 1)
+    header_line, _, payload = snapshot.path.read_bytes().partition(b"\n")
+    header = json.loads(header_line) | {"format": 0}
+    snapshot.path.write_bytes(json.dumps(header).encode() + b"\n" + payload)
+
+    assert snapshot.load(1) is None
+    assert load_statuses(statsd_mock) == ["corrupted"]
+
+
+@pytest.mark.asyncio
+async def test_save_error(tmp_path: Path, statsd_mock: Any) -> None:
+    """Test a failed save is reported without raising, and leaves no temporary file."""
+    blocker = tmp_path / "file"
+    blocker.write_text("")
+    snapshot = Snapshot("provider", blocker / "snapshots", 3600.0, statsd_mock)
+
+    assert not await snapshot.save(b"payload", 1)
+
+    statsd_mock.increment.assert_called_once_with(
+        "snapshot.save", tags={"snapshot": "provider", "status": "error"}
+    )
+    assert [path.name for path in tmp_path.iterdir()] == ["file"]
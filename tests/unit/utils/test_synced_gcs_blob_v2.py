@@ -8,6 +8,9 @@ fake GCS bucket.
 """
 
 import logging
+import pickle
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import cast
 from unittest.mock import MagicMock
@@ -49,6 +52,7 @@ def mock_blob(mocker: MockerFixture) -> MagicMock:
     blob = mocker.AsyncMock()
     blob.size = "100"
     blob.updated = BLOB_UPDATED
+    blob.generation = "1"
     blob.download = mocker.AsyncMock(return_value=orjson.dumps({"value": 1}))
     return cast(MagicMock, blob)
 
@@ -273,6 +277,103 @@ async def test_update_task_handles_generic_exception(
     statsd_mock.gauge.assert_any_call("gcs.sync.valid", value=0, tags=DEFAULT_TAGS)
 
 
+@pytest.mark.asyncio
+async def test_update_task_skips_unchanged_generation(
+    synced: SyncedGcsBlobV2, mock_blob: MagicMock, statsd_mock: MagicMock
+) -> None:
+    """An unchanged generation is neither downloaded nor parsed again, and a new one is."""
+    await synced._update_task()
+    await synced._update_task()
+
+    mock_blob.download.assert_called_once()
+    assert synced.update_count == 1
+    assert synced.generation == "1"
+    statsd_mock.increment.assert_any_call(
+        "gcs.sync.fetch.skipped", tags=DEFAULT_TAGS | {"reason": "unchanged"}
+    )
+
+    mock_blob.generation = "2"
+    mock_blob.download.return_value = orjson.dumps({"value": 2})
+    await synced._update_task()
+
+    assert synced.data == FakeModel(value=2)
+    assert synced.update_count == 2
+    assert synced.generation == "2"
+
+
+@pytest.mark.asyncio
+async def test_update_task_does_not_reparse_failed_generation(
+    synced: SyncedGcsBlobV2, mock_blob: MagicMock, statsd_mock: MagicMock
+) -> None:
+    """A generation that failed to parse is skipped until a new generation is uploaded."""
+    mock_blob.download.return_value = b"not valid json {"
+    await synced._update_task()
+    await synced._update_task()
+
+    mock_blob.download.assert_called_once()
+    statsd_mock.increment.assert_any_call(
+        "gcs.sync.fetch.skipped", tags=DEFAULT_TAGS | {"reason": "invalid"}
+    )
+
+    mock_blob.generation = "2"
+    mock_blob.download.return_value = orjson.dumps({"value": 3})
+    await synced._update_task()
+
+    assert synced.data == FakeModel(value=3)
+
+
+@pytest.mark.asyncio
+async def test_update_task_falls_back_to_updated_time_without_generation(
+    synced: SyncedGcsBlobV2, mock_blob: MagicMock
+) -> None:
+    """Without a generation in the metadata, changes are detected by the updated time."""
+    del mock_blob.generation
+
+    await synced._update_task()
+    await synced._update_task()
+
+    mock_blob.download.assert_called_once()
+    assert synced.update_count == 1
+
+
+@pytest.mark.asyncio
+async def test_update_task_parses_off_the_event_loop(
+    synced: SyncedGcsBlobV2, statsd_mock: MagicMock
+) -> None:
+    """fetch_callback runs in a worker thread and its duration is reported."""
+    callback_threads = []
+
+    def callback(raw: bytes) -> FakeModel:
+        callback_threads.append(threading.get_ident())
+        return FakeModel.model_validate(orjson.loads(raw))
+
+    synced.fetch_callback = callback
+
+    await synced._update_task()
+
+    assert callback_threads and callback_threads[0] != threading.get_ident()
+    assert synced.data == FakeModel(value=1)
+    statsd_mock.timeit.assert_any_call("gcs.sync.parse.timing", tags=DEFAULT_TAGS)
+
+
+@pytest.mark.asyncio
+async def test_update_task_parses_in_callback_executor(synced: SyncedGcsBlobV2) -> None:
+    """fetch_callback runs in the given executor."""
+    with ThreadPoolExecutor(thread_name_prefix="blob-parser") as executor:
+        synced.callback_executor = executor
+        thread_names = []
+
+        def callback(raw: bytes) -> FakeModel:
+            thread_names.append(threading.current_thread().name)
+            return FakeModel.model_validate(orjson.loads(raw))
+
+        synced.fetch_callback = callback
+        await synced._update_task()
+
+    assert thread_names[0].startswith("blob-parser")
+    assert synced.data == FakeModel(value=1)
+
+
 def test_initialize_is_idempotent(synced: SyncedGcsBlobV2, mocker: MockerFixture) -> None:
     """Calling initialize() twice creates only one cron task."""
     mock_create_task = mocker.patch("asyncio.create_task", return_value=mocker.MagicMock())
@@ -339,3 +440,21 @@ async def test_factory_raises_on_invalid_json(
 
     assert synced.data is None
     assert "Failed to decode blob JSON" in caplog.text
+
+
+def test_factory_callback_is_picklable(mock_storage: MagicMock, statsd_mock: MagicMock) -> None:
+    """The factory callback can be sent to a process pool executor."""
+    synced = typed_gcs_json_blob_factory(
+        model=FakeModel,
+        storage_client=mock_storage,
+        metrics_client=statsd_mock,
+        bucket_name=BUCKET_NAME,
+        blob_name=BLOB_NAME,
+        max_size=MAX_SIZE,
+        cron_interval_seconds=60,
+        cron_job_name="factory_test_pickle",
+    )
+
+    callback = pickle.loads(pickle.dumps(synced.fetch_callback))
+
+    assert callback(orjson.dumps({"value": 5})) == FakeModel(value=5)
@@ -82,12 +82,17 @@ SOURCE_TEST_MAPPING_DETAILED: dict[str, dict[str, list[str]]] = {
             "tests/integration/api/v1/curated_recommendations/ml_backends/test_gcs_local_model.py",
             "tests/integration/api/v1/curated_recommendations/test_curated_recommendations.py",
             "tests/unit/curated_recommendations/test_rankers.py",
+            "tests/unit/test_lazy_modules.py",
         ],
     },
     "merino/curated_recommendations/article_balancer.py": {
         "direct": [],
         "indirect": ["tests/unit/curated_recommendations/test_rankers.py"],
     },
+    "merino/curated_recommendations/candidate_snapshots.py": {
+        "direct": ["tests/unit/curated_recommendations/test_candidate_snapshots.py"],
+        "indirect": [],
+    },
     "merino/curated_recommendations/corpus_backends/__init__.py": {
         "direct": [],
         "indirect": [],
@@ -319,6 +324,10 @@ SOURCE_TEST_MAPPING_DETAILED: dict[str, dict[str, list[str]]] = {
         "direct": ["tests/unit/governance/test_service_governing.py"],
         "indirect": [],
     },
+    "merino/governance/admission.py": {
+        "direct": ["tests/unit/governance/test_admission.py"],
+        "indirect": ["tests/integration/api/v1/suggest/test_suggest_admission.py"],
+    },
     "merino/governance/circuitbreakers.py": {
         "direct": [],
         "indirect": [
@@ -406,10 +415,6 @@ SOURCE_TEST_MAPPING_DETAILED: dict[str, dict[str, list[str]]] = {
             "tests/unit/jobs/geonames_uploader/test_upload_geonames.py",
         ],
     },
-    "merino/jobs/geonames_uploader/tempzipfile.py": {
-        "direct": [],
-        "indirect": [],
-    },
     "merino/jobs/navigational_suggestions/__init__.py": {
         "direct": [
             "tests/integration/jobs/navigational_suggestions/test_init.py",
@@ -483,6 +488,14 @@ SOURCE_TEST_MAPPING_DETAILED: dict[str, dict[str, list[str]]] = {
             "tests/integration/jobs/navigational_suggestions/test_favicon_pipeline_integration.py",
         ],
     },
+    "merino/jobs/navigational_suggestions/io/async_favicon_uploader.py": {
+        "direct": [],
+        "indirect": [
+            "tests/unit/jobs/navigational_suggestions/test_async_favicon_uploader.py",
+            "tests/unit/jobs/navigational_suggestions/test_domain_processor.py",
+            "tests/unit/jobs/navigational_suggestions/test_favicon_processor.py",
+        ],
+    },
     "merino/jobs/navigational_suggestions/io/domain_data_downloader.py": {
         "direct": [],
         "indirect": ["tests/unit/jobs/navigational_suggestions/test_domain_data_downloader.py"],
@@ -566,6 +579,13 @@ SOURCE_TEST_MAPPING_DETAILED: dict[str, dict[str, list[str]]] = {
             "tests/unit/jobs/navigational_suggestions/test_favicon_scraper.py",
         ],
     },
+    "merino/jobs/navigational_suggestions/scrapers/page_parser.py": {
+        "direct": [],
+        "indirect": [
+            "tests/integration/jobs/navigational_suggestions/test_web_scraping_integration.py",
+            "tests/unit/jobs/navigational_suggestions/test_web_scraper.py",
+        ],
+    },
     "merino/jobs/navigational_suggestions/scrapers/web_scraper.py": {
         "direct": [],
         "indirect": [
@@ -692,7 +712,7 @@ SOURCE_TEST_MAPPING_DETAILED: dict[str, dict[str, list[str]]] = {
     },
     "merino/main.py": {
         "direct": [],
-        "indirect": [],
+        "indirect": ["tests/unit/test_lazy_modules.py"],
     },
     "merino/middleware/__init__.py": {
         "direct": [],
@@ -820,6 +840,10 @@ SOURCE_TEST_MAPPING_DETAILED: dict[str, dict[str, list[str]]] = {
             "tests/unit/providers/suggest/adm/backends/test_mars.py",
         ],
     },
+    "merino/providers/suggest/adm/priors.py": {
+        "direct": ["tests/unit/providers/suggest/adm/test_priors.py"],
+        "indirect": ["tests/unit/providers/suggest/adm/test_provider_thompson.py"],
+    },
     "merino/providers/suggest/adm/provider.py": {
         "direct": [
             "tests/unit/providers/suggest/adm/test_provider.py",
@@ -1007,7 +1031,10 @@ SOURCE_TEST_MAPPING_DETAILED: dict[str, dict[str, list[str]]] = {
     },
     "merino/providers/suggest/manager.py": {
         "direct": [],
-        "indirect": ["tests/unit/providers/suggest/test_init_providers.py"],
+        "indirect": [
+            "tests/unit/providers/suggest/test_init_providers.py",
+            "tests/unit/test_lazy_modules.py",
+        ],
     },
     "merino/providers/suggest/sports/__init__.py": {
         "direct": [],
@@ -1249,6 +1276,10 @@ SOURCE_TEST_MAPPING_DETAILED: dict[str, dict[str, list[str]]] = {
         "direct": [],
         "indirect": [],
     },
+    "merino/utils/api/response_cache.py": {
+        "direct": ["tests/unit/utils/api/test_response_cache.py"],
+        "indirect": ["tests/integration/api/v1/suggest/test_suggest_response_cache.py"],
+    },
     "merino/utils/api/query_params.py": {
         "direct": ["tests/unit/utils/api/test_query_params.py"],
         "indirect": [],
@@ -1312,6 +1343,10 @@ SOURCE_TEST_MAPPING_DETAILED: dict[str, dict[str, list[str]]] = {
             "tests/unit/utils/test_icon_processor.py",
         ],
     },
+    "merino/utils/hedging.py": {
+        "direct": ["tests/unit/utils/test_hedging.py"],
+        "indirect": ["tests/unit/providers/suggest/wikipedia/backends/test_elastic.py"],
+    },
     "merino/utils/icon_processor.py": {
         "direct": ["tests/unit/utils/test_icon_processor.py"],
         "indirect": [
@@ -1324,10 +1359,28 @@ SOURCE_TEST_MAPPING_DETAILED: dict[str, dict[str, list[str]]] = {
             "tests/integration/api/v1/suggest/test_suggest.py",
         ],
     },
+    "merino/utils/loop_monitor.py": {
+        "direct": ["tests/unit/utils/test_loop_monitor.py"],
+        "indirect": ["tests/unit/test_runtime_modes.py"],
+    },
     "merino/utils/metrics.py": {
         "direct": [],
         "indirect": ["tests/unit/providers/suggest/sports/test_sports_provider.py"],
     },
+    "merino/utils/profiler.py": {
+        "direct": ["tests/unit/utils/test_profiler.py"],
+        "indirect": ["tests/integration/api/test_profiler.py"],
+    },
+    "merino/utils/snapshot.py": {
+        "direct": ["tests/unit/utils/test_snapshot.py"],
+        "indirect": [
+            "tests/unit/providers/suggest/adm/backends/test_mars.py",
+            "tests/unit/providers/suggest/adm/test_provider.py",
+            "tests/unit/providers/suggest/finance/test_provider.py",
+            "tests/unit/providers/suggest/flightaware/test_provider.py",
+            "tests/unit/providers/suggest/top_picks/test_provider.py",
+        ],
+    },
     "merino/utils/synced_gcs_blob.py": {
         "direct": [],
         "indirect": [
@@ -1357,6 +1410,10 @@ SOURCE_TEST_MAPPING_DETAILED: dict[str, dict[str, list[str]]] = {
         "direct": [],
         "indirect": ["tests/integration/api/v1/"],
     },
+    "merino/web/profiler.py": {
+        "direct": ["tests/integration/api/test_profiler.py"],
+        "indirect": [],
+    },
 }
 
 